@@ -2,6 +2,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.profile.repositories.profile_repository import ProfileRepository
 from backend.module.session.repositories.session_repository import (
     SessionRepository,
@@ -21,7 +22,8 @@ class AuthHandler:
         self.usecase = AuthUseCase(
             self.user_repository,
             self.session_repository,
-            self.profile_repository
+            self.profile_repository,
+            SearchIndexer(session)
         )
 
     async def login(self, req: LoginDTO):
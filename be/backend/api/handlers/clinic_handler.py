@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.handlers.base import BaseHandler
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.clinic.entity.clinic_dto import (
     ClinicCreateDTO,
     ClinicDTO,
@@ -20,7 +21,7 @@ class ClinicHandler(BaseHandler):
     def __init__(self, session: AsyncSession = Depends(get_db)):
         super().__init__(session)
         self.repository = ClinicRepository(session)
-        self.usecase = ClinicUseCase(self.repository)
+        self.usecase = ClinicUseCase(self.repository, SearchIndexer(session))
 
     async def create_clinic(self, req: ClinicCreateDTO):
         clinic = await self.usecase.create_clinic(req)
@@ -0,0 +1,22 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.handlers.base import BaseHandler
+from backend.infrastructure.database.session import get_db
+from backend.module.diagnosis.usecases.diagnosis_catalog import get_diagnosis_catalog
+from backend.module.diagnosis.usecases.diagnosis_usecase import DiagnosisUseCase
+from backend.pkg.core.response import response_factory
+
+
+class DiagnosisHandler(BaseHandler):
+    def __init__(self, session: AsyncSession = Depends(get_db)):
+        super().__init__(session)
+        self.usecase = DiagnosisUseCase(get_diagnosis_catalog())
+
+    async def search_diagnoses(self, q: str, limit: int = 10):
+        results = await self.usecase.search_diagnoses(q, limit)
+        return response_factory.success(data=results)
+
+    async def get_diagnosis(self, code: str):
+        diagnosis = await self.usecase.get_diagnosis(code)
+        return response_factory.success(data=diagnosis)
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.handlers.base import BaseHandler
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.lab.entity.lab_dto import (
     LabOrderCreateDTO,
     LabOrderDTO,
@@ -31,7 +32,7 @@ class LabHandler(BaseHandler):
         self.test_repo = LabTestRepository(session)
         self.order_repo = LabOrderRepository(session)
         self.visit_repo = VisitRepository(session)
-        self.usecase = LabUseCase(self.test_repo, self.order_repo, self.visit_repo)
+        self.usecase = LabUseCase(self.test_repo, self.order_repo, self.visit_repo, SearchIndexer(session))
 
     # --- Tests ---
     async def create_lab_test(self, req: LabTestCreateDTO, profile: AuthenticatedProfile):
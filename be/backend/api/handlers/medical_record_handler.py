@@ -7,9 +7,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.handlers.base import BaseHandler
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.infrastructure.database.session import get_db
+from backend.module.diagnosis.usecases.diagnosis_catalog import get_diagnosis_catalog
+from backend.module.diagnosis.usecases.diagnosis_usecase import DiagnosisUseCase
 from backend.module.medical_record.entity.medical_record_dto import (
     MedicalRecordCreateDTO,
     MedicalRecordDTO,
+    MedicalRecordRevisionDTO,
+    MedicalRecordRevisionsDTO,
     MedicalRecordUpdateDTO,
 )
 from backend.module.medical_record.repositories.medical_record_repository import (
@@ -29,7 +33,9 @@ class MedicalRecordHandler(BaseHandler):
         self.profile_repository = ProfileRepository(session)
         self.repository = MedicalRecordRepository(session)
         self.visit_repository = VisitRepository(session)
-        self.usecase = MedicalRecordUseCase(self.repository, self.visit_repository)
+        self.usecase = MedicalRecordUseCase(
+            self.repository, self.visit_repository, DiagnosisUseCase(get_diagnosis_catalog())
+        )
 
     async def create_medical_record(self, req: MedicalRecordCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.create_medical_record(req, profile.id)
@@ -60,10 +66,75 @@ class MedicalRecordHandler(BaseHandler):
             offset=(page - 1) * limit
         )
 
+    async def list_medical_record_summaries(
+        self,
+        profile: AuthenticatedProfile,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        visit_id: Optional[UUID] = None
+    ):
+        summaries, total = await self.usecase.list_medical_record_summaries(
+            page=page,
+            limit=limit,
+            user_id=profile.id,
+            role=profile.role,
+            patient_id=patient_id,
+            doctor_id=doctor_id,
+            visit_id=visit_id
+        )
+        return response_factory.success_list(
+            data=summaries,
+            total=total,
+            limit=limit,
+            offset=(page - 1) * limit
+        )
+
+    async def search_medical_records(
+        self,
+        profile: AuthenticatedProfile,
+        q: str,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None
+    ):
+        results, total = await self.usecase.search_medical_records(
+            query=q,
+            page=page,
+            limit=limit,
+            user_id=profile.id,
+            role=profile.role,
+            patient_id=patient_id,
+            doctor_id=doctor_id
+        )
+        return response_factory.success_list(data=results, total=total, limit=limit, offset=(page - 1) * limit)
+
     async def get_medical_record(self, record_id: UUID, profile: AuthenticatedProfile):
         result = await self.usecase.get_medical_record(record_id, profile.id, profile.role)
         return response_factory.success(data=MedicalRecordDTO.model_validate(result))
 
+    async def list_medical_record_revisions(
+        self,
+        record_id: UUID,
+        profile: AuthenticatedProfile,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ):
+        revisions, next_cursor = await self.usecase.list_medical_record_revisions(
+            record_id, profile.id, profile.role, limit, cursor
+        )
+        return response_factory.success(data=MedicalRecordRevisionsDTO(
+            record_id=record_id,
+            revisions=[MedicalRecordRevisionDTO.model_validate(r) for r in revisions],
+            next_cursor=next_cursor
+        ))
+
+    async def get_medical_record_version(self, record_id: UUID, revision: int, profile: AuthenticatedProfile):
+        result = await self.usecase.get_medical_record_version(record_id, revision, profile.id, profile.role)
+        return response_factory.success(data=result)
+
     async def update_medical_record(self, record_id: UUID, req: MedicalRecordUpdateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.update_medical_record(record_id, req, profile.id)
         return response_factory.success(data=MedicalRecordDTO.model_validate(result), message="Medical record updated successfully")
@@ -0,0 +1,19 @@
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.handlers.base import BaseHandler
+from backend.infrastructure.database.session import get_db
+from backend.module.profile.repositories.patient_search_repository import PatientSearchRepository
+from backend.module.profile.usecases.patient_search import PatientSearchUseCase
+from backend.pkg.core.response import response_factory
+
+
+class PatientSearchHandler(BaseHandler):
+    def __init__(self, session: AsyncSession = Depends(get_db)):
+        super().__init__(session)
+        self.repository = PatientSearchRepository(session)
+        self.usecase = PatientSearchUseCase(self.repository)
+
+    async def search_patients(self, q: str, limit: int = 10):
+        results = await self.usecase.search_patients(q, limit)
+        return response_factory.success(data=results)
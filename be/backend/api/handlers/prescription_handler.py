@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.handlers.base import BaseHandler
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.prescription.entity.prescription_dto import (
     PrescriptionCreateDTO,
     PrescriptionDTO,
@@ -29,7 +30,7 @@ class PrescriptionHandler(BaseHandler):
         super().__init__(session)
         self.repository = PrescriptionRepository(session)
         self.visit_repository = VisitRepository(session)
-        self.usecase = PrescriptionUseCase(self.repository, self.visit_repository)
+        self.usecase = PrescriptionUseCase(self.repository, self.visit_repository, SearchIndexer(session))
 
     async def create_prescription(self, req: PrescriptionCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.create_prescription(req, profile.id)
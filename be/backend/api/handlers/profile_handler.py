@@ -2,6 +2,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.profile.entity.dto import (
     UpdateAdminProfileDTO,
     UpdateDoctorProfileDTO,
@@ -25,7 +26,7 @@ class GeneralProfileHandler:
     def __init__(self, session: AsyncSession = Depends(get_db)):
         self.user_repo = UserRepository(session)
         self.profile_repo = ProfileRepository(session)
-        self.usecase = ProfileUseCase(self.user_repo, self.profile_repo)
+        self.usecase = ProfileUseCase(self.user_repo, self.profile_repo, SearchIndexer(session))
 
     async def get_profile(self, user: User):
         result = await self.usecase.get_profile(user)
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from backend.api.handlers.base import BaseHandler
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.referral.entity.referral_dto import (
     ReferralCreateDTO,
     ReferralDTO,
@@ -24,7 +25,7 @@ class ReferralHandler(BaseHandler):
         super().__init__(session)
         self.repository = ReferralRepository(session)
         self.visit_repo = VisitRepository(session)
-        self.usecase = ReferralUseCase(self.repository, self.visit_repo)
+        self.usecase = ReferralUseCase(self.repository, self.visit_repo, SearchIndexer(session))
 
     async def create_referral(self, req: ReferralCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.create_referral(req, profile.id)
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.handlers.base import BaseHandler
+from backend.infrastructure.database.session import get_db
+from backend.module.schedule.entity.schedule_dto import DoctorScheduleCreateDTO, DoctorScheduleDTO
+from backend.module.schedule.repositories.schedule_repository import ScheduleRepository
+from backend.module.schedule.usecases.doctor_availability import AvailabilityUpdater, get_availability_cache
+from backend.module.schedule.usecases.schedule_usecase import ScheduleUseCase
+from backend.pkg.core.response import response_factory
+
+
+class ScheduleHandler(BaseHandler):
+    def __init__(self, session: AsyncSession = Depends(get_db)):
+        super().__init__(session)
+        self.repository = ScheduleRepository(session)
+        self.usecase = ScheduleUseCase(self.repository, AvailabilityUpdater(session), get_availability_cache())
+
+    async def create_schedule(self, clinic_id: UUID, req: DoctorScheduleCreateDTO):
+        schedule = await self.usecase.create_schedule(clinic_id, req)
+        return response_factory.success(
+            data=DoctorScheduleDTO.model_validate(schedule), message="Schedule created successfully"
+        )
+
+    async def list_schedules(self, clinic_id: UUID):
+        schedules = await self.usecase.list_schedules(clinic_id)
+        return response_factory.success(data=[DoctorScheduleDTO.model_validate(s) for s in schedules])
+
+    async def delete_schedule(self, clinic_id: UUID, schedule_id: UUID):
+        await self.usecase.delete_schedule(clinic_id, schedule_id)
+        return response_factory.success(message="Schedule deleted successfully")
+
+    async def search_slots(self, clinic_id: UUID, specialty: Optional[str], count: int, start: Optional[datetime]):
+        slots = await self.usecase.search_slots(clinic_id, specialty, count, start)
+        return response_factory.success(data=slots)
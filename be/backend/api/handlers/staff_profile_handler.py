@@ -1,4 +1,5 @@
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.profile.entity.dto import UpdateStaffProfileDTO
 from backend.module.profile.repositories.profile_repository import ProfileRepository
 from backend.module.profile.usecases.profile_usecase import ProfileUseCase
@@ -13,7 +14,7 @@ class StaffProfileHandler:
     def __init__(self, session: AsyncSession = Depends(get_db)):
         self.user_repo = UserRepository(session)
         self.profile_repo = ProfileRepository(session)
-        self.usecase = ProfileUseCase(self.user_repo, self.profile_repo)
+        self.usecase = ProfileUseCase(self.user_repo, self.profile_repo, SearchIndexer(session))
 
     async def update_profile(
         self,
@@ -0,0 +1,23 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.handlers.base import BaseHandler
+from backend.infrastructure.database.session import get_db
+from backend.module.stats.repositories.visit_stats_repository import VisitStatsRepository
+from backend.module.stats.usecases.visit_stats import VisitStatsUseCase, get_daily_stats_cache
+from backend.module.visit.usecases.visit_queue_board import hospital_today
+from backend.pkg.core.response import response_factory
+
+
+class StatsHandler(BaseHandler):
+    def __init__(self, session: AsyncSession = Depends(get_db)):
+        super().__init__(session)
+        self.repository = VisitStatsRepository(session)
+        self.usecase = VisitStatsUseCase(self.repository, get_daily_stats_cache())
+
+    async def daily_stats(self, day: Optional[date] = None):
+        stats = await self.usecase.daily_stats(day or hospital_today())
+        return response_factory.success(data=stats)
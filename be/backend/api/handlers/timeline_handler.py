@@ -0,0 +1,42 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.handlers.base import BaseHandler
+from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.infrastructure.database.session import get_db
+from backend.module.common.enums import TimelineSectionEnum
+from backend.module.timeline.entity.timeline_dto import PatientTimelineDTO
+from backend.module.timeline.repositories.patient_timeline_repository import PatientTimelineRepository
+from backend.module.timeline.usecases.patient_timeline_usecase import PatientTimelineUseCase
+from backend.pkg.core.response import response_factory
+
+
+class TimelineHandler(BaseHandler):
+    def __init__(self, session: AsyncSession = Depends(get_db)):
+        super().__init__(session)
+        self.repository = PatientTimelineRepository(session)
+        self.usecase = PatientTimelineUseCase(self.repository)
+
+    async def patient_timeline(
+        self,
+        patient_id: UUID,
+        profile: AuthenticatedProfile,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sections: Optional[List[TimelineSectionEnum]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ):
+        included, entries, next_cursor = await self.usecase.patient_timeline(
+            patient_id, profile.id, profile.role, limit, cursor, sections or (), date_from, date_to
+        )
+        return response_factory.success(data=PatientTimelineDTO(
+            patient_id=patient_id,
+            sections=included,
+            entries=entries,
+            next_cursor=next_cursor
+        ))
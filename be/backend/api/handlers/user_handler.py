@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.handlers.base import BaseHandler
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.profile.repositories.profile_repository import ProfileRepository
 from backend.module.profile.usecases.profile_usecase import ProfileUseCase
 from backend.module.user.entity.admin_dto import CreateUserDTO
@@ -17,8 +18,8 @@ class AdminUserHandler(BaseHandler):
         super().__init__(session)
         self.user_repository = UserRepository(session)
         self.profile_repository = ProfileRepository(session)
-        self.usecase = AdminUseCase(self.user_repository)
-        self.profile_usecase = ProfileUseCase(self.user_repository, self.profile_repository)
+        self.usecase = AdminUseCase(self.user_repository, SearchIndexer(session))
+        self.profile_usecase = ProfileUseCase(self.user_repository, self.profile_repository, SearchIndexer(session))
 
     async def create_user(self, req: CreateUserDTO):
         user = await self.usecase.create_user(req)
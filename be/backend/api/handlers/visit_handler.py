@@ -1,27 +1,45 @@
+from datetime import date
 from typing import Optional
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.handlers.base import BaseHandler
 from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.infrastructure.config.settings import settings
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.pubsub.hub import get_pubsub_hub
+from backend.module.schedule.usecases.doctor_availability import AvailabilityUpdater
+from backend.module.stats.usecases.visit_stats import VisitStatsRecorder
 from backend.module.visit.entity.visit_dto import (
     VisitCreateDTO,
     VisitDTO,
+    VisitListItemDTO,
     VisitUpdateDTO,
 )
 from backend.module.visit.repositories.visit_repository import VisitRepository
+from backend.module.visit.usecases.visit_queue_board import (
+    QueueBoard,
+    QueueEvent,
+    VisitQueuePublisher,
+    get_queue_board_cache,
+    hospital_today,
+    queue_topic,
+)
 from backend.module.visit.usecases.visit_usecase import VisitUseCase
 from backend.pkg.core.response import response_factory
+from backend.pkg.core.sse import sse_event, sse_response
 
 
 class VisitHandler(BaseHandler):
     def __init__(self, session: AsyncSession = Depends(get_db)):
         super().__init__(session)
         self.repository = VisitRepository(session)
-        self.usecase = VisitUseCase(self.repository)
+        self.usecase = VisitUseCase(
+            self.repository, VisitQueuePublisher(session), get_queue_board_cache(), AvailabilityUpdater(session),
+            VisitStatsRecorder(session)
+        )
 
     async def create_visit(self, req: VisitCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.create_visit(req, profile.id)
@@ -46,12 +64,16 @@ class VisitHandler(BaseHandler):
             date_to=date_to
         )
         return response_factory.success_list(
-            data=[VisitDTO.model_validate(v) for v in visits],
+            data=[VisitListItemDTO.model_validate(v) for v in visits],
             total=total,
             limit=limit,
             offset=(page - 1) * limit
         )
 
+    async def doctor_worklist(self, profile: AuthenticatedProfile, day: Optional[date] = None):
+        result = await self.usecase.doctor_worklist(profile.id, day or hospital_today())
+        return response_factory.success(data=result)
+
     async def get_visit(self, visit_id: UUID, profile: AuthenticatedProfile):
         result = await self.usecase.get_visit(visit_id, profile.id, profile.role)
         return response_factory.success(data=VisitDTO.model_validate(result))
@@ -63,3 +85,47 @@ class VisitHandler(BaseHandler):
     async def delete_visit(self, visit_id: UUID, profile: AuthenticatedProfile):
         await self.usecase.delete_visit(visit_id)
         return response_factory.success(message="Visit deleted successfully")
+
+    async def queue_board(self, clinic_id: UUID, queue_date: Optional[date] = None):
+        result = await self.usecase.queue_board(clinic_id, queue_date or hospital_today())
+        return response_factory.success(data=result)
+
+    async def stream_queue_board(
+        self, clinic_id: UUID, request: Request, queue_date: Optional[date] = None, last_event_id: Optional[str] = None
+    ):
+        # The board is loaded here (from the database on a miss); the stream itself only reads memory
+        board = await self.usecase.load_queue_board(clinic_id, queue_date or hospital_today())
+        resume_after = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+        return sse_response(self._queue_events(request, board, resume_after))
+
+    @staticmethod
+    async def _queue_events(request: Request, board: QueueBoard, resume_after: Optional[int]):
+        """
+        A snapshot of the board (or, when resuming, the events missed since Last-Event-ID), then
+        each queue event as it commits. A screen that falls behind is disconnected and resumes.
+        """
+        key = (board.clinic_id, board.queue_date)
+        with get_pubsub_hub().subscribe([queue_topic(board.clinic_id)]) as subscription:
+            # Subscribed before reading the board, so every later event arrives on the subscription
+            board = get_queue_board_cache().get(key) or board
+            yield "retry: 3000\n\n"
+            missed = board.events_after(resume_after) if resume_after is not None else None
+            if missed is None:
+                yield sse_event("snapshot", board.snapshot().model_dump_json(), board.event_id)
+            else:
+                for event_id, payload in missed:
+                    yield sse_event("visit", payload, event_id)
+            sent = board.event_id
+
+            while not await request.is_disconnected():
+                message = await subscription.get(timeout=settings.QUEUE_BOARD_STREAM_HEARTBEAT_SECONDS)
+                if message is None:
+                    yield ": keep-alive\n\n"
+                    continue
+                if subscription.take_dropped():
+                    return  # Events were lost: the client reconnects with its Last-Event-ID
+                event = QueueEvent.decode(message)
+                if event.queue_date != board.queue_date or event.event_id <= sent:
+                    continue
+                yield sse_event("visit", event.public(), event.event_id)
+                sent = event.event_id
@@ -0,0 +1,67 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.handlers.base import BaseHandler
+from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.infrastructure.database.session import get_db
+from backend.module.common.enums import WearableMetricEnum
+from backend.module.wearable.entity.wearable_dto import (
+    WearableAlertDTO,
+    WearableAlertThresholdDTO,
+    WearableAlertThresholdUpdateDTO,
+)
+from backend.module.wearable.repositories.wearable_alert_repository import WearableAlertRepository
+from backend.module.wearable.usecases.wearable_alert_usecase import WearableAlertUseCase
+from backend.pkg.core.response import response_factory
+
+
+class WearableAlertHandler(BaseHandler):
+    def __init__(self, session: AsyncSession = Depends(get_db)):
+        super().__init__(session)
+        self.repository = WearableAlertRepository(session)
+        self.usecase = WearableAlertUseCase(self.repository)
+
+    async def list_alerts(
+        self,
+        profile: AuthenticatedProfile,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: Optional[UUID] = None,
+        device_id: Optional[UUID] = None,
+        unacknowledged_only: bool = False
+    ):
+        alerts, total = await self.usecase.list_alerts(
+            page, limit, profile.id, profile.role, patient_id, device_id, unacknowledged_only
+        )
+        return response_factory.success_list(
+            data=[WearableAlertDTO.model_validate(a) for a in alerts],
+            total=total,
+            limit=limit,
+            offset=(page - 1) * limit
+        )
+
+    async def acknowledge_alert(self, alert_id: UUID, profile: AuthenticatedProfile):
+        result = await self.usecase.acknowledge_alert(alert_id, profile.id)
+        return response_factory.success(data=WearableAlertDTO.model_validate(result), message="Alert acknowledged")
+
+    async def list_thresholds(self, patient_id: UUID, profile: AuthenticatedProfile):
+        result = await self.usecase.list_thresholds(patient_id, profile.id, profile.role)
+        return response_factory.success(data=[WearableAlertThresholdDTO(**t) for t in result])
+
+    async def set_threshold(
+        self, patient_id: UUID, metric: WearableMetricEnum, req: WearableAlertThresholdUpdateDTO, profile: AuthenticatedProfile
+    ):
+        result = await self.usecase.set_threshold(patient_id, metric, req, profile.id)
+        return response_factory.success(
+            data=WearableAlertThresholdDTO(
+                metric=metric, min_value=result.min_value, max_value=result.max_value, is_override=True
+            ),
+            message="Threshold updated"
+        )
+
+    async def delete_threshold(self, patient_id: UUID, metric: WearableMetricEnum):
+        await self.usecase.delete_threshold(patient_id, metric)
+        return response_factory.success(message="Threshold reset to default")
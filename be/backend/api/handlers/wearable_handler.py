@@ -1,31 +1,56 @@
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.api.handlers.base import BaseHandler
-from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.api.middleware.auth_dto import AuthenticatedDevice, AuthenticatedProfile
+from backend.infrastructure.config.settings import settings
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.pubsub.hub import get_pubsub_hub
+from backend.module.common.enums import WearableBucketEnum, WearableMetricEnum
 from backend.module.wearable.entity.wearable_dto import (
+    WearableAggregateBucketDTO,
+    WearableAggregateDTO,
     WearableDeviceCreateDTO,
     WearableDeviceDTO,
+    WearableDeviceKeyCreatedDTO,
+    WearableDeviceKeyDTO,
     WearableDeviceUpdateDTO,
+    WearableIngestMetricsDTO,
+    WearableIngestResultDTO,
+    WearableLatestVitalsDTO,
     WearableMeasurementCreateDTO,
     WearableMeasurementDTO,
+    WearableTimelineDTO,
 )
+from backend.module.wearable.repositories.wearable_ingest_repository import WearableIngestRepository
 from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.usecases.wearable_columnar import decode_batch
+from backend.module.wearable.usecases.wearable_device_auth import get_device_key_cache
+from backend.module.wearable.usecases.wearable_publisher import (
+    VitalsPublisher,
+    device_topic,
+    patient_topic,
+)
 from backend.module.wearable.usecases.wearable_usecase import WearableUseCase
+from backend.module.wearable.usecases.wearable_vitals_cache import get_vitals_cache
+from backend.module.wearable.usecases.wearable_write_behind import get_write_behind
 from backend.pkg.core.response import response_factory
+from backend.pkg.core.sse import event_stream, sse_response
 
 
 class WearableHandler(BaseHandler):
     def __init__(self, session: AsyncSession = Depends(get_db)):
         super().__init__(session)
         self.repository = WearableRepository(session)
-        self.usecase = WearableUseCase(self.repository)
+        self.usecase = WearableUseCase(
+            self.repository, VitalsPublisher(session), get_vitals_cache(), get_write_behind(), get_device_key_cache(),
+            WearableIngestRepository(session)
+        )
 
     async def create_device(self, req: WearableDeviceCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.create_device(req, profile.id, profile.role)
@@ -52,6 +77,30 @@ class WearableHandler(BaseHandler):
         await self.usecase.delete_device(device_id, profile.id, profile.role)
         return response_factory.success(message="Device deleted")
 
+    async def create_device_key(self, device_id: UUID, profile: AuthenticatedProfile):
+        key, secret = await self.usecase.create_device_key(device_id, profile.id, profile.role)
+        return response_factory.success(
+            data=WearableDeviceKeyCreatedDTO(**WearableDeviceKeyDTO.model_validate(key).model_dump(), secret=secret),
+            message="Device key created. Store the secret now; it is not shown again"
+        )
+
+    async def list_device_keys(self, device_id: UUID, profile: AuthenticatedProfile):
+        keys = await self.usecase.list_device_keys(device_id, profile.id, profile.role)
+        return response_factory.success(data=[WearableDeviceKeyDTO.model_validate(k) for k in keys])
+
+    async def revoke_device_key(self, device_id: UUID, key_id: str, profile: AuthenticatedProfile):
+        result = await self.usecase.revoke_device_key(device_id, key_id, profile.id, profile.role)
+        return response_factory.success(data=WearableDeviceKeyDTO.model_validate(result), message="Device key revoked")
+
+    async def ingest_readings(self, request: Request, device: AuthenticatedDevice):
+        # The body was already read (and cached by Starlette) to verify the signature
+        columns = decode_batch(request.headers.get("content-type"), await request.body())
+        accepted = await self.usecase.ingest_readings(device.device_id, device.patient_id, columns)
+        return response_factory.success(
+            data=WearableIngestResultDTO(device_id=device.device_id, accepted=accepted),
+            message="Readings accepted"
+        )
+
     async def add_measurement(self, device_id: UUID, req: WearableMeasurementCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.add_measurement(device_id, req, profile.id, profile.role)
         return response_factory.success(data=WearableMeasurementDTO.model_validate(result), message="Measurement created")
@@ -74,3 +123,77 @@ class WearableHandler(BaseHandler):
             limit=limit,
             offset=(page - 1) * limit
         )
+
+    async def latest_readings(self, device_id: UUID, profile: AuthenticatedProfile, limit: int = 10):
+        ring, _ = await self.usecase.latest_readings(device_id, limit, profile.id, profile.role)
+        return response_factory.success(data=WearableLatestVitalsDTO(
+            device_id=device_id,
+            patient_id=ring.patient_id,
+            vitals=ring.vitals(),
+            readings=ring.readings(device_id, limit)
+        ))
+
+    async def patient_timeline(
+        self,
+        patient_id: UUID,
+        profile: AuthenticatedProfile,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        metrics: Optional[List[WearableMetricEnum]] = None
+    ):
+        readings, next_cursor = await self.usecase.patient_timeline(
+            patient_id, limit, profile.id, profile.role, cursor, date_from, date_to, metrics or ()
+        )
+        return response_factory.success(data=WearableTimelineDTO(
+            patient_id=patient_id,
+            readings=[WearableMeasurementDTO.model_validate(r) for r in readings],
+            next_cursor=next_cursor
+        ))
+
+    async def ingest_metrics(self):
+        write_behind = get_write_behind()
+        return response_factory.success(data=WearableIngestMetricsDTO(
+            write_behind_enabled=write_behind is not None,
+            **(write_behind.metrics() if write_behind else {})
+        ))
+
+    async def aggregate_measurements(
+        self,
+        device_id: UUID,
+        bucket: WearableBucketEnum,
+        date_from: datetime,
+        date_to: datetime,
+        profile: AuthenticatedProfile
+    ):
+        resolution, date_from, date_to, rows = await self.usecase.aggregate_measurements(
+            device_id, bucket, date_from, date_to, profile.id, profile.role
+        )
+        return response_factory.success(data=WearableAggregateDTO(
+            device_id=device_id,
+            bucket=bucket,
+            resolution=resolution,
+            date_from=date_from,
+            date_to=date_to,
+            buckets=[WearableAggregateBucketDTO.model_validate(r) for r in rows]
+        ))
+
+    async def stream_device(self, device_id: UUID, profile: AuthenticatedProfile, request: Request):
+        # Ownership is checked once; the stream itself never touches the database
+        await self.usecase.get_device(device_id, profile.id, profile.role)
+        return self._stream(request, [device_topic(device_id)])
+
+    async def stream_patient(self, patient_id: UUID, profile: AuthenticatedProfile, request: Request):
+        await self.usecase.authorize_patient(patient_id, profile.id, profile.role)
+        return self._stream(request, [patient_topic(patient_id)])
+
+    @staticmethod
+    def _stream(request: Request, topics):
+        hub = get_pubsub_hub()
+        return sse_response(event_stream(
+            request,
+            lambda: hub.subscribe(topics),
+            event="reading",
+            heartbeat_seconds=settings.WEARABLE_STREAM_HEARTBEAT_SECONDS,
+        ))
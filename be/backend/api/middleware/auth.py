@@ -1,5 +1,7 @@
 
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 from uuid import UUID
 
 from fastapi import Depends
@@ -80,6 +82,52 @@ async def get_current_profile(
     )
 
 
+class SessionCache:
+    """Profiles of access tokens whose session and user were checked in the database, for the TTL."""
+
+    def __init__(self, ttl_seconds: float, max_tokens: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_tokens = max_tokens
+        self._entries: "OrderedDict[str, Tuple[float, AuthenticatedProfile]]" = OrderedDict()
+
+    def get(self, token: str) -> Optional[AuthenticatedProfile]:
+        entry = self._entries.get(token)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            return None
+        self._entries.move_to_end(token)
+        return entry[1]
+
+    def put(self, token: str, profile: AuthenticatedProfile) -> None:
+        self._entries[token] = (time.monotonic(), profile)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_tokens:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+session_cache = SessionCache(settings.AUTH_SESSION_CACHE_TTL_SECONDS, settings.AUTH_SESSION_CACHE_SIZE)
+
+
+async def get_cached_profile(
+    token: str = Depends(oauth2_scheme),
+    session: AsyncSession = Depends(get_db),
+) -> AuthenticatedProfile:
+    """
+    get_current_profile for endpoints polled by many clients: the token's signature and expiry are
+    checked on every request, its session and user only once per AUTH_SESSION_CACHE_TTL_SECONDS.
+    """
+    if decode_access_token(token) is None:
+        raise AuthenticationException("Could not validate credentials")
+    profile = session_cache.get(token)
+    if profile is None:
+        user = await get_current_user(token, session)
+        profile = await get_current_profile(token, user)
+        session_cache.put(token, profile)
+    return profile
+
+
 # =============================================================================
 # Authorization Checkers (Middleware Dependencies)
 # =============================================================================
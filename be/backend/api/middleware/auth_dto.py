@@ -13,3 +13,10 @@ class AuthenticatedProfile(BaseModel):
     department: Optional[str] = None  # For staff department checks
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+class AuthenticatedDevice(BaseModel):
+    """Device context established from a signed ingestion request."""
+    device_id: UUID
+    patient_id: UUID
+    key_id: str
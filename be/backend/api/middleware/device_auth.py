@@ -0,0 +1,33 @@
+from typing import Optional
+
+from fastapi import Depends, Header, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.api.middleware.auth_dto import AuthenticatedDevice
+from backend.infrastructure.database.session import get_db
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.usecases.wearable_device_auth import (
+    WearableDeviceAuthUseCase,
+    get_device_key_cache,
+    get_device_replay_cache,
+)
+
+
+async def get_current_device(
+    request: Request,
+    key_id: Optional[str] = Header(None, alias="X-Device-Key"),
+    timestamp: Optional[str] = Header(None, alias="X-Device-Timestamp"),
+    signature: Optional[str] = Header(None, alias="X-Device-Signature"),
+    session: AsyncSession = Depends(get_db),
+) -> AuthenticatedDevice:
+    """
+    Authenticates a device-signed request: X-Device-Signature is the hex HMAC-SHA256 of
+    "<X-Device-Timestamp>.<raw body>" keyed with the device key's secret.
+    No user or session lookup; the key is usually served from the in-memory cache.
+    """
+    body = await request.body()
+    usecase = WearableDeviceAuthUseCase(
+        WearableRepository(session), get_device_key_cache(), get_device_replay_cache()
+    )
+    grant = await usecase.authenticate(key_id, timestamp, signature, body)
+    return AuthenticatedDevice(device_id=grant.device_id, patient_id=grant.patient_id, key_id=grant.key_id)
@@ -1,17 +1,27 @@
 
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
 
 from backend.api.handlers.clinic_handler import ClinicHandler
-from backend.api.middleware.auth import get_current_profile, require_admin
+from backend.api.handlers.schedule_handler import ScheduleHandler
+from backend.api.handlers.visit_handler import VisitHandler
+from backend.api.middleware.auth import get_cached_profile, get_current_profile, require_admin
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.module.clinic.entity.clinic_dto import (
     ClinicCreateDTO,
     ClinicDTO,
     ClinicUpdateDTO,
 )
+from backend.module.schedule.entity.schedule_dto import (
+    AvailableSlotDTO,
+    DoctorScheduleCreateDTO,
+    DoctorScheduleDTO,
+)
+from backend.module.visit.entity.visit_dto import QueueBoardDTO
 from backend.pkg.core.response import ApiResponse
 from backend.pkg.core.response_models import PaginatedApiResponse
 
@@ -69,3 +79,78 @@ async def delete_clinic(
 ):
     """Delete a clinic. Admin only."""
     return await handler.delete_clinic(clinic_id)
+
+
+@router.get("/{clinic_id}/queue", response_model=ApiResponse[QueueBoardDTO])
+async def queue_board(
+    clinic_id: UUID,
+    queue_date: Optional[date] = None,
+    profile: AuthenticatedProfile = Depends(get_cached_profile),
+    handler: VisitHandler = Depends()
+):
+    """
+    Clinic queue board for a day near today (default today): waiting, examining, done. Any authenticated
+    user; polls within AUTH_SESSION_CACHE_TTL_SECONDS of a checked one read no database.
+    """
+    return await handler.queue_board(clinic_id, queue_date)
+
+
+@router.get("/{clinic_id}/queue/stream", response_class=StreamingResponse)
+async def stream_queue_board(
+    clinic_id: UUID,
+    request: Request,
+    queue_date: Optional[date] = None,
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    profile: AuthenticatedProfile = Depends(get_cached_profile),
+    handler: VisitHandler = Depends()
+):
+    """
+    Queue board as server-sent events: a snapshot, then each queue change; resumes from Last-Event-ID.
+    Any authenticated user, checked once when the stream is opened.
+    """
+    return await handler.stream_queue_board(clinic_id, request, queue_date, last_event_id)
+
+
+@router.post("/{clinic_id}/schedules", response_model=ApiResponse[DoctorScheduleDTO], dependencies=[Depends(require_admin)])
+async def create_schedule(
+    clinic_id: UUID,
+    req: DoctorScheduleCreateDTO,
+    handler: ScheduleHandler = Depends()
+):
+    """Add a weekly working block of a doctor in the clinic. Admin only."""
+    return await handler.create_schedule(clinic_id, req)
+
+
+@router.get("/{clinic_id}/schedules", response_model=ApiResponse[List[DoctorScheduleDTO]])
+async def list_schedules(
+    clinic_id: UUID,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: ScheduleHandler = Depends()
+):
+    """Weekly doctor schedules of a clinic. Any authenticated user."""
+    return await handler.list_schedules(clinic_id)
+
+
+@router.delete(
+    "/{clinic_id}/schedules/{schedule_id}", response_model=ApiResponse, dependencies=[Depends(require_admin)]
+)
+async def delete_schedule(
+    clinic_id: UUID,
+    schedule_id: UUID,
+    handler: ScheduleHandler = Depends()
+):
+    """Remove a doctor schedule block. Admin only."""
+    return await handler.delete_schedule(clinic_id, schedule_id)
+
+
+@router.get("/{clinic_id}/slots", response_model=ApiResponse[List[AvailableSlotDTO]])
+async def search_slots(
+    clinic_id: UUID,
+    specialty: Optional[str] = None,
+    count: int = 10,
+    start: Optional[datetime] = None,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: ScheduleHandler = Depends()
+):
+    """First free appointment slots in the clinic from `start` (default now), optionally for a specialty. Any authenticated user."""
+    return await handler.search_slots(clinic_id, specialty, count, start)
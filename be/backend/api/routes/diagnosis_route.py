@@ -0,0 +1,35 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from backend.api.handlers.diagnosis_handler import DiagnosisHandler
+from backend.api.middleware.auth import get_current_profile
+from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.module.diagnosis.entity.diagnosis_dto import DiagnosisCodeDTO
+from backend.pkg.core.response import ApiResponse
+
+router = APIRouter(
+    prefix="/diagnoses",
+    tags=["diagnoses"],
+)
+
+
+@router.get("/search", response_model=ApiResponse[List[DiagnosisCodeDTO]])
+async def search_diagnoses(
+    q: str,
+    limit: int = 10,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: DiagnosisHandler = Depends()
+):
+    """Autocomplete ICD-10 diagnosis codes by code or description words. Any authenticated user."""
+    return await handler.search_diagnoses(q, limit)
+
+
+@router.get("/{code}", response_model=ApiResponse[DiagnosisCodeDTO])
+async def get_diagnosis(
+    code: str,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: DiagnosisHandler = Depends()
+):
+    """Get an ICD-10 diagnosis code (J06.9 or J069). Any authenticated user."""
+    return await handler.get_diagnosis(code)
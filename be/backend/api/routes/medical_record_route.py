@@ -13,7 +13,11 @@ from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.module.medical_record.entity.medical_record_dto import (
     MedicalRecordCreateDTO,
     MedicalRecordDTO,
+    MedicalRecordRevisionsDTO,
+    MedicalRecordSearchResultDTO,
+    MedicalRecordSummaryDTO,
     MedicalRecordUpdateDTO,
+    MedicalRecordVersionDTO,
 )
 from backend.pkg.core.response import ApiResponse
 from backend.pkg.core.response_models import PaginatedApiResponse
@@ -48,6 +52,34 @@ async def list_medical_records(
     return await handler.list_medical_records(profile, page, limit, patient_id, doctor_id, visit_id)
 
 
+@router.get("/summaries", response_model=PaginatedApiResponse[List[MedicalRecordSummaryDTO]])
+async def list_medical_record_summaries(
+    page: int = 1,
+    limit: int = 10,
+    patient_id: Optional[UUID] = None,
+    doctor_id: Optional[UUID] = None,
+    visit_id: Optional[UUID] = None,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: MedicalRecordHandler = Depends()
+):
+    """List medical records for list screens: visit, outcome, codes and the start of the diagnosis, no notes. Filtered by role."""
+    return await handler.list_medical_record_summaries(profile, page, limit, patient_id, doctor_id, visit_id)
+
+
+@router.get("/search", response_model=PaginatedApiResponse[List[MedicalRecordSearchResultDTO]])
+async def search_medical_records(
+    q: str,
+    page: int = 1,
+    limit: int = 10,
+    patient_id: Optional[UUID] = None,
+    doctor_id: Optional[UUID] = None,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: MedicalRecordHandler = Depends()
+):
+    """Full-text search of medical records (Indonesian and English), ranked, with highlights. Filtered by role."""
+    return await handler.search_medical_records(profile, q, page, limit, patient_id, doctor_id)
+
+
 @router.get("/{record_id}", response_model=ApiResponse[MedicalRecordDTO])
 async def get_medical_record(
     record_id: UUID,
@@ -58,6 +90,29 @@ async def get_medical_record(
     return await handler.get_medical_record(record_id, profile)
 
 
+@router.get("/{record_id}/revisions", response_model=ApiResponse[MedicalRecordRevisionsDTO])
+async def list_medical_record_revisions(
+    record_id: UUID,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: MedicalRecordHandler = Depends()
+):
+    """A medical record's revisions, newest first, keyset-paginated. Authorized by ownership."""
+    return await handler.list_medical_record_revisions(record_id, profile, limit, cursor)
+
+
+@router.get("/{record_id}/revisions/{revision}", response_model=ApiResponse[MedicalRecordVersionDTO])
+async def get_medical_record_version(
+    record_id: UUID,
+    revision: int,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: MedicalRecordHandler = Depends()
+):
+    """A medical record as it was at a revision. Authorized by ownership."""
+    return await handler.get_medical_record_version(record_id, revision, profile)
+
+
 @router.put("/{record_id}", response_model=ApiResponse[MedicalRecordDTO], dependencies=[Depends(require_doctor)])
 async def update_medical_record(
     record_id: UUID,
@@ -9,6 +9,7 @@ from backend.api.handlers.base import BaseHandler
 from backend.api.middleware.auth import get_current_profile, require_pharmacy_access
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.infrastructure.database.session import get_db
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.medicine.entity.medicine_dto import (
     MedicineCreateDTO,
     MedicineDTO,
@@ -24,7 +25,7 @@ class MedicineHandler(BaseHandler):
     def __init__(self, session: AsyncSession = Depends(get_db)):
         super().__init__(session)
         self.repository = MedicineRepository(session)
-        self.usecase = MedicineUseCase(self.repository)
+        self.usecase = MedicineUseCase(self.repository, SearchIndexer(session))
 
     async def create_medicine(self, req: MedicineCreateDTO, profile: AuthenticatedProfile):
         result = await self.usecase.create_medicine(req)
@@ -0,0 +1,27 @@
+from typing import List
+
+from fastapi import APIRouter, Depends
+
+from backend.api.handlers.patient_search_handler import PatientSearchHandler
+from backend.api.middleware.auth import require_registration_access
+from backend.module.profile.entity.dao import PatientSearchResultDAO
+from backend.pkg.core.response import ApiResponse
+
+router = APIRouter(
+    prefix="/patients",
+    tags=["patients"],
+)
+
+
+@router.get(
+    "/search",
+    response_model=ApiResponse[List[PatientSearchResultDAO]],
+    dependencies=[Depends(require_registration_access)]
+)
+async def search_patients(
+    q: str,
+    limit: int = 10,
+    handler: PatientSearchHandler = Depends()
+):
+    """Find patients by NIK or BPJS number (leading digits) or by name, best match first. Admin or Registration Staff only."""
+    return await handler.search_patients(q, limit)
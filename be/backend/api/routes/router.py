@@ -3,14 +3,18 @@ from fastapi import APIRouter
 from backend.api.routes import (
     auth_route,
     clinic_route,
+    diagnosis_route,
     health_route,
     invoice_route,
     lab_route,
     medical_record_route,
     medicine_route,
+    patient_route,
     prescription_route,
     profile_route,
     referral_route,
+    stats_route,
+    timeline_route,
     user_route,
     visit_route,
     wearable_route,
@@ -30,10 +34,14 @@ api_router.include_router(profile_route.router) # /profile
 
 api_router.include_router(visit_route.router)
 api_router.include_router(medical_record_route.router)
+api_router.include_router(diagnosis_route.router)
 api_router.include_router(medicine_route.router)
 api_router.include_router(prescription_route.router)
 api_router.include_router(lab_route.router)
 api_router.include_router(referral_route.router)
 api_router.include_router(invoice_route.router)
 api_router.include_router(wearable_route.router)
+api_router.include_router(patient_route.router)
+api_router.include_router(timeline_route.router)
+api_router.include_router(stats_route.router)
 api_router.include_router(health_route.router)
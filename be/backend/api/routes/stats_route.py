@@ -0,0 +1,23 @@
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends
+
+from backend.api.handlers.stats_handler import StatsHandler
+from backend.api.middleware.auth import require_admin
+from backend.module.stats.entity.visit_stats_dto import DailyStatsDTO
+from backend.pkg.core.response import ApiResponse
+
+router = APIRouter(
+    prefix="/stats",
+    tags=["stats"],
+)
+
+
+@router.get("/daily", response_model=ApiResponse[DailyStatsDTO], dependencies=[Depends(require_admin)])
+async def daily_stats(
+    day: Optional[date] = None,
+    handler: StatsHandler = Depends()
+):
+    """Visit census of a day (default today): per clinic, status and type, waits, completed per doctor. Admin only."""
+    return await handler.daily_stats(day)
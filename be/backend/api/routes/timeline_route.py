@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+
+from backend.api.handlers.timeline_handler import TimelineHandler
+from backend.api.middleware.auth import get_current_profile
+from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.module.common.enums import TimelineSectionEnum
+from backend.module.timeline.entity.timeline_dto import PatientTimelineDTO
+from backend.pkg.core.response import ApiResponse
+
+router = APIRouter(
+    prefix="/patients",
+    tags=["timeline"],
+)
+
+
+@router.get("/{patient_id}/timeline", response_model=ApiResponse[PatientTimelineDTO])
+async def patient_timeline(
+    patient_id: UUID,
+    limit: int = 50,
+    cursor: Optional[str] = None,
+    sections: Optional[List[TimelineSectionEnum]] = Query(None),
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: TimelineHandler = Depends()
+):
+    """A patient's merged history across modules, newest first, keyset-paginated. Filtered by role."""
+    return await handler.patient_timeline(patient_id, profile, limit, cursor, sections, date_from, date_to)
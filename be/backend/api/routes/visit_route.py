@@ -1,3 +1,4 @@
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
@@ -7,13 +8,16 @@ from backend.api.handlers.visit_handler import VisitHandler
 from backend.api.middleware.auth import (
     get_current_profile,
     require_admin_or_doctor,
+    require_doctor,
     require_registration_access,
 )
 from backend.api.middleware.auth_dto import AuthenticatedProfile
 from backend.module.visit.entity.visit_dto import (
     VisitCreateDTO,
     VisitDTO,
+    VisitListItemDTO,
     VisitUpdateDTO,
+    WorklistItemDTO,
 )
 from backend.pkg.core.response import ApiResponse
 from backend.pkg.core.response_models import PaginatedApiResponse
@@ -34,7 +38,7 @@ async def create_visit(
     return await handler.create_visit(req, profile)
 
 
-@router.get("", response_model=PaginatedApiResponse[List[VisitDTO]])
+@router.get("", response_model=PaginatedApiResponse[List[VisitListItemDTO]])
 async def list_visits(
     page: int = 1,
     limit: int = 10,
@@ -48,6 +52,16 @@ async def list_visits(
     return await handler.list_visits(profile, page, limit, visit_status, date_from, date_to)
 
 
+@router.get("/worklist", response_model=ApiResponse[List[WorklistItemDTO]], dependencies=[Depends(require_doctor)])
+async def doctor_worklist(
+    day: Optional[date] = None,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: VisitHandler = Depends()
+):
+    """The current doctor's visits for a day (default today) with their open work. Doctor only."""
+    return await handler.doctor_worklist(profile, day)
+
+
 @router.get("/{visit_id}", response_model=ApiResponse[VisitDTO])
 async def get_visit(
     visit_id: UUID,
@@ -3,17 +3,36 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 
+from backend.api.handlers.wearable_alert_handler import WearableAlertHandler
 from backend.api.handlers.wearable_handler import WearableHandler
-from backend.api.middleware.auth import get_current_profile, require_patient
-from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.api.middleware.auth import (
+    get_current_profile,
+    require_admin,
+    require_doctor,
+    require_patient,
+)
+from backend.api.middleware.auth_dto import AuthenticatedDevice, AuthenticatedProfile
+from backend.api.middleware.device_auth import get_current_device
+from backend.module.common.enums import WearableBucketEnum, WearableMetricEnum
 from backend.module.wearable.entity.wearable_dto import (
+    WearableAggregateDTO,
+    WearableAlertDTO,
+    WearableAlertThresholdDTO,
+    WearableAlertThresholdUpdateDTO,
     WearableDeviceCreateDTO,
     WearableDeviceDTO,
+    WearableDeviceKeyCreatedDTO,
+    WearableDeviceKeyDTO,
     WearableDeviceUpdateDTO,
+    WearableIngestMetricsDTO,
+    WearableIngestResultDTO,
+    WearableLatestVitalsDTO,
     WearableMeasurementCreateDTO,
     WearableMeasurementDTO,
+    WearableTimelineDTO,
 )
 from backend.pkg.core.response import ApiResponse
 from backend.pkg.core.response_models import PaginatedApiResponse
@@ -76,6 +95,55 @@ async def delete_device(
     return await handler.delete_device(device_id, profile)
 
 
+@router.post("/devices/{device_id}/keys", response_model=ApiResponse[WearableDeviceKeyCreatedDTO], dependencies=[Depends(require_patient)])
+async def create_device_key(
+    device_id: UUID,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Issue a device API key (rotates: previous keys expire after the grace period). Patient only."""
+    return await handler.create_device_key(device_id, profile)
+
+
+@router.get("/devices/{device_id}/keys", response_model=ApiResponse[List[WearableDeviceKeyDTO]], dependencies=[Depends(require_patient)])
+async def list_device_keys(
+    device_id: UUID,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """List a device's API keys (without secrets). Patient only."""
+    return await handler.list_device_keys(device_id, profile)
+
+
+@router.delete("/devices/{device_id}/keys/{key_id}", response_model=ApiResponse[WearableDeviceKeyDTO], dependencies=[Depends(require_patient)])
+async def revoke_device_key(
+    device_id: UUID,
+    key_id: str,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Revoke a device API key immediately. Patient only."""
+    return await handler.revoke_device_key(device_id, key_id, profile)
+
+
+@router.post(
+    "/ingest",
+    response_model=ApiResponse[WearableIngestResultDTO],
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "application/json": {"schema": {"type": "object", "title": "WearableMeasurementBatchCreateDTO"}},
+        "application/msgpack": {"schema": {"type": "string", "format": "binary"}},
+        "application/cbor": {"schema": {"type": "string", "format": "binary"}},
+    }}},
+)
+async def ingest_readings(
+    request: Request,
+    device: AuthenticatedDevice = Depends(get_current_device),
+    handler: WearableHandler = Depends()
+):
+    """Batch upload signed with a device API key; JSON, or columnar MessagePack/CBOR by Content-Type."""
+    return await handler.ingest_readings(request, device)
+
+
 @router.post("/devices/{device_id}/measurements", response_model=ApiResponse[WearableMeasurementDTO], dependencies=[Depends(require_patient)])
 async def add_measurement(
     device_id: UUID,
@@ -87,6 +155,12 @@ async def add_measurement(
     return await handler.add_measurement(device_id, req, profile)
 
 
+@router.get("/ingest/metrics", response_model=ApiResponse[WearableIngestMetricsDTO], dependencies=[Depends(require_admin)])
+async def ingest_metrics(handler: WearableHandler = Depends()):
+    """Write-behind ingestion backlog, lag and flush throughput. Admin only."""
+    return await handler.ingest_metrics()
+
+
 @router.get("/devices/{device_id}/measurements", response_model=PaginatedApiResponse[List[WearableMeasurementDTO]])
 async def list_measurements(
     device_id: UUID,
@@ -99,3 +173,120 @@ async def list_measurements(
 ):
     """List measurements for a device. Authorized by ownership."""
     return await handler.list_measurements(device_id, profile, page, limit, date_from, date_to)
+
+
+@router.get("/devices/{device_id}/latest", response_model=ApiResponse[WearableLatestVitalsDTO])
+async def latest_readings(
+    device_id: UUID,
+    limit: int = 10,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Latest vitals and last readings of a device, served from the in-memory cache. Authorized by ownership."""
+    return await handler.latest_readings(device_id, profile, limit)
+
+
+@router.get("/devices/{device_id}/stream", response_class=StreamingResponse)
+async def stream_device(
+    device_id: UUID,
+    request: Request,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Live readings of a device as server-sent events. Authorized by ownership."""
+    return await handler.stream_device(device_id, profile, request)
+
+
+@router.get("/patients/{patient_id}/stream", response_class=StreamingResponse)
+async def stream_patient(
+    patient_id: UUID,
+    request: Request,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Live readings of all a patient's devices as server-sent events. Patient (own) or doctor."""
+    return await handler.stream_patient(patient_id, profile, request)
+
+
+@router.get("/patients/{patient_id}/timeline", response_model=ApiResponse[WearableTimelineDTO])
+async def patient_timeline(
+    patient_id: UUID,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    metrics: Optional[List[WearableMetricEnum]] = Query(None),
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Newest-first readings of all a patient's devices, keyset-paginated. Patient (own) or doctor."""
+    return await handler.patient_timeline(patient_id, profile, limit, cursor, date_from, date_to, metrics)
+
+
+@router.get("/devices/{device_id}/measurements/aggregate", response_model=ApiResponse[WearableAggregateDTO])
+async def aggregate_measurements(
+    device_id: UUID,
+    date_from: datetime,
+    date_to: datetime,
+    bucket: WearableBucketEnum = WearableBucketEnum.HOUR_1,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableHandler = Depends()
+):
+    """Aggregate measurements into time buckets over [date_from, date_to). Served from rollups when aligned."""
+    return await handler.aggregate_measurements(device_id, bucket, date_from, date_to, profile)
+
+
+@router.get("/alerts", response_model=PaginatedApiResponse[List[WearableAlertDTO]])
+async def list_alerts(
+    page: int = 1,
+    limit: int = 10,
+    patient_id: Optional[UUID] = None,
+    device_id: Optional[UUID] = None,
+    unacknowledged_only: bool = False,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableAlertHandler = Depends()
+):
+    """List vitals alerts. Patients see their own; doctors and admins can filter by patient."""
+    return await handler.list_alerts(profile, page, limit, patient_id, device_id, unacknowledged_only)
+
+
+@router.post("/alerts/{alert_id}/acknowledge", response_model=ApiResponse[WearableAlertDTO], dependencies=[Depends(require_doctor)])
+async def acknowledge_alert(
+    alert_id: UUID,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableAlertHandler = Depends()
+):
+    """Acknowledge a vitals alert. Doctor only."""
+    return await handler.acknowledge_alert(alert_id, profile)
+
+
+@router.get("/patients/{patient_id}/thresholds", response_model=ApiResponse[List[WearableAlertThresholdDTO]])
+async def list_thresholds(
+    patient_id: UUID,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableAlertHandler = Depends()
+):
+    """Effective alert ranges for a patient (defaults merged with overrides)."""
+    return await handler.list_thresholds(patient_id, profile)
+
+
+@router.put("/patients/{patient_id}/thresholds/{metric}", response_model=ApiResponse[WearableAlertThresholdDTO], dependencies=[Depends(require_doctor)])
+async def set_threshold(
+    patient_id: UUID,
+    metric: WearableMetricEnum,
+    req: WearableAlertThresholdUpdateDTO,
+    profile: AuthenticatedProfile = Depends(get_current_profile),
+    handler: WearableAlertHandler = Depends()
+):
+    """Override a patient's alert range for one metric. Doctor only."""
+    return await handler.set_threshold(patient_id, metric, req, profile)
+
+
+@router.delete("/patients/{patient_id}/thresholds/{metric}", response_model=ApiResponse, dependencies=[Depends(require_doctor)])
+async def delete_threshold(
+    patient_id: UUID,
+    metric: WearableMetricEnum,
+    handler: WearableAlertHandler = Depends()
+):
+    """Reset a patient's alert range for one metric to the default. Doctor only."""
+    return await handler.delete_threshold(patient_id, metric)
@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
@@ -7,14 +9,38 @@ from backend.api.middleware.request_middleware import request_middleware
 from backend.api.middleware.security_middleware import SecurityMiddleware
 from backend.api.routes.router import api_router
 from backend.infrastructure.config.settings import settings
+from backend.infrastructure.pubsub.pg_notify import create_notify_bridge
+from backend.infrastructure.search.service import get_search_service
+from backend.module.diagnosis.usecases.diagnosis_catalog import get_diagnosis_catalog
+from backend.module.wearable.usecases.wearable_write_behind import get_write_behind
 from backend.pkg.core.exceptions import BaseAPIException
 from backend.pkg.core.response import response_factory
 from backend.pkg.core.response_models import ErrorResponse
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    bridge = create_notify_bridge() if settings.PUBSUB_NOTIFY_ENABLED else None
+    if bridge:
+        bridge.start()
+    search = get_search_service()
+    await search.start()
+    get_diagnosis_catalog().start()  # Indexed in the background; searches wait for it
+    write_behind = get_write_behind()
+    if write_behind:
+        write_behind.start()
+    yield
+    if write_behind:
+        await write_behind.stop()
+    await search.close()
+    if bridge:
+        await bridge.stop()
+
+
 def get_application() -> FastAPI:
     app = FastAPI(
         title=settings.PROJECT_NAME,
+        lifespan=lifespan,
         openapi_url=f"{settings.API_V1_STR}/openapi.json",
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Endpoints polled by display screens (queue boards) trust an access token whose session was
+    # checked in the database for this long, so a logout reaches them only after the TTL
+    AUTH_SESSION_CACHE_TTL_SECONDS: int = 30
+    AUTH_SESSION_CACHE_SIZE: int = 10000
 
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
@@ -37,9 +41,109 @@ class Settings(BaseSettings):
     STORAGE_REGION: str = "us-east-1"
     STORAGE_PUBLIC_BASE_URL: str = "http://localhost:9000"
 
+    # Wearables
+    # Rollup job: readings newer than now - SETTLE are left for the next pass so
+    # in-flight transactions with an older created_at are not skipped.
+    WEARABLE_ROLLUP_INTERVAL_SECONDS: int = 60
+    WEARABLE_ROLLUP_SETTLE_SECONDS: int = 120
+    WEARABLE_ROLLUP_BATCH_SIZE: int = 500
+    WEARABLE_PARTITION_MONTHS_AHEAD: int = 3
+    WEARABLE_RAW_RETENTION_MONTHS: int = 0  # 0 keeps raw readings forever
+    WEARABLE_RETENTION_MODE: str = "archive"  # "archive" (detach into WEARABLE_ARCHIVE_SCHEMA) or "drop"
+    WEARABLE_ARCHIVE_SCHEMA: str = "archive"
+    WEARABLE_ALERT_INTERVAL_SECONDS: int = 30
+    WEARABLE_ALERT_SETTLE_SECONDS: int = 10
+    WEARABLE_ALERT_BATCH_SIZE: int = 500
+    WEARABLE_ALERT_LOOKBACK_SECONDS: int = 21600  # Older readings loaded as rolling-statistics context
+    WEARABLE_STREAM_HEARTBEAT_SECONDS: int = 15
+    # Latest-vitals cache: readings kept per device, LRU-bounded device count (64 bytes per reading)
+    WEARABLE_VITALS_CACHE_SIZE: int = 60
+    WEARABLE_VITALS_CACHE_DEVICES: int = 10000
+    WEARABLE_VITALS_CACHE_TTL_SECONDS: int = 300
+    # Write-behind ingestion: readings are acknowledged once appended to a local segment log
+    # and COPYed into the database by a flusher in each API worker.
+    WEARABLE_WRITE_BEHIND_ENABLED: bool = False
+    WEARABLE_WRITE_BEHIND_DIR: str = "/var/lib/his/wearable-ingest"  # Must survive restarts (volume)
+    WEARABLE_WRITE_BEHIND_FLUSH_SECONDS: float = 1.0
+    WEARABLE_WRITE_BEHIND_SEGMENT_BYTES: int = 8 * 1024 * 1024
+    WEARABLE_WRITE_BEHIND_MAX_BYTES: int = 512 * 1024 * 1024  # Backpressure: refuse readings beyond this backlog
+    WEARABLE_WRITE_BEHIND_FSYNC: bool = True
+    # Device API keys: signed requests older/newer than the skew are refused; on rotation the
+    # previous key stays valid for the grace period. Cached keys are re-checked after the TTL.
+    WEARABLE_DEVICE_KEY_MAX_SKEW_SECONDS: int = 300
+    WEARABLE_DEVICE_KEY_ROTATION_GRACE_SECONDS: int = 86400
+    WEARABLE_DEVICE_KEY_CACHE_TTL_SECONDS: int = 60
+    WEARABLE_DEVICE_KEY_CACHE_SIZE: int = 100000
+    # Signatures remembered per worker to refuse replays within the skew window (~200 bytes each)
+    WEARABLE_DEVICE_REPLAY_CACHE_SIZE: int = 200000
+    # Readings per signed ingestion batch (JSON, MessagePack or CBOR)
+    WEARABLE_INGEST_MAX_BATCH: int = 10000
+    # Research export to Parquet: "s3" writes to a private bucket (never the public uploads
+    # bucket), "local" to a directory. Rows per cursor fetch and per Parquet row group bound memory.
+    WEARABLE_EXPORT_STORAGE: str = "s3"
+    WEARABLE_EXPORT_BUCKET: str = "his-research-exports"
+    WEARABLE_EXPORT_LOCAL_DIR: str = "/var/lib/his/exports"
+    WEARABLE_EXPORT_PREFIX: str = "wearable"
+    WEARABLE_EXPORT_BATCH_ROWS: int = 16384
+    WEARABLE_EXPORT_ROW_GROUP_ROWS: int = 65536
+    WEARABLE_EXPORT_COMPRESSION: str = "zstd"
+
+    # Clinic queues: numbers restart per clinic at local midnight in HOSPITAL_TIMEZONE.
+    # Queue boards are kept in memory per clinic and day, reloaded after the TTL. Each board keeps
+    # its last QUEUE_BOARD_EVENT_LOG events so reconnecting streams resume instead of re-snapshotting.
+    HOSPITAL_TIMEZONE: str = "UTC"
+    QUEUE_BOARD_MAX_BOARDS: int = 1000
+    QUEUE_BOARD_TTL_SECONDS: int = 300
+    QUEUE_BOARD_EVENT_LOG: int = 256
+    QUEUE_BOARD_STREAM_HEARTBEAT_SECONDS: int = 15
+    QUEUE_BOARD_DATE_WINDOW_DAYS: int = 1  # Boards are served for today plus or minus this many days
+
+    # Appointment slots: doctor schedules are materialized into one availability bitmap per doctor,
+    # clinic and day (SCHEDULE_SLOT_MINUTES per bit, must divide a day; changing it needs a
+    # `make schedule-availability` run) for SCHEDULE_HORIZON_DAYS ahead. Slot searches run on
+    # per-clinic copies held in memory, reloaded after the TTL.
+    SCHEDULE_SLOT_MINUTES: int = 15
+    SCHEDULE_HORIZON_DAYS: int = 90
+    SCHEDULE_CACHE_MAX_CLINICS: int = 200
+    SCHEDULE_CACHE_TTL_SECONDS: int = 300
+
+    # Legacy HIS import (backend.scripts.legacy_import): rows validated and COPYed per transaction
+    LEGACY_IMPORT_BATCH_ROWS: int = 5000
+
+    # Daily visit statistics: served from the per-day counters, cached per day for this long
+    STATS_CACHE_TTL_SECONDS: int = 10
+
+    # Medical record search: results are ranked among this many newest matches, which bounds its cost
+    MEDICAL_RECORD_SEARCH_MAX_MATCHES: int = 1000
+    # Medical record history: every this many revisions (and whenever a diff would be no smaller)
+    # a revision stores the whole record, so a version is rebuilt from at most this many rows
+    MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL: int = 10
+
+    # Patient lookup by name (pg_trgm): names whose closest word run is at least this similar to
+    # the query match, and at most this many matches are ranked, which bounds common names
+    PATIENT_SEARCH_MIN_SIMILARITY: float = 0.5
+    PATIENT_SEARCH_MAX_CANDIDATES: int = 2000
+
+    # ICD-10 diagnosis codes: code<TAB>description file indexed in memory by every worker at
+    # startup (empty: the bundled subset of common codes)
+    ICD10_CATALOG_PATH: str = ""
+
+    # Pub/Sub (live streams)
+    # Per-subscriber buffer; a slow viewer loses its oldest messages beyond this.
+    PUBSUB_QUEUE_SIZE: int = 256
+    # Fan out across API workers through Postgres LISTEN/NOTIFY
+    PUBSUB_NOTIFY_ENABLED: bool = False
+    PUBSUB_NOTIFY_CHANNEL: str = "his_pubsub"
+
     # Elasticsearch
     ELASTICSEARCH_URL: str = "http://elasticsearch:9200"
 
+    # Search behind list endpoints' `search` parameter: postgres (match the tables directly),
+    # elasticsearch (indexes at ELASTICSEARCH_URL) or memory (in-process, rebuilt at startup)
+    SEARCH_BACKEND: str = "postgres"
+    SEARCH_INDEX_PREFIX: str = "his-"
+    SEARCH_MAX_MATCHES: int = 10000  # Matches an index backend may return for one search; more is refused
+
     # CORS - can be "*" or comma-separated list of origins
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:8000"
 
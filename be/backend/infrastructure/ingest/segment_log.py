@@ -0,0 +1,231 @@
+"""
+Append-only segment log: a durable local buffer for write-behind ingestion.
+
+Records are framed as (length, crc32, payload) and appended to the process's active segment file.
+Concurrent appends share one fsync (group commit) that runs off the event loop, so a request is
+acknowledged once its record is on disk without each request paying for its own fsync.
+
+Segments are sealed by size or on demand and then claimed by a consumer, which holds an exclusive
+`flock` while processing and unlinks the file when done. The writer also holds `flock` on its
+active segment, taken under a name consumers ignore before the file is renamed to `*.seg`, so a
+segment that can be locked while named `*.seg` belongs to a process that died: it is recovered like
+a sealed one, up to its last complete frame.
+"""
+import asyncio
+import fcntl
+import logging
+import os
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Sequence
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct("<II")  # payload length, crc32
+ACTIVE_SUFFIX = ".seg"
+SEALED_SUFFIX = ".sealed"
+OPENING_SUFFIX = ".opening"  # Created and locked, not yet an active segment; never listed
+# An opening file this old that nobody holds was left by a process that died before renaming it
+_STALE_OPENING_SECONDS = 60
+
+
+class BacklogFullError(Exception):
+    """Raised when unflushed segments exceed the configured size."""
+
+
+@dataclass
+class Segment:
+    path: str
+    size: int
+    created_at: float  # Epoch seconds, from the file name
+
+
+def _created_at(name: str) -> float:
+    try:
+        return int(name.split("-", 1)[0]) / 1000
+    except ValueError:
+        return time.time()
+
+
+def list_segments(directory: str) -> List[Segment]:
+    """Active and sealed segments in the directory, oldest first."""
+    segments = []
+    for entry in os.scandir(directory):
+        if entry.name.endswith((ACTIVE_SUFFIX, SEALED_SUFFIX)):
+            try:
+                segments.append(Segment(entry.path, entry.stat().st_size, _created_at(entry.name)))
+            except FileNotFoundError:
+                continue  # Consumed meanwhile
+    return sorted(segments, key=lambda s: s.created_at)
+
+
+def _remove_stale_opening(directory: str) -> None:
+    """Unlink the (empty) opening files of processes that died between creating and renaming them."""
+    for entry in os.scandir(directory):
+        if not entry.name.endswith(OPENING_SUFFIX) or time.time() - _created_at(entry.name) < _STALE_OPENING_SECONDS:
+            continue
+        segment = claim(Segment(entry.path, 0, _created_at(entry.name)))
+        if segment is not None:
+            segment.complete()
+
+
+def read_frames(data: bytes) -> Iterator[bytes]:
+    """Payloads of all complete, intact frames; stops at a torn or corrupt tail."""
+    offset = 0
+    while offset + _HEADER.size <= len(data):
+        length, crc = _HEADER.unpack_from(data, offset)
+        start = offset + _HEADER.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            logger.warning(f"Ignoring {len(data) - offset} trailing bytes of a torn segment")
+            return
+        yield payload
+        offset = start + length
+
+
+class ClaimedSegment:
+    """A segment locked by this process. Call `complete()` once its records are persisted."""
+
+    def __init__(self, segment: Segment, fd: int):
+        self.segment = segment
+        self._fd = fd
+
+    def read(self) -> List[bytes]:
+        with os.fdopen(os.dup(self._fd), "rb") as file:
+            return list(read_frames(file.read()))
+
+    def complete(self) -> None:
+        os.unlink(self.segment.path)
+        self.release()
+
+    def release(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)  # Also drops the lock
+            self._fd = -1
+
+
+def claim(segment: Segment) -> Optional[ClaimedSegment]:
+    """Lock a sealed or orphaned segment, or None if another process holds it or it is gone."""
+    try:
+        fd = os.open(segment.path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None
+    if os.fstat(fd).st_nlink == 0:
+        os.close(fd)  # Consumed by another process between listing and locking
+        return None
+    return ClaimedSegment(segment, fd)
+
+
+class SegmentLog:
+    def __init__(self, directory: str, segment_bytes: int, max_pending_bytes: int, fsync: bool = True):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.max_pending_bytes = max_pending_bytes
+        self.fsync = fsync
+        self.writer_id = uuid4().hex[:12]
+        os.makedirs(directory, exist_ok=True)
+        _remove_stale_opening(directory)
+
+        self._file = None
+        self._path: Optional[str] = None
+        self._size = 0
+        self._sequence = 0
+        self._written = 0  # Appends written to the active file
+        self._synced = 0  # Appends known to be on disk
+        self._sync_task: Optional[asyncio.Task] = None
+        self._io_lock = asyncio.Lock()
+
+        # Approximate size of everything not yet consumed; refreshed by `refresh_pending`
+        self.pending_bytes = sum(s.size for s in list_segments(directory))
+        self.appended = 0
+        self.rejected = 0
+
+    def _open(self) -> None:
+        self._sequence += 1
+        name = f"{int(time.time() * 1000):013d}-{self.writer_id}-{self._sequence:06d}"
+        self._path = os.path.join(self.directory, name + ACTIVE_SUFFIX)
+        # Locked before consumers can see it: an unlocked `*.seg` is claimed as orphaned
+        opening = os.path.join(self.directory, name + OPENING_SUFFIX)
+        self._file = open(opening, "ab")
+        fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+        os.rename(opening, self._path)
+        self._size = 0
+
+    def _seal_active(self) -> None:
+        """Make the active segment durable and hand it over to consumers. Caller holds _io_lock."""
+        if self._file is None:
+            return
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._synced = self._written
+        if self._size:
+            os.rename(self._path, self._path[:-len(ACTIVE_SUFFIX)] + SEALED_SUFFIX)
+        else:
+            os.unlink(self._path)
+        self._file.close()  # Releases the lock
+        self._file = None
+
+    async def append(self, payload: bytes) -> None:
+        """Append one record and return once it is durable."""
+        await self.append_many([payload])
+
+    async def append_many(self, payloads: Sequence[bytes]) -> None:
+        """Append records together (all or none are accepted) and return once they are durable."""
+        if self.pending_bytes >= self.max_pending_bytes:
+            self.rejected += len(payloads)
+            raise BacklogFullError(f"Write-behind backlog is full ({self.pending_bytes} bytes pending)")
+
+        if self._file is None:
+            self._open()
+        data = b"".join(_HEADER.pack(len(p), zlib.crc32(p)) + p for p in payloads)
+        self._file.write(data)
+        self._size += len(data)
+        self.pending_bytes += len(data)
+        self._written += 1
+        self.appended += len(payloads)
+
+        target = self._written
+        while self._synced < target:
+            if self._sync_task is None:
+                self._sync_task = asyncio.ensure_future(self._sync())
+            await asyncio.shield(self._sync_task)
+
+    async def _sync(self) -> None:
+        try:
+            async with self._io_lock:
+                if self._file is None:
+                    return
+                target = self._written
+                self._file.flush()
+                if self.fsync:
+                    await asyncio.to_thread(os.fsync, self._file.fileno())
+                self._synced = max(self._synced, target)
+                if self._size >= self.segment_bytes:
+                    self._seal_active()
+        finally:
+            self._sync_task = None
+
+    async def seal(self) -> None:
+        """Seal the active segment so its records become visible to consumers."""
+        async with self._io_lock:
+            self._seal_active()
+
+    def refresh_pending(self) -> List[Segment]:
+        segments = list_segments(self.directory)
+        self.pending_bytes = sum(s.size for s in segments)
+        return segments
+
+    def is_own_active(self, segment: Segment) -> bool:
+        return segment.path == self._path and self._file is not None
+
+    async def close(self) -> None:
+        await self.seal()
@@ -0,0 +1,122 @@
+"""
+In-process publish/subscribe hub.
+
+Publishers hand over an already-encoded message once; the hub appends it to every subscriber's
+bounded buffer. A slow subscriber never blocks publishers or other subscribers: when its buffer
+is full the oldest message is dropped and counted.
+"""
+import asyncio
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from backend.infrastructure.config.settings import settings
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+_PENDING_KEY = "pubsub_pending"
+
+
+class Subscription:
+    def __init__(self, maxsize: int):
+        self._buffer: deque = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+        self.dropped = 0
+
+    def put(self, message: str) -> None:
+        if len(self._buffer) == self._buffer.maxlen:
+            self.dropped += 1
+        self._buffer.append(message)
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Next message, or None when nothing arrived within `timeout` seconds."""
+        while not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._buffer.popleft()
+
+    def take_dropped(self) -> int:
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+
+class PubSubHub:
+    def __init__(self, queue_size: int):
+        self.queue_size = queue_size
+        self._topics: Dict[str, Set[Subscription]] = {}
+        self._listeners: List[Tuple[str, Callable[[str, str], None]]] = []
+        self.published = 0
+
+    def publish(self, topics: Iterable[str], message: str) -> int:
+        """Deliver to every subscriber of any of `topics`. Returns the number of deliveries."""
+        self.published += 1
+        delivered = 0
+        for topic in topics:
+            for subscription in self._topics.get(topic, ()):
+                subscription.put(message)
+                delivered += 1
+            for prefix, callback in self._listeners:
+                if topic.startswith(prefix):
+                    try:
+                        callback(topic, message)
+                    except Exception as e:
+                        logger.error(f"Pub/sub listener for '{prefix}' failed: {e}")
+        return delivered
+
+    def add_listener(self, prefix: str, callback: Callable[[str, str], None]) -> None:
+        """Call `callback(topic, message)` synchronously for every message on topics starting with `prefix`."""
+        self._listeners.append((prefix, callback))
+
+    @contextmanager
+    def subscribe(self, topics: Iterable[str], maxsize: Optional[int] = None) -> Iterator[Subscription]:
+        subscription = Subscription(maxsize or self.queue_size)
+        topics = list(topics)
+        for topic in topics:
+            self._topics.setdefault(topic, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            for topic in topics:
+                subscribers = self._topics.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._topics[topic]
+
+    def subscriber_count(self, topic: Optional[str] = None) -> int:
+        if topic is not None:
+            return len(self._topics.get(topic, ()))
+        return sum(len(s) for s in self._topics.values())
+
+
+def publish_after_commit(session: AsyncSession, topics: List[str], message: str) -> None:
+    """Queue a local publish that only happens if the session's transaction commits."""
+    session.sync_session.info.setdefault(_PENDING_KEY, []).append((topics, message))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    pending: List[Tuple[List[str], str]] = session.info.pop(_PENDING_KEY, [])
+    for topics, message in pending:
+        pubsub_hub.publish(topics, message)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# Singleton instance
+pubsub_hub = PubSubHub(settings.PUBSUB_QUEUE_SIZE)
+
+
+def get_pubsub_hub() -> PubSubHub:
+    return pubsub_hub
@@ -0,0 +1,109 @@
+"""
+Postgres LISTEN/NOTIFY bridge for the pub/sub hub.
+
+With several API workers, a reading ingested by one worker must reach viewers connected to the
+others. When PUBSUB_NOTIFY_ENABLED is set, publishers send `pg_notify` inside their transaction
+(Postgres only delivers it on commit) and every worker's bridge re-publishes it to its local hub.
+Each worker holds exactly one LISTEN connection regardless of how many viewers it serves.
+"""
+import asyncio
+import json
+import logging
+from typing import List, Optional, Sequence, Tuple
+
+import asyncpg
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.pubsub.hub import PubSubHub, get_pubsub_hub, publish_after_commit
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads are limited to 8000 bytes by default
+MAX_PAYLOAD_BYTES = 7900
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    return database_url.replace("postgresql+asyncpg://", "postgresql://", 1)
+
+
+async def publish(session: AsyncSession, topics: List[str], message: str) -> None:
+    """
+    Publish once the session's transaction commits: through NOTIFY when the bridge is enabled
+    (reaches every worker, including this one), otherwise straight to the local hub.
+    """
+    payload = json.dumps({"t": topics, "m": message}, separators=(",", ":"))
+    if settings.PUBSUB_NOTIFY_ENABLED and len(payload.encode()) <= MAX_PAYLOAD_BYTES:
+        await session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": settings.PUBSUB_NOTIFY_CHANNEL, "payload": payload},
+        )
+    else:
+        publish_after_commit(session, topics, message)
+
+
+async def publish_many(session: AsyncSession, items: Sequence[Tuple[List[str], str]]) -> None:
+    """Like `publish` for many messages, with one NOTIFY round trip."""
+    payloads = []
+    for topics, message in items:
+        payload = json.dumps({"t": topics, "m": message}, separators=(",", ":"))
+        if settings.PUBSUB_NOTIFY_ENABLED and len(payload.encode()) <= MAX_PAYLOAD_BYTES:
+            payloads.append(payload)
+        else:
+            publish_after_commit(session, topics, message)
+    if payloads:
+        await session.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": settings.PUBSUB_NOTIFY_CHANNEL, "payloads": payloads},
+        )
+
+
+class PostgresNotifyBridge:
+    def __init__(self, hub: PubSubHub, dsn: str, channel: str, reconnect_seconds: float = 2.0):
+        self.hub = hub
+        self.dsn = dsn
+        self.channel = channel
+        self.reconnect_seconds = reconnect_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._connection: Optional[asyncpg.Connection] = None
+
+    def _on_notify(self, connection, pid, channel, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            self.hub.publish(data["t"], data["m"])
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring malformed pub/sub notification: {e}")
+
+    async def _run(self) -> None:
+        while True:
+            closed = asyncio.Event()
+            try:
+                self._connection = await asyncpg.connect(self.dsn)
+                self._connection.add_termination_listener(lambda _: closed.set())
+                await self._connection.add_listener(self.channel, self._on_notify)
+                logger.info(f"Listening for pub/sub notifications on '{self.channel}'")
+                await closed.wait()
+                logger.warning("Pub/sub LISTEN connection lost, reconnecting")
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.error(f"Pub/sub LISTEN connection failed: {e}")
+            await asyncio.sleep(self.reconnect_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._connection is not None and not self._connection.is_closed():
+            await self._connection.close()
+        self._connection = None
+
+
+def create_notify_bridge() -> PostgresNotifyBridge:
+    return PostgresNotifyBridge(get_pubsub_hub(), _asyncpg_dsn(settings.DATABASE_URL), settings.PUBSUB_NOTIFY_CHANNEL)
@@ -0,0 +1,281 @@
+"""
+Search backends behind SearchService.
+
+- postgres: no separate index; a search becomes a condition on the entity's own table, every
+  query word matching part of one of the searched columns (`ILIKE`, served by trigram indexes
+  where the pg_trgm extension is installed).
+- elasticsearch: documents in an Elasticsearch (or OpenSearch) index per entity, analyzed into
+  n-grams so query words match parts of words; a search collects every matching id, page by page,
+  and one matching more than SEARCH_MAX_MATCHES is refused (a subset would be counted and paged
+  as if it were all of them).
+- memory: an in-process inverted index per entity, built from the database at startup, for tests
+  and single-node deployments with small catalogs; searches are capped like elasticsearch ones.
+
+The indexing backends select the matched ids with one array parameter (`id = ANY(...)`), so a
+large match never runs into the limit on bind parameters per statement.
+
+The indexing backends are kept current by the write events of the use cases (see
+SearchService) and checked against the database with `backend.scripts.search_index check`.
+"""
+import asyncio
+import json
+import logging
+import urllib.error
+import urllib.request
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from uuid import UUID
+
+from backend.infrastructure.search.models import Documents, SearchIndexSpec, fingerprint, tokenize
+from backend.pkg.core.exceptions import BusinessLogicException
+from sqlalchemy import and_, any_, false, literal, or_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+
+def _like_pattern(word: str) -> str:
+    escaped = word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _ids_condition(spec: SearchIndexSpec, ids: Iterable[UUID]) -> ColumnElement:
+    ids = list(ids)
+    return spec.id_column == any_(literal(ids, ARRAY(spec.id_column.type))) if ids else false()
+
+
+def _too_many_matches(spec: SearchIndexSpec, max_matches: int) -> BusinessLogicException:
+    return BusinessLogicException(f"Search matches more than {max_matches} {spec.name}, add words to narrow it")
+
+
+class SearchBackend:
+    # Whether documents must be pushed to the backend as entities change
+    indexes_documents = True
+    # Whether the index lives in this process and is rebuilt from the database at startup
+    in_process = False
+
+    async def start(self, specs: Sequence[SearchIndexSpec]) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def match(self, spec: SearchIndexSpec, words: List[str]) -> ColumnElement:
+        """Condition on the spec's table selecting the documents that contain every word."""
+        raise NotImplementedError
+
+    async def upsert(self, spec: SearchIndexSpec, documents: Documents) -> None:
+        raise NotImplementedError
+
+    async def remove(self, spec: SearchIndexSpec, ids: Iterable[UUID]) -> None:
+        raise NotImplementedError
+
+    async def fingerprints(self, spec: SearchIndexSpec) -> Dict[UUID, str]:
+        """Every indexed id with the fingerprint of the text it was indexed with."""
+        raise NotImplementedError
+
+
+class PostgresSearchBackend(SearchBackend):
+    indexes_documents = False
+
+    async def match(self, spec: SearchIndexSpec, words: List[str]) -> ColumnElement:
+        return and_(*(
+            or_(*(column.ilike(_like_pattern(word), escape="\\") for column in spec.fields)) for word in words
+        ))
+
+
+class _MemoryIndex:
+    __slots__ = ("documents", "postings")
+
+    def __init__(self):
+        self.documents: Dict[UUID, Tuple[str, Set[str]]] = {}  # id -> (fingerprint, tokens)
+        self.postings: Dict[str, Set[UUID]] = {}  # token -> ids
+
+    def remove(self, document_id: UUID) -> None:
+        _, tokens = self.documents.pop(document_id, ("", set()))
+        for token in tokens:
+            ids = self.postings[token]
+            ids.discard(document_id)
+            if not ids:
+                del self.postings[token]
+
+    def add(self, document_id: UUID, values: List[Optional[str]]) -> None:
+        self.remove(document_id)
+        tokens = {token for value in values for token in tokenize(value)}
+        self.documents[document_id] = (fingerprint(values), tokens)
+        for token in tokens:
+            self.postings.setdefault(token, set()).add(document_id)
+
+    def search(self, words: List[str]) -> Set[UUID]:
+        matched: Optional[Set[UUID]] = None
+        for word in sorted(words, key=len, reverse=True):  # Longest words first: fewest matches
+            ids: Set[UUID] = set()
+            for token, token_ids in self.postings.items():
+                if word in token:
+                    ids |= token_ids
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                break
+        return matched or set()
+
+
+class InProcessSearchBackend(SearchBackend):
+    in_process = True
+
+    def __init__(self, max_matches: int):
+        self.max_matches = max_matches
+        self._indexes: Dict[str, _MemoryIndex] = {}
+
+    def _index(self, spec: SearchIndexSpec) -> _MemoryIndex:
+        return self._indexes.setdefault(spec.name, _MemoryIndex())
+
+    async def match(self, spec: SearchIndexSpec, words: List[str]) -> ColumnElement:
+        ids = self._index(spec).search(words)
+        if len(ids) > self.max_matches:
+            raise _too_many_matches(spec, self.max_matches)
+        return _ids_condition(spec, ids)
+
+    async def upsert(self, spec: SearchIndexSpec, documents: Documents) -> None:
+        index = self._index(spec)
+        names = spec.field_names
+        for document_id, values in documents.items():
+            index.add(document_id, [values.get(name) for name in names])
+
+    async def remove(self, spec: SearchIndexSpec, ids: Iterable[UUID]) -> None:
+        index = self._index(spec)
+        for document_id in ids:
+            index.remove(document_id)
+
+    async def fingerprints(self, spec: SearchIndexSpec) -> Dict[UUID, str]:
+        return {document_id: fp for document_id, (fp, _) in self._index(spec).documents.items()}
+
+
+class ElasticsearchSearchBackend(SearchBackend):
+    """Talks to the REST API with the standard library, off the event loop."""
+
+    PAGE_SIZE = 5000
+
+    def __init__(self, url: str, index_prefix: str, max_matches: int, timeout: float = 10.0):
+        self.url = url.rstrip("/")
+        self.index_prefix = index_prefix
+        self.max_matches = max_matches
+        self.timeout = timeout
+
+    def _index_name(self, spec: SearchIndexSpec) -> str:
+        return f"{self.index_prefix}{spec.name}"
+
+    def _request_sync(self, method: str, path: str, body=None, ndjson: bool = False) -> Optional[dict]:
+        data, content_type = None, "application/json"
+        if ndjson:
+            data, content_type = ("\n".join(json.dumps(line) for line in body) + "\n").encode(), "application/x-ndjson"
+        elif body is not None:
+            data = json.dumps(body).encode()
+        request = urllib.request.Request(
+            f"{self.url}{path}", data=data, method=method, headers={"Content-Type": content_type}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                raw = response.read()
+                return json.loads(raw) if raw else {}
+        except urllib.error.HTTPError as e:
+            if e.code == 404:
+                return None
+            raise RuntimeError(f"Elasticsearch {method} {path} failed: {e.code} {e.read()[:500]!r}") from e
+
+    async def _request(self, method: str, path: str, body=None, ndjson: bool = False) -> Optional[dict]:
+        return await asyncio.to_thread(self._request_sync, method, path, body, ndjson)
+
+    async def start(self, specs: Sequence[SearchIndexSpec]) -> None:
+        for spec in specs:
+            name = self._index_name(spec)
+            if await self._request("HEAD", f"/{name}") is not None:
+                continue
+            text_field = {"type": "text", "analyzer": "his_ngram", "search_analyzer": "his_words"}
+            await self._request("PUT", f"/{name}", {
+                "settings": {
+                    "index": {"max_ngram_diff": 18},
+                    "analysis": {
+                        "filter": {"his_ngram": {"type": "ngram", "min_gram": 2, "max_gram": 20}},
+                        "analyzer": {
+                            "his_ngram": {"tokenizer": "standard", "filter": ["lowercase", "his_ngram"]},
+                            "his_words": {"tokenizer": "standard", "filter": ["lowercase"]},
+                        },
+                    },
+                },
+                "mappings": {
+                    "properties": {
+                        "id": {"type": "keyword"},
+                        "fingerprint": {"type": "keyword", "index": False},
+                        **{field_name: text_field for field_name in spec.field_names},
+                    },
+                },
+            })
+            logger.info(f"Created search index '{name}'")
+
+    async def match(self, spec: SearchIndexSpec, words: List[str]) -> ColumnElement:
+        body = {
+            "size": min(self.PAGE_SIZE, self.max_matches),
+            "_source": False,
+            "sort": [{"id": "asc"}],
+            # Counted exactly up to just past the limit, on the first page only
+            "track_total_hits": self.max_matches + 1,
+            "query": {
+                "multi_match": {
+                    "query": " ".join(words), "fields": spec.field_names, "type": "cross_fields", "operator": "and",
+                },
+            },
+        }
+        ids: List[UUID] = []
+        while True:
+            result = (await self._request("POST", f"/{self._index_name(spec)}/_search", body) or {}).get("hits", {})
+            if result.get("total", {}).get("value", 0) > self.max_matches:
+                raise _too_many_matches(spec, self.max_matches)
+            hits = result.get("hits", [])
+            ids.extend(UUID(hit["_id"]) for hit in hits)
+            if len(hits) < body["size"]:
+                return _ids_condition(spec, ids)
+            body["search_after"] = hits[-1]["sort"]
+            body["track_total_hits"] = False
+
+    async def upsert(self, spec: SearchIndexSpec, documents: Documents) -> None:
+        if not documents:
+            return
+        names = spec.field_names
+        lines = []
+        for document_id, values in documents.items():
+            lines.append({"index": {"_index": self._index_name(spec), "_id": str(document_id)}})
+            lines.append({
+                "id": str(document_id),
+                "fingerprint": fingerprint([values.get(name) for name in names]),
+                **{name: values.get(name) for name in names},
+            })
+        await self._bulk(lines)
+
+    async def remove(self, spec: SearchIndexSpec, ids: Iterable[UUID]) -> None:
+        lines = [{"delete": {"_index": self._index_name(spec), "_id": str(document_id)}} for document_id in ids]
+        if lines:
+            await self._bulk(lines)
+
+    async def _bulk(self, lines: List[dict]) -> None:
+        result = await self._request("POST", "/_bulk", lines, ndjson=True)
+        if result and result.get("errors"):
+            failed = [item for item in result["items"] if next(iter(item.values())).get("error")]
+            raise RuntimeError(f"Elasticsearch bulk request failed for {len(failed)} documents: {failed[:3]}")
+
+    async def fingerprints(self, spec: SearchIndexSpec) -> Dict[UUID, str]:
+        fingerprints: Dict[UUID, str] = {}
+        after = None
+        while True:
+            body = {
+                "size": self.PAGE_SIZE, "_source": ["fingerprint"], "sort": [{"id": "asc"}],
+                "query": {"match_all": {}},
+            }
+            if after is not None:
+                body["search_after"] = after
+            result = await self._request("POST", f"/{self._index_name(spec)}/_search", body)
+            hits = (result or {}).get("hits", {}).get("hits", [])
+            for hit in hits:
+                fingerprints[UUID(hit["_id"])] = hit["_source"].get("fingerprint", "")
+            if len(hits) < self.PAGE_SIZE:
+                return fingerprints
+            after = hits[-1]["sort"]
@@ -0,0 +1,48 @@
+import hashlib
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import Column
+
+_WORD = re.compile(r"\w+")
+
+# id -> searched column name -> value
+Documents = Dict[UUID, Dict[str, Optional[str]]]
+
+
+@dataclass(frozen=True)
+class SearchIndexSpec:
+    """A searchable entity: its id column and the text columns a search matches."""
+    name: str
+    id_column: Column
+    fields: Tuple[Column, ...]
+
+    @property
+    def field_names(self) -> List[str]:
+        return [column.key for column in self.fields]
+
+
+@dataclass
+class SearchConsistency:
+    """An index compared with its table: ids missing from the index, indexed with outdated text, or deleted."""
+    index: str
+    documents: int = 0
+    missing: List[UUID] = field(default_factory=list)
+    stale: List[UUID] = field(default_factory=list)
+    orphaned: List[UUID] = field(default_factory=list)
+    repaired: bool = False
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.missing or self.stale or self.orphaned)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Case-folded words; a search matches documents containing every query word."""
+    return _WORD.findall(text.casefold()) if text else []
+
+
+def fingerprint(values: Sequence[Optional[str]]) -> str:
+    return hashlib.sha1("\x1f".join(value or "" for value in values).encode()).hexdigest()[:16]
@@ -0,0 +1,189 @@
+"""
+Search service behind the `search` parameter of list endpoints.
+
+Repositories turn a search into a condition on their table through `SearchService.match`, so
+the backend (SEARCH_BACKEND) can be swapped without touching them. Indexing backends are fed by
+write events: use cases report the ids of searchable entities they created, changed or deleted
+through a SearchIndexer, which publishes them once the transaction commits (to every worker when
+the LISTEN/NOTIFY bridge is enabled); the service then reloads those rows and updates or removes
+their documents. `check` compares an index with its table and can repair the differences.
+"""
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.pubsub import pg_notify
+from backend.infrastructure.pubsub.hub import get_pubsub_hub
+from backend.infrastructure.search.backends import (
+    ElasticsearchSearchBackend,
+    InProcessSearchBackend,
+    PostgresSearchBackend,
+    SearchBackend,
+)
+from backend.infrastructure.search.models import (
+    SearchConsistency,
+    SearchIndexSpec,
+    fingerprint,
+    tokenize,
+)
+from sqlalchemy import select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+SEARCH_TOPIC_PREFIX = "search:"
+LOAD_BATCH_ROWS = 5000
+
+
+def search_topic(spec: SearchIndexSpec) -> str:
+    return f"{SEARCH_TOPIC_PREFIX}{spec.name}"
+
+
+def create_search_backend(kind: str = settings.SEARCH_BACKEND) -> SearchBackend:
+    if kind == "postgres":
+        return PostgresSearchBackend()
+    if kind == "memory":
+        return InProcessSearchBackend(settings.SEARCH_MAX_MATCHES)
+    if kind == "elasticsearch":
+        return ElasticsearchSearchBackend(
+            settings.ELASTICSEARCH_URL, settings.SEARCH_INDEX_PREFIX, settings.SEARCH_MAX_MATCHES
+        )
+    raise ValueError(f"Unknown search backend '{kind}'")
+
+
+class SearchService:
+    def __init__(self, backend: SearchBackend):
+        self.backend = backend
+        self._specs: Dict[str, SearchIndexSpec] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def register(self, *specs: SearchIndexSpec) -> None:
+        for spec in specs:
+            self._specs[spec.name] = spec
+
+    @property
+    def specs(self) -> List[SearchIndexSpec]:
+        return list(self._specs.values())
+
+    async def start(self) -> None:
+        await self.backend.start(self.specs)
+        if self.backend.in_process:
+            for spec in self.specs:
+                await self.rebuild(spec)
+
+    async def close(self) -> None:
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.backend.close()
+
+    async def match(self, spec: SearchIndexSpec, query: str) -> ColumnElement:
+        """Condition on the spec's table selecting the rows containing every word of the query."""
+        words = tokenize(query)
+        if not words:
+            return true()
+        return await self.backend.match(spec, words)
+
+    # Indexing
+
+    @staticmethod
+    async def _load(session: AsyncSession, spec: SearchIndexSpec, ids: Optional[List[UUID]] = None):
+        """The spec's rows (all, or those of `ids`) as batches of documents."""
+        stmt = select(spec.id_column, *spec.fields)
+        if ids is not None:
+            stmt = stmt.where(spec.id_column.in_(ids))
+        names = spec.field_names
+        result = await session.stream(stmt.execution_options(yield_per=LOAD_BATCH_ROWS))
+        async for rows in result.partitions():
+            yield {row[0]: dict(zip(names, row[1:])) for row in rows}
+
+    async def refresh(self, spec: SearchIndexSpec, ids: Iterable[UUID]) -> None:
+        """Index the current text of `ids`, removing those no longer in the table."""
+        ids = list(ids)
+        remaining = set(ids)
+        async for session in db_manager.get_session():
+            async for documents in self._load(session, spec, ids):
+                await self.backend.upsert(spec, documents)
+                remaining -= documents.keys()
+        if remaining:
+            await self.backend.remove(spec, remaining)
+
+    async def rebuild(self, spec: SearchIndexSpec) -> int:
+        """Index every row of the spec's table and drop documents of deleted rows; returns the rows."""
+        indexed = await self.backend.fingerprints(spec)
+        seen = 0
+        async for session in db_manager.get_session():
+            async for documents in self._load(session, spec):
+                await self.backend.upsert(spec, documents)
+                for document_id in documents:
+                    indexed.pop(document_id, None)
+                seen += len(documents)
+        if indexed:
+            await self.backend.remove(spec, indexed.keys())
+        logger.info(f"Indexed {seen} documents into search index '{spec.name}'")
+        return seen
+
+    async def check(self, spec: SearchIndexSpec, repair: bool = False) -> SearchConsistency:
+        """Compare the index with the table by document fingerprints; `repair` re-indexes the differences."""
+        report = SearchConsistency(spec.name)
+        if not self.backend.indexes_documents:
+            return report  # The table is the index
+        indexed = await self.backend.fingerprints(spec)
+        names = spec.field_names
+        async for session in db_manager.get_session():
+            async for documents in self._load(session, spec):
+                for document_id, values in documents.items():
+                    report.documents += 1
+                    stored = indexed.pop(document_id, None)
+                    if stored is None:
+                        report.missing.append(document_id)
+                    elif stored != fingerprint([values.get(name) for name in names]):
+                        report.stale.append(document_id)
+        report.orphaned = list(indexed)
+        if repair and not report.consistent:
+            await self.refresh(spec, report.missing + report.stale + report.orphaned)
+            report.repaired = True
+        return report
+
+    # Write events
+
+    def on_message(self, topic: str, message: str) -> None:
+        """Pub/sub listener for search topics: re-index the reported ids after their commit."""
+        spec = self._specs.get(topic[len(SEARCH_TOPIC_PREFIX):])
+        if spec is None or not self.backend.indexes_documents:
+            return
+        ids = [UUID(value) for value in json.loads(message)]
+        task = asyncio.get_running_loop().create_task(self.refresh(spec, ids))
+        self._tasks.add(task)
+        task.add_done_callback(self._on_refreshed)
+
+    def _on_refreshed(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # The next consistency check (or rebuild) repairs what was missed
+            logger.error(f"Search index update failed: {task.exception()}")
+
+
+class SearchIndexer:
+    """Reports use case writes to searchable entities; their documents are updated once the transaction commits."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def changed(self, spec: SearchIndexSpec, *ids: UUID) -> None:
+        if not get_search_service().backend.indexes_documents:
+            return
+        await pg_notify.publish(self.session, [search_topic(spec)], json.dumps([str(i) for i in ids]))
+
+
+# Singleton instance
+search_service = SearchService(create_search_backend())
+get_pubsub_hub().add_listener(SEARCH_TOPIC_PREFIX, search_service.on_message)
+
+
+def get_search_service() -> SearchService:
+    return search_service
@@ -1,3 +1,6 @@
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -52,3 +55,34 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
         return decoded_token
     except Exception:
         return None
+
+
+# =============================================================================
+# Device API keys (HMAC request signing)
+# =============================================================================
+
+DEVICE_KEY_PREFIX = "dk_"
+
+
+def generate_device_key_id() -> str:
+    return DEVICE_KEY_PREFIX + secrets.token_hex(16)
+
+
+def derive_device_secret(key_id: str) -> str:
+    """
+    Signing secret of a device API key. Derived from the server secret, so it is never stored
+    and a database dump does not expose it; changing SECRET_KEY invalidates every device key.
+    """
+    return hmac.new(
+        settings.SECRET_KEY.encode(), b"wearable-device-key:" + key_id.encode(), hashlib.sha256
+    ).hexdigest()
+
+
+def sign_device_request(secret: str, timestamp: str, body: bytes) -> str:
+    """Hex HMAC-SHA256 of "<timestamp>.<body>" keyed with the device secret."""
+    return hmac.new(secret.encode(), timestamp.encode() + b"." + body, hashlib.sha256).hexdigest()
+
+
+def verify_device_signature(secret: str, timestamp: str, body: bytes, signature: str) -> bool:
+    # As bytes: compare_digest refuses str with non-ASCII characters
+    return hmac.compare_digest(sign_device_request(secret, timestamp, body).encode(), signature.encode())
@@ -0,0 +1,79 @@
+
+import asyncio
+import logging
+import os
+import shutil
+from datetime import datetime
+from typing import Any, BinaryIO, Optional
+
+from backend.infrastructure.storage.models import FileMetadata, UploadResult
+
+logger = logging.getLogger(__name__)
+
+
+class LocalStorageService:
+    """Filesystem stand-in for S3StorageService (same interface), for development and exports to a volume."""
+
+    def __init__(self, root: str, public_base_url: Optional[str] = None):
+        self.root = root
+        self.public_base_url = public_base_url
+
+    def _path(self, file_path: str) -> str:
+        path = os.path.normpath(os.path.join(self.root, file_path))
+        if not path.startswith(os.path.normpath(self.root) + os.sep):
+            raise ValueError(f"Path escapes the storage root: {file_path}")
+        return path
+
+    def _write(self, file_data: BinaryIO, path: str) -> int:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        file_data.seek(0)
+        partial = f"{path}.partial"
+        with open(partial, "wb") as target:
+            shutil.copyfileobj(file_data, target, 1024 * 1024)
+            size = target.tell()
+        os.replace(partial, path)  # Readers never see a half-written file
+        return size
+
+    async def upload_file(
+        self,
+        file_data: BinaryIO,
+        file_path: str,
+        content_type: str,
+        metadata: dict[str, Any] = None,
+    ) -> UploadResult:
+        try:
+            path = self._path(file_path)
+            size = await asyncio.to_thread(self._write, file_data, path)
+            file_url = f"{self.public_base_url.rstrip('/')}/{file_path}" if self.public_base_url else f"file://{path}"
+            return UploadResult(
+                success=True,
+                file_path=file_path,
+                file_url=file_url,
+                metadata=FileMetadata(
+                    file_name=file_path.split("/")[-1],
+                    file_path=file_path,
+                    content_type=content_type,
+                    size=size,
+                    created_at=datetime.utcnow(),
+                    metadata={str(k): str(v) for k, v in (metadata or {}).items()},
+                )
+            )
+        except Exception as e:
+            logger.error(f"Upload error: {e}")
+            return UploadResult(
+                success=False,
+                file_path=file_path,
+                file_url=None,
+                metadata=FileMetadata(
+                    file_name=file_path, file_path=file_path, content_type=content_type, size=0, created_at=datetime.utcnow()
+                ),
+                error=str(e)
+            )
+
+    async def delete_file(self, file_path: str) -> bool:
+        try:
+            await asyncio.to_thread(os.remove, self._path(file_path))
+            return True
+        except Exception as e:
+            logger.error(f"Delete error: {e}")
+            return False
@@ -16,7 +16,7 @@ from botocore.exceptions import ClientError
 logger = logging.getLogger(__name__)
 
 class S3StorageService:
-    def __init__(self, config: StorageConfig):
+    def __init__(self, config: StorageConfig, public_read: bool = True):
         self.config = config
         self.bucket_name = config.bucket_name
 
@@ -39,6 +39,8 @@ class S3StorageService:
         except ClientError:
              try:
                  self.s3_client.create_bucket(Bucket=self.bucket_name)
+                 if not public_read:
+                     return
                  # Make bucket public readable for this use case
                  policy = {
                     "Version": "2012-10-17",
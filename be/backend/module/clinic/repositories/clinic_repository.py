@@ -1,7 +1,9 @@
 
 from uuid import UUID
 
+from backend.infrastructure.search.service import get_search_service
 from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.search_indexes import CLINIC_SEARCH
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -34,7 +36,7 @@ class ClinicRepository:
 
         filters = []
         if search:
-            filters.append(Clinic.name.ilike(f"%{search}%"))
+            filters.append(await get_search_service().match(CLINIC_SEARCH, search))
 
         if filters:
             for f in filters:
@@ -1,21 +1,28 @@
 
+from typing import Optional
 from uuid import UUID
 
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.clinic.entity.clinic import Clinic
 from backend.module.clinic.entity.clinic_dto import ClinicCreateDTO, ClinicUpdateDTO
 from backend.module.clinic.repositories.clinic_repository import ClinicRepository
+from backend.module.common.search_indexes import CLINIC_SEARCH
 from backend.pkg.core.exceptions import NotFoundException
 
 
 class ClinicUseCase:
-    def __init__(self, clinic_repository: ClinicRepository):
+    def __init__(self, clinic_repository: ClinicRepository, search: Optional[SearchIndexer] = None):
         self.clinic_repository = clinic_repository
+        self.search = search
 
     async def create_clinic(self, req: ClinicCreateDTO) -> Clinic:
         new_clinic = Clinic(
             name=req.name
         )
-        return await self.clinic_repository.create(new_clinic)
+        clinic = await self.clinic_repository.create(new_clinic)
+        if self.search:
+            await self.search.changed(CLINIC_SEARCH, clinic.id)
+        return clinic
 
     async def get_clinic(self, clinic_id: UUID) -> Clinic:
         clinic = await self.clinic_repository.get_by_id(clinic_id)
@@ -26,11 +33,16 @@ class ClinicUseCase:
     async def update_clinic(self, clinic_id: UUID, req: ClinicUpdateDTO) -> Clinic:
         clinic = await self.get_clinic(clinic_id)
         clinic.name = req.name
-        return await self.clinic_repository.update(clinic)
+        clinic = await self.clinic_repository.update(clinic)
+        if self.search:
+            await self.search.changed(CLINIC_SEARCH, clinic.id)
+        return clinic
 
     async def delete_clinic(self, clinic_id: UUID) -> None:
         clinic = await self.get_clinic(clinic_id)
         await self.clinic_repository.delete(clinic)
+        if self.search:
+            await self.search.changed(CLINIC_SEARCH, clinic_id)
 
     async def list_clinics(self, page: int, limit: int, search: str = None) -> tuple[list[Clinic], int]:
         return await self.clinic_repository.list_clinics(page, limit, search)
@@ -83,3 +83,44 @@ class ReferralStatusEnum(str, Enum):
     PENDING = 'pending'
     COMPLETED = 'completed'
     CANCELED = 'canceled'
+
+class WearableBucketEnum(str, Enum):
+    MINUTE_5 = '5m'
+    MINUTE_15 = '15m'
+    HOUR_1 = '1h'
+    HOUR_6 = '6h'
+    DAY_1 = '1d'
+    DAY_7 = '7d'
+
+class WearableResolutionEnum(str, Enum):
+    RAW = 'raw'
+    HOURLY = 'hourly'
+    DAILY = 'daily'
+
+class WearableMetricEnum(str, Enum):
+    HEART_RATE = 'heart_rate'
+    SYSTOLIC_BP = 'systolic_bp'
+    DIASTOLIC_BP = 'diastolic_bp'
+    BODY_TEMPERATURE = 'body_temperature'
+    SPO2 = 'spo2'
+
+class WearableAlertRuleEnum(str, Enum):
+    THRESHOLD_LOW = 'threshold_low'
+    THRESHOLD_HIGH = 'threshold_high'
+    ZSCORE = 'zscore'
+    RATE_OF_CHANGE = 'rate_of_change'
+
+class TimelineSectionEnum(str, Enum):
+    VISITS = 'visits'
+    MEDICAL_RECORDS = 'medical_records'
+    PRESCRIPTIONS = 'prescriptions'
+    LAB_ORDERS = 'lab_orders'
+    LAB_RESULTS = 'lab_results'
+    REFERRALS = 'referrals'
+    INVOICES = 'invoices'
+    WEARABLES = 'wearables'
+
+class PatientMatchEnum(str, Enum):
+    NIK = 'nik'
+    BPJS_NUMBER = 'bpjs_number'
+    NAME = 'name'
@@ -0,0 +1,23 @@
+"""Searchable entities: the columns the `search` parameter of their list endpoint matches."""
+from backend.infrastructure.search.models import SearchIndexSpec
+from backend.infrastructure.search.service import get_search_service
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.lab.entity.lab import LabTest
+from backend.module.medicine.entity.medicine import Medicine
+from backend.module.prescription.entity.prescription import Prescription
+from backend.module.referral.entity.referral import Referral
+from backend.module.user.entity.user import User
+
+CLINIC_SEARCH = SearchIndexSpec("clinics", Clinic.id, (Clinic.name,))
+LAB_TEST_SEARCH = SearchIndexSpec("lab_tests", LabTest.id, (LabTest.test_name, LabTest.test_code))
+MEDICINE_SEARCH = SearchIndexSpec("medicines", Medicine.id, (Medicine.medicine_name,))
+PRESCRIPTION_SEARCH = SearchIndexSpec("prescriptions", Prescription.id, (Prescription.notes,))
+REFERRAL_SEARCH = SearchIndexSpec(
+    "referrals", Referral.id, (Referral.referred_to_facility, Referral.diagnosis, Referral.reason)
+)
+USER_SEARCH = SearchIndexSpec("users", User.id, (User.username, User.full_name))
+
+SEARCH_INDEXES = (
+    CLINIC_SEARCH, LAB_TEST_SEARCH, MEDICINE_SEARCH, PRESCRIPTION_SEARCH, REFERRAL_SEARCH, USER_SEARCH,
+)
+get_search_service().register(*SEARCH_INDEXES)
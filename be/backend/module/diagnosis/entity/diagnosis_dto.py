@@ -0,0 +1,6 @@
+from pydantic import BaseModel
+
+
+class DiagnosisCodeDTO(BaseModel):
+    code: str  # As in the catalog, e.g. J06.9
+    description: str
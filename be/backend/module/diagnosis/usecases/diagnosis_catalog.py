@@ -0,0 +1,266 @@
+"""
+ICD-10 diagnosis codes, indexed in memory for autocomplete.
+
+The catalog (ICD10_CATALOG_PATH, default the bundled subset) is read once per worker into a
+DiagnosisIndex, in a thread started at app startup so that neither startup nor the first
+request builds it inline.
+
+Entries are numbered best first (shortest description, then code), and the entries of each
+description word are kept in that order (arrays of entry numbers), with the words sorted: the
+words starting with a prefix are one bisected range, and merging their arrays yields entries
+best first. A query walks the entries of its rarest word that way, checks them for its other
+words by bisecting those words' arrays, and stops after `limit` matches (or MAX_CANDIDATES
+entries). The codes are kept sorted too, so the codes starting with a prefix are another
+bisected range, in code order. A query word matching no word is taken as misspelled and replaced
+by the catalog words sharing most of its trigrams; the vocabulary is far smaller than the
+catalog, so this costs about as much as a prefix.
+"""
+import asyncio
+import heapq
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from itertools import groupby, islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from backend.infrastructure.config.settings import settings
+from backend.module.diagnosis.entity.diagnosis_dto import DiagnosisCodeDTO
+
+BUNDLED_CATALOG = Path(__file__).resolve().parent.parent / "data" / "icd10.tsv"
+
+# A misspelled word is replaced by at most this many catalog words having at least this share
+# of its trigrams
+MAX_CORRECTIONS = 3
+MIN_CORRECTION_SIMILARITY = 0.5
+# Entries having a query's rarest word (or code) checked for its other words, best first; the
+# matches ranked beyond them only show up as more is typed
+MAX_CANDIDATES = 1000
+
+_WORD = re.compile(r"\w+")
+# A category letter and a digit: the start of a code (J0, J06, J06.9, j069). A query of just a
+# letter is a code prefix too (the first keystroke of a code); with other words it stays a word
+# (hepatitis a)
+_CODE = re.compile(r"^[A-Za-z]\d[0-9A-Za-z.]*$")
+_CATEGORY = re.compile(r"^[A-Za-z]$")
+_END_OF_PREFIX = "\uffff"
+
+# A query word, as the postings of the words it matches
+WordFilter = List[array]
+
+
+def code_key(code: str) -> str:
+    """The form codes are compared in: upper case without the dot (J06.9, j069 -> J069)."""
+    return "".join(ch for ch in code.upper() if ch.isalnum())
+
+
+def fold(text: str) -> str:
+    """Lower case without accents, so `Sjögren` matches `sjogren`."""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def words_text(description: str) -> str:
+    """The words of a description folded and space separated, with a space at both ends."""
+    return f" {' '.join(_WORD.findall(fold(description)))} "
+
+
+def trigrams(word: str) -> Set[str]:
+    """Trigrams of a word padded like pg_trgm does: two spaces before, one after."""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def read_catalog(path: Path) -> Iterable[Tuple[str, str]]:
+    """(code, description) per line of a code<TAB>description file; # starts a comment line."""
+    with open(path, encoding="utf-8") as lines:
+        for number, line in enumerate(lines, 1):
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            code, separator, description = line.partition("\t")
+            if not separator or not code_key(code) or not description.strip():
+                raise ValueError(f"{path}:{number}: expected code<TAB>description")
+            yield code.strip(), description.strip()
+
+
+class DiagnosisIndex:
+    """Prefix and trigram index over a catalog; read-only once built, so shared without locks."""
+
+    def __init__(self, entries: Iterable[Tuple[str, str]]):
+        catalog: Dict[str, Tuple[str, str]] = {}
+        for code, description in entries:
+            catalog.setdefault(code_key(code), (code, description))  # First occurrence wins
+
+        # Entry i, best first
+        by_rank = sorted(catalog, key=lambda key: (len(catalog[key][1]), key))
+        self.entry_keys: List[str] = by_rank
+        self.codes: List[str] = [catalog[key][0] for key in by_rank]
+        self.descriptions: List[str] = [catalog[key][1] for key in by_rank]
+
+        # Codes in code order, with their entries
+        self.keys: List[str] = sorted(by_rank)
+        entry_of = {key: entry for entry, key in enumerate(by_rank)}
+        self.key_entries = array("I", (entry_of[key] for key in self.keys))
+
+        postings: Dict[str, array] = {}
+        for entry, description in enumerate(self.descriptions):
+            for word in set(words_text(description).split()):
+                postings.setdefault(word, array("I")).append(entry)
+        self.words: List[str] = sorted(postings)
+        self.word_postings: List[array] = [postings[word] for word in self.words]
+
+        # Words (numbers into self.words) by trigram, for correcting misspellings
+        self.word_trigrams: Dict[str, array] = {}
+        self.word_trigram_counts = array("H")
+        for number, word in enumerate(self.words):
+            word_trigrams = trigrams(word)
+            self.word_trigram_counts.append(len(word_trigrams))
+            for trigram in word_trigrams:
+                self.word_trigrams.setdefault(trigram, array("I")).append(number)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _entry(self, entry: int) -> DiagnosisCodeDTO:
+        return DiagnosisCodeDTO(code=self.codes[entry], description=self.descriptions[entry])
+
+    def _corrections(self, word: str) -> List[int]:
+        """The catalog words most similar to a misspelled `word` (by trigrams), best first."""
+        word_trigrams = trigrams(word)
+        shared: Counter = Counter()
+        for trigram in word_trigrams:
+            shared.update(self.word_trigrams.get(trigram, ()))
+        needed = MIN_CORRECTION_SIMILARITY * len(word_trigrams)
+        # Of those having enough of the word's trigrams, the ones with the fewest others first
+        return heapq.nsmallest(
+            MAX_CORRECTIONS,
+            (number for number, count in shared.items() if count >= needed),
+            key=lambda number: (self.word_trigram_counts[number] - 2 * shared[number], number),
+        )
+
+    def _word_filter(self, word: str) -> WordFilter:
+        """Words starting with `word` (equal to it for one letter), else its corrections."""
+        if len(word) > 1:
+            start, stop = bisect_left(self.words, word), bisect_left(self.words, word + _END_OF_PREFIX)
+            if start < stop:
+                return self.word_postings[start:stop]
+        else:
+            start = bisect_left(self.words, word)
+            if start < len(self.words) and self.words[start] == word:
+                return [self.word_postings[start]]
+        corrections = self._corrections(word) if len(word) > 2 else []
+        return [self.word_postings[number] for number in corrections]
+
+    @staticmethod
+    def _size(word_filter: WordFilter) -> int:
+        return sum(len(entry_postings) for entry_postings in word_filter)
+
+    @staticmethod
+    def _stream(word_filter: WordFilter) -> Iterator[int]:
+        """The entries of a filter, best first, each once."""
+        merged = word_filter[0] if len(word_filter) == 1 else heapq.merge(*word_filter)
+        return (entry for entry, _ in groupby(merged))
+
+    @staticmethod
+    def _has_words(entry: int, word_filters: List[WordFilter]) -> bool:
+        """Whether the entry has a word of each filter (postings are sorted, so by bisection)."""
+        for word_filter in word_filters:
+            for entry_postings in word_filter:
+                position = bisect_left(entry_postings, entry)
+                if position < len(entry_postings) and entry_postings[position] == entry:
+                    break
+            else:
+                return False
+        return True
+
+    def get(self, code: str) -> Optional[DiagnosisCodeDTO]:
+        """The entry of a code in any accepted form (J06.9, j069), or None."""
+        key = code_key(code)
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            return self._entry(self.key_entries[position])
+        return None
+
+    def search(self, query: str, limit: int) -> List[DiagnosisCodeDTO]:
+        """
+        Entries whose code starts with the query's code (J06, j06.9, or a query of just J) and
+        whose description has a word starting with each of its other words: in code order when a
+        code is given, the exact code first, else shortest description first. A word matching
+        nothing is taken as misspelled and corrected.
+        """
+        code = None
+        words: List[str] = []
+        tokens = query.split()
+        if len(tokens) == 1 and _CATEGORY.match(tokens[0]):
+            tokens, code = [], code_key(tokens[0])
+        for token in tokens:
+            if code is None and _CODE.match(token):
+                code = code_key(token)
+            else:
+                words += _WORD.findall(fold(token))
+
+        filters = sorted((self._word_filter(word) for word in words), key=self._size)
+        if not all(filters):
+            return []  # A word neither in the catalog nor close to one of its words
+
+        if code is not None:
+            start, stop = bisect_left(self.keys, code), bisect_left(self.keys, code + _END_OF_PREFIX)
+            if not filters or stop - start <= self._size(filters[0]):
+                # Walk the codes, which are in order already
+                candidates = islice(range(start, stop), MAX_CANDIDATES)
+                entries = (self.key_entries[position] for position in candidates)
+                matches = (entry for entry in entries if self._has_words(entry, filters))
+                return [self._entry(entry) for entry in islice(matches, limit)]
+            # Fewer entries have the rarest word than the code: walk those, then order by code
+            found = [
+                entry for entry in islice(self._stream(filters[0]), MAX_CANDIDATES)
+                if self.entry_keys[entry].startswith(code) and self._has_words(entry, filters[1:])
+            ]
+            return [self._entry(entry) for entry in heapq.nsmallest(limit, found, key=self.entry_keys.__getitem__)]
+
+        if not filters:
+            return []
+        candidates = islice(self._stream(filters[0]), MAX_CANDIDATES)
+        matches = (entry for entry in candidates if self._has_words(entry, filters[1:]))
+        return [self._entry(entry) for entry in islice(matches, limit)]
+
+
+class DiagnosisCatalog:
+    """The index of the worker, built once in a thread; requests wait for it if it is not ready."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._index: Optional[DiagnosisIndex] = None
+        self._loading: Optional[asyncio.Future] = None
+
+    def start(self) -> None:
+        if self._loading is None:
+            self._loading = asyncio.ensure_future(asyncio.to_thread(self.load))
+
+    def load(self) -> DiagnosisIndex:
+        return DiagnosisIndex(read_catalog(self.path))
+
+    async def index(self) -> DiagnosisIndex:
+        if self._index is None:
+            self.start()
+            loading = self._loading
+            try:
+                self._index = await asyncio.shield(loading)
+            except Exception:
+                if self._loading is loading:  # Retry on the next request (the file may be fixed)
+                    self._loading = None
+                raise
+        return self._index
+
+
+# Singleton instance
+diagnosis_catalog = DiagnosisCatalog(Path(settings.ICD10_CATALOG_PATH) if settings.ICD10_CATALOG_PATH else BUNDLED_CATALOG)
+
+
+def get_diagnosis_catalog() -> DiagnosisCatalog:
+    return diagnosis_catalog
@@ -0,0 +1,40 @@
+from typing import List
+
+from backend.module.diagnosis.entity.diagnosis_dto import DiagnosisCodeDTO
+from backend.module.diagnosis.usecases.diagnosis_catalog import DiagnosisCatalog
+from backend.pkg.core.exceptions import BusinessLogicException, NotFoundException
+
+MAX_DIAGNOSIS_SEARCH_LIMIT = 50
+MAX_DIAGNOSIS_QUERY_LENGTH = 100
+
+
+class DiagnosisUseCase:
+    def __init__(self, catalog: DiagnosisCatalog):
+        self.catalog = catalog
+
+    async def search_diagnoses(self, q: str, limit: int = 10) -> List[DiagnosisCodeDTO]:
+        """Autocomplete by code (J06, j06.9) or description words (infeksi saluran napas, pneumo)."""
+        query = q.strip()
+        if not query or len(query) > MAX_DIAGNOSIS_QUERY_LENGTH:
+            raise BusinessLogicException(f"q must be 1 to {MAX_DIAGNOSIS_QUERY_LENGTH} characters")
+        if limit < 1 or limit > MAX_DIAGNOSIS_SEARCH_LIMIT:
+            raise BusinessLogicException(f"limit must be between 1 and {MAX_DIAGNOSIS_SEARCH_LIMIT}")
+        return (await self.catalog.index()).search(query, limit)
+
+    async def get_diagnosis(self, code: str) -> DiagnosisCodeDTO:
+        diagnosis = (await self.catalog.index()).get(code)
+        if not diagnosis:
+            raise NotFoundException(f"Diagnosis code {code} not found")
+        return diagnosis
+
+    async def normalize_codes(self, codes: List[str]) -> List[str]:
+        """`codes` as written in the catalog (j069 -> J06.9), first occurrence kept; unknown codes are rejected."""
+        index = await self.catalog.index()
+        normalized: List[str] = []
+        for code in codes:
+            diagnosis = index.get(code)
+            if not diagnosis:
+                raise BusinessLogicException(f"Unknown diagnosis code: {code}")
+            if diagnosis.code not in normalized:
+                normalized.append(diagnosis.code)
+        return normalized
@@ -29,7 +29,7 @@ class LabOrder(Base):
     __tablename__ = "lab_orders"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    visit_id = Column(PG_UUID(as_uuid=True), ForeignKey("visits.id", ondelete="CASCADE"), nullable=False)
+    visit_id = Column(PG_UUID(as_uuid=True), ForeignKey("visits.id", ondelete="CASCADE"), nullable=False, index=True)
     doctor_id = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id"), nullable=False)
     lab_staff_id = Column(PG_UUID(as_uuid=True), ForeignKey("staff.id"), nullable=True)
     lab_test_id = Column(PG_UUID(as_uuid=True), ForeignKey("lab_tests.id"), nullable=False)
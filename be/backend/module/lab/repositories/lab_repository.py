@@ -2,9 +2,11 @@
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from backend.infrastructure.search.service import get_search_service
+from backend.module.common.search_indexes import LAB_TEST_SEARCH
 from backend.module.lab.entity.lab import LabOrder, LabTest
 from backend.module.visit.entity.visit import Visit
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -53,12 +55,7 @@ class LabTestRepository:
              stmt = stmt.where(LabTest.is_active == is_active)
 
         if search:
-            stmt = stmt.where(
-                or_(
-                    LabTest.test_name.ilike(f"%{search}%"),
-                    LabTest.test_code.ilike(f"%{search}%")
-                )
-            )
+            stmt = stmt.where(await get_search_service().match(LAB_TEST_SEARCH, search))
 
         stmt = stmt.order_by(LabTest.test_name) # Alphabetical
 
@@ -2,7 +2,9 @@
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.common.enums import OrderStatusEnum, RoleEnum
+from backend.module.common.search_indexes import LAB_TEST_SEARCH
 from backend.module.lab.entity.lab import LabOrder, LabResult, LabTest
 from backend.module.lab.entity.lab_dto import (
     LabOrderCreateDTO,
@@ -27,11 +29,13 @@ class LabUseCase:
         self,
         test_repository: LabTestRepository,
         order_repository: LabOrderRepository,
-        visit_repository: VisitRepository
+        visit_repository: VisitRepository,
+        search: Optional[SearchIndexer] = None
     ):
         self.test_repository = test_repository
         self.order_repository = order_repository
         self.visit_repository = visit_repository
+        self.search = search
 
     # --- Lab Test Management ---
 
@@ -41,8 +45,10 @@ class LabUseCase:
         if existing:
             raise BusinessLogicException(f"Lab test with code {req.test_code} already exists")
 
-        lab_test = LabTest(**req.model_dump())
-        return await self.test_repository.create(lab_test)
+        lab_test = await self.test_repository.create(LabTest(**req.model_dump()))
+        if self.search:
+            await self.search.changed(LAB_TEST_SEARCH, lab_test.id)
+        return lab_test
 
     async def list_lab_tests(
         self, page: int, limit: int, search: Optional[str] = None, category: Optional[str] = None
@@ -65,7 +71,10 @@ class LabUseCase:
         for key, value in req.model_dump(exclude_unset=True).items():
             setattr(lab_test, key, value)
 
-        return await self.test_repository.update(lab_test)
+        lab_test = await self.test_repository.update(lab_test)
+        if self.search:
+            await self.search.changed(LAB_TEST_SEARCH, lab_test.id)
+        return lab_test
 
     async def delete_lab_test(self, test_id: UUID) -> None:
 
@@ -74,6 +83,8 @@ class LabUseCase:
              raise NotFoundException("Lab test not found")
 
         await self.test_repository.delete(lab_test)
+        if self.search:
+            await self.search.changed(LAB_TEST_SEARCH, test_id)
 
     # --- Lab Order Management ---
 
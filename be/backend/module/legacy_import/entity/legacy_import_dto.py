@@ -0,0 +1,45 @@
+from datetime import date, datetime
+from typing import Optional
+
+from backend.module.common.enums import (
+    BloodTypeEnum,
+    GenderEnum,
+    OutcomeEnum,
+    VisitStatusEnum,
+    VisitTypeEnum,
+)
+from pydantic import BaseModel, Field
+
+
+class PatientImportRowDTO(BaseModel):
+    """A patient of a legacy export. The patient's login is created with the NIK as username."""
+    nik: str = Field(..., pattern=r"^\d{16}$")
+    full_name: str = Field(..., min_length=1, max_length=150)
+    date_of_birth: date
+    gender: GenderEnum
+    bpjs_number: Optional[str] = Field(None, max_length=20)
+    blood_type: Optional[BloodTypeEnum] = None
+    address: Optional[str] = None
+    phone_number: Optional[str] = Field(None, max_length=20)
+    email: Optional[str] = Field(None, max_length=100)
+    emergency_contact_name: Optional[str] = Field(None, max_length=100)
+    emergency_contact_phone: Optional[str] = Field(None, max_length=20)
+
+
+class VisitImportRowDTO(BaseModel):
+    """A visit of a legacy export, with its medical record when any record field is set."""
+    legacy_id: Optional[str] = Field(None, max_length=100, description="Visit id in the legacy system")
+    patient_nik: str = Field(..., pattern=r"^\d{16}$")
+    doctor: str = Field(..., min_length=1, description="Doctor's SIP number or username")
+    clinic: str = Field(..., min_length=1, description="Clinic name")
+    visit_datetime: datetime = Field(..., description="Local time (HOSPITAL_TIMEZONE) unless an offset is given")
+    visit_type: VisitTypeEnum = VisitTypeEnum.GENERAL
+    visit_status: VisitStatusEnum = VisitStatusEnum.COMPLETED
+    chief_complaint: Optional[str] = None
+
+    anamnesis: Optional[str] = None
+    physical_exam: Optional[str] = None
+    diagnosis: Optional[str] = None
+    treatment_plan: Optional[str] = None
+    doctor_notes: Optional[str] = None
+    outcome: Optional[OutcomeEnum] = None
@@ -0,0 +1,117 @@
+from typing import Dict, List, Sequence
+from uuid import UUID
+
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.user.entity.user import User
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+USER_COLUMNS = (
+    "id", "username", "password_hash", "full_name", "email", "phone_number", "is_active", "role",
+    "created_at", "updated_at",
+)
+PATIENT_COLUMNS = (
+    "id", "user_id", "nik", "bpjs_number", "date_of_birth", "gender", "blood_type", "address",
+    "emergency_contact_name", "emergency_contact_phone",
+)
+VISIT_COLUMNS = (
+    "id", "patient_id", "doctor_id", "registration_staff_id", "clinic_id", "queue_date", "visit_datetime",
+    "visit_type", "chief_complaint", "visit_status", "created_at", "updated_at",
+)
+MEDICAL_RECORD_COLUMNS = (
+    "id", "visit_id", "anamnesis", "physical_exam", "diagnosis", "treatment_plan", "doctor_notes", "outcome",
+    "created_at", "updated_at",
+)
+
+
+def _staging(table: str) -> str:
+    return f"legacy_import_{table}"
+
+
+class LegacyImportRepository:
+    """Lookups and bulk loading for legacy imports. Enum values are passed as their DB labels."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def patient_ids_by_nik(self) -> Dict[str, UUID]:
+        return dict((await self.session.execute(select(Patient.nik, Patient.id))).all())
+
+    async def doctor_ids_by_key(self) -> Dict[str, UUID]:
+        """Doctor ids by SIP number and by username."""
+        rows = (await self.session.execute(
+            select(Doctor.id, Doctor.sip_number, User.username).join(User, User.id == Doctor.user_id)
+        )).all()
+        keys = {}
+        for doctor_id, sip_number, username in rows:
+            keys[username] = doctor_id
+            if sip_number:
+                keys[sip_number] = doctor_id
+        return keys
+
+    async def clinic_ids_by_name(self) -> Dict[str, UUID]:
+        rows = (await self.session.execute(select(Clinic.name, Clinic.id))).all()
+        return {name.casefold(): clinic_id for name, clinic_id in rows}
+
+    async def staff_id_by_username(self, username: str) -> UUID | None:
+        stmt = select(Staff.id).join(User, User.id == Staff.user_id).where(User.username == username)
+        return (await self.session.execute(stmt)).scalar()
+
+    async def _copy(self, table: str, columns: Sequence[str], records: Sequence[tuple]) -> None:
+        """COPY records into a session-local staging copy of `table` (same column types, no constraints)."""
+        await self.session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {_staging(table)} ON COMMIT DELETE ROWS "
+            f"AS SELECT {', '.join(columns)} FROM {table} WITH NO DATA"
+        ))
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(_staging(table), records=records, columns=columns)
+
+    async def copy_patients(self, users: Sequence[tuple], patients: Sequence[tuple]) -> List[UUID]:
+        """
+        Insert patients with their users. Rows whose NIK, username or email is taken are skipped
+        (no user is left behind for them). Returns the ids of the patients inserted.
+        """
+        await self._copy("users", USER_COLUMNS, users)
+        await self._copy("patients", PATIENT_COLUMNS, patients)
+        user_columns = ", ".join(USER_COLUMNS)
+        patient_columns = ", ".join(PATIENT_COLUMNS)
+        await self.session.execute(text(f"""
+            INSERT INTO users ({user_columns})
+            SELECT {user_columns} FROM {_staging("users")} s
+            WHERE NOT EXISTS (SELECT 1 FROM patients p WHERE p.nik = s.username)
+            ON CONFLICT DO NOTHING
+        """))
+        inserted = (await self.session.execute(text(f"""
+            INSERT INTO patients ({patient_columns})
+            SELECT {", ".join(f"s.{c}" for c in PATIENT_COLUMNS)}
+            FROM {_staging("patients")} s
+            JOIN users u ON u.id = s.user_id
+            ON CONFLICT DO NOTHING
+            RETURNING id
+        """))).scalars().all()
+        await self.session.execute(text(f"""
+            DELETE FROM users u USING {_staging("users")} s
+            WHERE u.id = s.id AND NOT EXISTS (SELECT 1 FROM patients p WHERE p.user_id = u.id)
+        """))
+        return list(inserted)
+
+    async def copy_visits(self, visits: Sequence[tuple], medical_records: Sequence[tuple]) -> int:
+        """
+        Insert visits and their medical records; visits already imported (same id) and their
+        records are skipped. Returns the number of visits inserted.
+        """
+        await self._copy("visits", VISIT_COLUMNS, visits)
+        visit_columns = ", ".join(VISIT_COLUMNS)
+        result = await self.session.execute(text(
+            f"INSERT INTO visits ({visit_columns}) SELECT {visit_columns} FROM {_staging('visits')} ON CONFLICT DO NOTHING"
+        ))
+        if medical_records:
+            await self._copy("medical_records", MEDICAL_RECORD_COLUMNS, medical_records)
+            record_columns = ", ".join(MEDICAL_RECORD_COLUMNS)
+            await self.session.execute(text(
+                f"INSERT INTO medical_records ({record_columns}) "
+                f"SELECT {record_columns} FROM {_staging('medical_records')} ON CONFLICT DO NOTHING"
+            ))
+        return result.rowcount
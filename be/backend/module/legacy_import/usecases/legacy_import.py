@@ -0,0 +1,283 @@
+"""
+Bulk import of patients and visits from legacy HIS exports (CSV with a header row, or NDJSON).
+
+Input is streamed and handled LEGACY_IMPORT_BATCH_ROWS rows at a time: rows are validated,
+patient NIKs, doctors (SIP number or username) and clinics (name) are resolved through maps
+loaded once per run, and the batch is COPYed into staging tables and inserted in one
+transaction. Patients get a login with their NIK as username and an unusable random password;
+visits carry their medical record fields.
+
+Ids are derived from the source (NIK, legacy visit id or source name and row number), so running
+an import again skips what is already there. After each committed batch the number of rows done
+is saved to a checkpoint file, and a run resumes from it. Rows that fail validation or cannot be
+resolved are written, with the reason, to a rejects file (NDJSON).
+"""
+import csv
+import json
+import logging
+import os
+import secrets
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import NAMESPACE_URL, UUID, uuid5
+from zoneinfo import ZoneInfo
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.security.password import get_password_hash
+from backend.module.common.enums import RoleEnum
+from backend.module.legacy_import.entity.legacy_import_dto import PatientImportRowDTO, VisitImportRowDTO
+from backend.module.legacy_import.repositories.legacy_import_repository import LegacyImportRepository
+from backend.module.visit.usecases.visit_queue_board import queue_date_of
+from pydantic import ValidationError
+
+logger = logging.getLogger(__name__)
+
+PATIENTS = "patients"
+VISITS = "visits"
+FORMATS = ("csv", "ndjson")
+
+_NAMESPACE = uuid5(NAMESPACE_URL, "his:legacy-import")
+_HOSPITAL_TZ = ZoneInfo(settings.HOSPITAL_TIMEZONE)
+_PARSE_ERROR = "_parse_error"
+_RECORD_FIELDS = ("anamnesis", "physical_exam", "diagnosis", "treatment_plan", "doctor_notes", "outcome")
+
+# Row number (1-based, header excluded), raw row
+SourceRow = Tuple[int, dict]
+
+
+def import_id(*parts: str) -> UUID:
+    return uuid5(_NAMESPACE, ":".join(parts))
+
+
+def read_rows(path: str, fmt: str) -> Iterator[SourceRow]:
+    """Stream the rows of a CSV (empty cells read as missing) or NDJSON (blank lines skipped) file."""
+    with open(path, newline="" if fmt == "csv" else None, encoding="utf-8") as source:
+        if fmt == "csv":
+            for number, row in enumerate(csv.DictReader(source), start=1):
+                yield number, {key: value for key, value in row.items() if value not in ("", None)}
+        else:
+            number = 0
+            for line in source:
+                if line.strip():
+                    number += 1
+                    try:
+                        row = json.loads(line)
+                    except ValueError as e:
+                        row = {_PARSE_ERROR: f"Invalid JSON: {e}", "line": line.rstrip("\n")}
+                    if not isinstance(row, dict):
+                        row = {_PARSE_ERROR: "Not a JSON object", "line": line.rstrip("\n")}
+                    yield number, row
+
+
+def _validate(dto, raw: dict):
+    """-> (row, None) or (None, reason)."""
+    if _PARSE_ERROR in raw:
+        return None, raw[_PARSE_ERROR]
+    try:
+        return dto.model_validate(raw), None
+    except ValidationError as e:
+        return None, "; ".join(f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}" for err in e.errors())
+
+
+@dataclass
+class ImportSummary:
+    kind: str
+    source: str
+    rows: int = 0
+    imported: int = 0
+    skipped: int = 0  # Already imported
+    rejected: int = 0
+    resumed_from: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.rows - self.resumed_from) / self.seconds if self.seconds else 0.0
+
+
+class LegacyImportUseCase:
+    def __init__(
+        self,
+        kind: str,
+        staff_username: Optional[str] = None,
+        source_name: Optional[str] = None,
+        batch_rows: int = settings.LEGACY_IMPORT_BATCH_ROWS
+    ):
+        if kind not in (PATIENTS, VISITS):
+            raise ValueError(f"Unknown import kind: {kind}")
+        if kind == VISITS and not staff_username:
+            raise ValueError("A visit import needs the registering staff member's username")
+        self.kind = kind
+        self.staff_username = staff_username
+        self.source_name = source_name
+        self.batch_rows = batch_rows
+        self.patients: Dict[str, UUID] = {}
+        self.doctors: Dict[str, UUID] = {}
+        self.clinics: Dict[str, UUID] = {}
+        self.staff_id: Optional[UUID] = None
+        self._password_hash: Optional[str] = None
+
+    async def load_lookups(self) -> None:
+        async for session in db_manager.get_session():
+            repository = LegacyImportRepository(session)
+            self.patients = await repository.patient_ids_by_nik()
+            if self.kind == VISITS:
+                self.doctors = await repository.doctor_ids_by_key()
+                self.clinics = await repository.clinic_ids_by_name()
+                self.staff_id = await repository.staff_id_by_username(self.staff_username)
+        if self.kind == VISITS and self.staff_id is None:
+            raise ValueError(f"No staff member with username '{self.staff_username}'")
+        logger.info(
+            f"Lookups: {len(self.patients)} patients, {len(self.doctors)} doctor keys, {len(self.clinics)} clinics"
+        )
+
+    def prepare_patients(self, batch: List[SourceRow]) -> Tuple[list, list, list, list]:
+        """-> (user records, patient records, (row number, NIK, patient id, row) to import, rejects)."""
+        if self._password_hash is None:
+            # Imported patients cannot log in until their password is reset
+            self._password_hash = get_password_hash(secrets.token_urlsafe(32))
+        now = datetime.utcnow()
+        users, patients, pending, rejects = [], [], [], []
+        seen = set()
+        for number, raw in batch:
+            row, error = _validate(PatientImportRowDTO, raw)
+            if error:
+                rejects.append((number, error, raw))
+                continue
+            if row.nik in self.patients or row.nik in seen:
+                pending.append((number, row.nik, None, raw))  # Already imported: skipped
+                continue
+            seen.add(row.nik)
+            user_id, patient_id = import_id("user", row.nik), import_id("patient", row.nik)
+            users.append((
+                user_id, row.nik, self._password_hash, row.full_name, row.email, row.phone_number, True,
+                RoleEnum.PATIENT.name, now, now,
+            ))
+            patients.append((
+                patient_id, user_id, row.nik, row.bpjs_number, row.date_of_birth, row.gender.name,
+                row.blood_type.name if row.blood_type else None, row.address, row.emergency_contact_name,
+                row.emergency_contact_phone,
+            ))
+            pending.append((number, row.nik, patient_id, raw))
+        return users, patients, pending, rejects
+
+    def prepare_visits(self, batch: List[SourceRow]) -> Tuple[list, list, list]:
+        """-> (visit records, medical record records, rejects)."""
+        now = datetime.now(timezone.utc)
+        visits, records, rejects = [], [], []
+        for number, raw in batch:
+            row, error = _validate(VisitImportRowDTO, raw)
+            if error:
+                rejects.append((number, error, raw))
+                continue
+            patient_id = self.patients.get(row.patient_nik)
+            doctor_id = self.doctors.get(row.doctor)
+            clinic_id = self.clinics.get(row.clinic.casefold())
+            missing = [
+                f"{name} '{value}' not found"
+                for name, value, found in (
+                    ("patient NIK", row.patient_nik, patient_id), ("doctor", row.doctor, doctor_id),
+                    ("clinic", row.clinic, clinic_id),
+                )
+                if found is None
+            ]
+            if missing:
+                rejects.append((number, "; ".join(missing), raw))
+                continue
+
+            visit_datetime = row.visit_datetime
+            if visit_datetime.tzinfo is None:
+                visit_datetime = visit_datetime.replace(tzinfo=_HOSPITAL_TZ)
+            if row.legacy_id:
+                visit_id = import_id("visit", row.legacy_id)
+            else:
+                visit_id = import_id("visit", self.source_name, str(number))
+            visits.append((
+                visit_id, patient_id, doctor_id, self.staff_id, clinic_id, queue_date_of(visit_datetime),
+                visit_datetime, row.visit_type.name, row.chief_complaint, row.visit_status.name, now, now,
+            ))
+            if any(getattr(row, name) is not None for name in _RECORD_FIELDS):
+                records.append((
+                    import_id("medical_record", str(visit_id)), visit_id, row.anamnesis, row.physical_exam,
+                    row.diagnosis, row.treatment_plan, row.doctor_notes, row.outcome.name if row.outcome else None,
+                    now, now,
+                ))
+        return visits, records, rejects
+
+    async def import_batch(self, batch: List[SourceRow], summary: ImportSummary) -> list:
+        """Validate, resolve and load one batch in one transaction; returns its rejects."""
+        if self.kind == PATIENTS:
+            users, patients, pending, rejects = self.prepare_patients(batch)
+            inserted = set()
+            if patients:
+                async for session in db_manager.get_session():
+                    inserted = set(await LegacyImportRepository(session).copy_patients(users, patients))
+            for number, nik, patient_id, raw in pending:
+                if patient_id is None:
+                    summary.skipped += 1
+                elif patient_id in inserted:
+                    self.patients[nik] = patient_id
+                    summary.imported += 1
+                else:
+                    rejects.append((number, "NIK, username or email already taken", raw))
+        else:
+            visits, records, rejects = self.prepare_visits(batch)
+            inserted = 0
+            if visits:
+                async for session in db_manager.get_session():
+                    inserted = await LegacyImportRepository(session).copy_visits(visits, records)
+            summary.imported += inserted
+            summary.skipped += len(visits) - inserted
+        summary.rejected += len(rejects)
+        summary.rows += len(batch)
+        return rejects
+
+    async def run(
+        self, path: str, fmt: str, checkpoint_path: str, rejects_path: str, restart: bool = False
+    ) -> ImportSummary:
+        """Import `path`, resuming after the rows recorded in `checkpoint_path` unless `restart`."""
+        self.source_name = self.source_name or os.path.basename(path)
+        summary = ImportSummary(self.kind, self.source_name)
+        if not restart and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as checkpoint:
+                saved = json.load(checkpoint)
+            if saved["kind"] != self.kind or saved["source"] != self.source_name:
+                raise ValueError(f"Checkpoint {checkpoint_path} belongs to another import; pass restart")
+            summary = ImportSummary(**{**saved, "seconds": 0.0, "resumed_from": saved["rows"]})
+            logger.info(f"Resuming {self.source_name} after row {summary.rows}")
+
+        await self.load_lookups()
+        started = time.perf_counter()
+        rows = read_rows(path, fmt)
+        for _ in islice(rows, summary.resumed_from):
+            pass
+        with open(rejects_path, "a" if summary.resumed_from else "w", encoding="utf-8") as rejects_file:
+            while True:
+                batch = list(islice(rows, self.batch_rows))
+                if not batch:
+                    break
+                rejects = await self.import_batch(batch, summary)
+                for number, error, raw in rejects:
+                    data = {key: value for key, value in raw.items() if key != _PARSE_ERROR}
+                    rejects_file.write(json.dumps({"row": number, "error": error, "data": data}, default=str) + "\n")
+                rejects_file.flush()
+                summary.seconds = time.perf_counter() - started
+                self._save_checkpoint(checkpoint_path, summary)
+                logger.info(
+                    f"{self.source_name}: {summary.rows} rows, {summary.imported} imported, {summary.skipped} skipped, "
+                    f"{summary.rejected} rejected, {summary.rows_per_second:,.0f} rows/s"
+                )
+        summary.seconds = time.perf_counter() - started
+        return summary
+
+    @staticmethod
+    def _save_checkpoint(path: str, summary: ImportSummary) -> None:
+        data = {key: value for key, value in asdict(summary).items() if key not in ("seconds", "resumed_from")}
+        partial = f"{path}.tmp"
+        with open(partial, "w") as checkpoint:
+            json.dump(data, checkpoint)
+        os.replace(partial, path)
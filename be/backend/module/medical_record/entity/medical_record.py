@@ -4,9 +4,28 @@ from datetime import datetime
 
 from backend.infrastructure.database.connection import Base
 from backend.module.common.enums import OutcomeEnum
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Text
-from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR, UUID as PG_UUID
+from sqlalchemy.orm import deferred, relationship
+
+# Text search configurations the record text is indexed (and queries parsed) with
+SEARCH_CONFIGS = ("indonesian", "english")
+# Searched columns by weight: a match in the diagnosis ranks above one in the notes
+SEARCH_FIELDS = (
+    ("diagnosis", "A"),
+    ("anamnesis", "B"),
+    ("physical_exam", "C"),
+    ("treatment_plan", "C"),
+    ("doctor_notes", "D"),
+)
+
+
+def search_vector_expression() -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({field}, '')), '{weight}')"
+        for field, weight in SEARCH_FIELDS
+        for config in SEARCH_CONFIGS
+    )
 
 
 class MedicalRecord(Base):
@@ -20,14 +39,29 @@ class MedicalRecord(Base):
     diagnosis = Column(Text, nullable=True)
     treatment_plan = Column(Text, nullable=True)
     doctor_notes = Column(Text, nullable=True)
+    # ICD-10 codes as written in the diagnosis catalog (J06.9), principal diagnosis first
+    diagnosis_codes = Column(ARRAY(String(10)), nullable=True)
 
     outcome = Column(
         Enum(OutcomeEnum, name="outcome_enum", create_type=False),
         nullable=True
     )
+    # Latest of the record's revisions (medical_record_revisions); 0 while it has none, for
+    # records written before revisions were kept
+    revision = Column(Integer, nullable=False, default=0, server_default="0")
 
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
 
+    # Maintained by Postgres from the text columns; only full-text search reads it. The migration
+    # raises its statistics target so that search plans can tell rare terms from common ones.
+    search_vector = deferred(Column(TSVECTOR, Computed(search_vector_expression(), persisted=True)))
+
+    __table_args__ = (
+        Index("ix_medical_records_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_medical_records_created_at", "created_at"),
+        Index("ix_medical_records_diagnosis_codes", "diagnosis_codes", postgresql_using="gin"),
+    )
+
     # Relationships
     visit = relationship("Visit", backref="medical_record", lazy="select")
@@ -1,16 +1,20 @@
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 from backend.module.common.enums import OutcomeEnum
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
+
+MAX_DIAGNOSIS_CODES = 20
 
 
 class MedicalRecordBase(BaseModel):
     anamnesis: Optional[str] = None
     physical_exam: Optional[str] = None
     diagnosis: Optional[str] = None
+    # ICD-10 codes (GET /diagnoses/search), principal diagnosis first; [] clears them
+    diagnosis_codes: Optional[List[str]] = Field(None, max_length=MAX_DIAGNOSIS_CODES)
     treatment_plan: Optional[str] = None
     doctor_notes: Optional[str] = None
     outcome: Optional[OutcomeEnum] = None
@@ -31,3 +35,52 @@ class MedicalRecordDTO(MedicalRecordBase):
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class MedicalRecordSummaryDTO(BaseModel):
+    """A record in a list: what identifies and sums it up, without the notes (GET the record for those)."""
+    id: UUID
+    visit_id: UUID
+    patient_id: UUID
+    doctor_id: UUID
+    visit_datetime: datetime
+    # The start of the diagnosis; truncated when diagnosis_truncated
+    diagnosis: Optional[str] = None
+    diagnosis_truncated: bool = False
+    diagnosis_codes: Optional[List[str]] = None
+    outcome: Optional[OutcomeEnum] = None
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MedicalRecordSearchResultDTO(MedicalRecordDTO):
+    patient_id: UUID
+    doctor_id: UUID
+    visit_datetime: datetime
+    rank: float
+    # Matching fragments, HTML-escaped, with the matched terms in <mark></mark>
+    highlight: Optional[str] = None
+
+
+class MedicalRecordRevisionDTO(BaseModel):
+    """A change to a record: which fields it changed, by whom and when."""
+    revision: int
+    changed_fields: List[str]
+    changed_by: Optional[UUID] = None  # Doctor; None for the version a record had before revisions were kept
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MedicalRecordRevisionsDTO(BaseModel):
+    record_id: UUID
+    revisions: List[MedicalRecordRevisionDTO] = []
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next (older) page
+
+
+class MedicalRecordVersionDTO(MedicalRecordBase, MedicalRecordRevisionDTO):
+    """A record as it was at a revision."""
+    id: UUID
+    visit_id: UUID
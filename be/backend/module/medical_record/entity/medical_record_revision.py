@@ -0,0 +1,27 @@
+
+from datetime import datetime
+
+from backend.infrastructure.database.connection import Base
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID as PG_UUID
+
+
+class MedicalRecordRevision(Base):
+    """
+    A version of a medical record: a snapshot of its fields, or the fields it changed as diffs
+    against the previous revision (see usecases/medical_record_revisions.py).
+    """
+    __tablename__ = "medical_record_revisions"
+
+    record_id = Column(
+        PG_UUID(as_uuid=True), ForeignKey("medical_records.id", ondelete="CASCADE"), primary_key=True
+    )
+    revision = Column(Integer, primary_key=True)  # 1, 2, ... per record
+
+    snapshot = Column(Boolean, nullable=False)
+    changes = Column(JSONB, nullable=False)
+    changed_fields = Column(ARRAY(String(20)), nullable=False)
+    # None for the version a record had before revisions were kept
+    changed_by = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id"), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
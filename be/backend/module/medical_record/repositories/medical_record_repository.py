@@ -1,22 +1,50 @@
 
+from functools import reduce
+from typing import Any, Dict, Optional, Sequence
 from uuid import UUID
 
-from backend.module.medical_record.entity.medical_record import MedicalRecord
+from backend.module.medical_record.entity.medical_record import SEARCH_CONFIGS, SEARCH_FIELDS, MedicalRecord
+from backend.module.medical_record.entity.medical_record_revision import MedicalRecordRevision
 from backend.module.visit.entity.visit import Visit
-from sqlalchemy import func, select
+from sqlalchemy import case, cast, column, exists, func, literal, select, text, update
+from sqlalchemy import values as sa_values
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSQUERY, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import aliased, joinedload
+
+
+# Markers around matched terms in highlights, replaced once the text is escaped
+HIGHLIGHT_START = "\ue000"
+HIGHLIGHT_STOP = "\ue001"
+_HEADLINE_OPTIONS = (
+    f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+    'MaxFragments=2, MaxWords=20, MinWords=8, FragmentDelimiter=" … "'
+)
+
+
+def _search_query(search: str):
+    """The search as a web-search style query in every configuration, any of them matching."""
+    queries = [func.websearch_to_tsquery(cast(literal(config), REGCONFIG), search) for config in SEARCH_CONFIGS]
+    return reduce(lambda left, right: left.op("||", return_type=TSQUERY)(right), queries)
 
 
 class MedicalRecordRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def create(self, record: MedicalRecord) -> MedicalRecord:
-        self.session.add(record)
-        await self.session.flush()
-        await self.session.refresh(record)
-        return record
+    @staticmethod
+    def _with_revisions(stmt, revisions: Sequence[Dict[str, Any]]):
+        """
+        `stmt` also inserting the revisions, as a CTE: one statement, one round trip. A revision
+        already there (written by a concurrent update) is left alone.
+        """
+        revisions_insert = insert(MedicalRecordRevision).values(list(revisions)).on_conflict_do_nothing()
+        return stmt.add_cte(revisions_insert.cte("revisions")).returning(MedicalRecord)
+
+    async def create(self, values: Dict[str, Any], revisions: Sequence[Dict[str, Any]]) -> MedicalRecord:
+        """Insert a record (`values` including its id) with its first revisions."""
+        stmt = self._with_revisions(insert(MedicalRecord).values(**values), revisions)
+        return (await self.session.scalars(stmt)).one()
 
     async def get_by_id(self, record_id: UUID) -> MedicalRecord | None:
         stmt = select(MedicalRecord).options(joinedload(MedicalRecord.visit)).where(MedicalRecord.id == record_id)
@@ -28,16 +56,89 @@ class MedicalRecordRepository:
         result = await self.session.execute(stmt)
         return result.scalars().first()
 
-    async def update(self, record: MedicalRecord) -> MedicalRecord:
-        self.session.add(record)
-        await self.session.flush()
-        await self.session.refresh(record)
-        return record
+    async def update(
+        self, record_id: UUID, revision: int, values: Dict[str, Any], revisions: Sequence[Dict[str, Any]]
+    ) -> MedicalRecord | None:
+        """
+        Set `values` on the record and add its new revisions, if the record is still at
+        `revision`; else (it was changed or deleted meanwhile) None. One statement: the
+        revisions are inserted from the row the UPDATE returned, so none are written when it
+        matched nothing (which, for a deleted record, would violate their foreign key).
+        """
+        updated = (
+            update(MedicalRecord)
+            .where(MedicalRecord.id == record_id, MedicalRecord.revision == revision)
+            .values(**values)
+            .returning(*MedicalRecord.__table__.c)
+            .cte("updated")
+        )
+        columns = MedicalRecordRevision.__table__.c
+        rows = sa_values(*(column(c.name, c.type) for c in columns), name="new_revisions").data(
+            [tuple(row[c.name] for c in columns) for row in revisions]
+        )
+        revisions_insert = insert(MedicalRecordRevision).from_select(
+            [c.name for c in columns],
+            # Cast, since a VALUES column of NULLs (e.g. no changed_by) has no type of its own
+            select(*(cast(rows.c[c.name], c.type) for c in columns)).where(exists(select(updated.c.id)))
+        ).on_conflict_do_nothing()
+        stmt = select(aliased(MedicalRecord, updated)).add_cte(revisions_insert.cte("revisions"))
+        result = await self.session.scalars(stmt, execution_options={"populate_existing": True})
+        return result.one_or_none()
 
     async def delete(self, record: MedicalRecord) -> None:
         await self.session.delete(record)
         await self.session.flush()
 
+    async def list_revisions(self, record_id: UUID, limit: int, before: Optional[int] = None) -> list:
+        """Up to `limit` revisions of a record below `before`, newest first, without their changes."""
+        stmt = select(
+            MedicalRecordRevision.revision, MedicalRecordRevision.changed_fields,
+            MedicalRecordRevision.changed_by, MedicalRecordRevision.created_at,
+        ).where(MedicalRecordRevision.record_id == record_id)
+        if before is not None:
+            stmt = stmt.where(MedicalRecordRevision.revision < before)
+        stmt = stmt.order_by(MedicalRecordRevision.revision.desc()).limit(limit)
+        return list((await self.session.execute(stmt)).all())
+
+    async def get_revision_chain(self, record_id: UUID, revision: int) -> list[MedicalRecordRevision]:
+        """The revisions from the last snapshot at or before `revision` up to it, in order."""
+        snapshot = (
+            select(func.max(MedicalRecordRevision.revision))
+            .where(
+                MedicalRecordRevision.record_id == record_id,
+                MedicalRecordRevision.snapshot,
+                MedicalRecordRevision.revision <= revision,
+            )
+            .scalar_subquery()
+        )
+        stmt = (
+            select(MedicalRecordRevision)
+            .where(
+                MedicalRecordRevision.record_id == record_id,
+                MedicalRecordRevision.revision >= snapshot,
+                MedicalRecordRevision.revision <= revision,
+            )
+            .order_by(MedicalRecordRevision.revision)
+        )
+        return list((await self.session.scalars(stmt)).all())
+
+    @staticmethod
+    def _list_filters(patient_id: UUID = None, doctor_id: UUID = None, visit_id: UUID = None) -> list:
+        filters = []
+        if visit_id:
+            filters.append(MedicalRecord.visit_id == visit_id)
+        if patient_id:
+            filters.append(Visit.patient_id == patient_id)
+        if doctor_id:
+            filters.append(Visit.doctor_id == doctor_id)
+        return filters
+
+    async def _count(self, filters: list) -> int:
+        count_stmt = select(func.count()).select_from(MedicalRecord).join(Visit, MedicalRecord.visit_id == Visit.id)
+        for f in filters:
+            count_stmt = count_stmt.where(f)
+        return (await self.session.execute(count_stmt)).scalar() or 0
+
     async def list_medical_records(
         self,
         page: int = 1,
@@ -48,28 +149,15 @@ class MedicalRecordRepository:
     ) -> tuple[list[MedicalRecord], int]:
         stmt = select(MedicalRecord).join(Visit, MedicalRecord.visit_id == Visit.id)
 
-        filters = []
-        if visit_id:
-            filters.append(MedicalRecord.visit_id == visit_id)
-        if patient_id:
-            filters.append(Visit.patient_id == patient_id)
-        if doctor_id:
-            filters.append(Visit.doctor_id == doctor_id)
-
-        if filters:
-            for f in filters:
-                stmt = stmt.where(f)
+        filters = self._list_filters(patient_id, doctor_id, visit_id)
+        for f in filters:
+            stmt = stmt.where(f)
 
         # Order by created_at desc
         stmt = stmt.order_by(MedicalRecord.created_at.desc())
 
         # Total count
-        count_stmt = select(func.count()).select_from(MedicalRecord).join(Visit, MedicalRecord.visit_id == Visit.id)
-        if filters:
-            for f in filters:
-                count_stmt = count_stmt.where(f)
-
-        total = (await self.session.execute(count_stmt)).scalar() or 0
+        total = await self._count(filters)
 
         # Paginate
         stmt = stmt.offset((page - 1) * limit).limit(limit)
@@ -77,3 +165,106 @@ class MedicalRecordRepository:
         records = result.scalars().all()
 
         return records, total
+
+    async def list_medical_record_summaries(
+        self,
+        diagnosis_length: int,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: UUID = None,
+        doctor_id: UUID = None,
+        visit_id: UUID = None
+    ) -> tuple[list, int]:
+        """
+        The list_medical_records page as rows of the record's metadata, its visit's patient,
+        doctor and time, and the first `diagnosis_length` characters of the diagnosis. The other
+        text columns, which can be long, are not read.
+        """
+        stmt = (
+            select(
+                MedicalRecord.id, MedicalRecord.visit_id, Visit.patient_id, Visit.doctor_id, Visit.visit_datetime,
+                func.left(MedicalRecord.diagnosis, diagnosis_length).label("diagnosis"),
+                MedicalRecord.diagnosis_codes, MedicalRecord.outcome, MedicalRecord.created_at,
+                MedicalRecord.updated_at,
+            )
+            .join(Visit, MedicalRecord.visit_id == Visit.id)
+        )
+        filters = self._list_filters(patient_id, doctor_id, visit_id)
+        for f in filters:
+            stmt = stmt.where(f)
+        stmt = stmt.order_by(MedicalRecord.created_at.desc()).offset((page - 1) * limit).limit(limit)
+        rows = (await self.session.execute(stmt)).all()
+        return list(rows), await self._count(filters)
+
+    async def search_medical_records(
+        self,
+        search: str,
+        max_matches: int,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: UUID = None,
+        doctor_id: UUID = None
+    ) -> tuple[list, int]:
+        """
+        Records matching the full-text query, best match first among the newest `max_matches`
+        matches, as rows of the record columns, the visit's patient, doctor and time, `rank` and
+        `highlight`. The total counts the ranked matches, so at most `max_matches`.
+
+        Ranking reads every candidate's vector, so the candidates are bounded: Postgres takes the
+        newest matches from the GIN index for rare terms or by walking created_at backwards for
+        common ones. Only the page's rows get a highlight, the other expensive part.
+        """
+        # The plan depends on how common the searched terms are; a cached generic plan cannot know
+        await self.session.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+
+        tsquery = select(_search_query(search)).scalar_subquery()  # Evaluated once
+        candidates = (
+            select(MedicalRecord.id, MedicalRecord.created_at, MedicalRecord.search_vector)
+            .join(Visit, MedicalRecord.visit_id == Visit.id)
+            .where(MedicalRecord.search_vector.bool_op("@@")(_search_query(search)))
+            .order_by(MedicalRecord.created_at.desc())
+            .limit(max_matches)
+        )
+        if patient_id:
+            candidates = candidates.where(Visit.patient_id == patient_id)
+        if doctor_id:
+            candidates = candidates.where(Visit.doctor_id == doctor_id)
+        candidates = candidates.subquery()
+
+        rank = func.ts_rank_cd(candidates.c.search_vector, tsquery)
+        ranked = (
+            select(candidates.c.id, rank.label("rank"), func.count().over().label("total"))
+            .order_by(rank.desc(), candidates.c.created_at.desc(), candidates.c.id)
+            .offset((page - 1) * limit)
+            .limit(limit)
+            .subquery()
+        )
+        document = func.concat_ws(" … ", *(getattr(MedicalRecord, field) for field, _ in SEARCH_FIELDS))
+        # A term may match in one configuration only (stemmed differently), so highlight with the
+        # first configuration that marks anything
+        headlines = [
+            func.ts_headline(cast(literal(config), REGCONFIG), document, tsquery, _HEADLINE_OPTIONS)
+            for config in SEARCH_CONFIGS
+        ]
+        highlight = reduce(
+            lambda fallback, headline: case((func.strpos(headline, HIGHLIGHT_START) > 0, headline), else_=fallback),
+            reversed(headlines),
+        )
+        stmt = (
+            select(
+                MedicalRecord.id, MedicalRecord.visit_id, MedicalRecord.anamnesis, MedicalRecord.physical_exam,
+                MedicalRecord.diagnosis, MedicalRecord.diagnosis_codes, MedicalRecord.treatment_plan,
+                MedicalRecord.doctor_notes, MedicalRecord.outcome, MedicalRecord.created_at, MedicalRecord.updated_at,
+                Visit.patient_id, Visit.doctor_id, Visit.visit_datetime, ranked.c.rank, ranked.c.total,
+                highlight.label("highlight"),
+            )
+            .join(ranked, ranked.c.id == MedicalRecord.id)
+            .join(Visit, MedicalRecord.visit_id == Visit.id)
+            .order_by(ranked.c.rank.desc(), MedicalRecord.created_at.desc(), MedicalRecord.id)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        if rows or page == 1:
+            return rows, rows[0].total if rows else 0
+        # Past the last page: count the candidates on their own
+        total = (await self.session.execute(select(func.count()).select_from(candidates))).scalar() or 0
+        return rows, total
@@ -0,0 +1,164 @@
+"""
+Medical record history, stored compactly.
+
+Every change to a record adds a revision holding only the fields it changed, each text field as
+a diff against its previous value (or the new value, when shorter), so the history of a long
+note grows with the edits made to it rather than with its length. Every
+MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL revisions (and whenever the diff would be no smaller) a
+revision holds every field instead, so that any version is rebuilt from the nearest snapshot at
+or before it plus fewer than that many diffs, one query.
+
+A text diff is a list of operations on the previous text: a positive number copies that many
+characters, a negative one skips that many, a string is inserted, and whatever is left of the
+previous text is copied. Edits are found between words and spaces (difflib over tokens) once
+the common start and end are trimmed, so a local edit of a long note is cheap to find.
+"""
+import json
+import re
+from datetime import datetime
+from difflib import SequenceMatcher
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Union
+from uuid import UUID
+
+from backend.infrastructure.config.settings import settings
+from backend.module.medical_record.entity.medical_record import MedicalRecord
+from backend.module.medical_record.entity.medical_record_revision import MedicalRecordRevision
+
+TEXT_FIELDS = ("anamnesis", "physical_exam", "diagnosis", "treatment_plan", "doctor_notes")
+# Stored whole when changed
+VALUE_FIELDS = ("diagnosis_codes", "outcome")
+REVISION_FIELDS = TEXT_FIELDS + VALUE_FIELDS
+
+_TOKEN = re.compile(r"\s+|\S+")
+
+# A record's revisioned fields as JSON values (outcome by value)
+Version = Dict[str, Any]
+TextDiff = List[Union[int, str]]
+
+
+def record_version(record: MedicalRecord) -> Version:
+    return version_of({field: getattr(record, field) for field in REVISION_FIELDS})
+
+
+def version_of(values: Dict[str, Any]) -> Version:
+    return {field: value.value if isinstance(value, Enum) else value for field, value in values.items()}
+
+
+def _size(value: Any) -> int:
+    return len(json.dumps(value, ensure_ascii=False))
+
+
+def _append(ops: TextDiff, op: Union[int, str]) -> None:
+    """Add an operation, merged into the last one when of the same kind."""
+    if not op:
+        return
+    if ops:
+        last = ops[-1]
+        if isinstance(op, str) and isinstance(last, str):
+            ops[-1] = last + op
+            return
+        if isinstance(op, int) and isinstance(last, int) and (op > 0) == (last > 0):
+            ops[-1] = last + op
+            return
+    ops.append(op)
+
+
+def diff_text(old: str, new: str) -> TextDiff:
+    """Operations turning `old` into `new` (see the module docstring)."""
+    old_tokens, new_tokens = _TOKEN.findall(old), _TOKEN.findall(new)
+    start = 0
+    while start < min(len(old_tokens), len(new_tokens)) and old_tokens[start] == new_tokens[start]:
+        start += 1
+    old_stop, new_stop = len(old_tokens), len(new_tokens)
+    while old_stop > start and new_stop > start and old_tokens[old_stop - 1] == new_tokens[new_stop - 1]:
+        old_stop -= 1
+        new_stop -= 1
+
+    ops: TextDiff = []
+    _append(ops, sum(map(len, old_tokens[:start])))
+    old_middle, new_middle = old_tokens[start:old_stop], new_tokens[start:new_stop]
+    matcher = SequenceMatcher(None, old_middle, new_middle, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            _append(ops, sum(map(len, old_middle[i1:i2])))
+        else:
+            _append(ops, -sum(map(len, old_middle[i1:i2])))
+            _append(ops, "".join(new_middle[j1:j2]))
+    if ops and isinstance(ops[-1], int) and ops[-1] > 0:
+        ops.pop()  # The rest is copied anyway
+    return ops
+
+
+def apply_text(old: str, ops: TextDiff) -> str:
+    parts, position = [], 0
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.append(old[position:position + op])
+            position += op
+        else:
+            position -= op
+    parts.append(old[position:])
+    return "".join(parts)
+
+
+def new_revision(
+    record_id: UUID,
+    revision: int,
+    previous: Optional[Version],
+    current: Version,
+    changed_by: Optional[UUID],
+    created_at: datetime
+) -> Dict[str, Any]:
+    """
+    The medical_record_revisions row of `revision`, which turns `previous` into `current`:
+    a snapshot for the first revision and every MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL,
+    else the diff of the changed fields unless it is no smaller than a snapshot.
+    """
+    if previous is None:
+        changed = [field for field in REVISION_FIELDS if current[field] is not None]
+    else:
+        changed = [field for field in REVISION_FIELDS if current[field] != previous[field]]
+
+    # Snapshots leave out empty fields
+    changes = {field: current[field] for field in REVISION_FIELDS if current[field] is not None}
+    snapshot = previous is None or (revision - 1) % settings.MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL == 0
+    if not snapshot:
+        diff = {}
+        for field in changed:
+            old, new = previous[field], current[field]
+            # A diff is a list; a string or None replaces the text (when no longer than the diff)
+            diff[field] = new
+            if field in TEXT_FIELDS and old and new:
+                ops = diff_text(old, new)
+                if _size(ops) < _size(new):
+                    diff[field] = ops
+        snapshot = _size(diff) >= _size(changes)
+        if not snapshot:
+            changes = diff
+
+    return {
+        "record_id": record_id,
+        "revision": revision,
+        "snapshot": snapshot,
+        "changes": changes,
+        "changed_fields": changed,
+        "changed_by": changed_by,
+        "created_at": created_at,
+    }
+
+
+def rebuild(revisions: Sequence[MedicalRecordRevision]) -> Version:
+    """The version of the last of `revisions`, which start with a snapshot and follow in order."""
+    version: Version = {}
+    for revision in revisions:
+        if revision.snapshot:
+            version = {field: revision.changes.get(field) for field in REVISION_FIELDS}
+            continue
+        for field, value in revision.changes.items():
+            if field in TEXT_FIELDS and isinstance(value, list):
+                value = apply_text(version[field], value)
+            version[field] = value
+    return version
@@ -1,15 +1,32 @@
-from typing import List, Optional
+import html
+import uuid
+from datetime import datetime
+from typing import List, Optional, Tuple
 from uuid import UUID
 
+from backend.infrastructure.config.settings import settings
 from backend.module.common.enums import RoleEnum
+from backend.module.diagnosis.usecases.diagnosis_usecase import DiagnosisUseCase
 from backend.module.medical_record.entity.medical_record import MedicalRecord
 from backend.module.medical_record.entity.medical_record_dto import (
     MedicalRecordCreateDTO,
+    MedicalRecordSearchResultDTO,
+    MedicalRecordSummaryDTO,
     MedicalRecordUpdateDTO,
+    MedicalRecordVersionDTO,
 )
 from backend.module.medical_record.repositories.medical_record_repository import (
+    HIGHLIGHT_START,
+    HIGHLIGHT_STOP,
     MedicalRecordRepository,
 )
+from backend.module.medical_record.usecases.medical_record_revisions import (
+    REVISION_FIELDS,
+    new_revision,
+    rebuild,
+    record_version,
+    version_of,
+)
 from backend.module.visit.repositories.visit_repository import VisitRepository
 from backend.pkg.core.exceptions import (
     AuthorizationException,
@@ -17,11 +34,47 @@ from backend.pkg.core.exceptions import (
     NotFoundException,
 )
 
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_QUERY_LENGTH = 200
+# Characters of the diagnosis in record summaries
+SUMMARY_DIAGNOSIS_LENGTH = 120
+MAX_REVISION_LIMIT = 100
+
+
+def _visible_to(
+    user_id: UUID, role: str, patient_id: Optional[UUID], doctor_id: Optional[UUID]
+) -> Tuple[Optional[UUID], Optional[UUID]]:
+    """(patient_id, doctor_id) filters narrowed to the records the user may see."""
+    if role == RoleEnum.PATIENT.value:
+        patient_id = user_id
+    elif role == RoleEnum.DOCTOR.value and not patient_id:
+        doctor_id = user_id
+    # Admin/Staff see all
+    return patient_id, doctor_id
+
+
+def _highlight(headline: Optional[str]) -> Optional[str]:
+    if not headline:
+        return None
+    return html.escape(headline).replace(HIGHLIGHT_START, "<mark>").replace(HIGHLIGHT_STOP, "</mark>")
+
 
 class MedicalRecordUseCase:
-    def __init__(self, repository: MedicalRecordRepository, visit_repository: VisitRepository):
+    def __init__(
+        self,
+        repository: MedicalRecordRepository,
+        visit_repository: VisitRepository,
+        diagnoses: Optional[DiagnosisUseCase] = None
+    ):
         self.repository = repository
         self.visit_repository = visit_repository
+        self.diagnoses = diagnoses
+
+    async def _diagnosis_codes(self, codes: Optional[List[str]]) -> Optional[List[str]]:
+        """Codes checked against the diagnosis catalog and written as it writes them; None for none."""
+        if codes and self.diagnoses:
+            codes = await self.diagnoses.normalize_codes(codes)
+        return codes or None
 
     async def create_medical_record(self, req: MedicalRecordCreateDTO, doctor_id: UUID) -> MedicalRecord:
         """Create medical record. Authorization handled by middleware."""
@@ -38,16 +91,24 @@ class MedicalRecordUseCase:
         if existing:
             raise BusinessLogicException("Medical record already exists for this visit")
 
-        new_record = MedicalRecord(
+        now = datetime.utcnow()
+        values = dict(
+            id=uuid.uuid4(),
             visit_id=req.visit_id,
             anamnesis=req.anamnesis,
             physical_exam=req.physical_exam,
             diagnosis=req.diagnosis,
+            diagnosis_codes=await self._diagnosis_codes(req.diagnosis_codes),
             treatment_plan=req.treatment_plan,
             doctor_notes=req.doctor_notes,
-            outcome=req.outcome
+            outcome=req.outcome,
+            revision=1,
+            created_at=now,
+            updated_at=now
         )
-        return await self.repository.create(new_record)
+        current = version_of({field: values[field] for field in REVISION_FIELDS})
+        revision = new_revision(values["id"], 1, None, current, doctor_id, now)
+        return await self.repository.create(values, [revision])
 
     async def get_medical_record(self, record_id: UUID, user_id: UUID, role: str) -> MedicalRecord:
         """Get medical record with ownership check."""
@@ -75,20 +136,32 @@ class MedicalRecordUseCase:
         if record.visit.doctor_id != doctor_id:
             raise AuthorizationException("You are not the assigned doctor for this visit")
 
-        if req.anamnesis is not None:
-            record.anamnesis = req.anamnesis
-        if req.physical_exam is not None:
-            record.physical_exam = req.physical_exam
-        if req.diagnosis is not None:
-            record.diagnosis = req.diagnosis
-        if req.treatment_plan is not None:
-            record.treatment_plan = req.treatment_plan
-        if req.doctor_notes is not None:
-            record.doctor_notes = req.doctor_notes
-        if req.outcome is not None:
-            record.outcome = req.outcome
-
-        return await self.repository.update(record)
+        values = req.model_dump(exclude_none=True)
+        if "diagnosis_codes" in values:
+            values["diagnosis_codes"] = await self._diagnosis_codes(values["diagnosis_codes"])
+        previous = record_version(record)
+        current = {**previous, **version_of(values)}
+        changed = {field: values[field] for field in REVISION_FIELDS if current[field] != previous[field]}
+        if not changed:
+            return record
+
+        # The record and its new revision are written in one statement, if no other update got
+        # there first
+        now = datetime.utcnow()
+        revisions = []
+        revision = record.revision
+        if revision == 0:
+            # Written before revisions were kept: its version so far becomes the first
+            revision = 1
+            revisions.append(new_revision(record.id, 1, None, previous, None, record.updated_at))
+        revision += 1
+        revisions.append(new_revision(record.id, revision, previous, current, doctor_id, now))
+        updated = await self.repository.update(
+            record.id, record.revision, {**changed, "revision": revision, "updated_at": now}, revisions
+        )
+        if not updated:
+            raise BusinessLogicException("Medical record was changed by another request, reload it and try again")
+        return updated
 
     async def delete_medical_record(self, record_id: UUID, doctor_id: UUID) -> None:
         """Delete medical record. Authorization handled by middleware, ownership check here."""
@@ -102,6 +175,51 @@ class MedicalRecordUseCase:
 
         await self.repository.delete(record)
 
+    async def list_medical_record_revisions(
+        self,
+        record_id: UUID,
+        user_id: UUID,
+        role: str,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[list, Optional[str]]:
+        """
+        The record's revisions newest first, with ownership check. Returns (page, token for the
+        next page or None).
+        """
+        if limit < 1 or limit > MAX_REVISION_LIMIT:
+            raise BusinessLogicException(f"limit must be between 1 and {MAX_REVISION_LIMIT}")
+        try:
+            before = int(cursor) if cursor else None
+        except ValueError:
+            raise BusinessLogicException("Invalid revision cursor")
+        await self.get_medical_record(record_id, user_id, role)
+
+        # One extra row tells whether another page follows
+        revisions = await self.repository.list_revisions(record_id, limit + 1, before)
+        if len(revisions) > limit:
+            return revisions[:limit], str(revisions[limit - 1].revision)
+        return revisions, None
+
+    async def get_medical_record_version(
+        self, record_id: UUID, revision: int, user_id: UUID, role: str
+    ) -> MedicalRecordVersionDTO:
+        """The record as it was at a revision, with ownership check."""
+        record = await self.get_medical_record(record_id, user_id, role)
+        chain = await self.repository.get_revision_chain(record_id, revision)
+        if not chain or chain[-1].revision != revision:
+            raise NotFoundException(f"Revision {revision} of the medical record not found")
+        last = chain[-1]
+        return MedicalRecordVersionDTO(
+            id=record.id,
+            visit_id=record.visit_id,
+            revision=revision,
+            changed_fields=last.changed_fields,
+            changed_by=last.changed_by,
+            created_at=last.created_at,
+            **rebuild(chain)
+        )
+
     async def list_medical_records(
         self,
         page: int,
@@ -113,15 +231,7 @@ class MedicalRecordUseCase:
         visit_id: Optional[UUID] = None
     ) -> tuple[List[MedicalRecord], int]:
         """List medical records with ownership filter."""
-        filter_patient_id = patient_id
-        filter_doctor_id = doctor_id
-
-        if role == RoleEnum.PATIENT.value:
-            filter_patient_id = user_id
-        elif role == RoleEnum.DOCTOR.value and not patient_id:
-            filter_doctor_id = user_id
-        # Admin/Staff see all
-
+        filter_patient_id, filter_doctor_id = _visible_to(user_id, role, patient_id, doctor_id)
         return await self.repository.list_medical_records(
             page=page,
             limit=limit,
@@ -129,3 +239,64 @@ class MedicalRecordUseCase:
             doctor_id=filter_doctor_id,
             visit_id=visit_id
         )
+
+    async def list_medical_record_summaries(
+        self,
+        page: int,
+        limit: int,
+        user_id: UUID,
+        role: str,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        visit_id: Optional[UUID] = None
+    ) -> tuple[List[MedicalRecordSummaryDTO], int]:
+        """List medical records with ownership filter, without their text but the start of the diagnosis."""
+        filter_patient_id, filter_doctor_id = _visible_to(user_id, role, patient_id, doctor_id)
+        # One character more than shown tells whether there is more
+        rows, total = await self.repository.list_medical_record_summaries(
+            SUMMARY_DIAGNOSIS_LENGTH + 1,
+            page=page,
+            limit=limit,
+            patient_id=filter_patient_id,
+            doctor_id=filter_doctor_id,
+            visit_id=visit_id
+        )
+        summaries = []
+        for row in rows:
+            summary = MedicalRecordSummaryDTO.model_validate(row)
+            if summary.diagnosis and len(summary.diagnosis) > SUMMARY_DIAGNOSIS_LENGTH:
+                summary.diagnosis = summary.diagnosis[:SUMMARY_DIAGNOSIS_LENGTH]
+                summary.diagnosis_truncated = True
+            summaries.append(summary)
+        return summaries, total
+
+    async def search_medical_records(
+        self,
+        query: str,
+        page: int,
+        limit: int,
+        user_id: UUID,
+        role: str,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None
+    ) -> tuple[List[MedicalRecordSearchResultDTO], int]:
+        """
+        Full-text search over the records the user may see, best match first among the newest
+        MEDICAL_RECORD_SEARCH_MAX_MATCHES matches, with highlights.
+        """
+        query = query.strip()
+        if not query or len(query) > MAX_SEARCH_QUERY_LENGTH:
+            raise BusinessLogicException(f"q must be 1 to {MAX_SEARCH_QUERY_LENGTH} characters")
+        if page < 1 or limit < 1 or limit > MAX_SEARCH_LIMIT:
+            raise BusinessLogicException(f"page must be positive and limit between 1 and {MAX_SEARCH_LIMIT}")
+        filter_patient_id, filter_doctor_id = _visible_to(user_id, role, patient_id, doctor_id)
+
+        rows, total = await self.repository.search_medical_records(
+            query, settings.MEDICAL_RECORD_SEARCH_MAX_MATCHES, page=page, limit=limit,
+            patient_id=filter_patient_id, doctor_id=filter_doctor_id
+        )
+        results = [
+            MedicalRecordSearchResultDTO.model_validate(row).model_copy(update={"highlight": _highlight(row.highlight)})
+            for row in rows
+        ]
+        return results, total
@@ -2,6 +2,8 @@
 from typing import Optional
 from uuid import UUID
 
+from backend.infrastructure.search.service import get_search_service
+from backend.module.common.search_indexes import MEDICINE_SEARCH
 from backend.module.medicine.entity.medicine import Medicine
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -44,7 +46,7 @@ class MedicineRepository:
         stmt = select(Medicine)
 
         if search:
-            stmt = stmt.where(Medicine.medicine_name.ilike(f"%{search}%"))
+            stmt = stmt.where(await get_search_service().match(MEDICINE_SEARCH, search))
 
         if is_active is not None:
             stmt = stmt.where(Medicine.is_active == is_active)
@@ -1,6 +1,9 @@
 
+from typing import Optional
 from uuid import UUID
 
+from backend.infrastructure.search.service import SearchIndexer
+from backend.module.common.search_indexes import MEDICINE_SEARCH
 from backend.module.medicine.entity.medicine import Medicine
 from backend.module.medicine.entity.medicine_dto import (
     MedicineCreateDTO,
@@ -11,8 +14,9 @@ from backend.pkg.core.exceptions import BusinessLogicException, NotFoundExceptio
 
 
 class MedicineUseCase:
-    def __init__(self, repository: MedicineRepository):
+    def __init__(self, repository: MedicineRepository, search: Optional[SearchIndexer] = None):
         self.repository = repository
+        self.search = search
 
     async def create_medicine(self, req: MedicineCreateDTO) -> Medicine:
         """Create a medicine. Authorization handled by middleware."""
@@ -27,7 +31,10 @@ class MedicineUseCase:
             unit_price=req.unit_price,
             is_active=req.is_active
         )
-        return await self.repository.create(new_medicine)
+        medicine = await self.repository.create(new_medicine)
+        if self.search:
+            await self.search.changed(MEDICINE_SEARCH, medicine.id)
+        return medicine
 
     async def get_medicine(self, medicine_id: UUID) -> Medicine:
         """Get a single medicine by ID."""
@@ -59,7 +66,10 @@ class MedicineUseCase:
         if req.is_active is not None:
             medicine.is_active = req.is_active
 
-        return await self.repository.update(medicine)
+        medicine = await self.repository.update(medicine)
+        if self.search:
+            await self.search.changed(MEDICINE_SEARCH, medicine.id)
+        return medicine
 
     async def delete_medicine(self, medicine_id: UUID) -> None:
         """Delete a medicine. Authorization handled by middleware."""
@@ -68,6 +78,8 @@ class MedicineUseCase:
             raise NotFoundException("Medicine not found")
 
         await self.repository.delete(medicine)
+        if self.search:
+            await self.search.changed(MEDICINE_SEARCH, medicine_id)
 
     async def list_medicines(self, page: int, limit: int, search: str = None) -> tuple[list[Medicine], int]:
         """List medicines. Any authenticated user can access."""
@@ -2,6 +2,8 @@
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from backend.infrastructure.search.service import get_search_service
+from backend.module.common.search_indexes import PRESCRIPTION_SEARCH
 from backend.module.prescription.entity.prescription import (
     Prescription,
     PrescriptionItem,
@@ -81,19 +83,8 @@ class PrescriptionRepository:
             stmt = stmt.where(Prescription.prescription_status == status)
 
         if search:
-            # Search by patient name (via Visit -> Patient (Profile?) -> or just generic search?)
-            # Since we joined Visit, let's assume we can search by something visible?
-            # Maybe search medicine name in items?
-            # Or notes?
-            # User requirement: "each list must have search query"
-            # Let's search notes or patient name?
-            # Note: Checking patient name requires joining Patient Profile.
-            # Let's do a simple search on notes for now, or if Patient name is critical we need another join.
-            # Assuming 'visit' has relation to 'patient' (Profile) which has 'name'.
-            # But 'Visit' refers to 'patient_id' (User ID or Profile ID?).
-            # In Visit entity: patient_id is UUID.
-            # Let's implement search on notes for simplicity unless specific requirment.
-            stmt = stmt.where(Prescription.notes.ilike(f"%{search}%"))
+            # Search by notes
+            stmt = stmt.where(await get_search_service().match(PRESCRIPTION_SEARCH, search))
 
         stmt = stmt.order_by(desc(Prescription.created_at))
 
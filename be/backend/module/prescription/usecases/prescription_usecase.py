@@ -2,7 +2,9 @@
 from typing import List, Optional
 from uuid import UUID
 
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.common.enums import PrescriptionStatusEnum, RoleEnum
+from backend.module.common.search_indexes import PRESCRIPTION_SEARCH
 from backend.module.prescription.entity.prescription import (
     Prescription,
     PrescriptionItem,
@@ -27,10 +29,12 @@ class PrescriptionUseCase:
     def __init__(
         self,
         repository: PrescriptionRepository,
-        visit_repository: VisitRepository
+        visit_repository: VisitRepository,
+        search: Optional[SearchIndexer] = None
     ):
         self.repository = repository
         self.visit_repository = visit_repository
+        self.search = search
 
     async def create_prescription(self, req: PrescriptionCreateDTO, doctor_id: UUID) -> Prescription:
         """Create prescription. Authorization handled by middleware."""
@@ -65,7 +69,10 @@ class PrescriptionUseCase:
             )
             prescription.items.append(item)
 
-        return await self.repository.create(prescription)
+        prescription = await self.repository.create(prescription)
+        if self.search:
+            await self.search.changed(PRESCRIPTION_SEARCH, prescription.id)
+        return prescription
 
     async def get_prescription(self, prescription_id: UUID, user_id: UUID, role: str) -> Prescription:
         """Get prescription with ownership check."""
@@ -97,6 +104,8 @@ class PrescriptionUseCase:
 
         if req.notes is not None:
             prescription.notes = req.notes
+            if self.search:
+                await self.search.changed(PRESCRIPTION_SEARCH, prescription.id)
 
         if req.items is not None:
             prescription.items.clear()
@@ -1,9 +1,11 @@
 from datetime import date
 from typing import Optional, Union
+from uuid import UUID
 
 from backend.module.common.enums import (
     BloodTypeEnum,
     GenderEnum,
+    PatientMatchEnum,
     StaffDepartmentEnum,
 )
 from backend.module.user.entity.user_dao import UserDAO
@@ -33,3 +35,15 @@ class PatientProfileDAO(BaseResponseSchema):
 
 class UserProfileDAO(UserDAO):
     details: Optional[Union[StaffProfileDAO, DoctorProfileDAO, PatientProfileDAO]] = None
+
+
+class PatientSearchResultDAO(BaseResponseSchema):
+    patient_id: UUID
+    user_id: UUID
+    full_name: str
+    nik: str
+    bpjs_number: Optional[str] = None
+    date_of_birth: date
+    gender: GenderEnum
+    matched_on: PatientMatchEnum
+    score: Optional[float] = None  # 1.0 for an exact match; None where pg_trgm is not installed
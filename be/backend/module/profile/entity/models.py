@@ -7,7 +7,7 @@ from backend.module.common.enums import (
     StaffDepartmentEnum,
 )
 from backend.module.user.entity.user import User
-from sqlalchemy import Column, Date, Enum, ForeignKey, String, Text
+from sqlalchemy import Column, Date, Enum, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
@@ -52,4 +52,11 @@ class Patient(Base):
     emergency_contact_name = Column(String(100))
     emergency_contact_phone = Column(String(20))
 
+    # Exact and prefix lookups by NIK or BPJS number at the registration desk. Names are matched
+    # through trigram indexes on users, created by migration where pg_trgm is available.
+    __table_args__ = (
+        Index("ix_patients_nik_pattern", "nik", postgresql_ops={"nik": "varchar_pattern_ops"}),
+        Index("ix_patients_bpjs_number_pattern", "bpjs_number", postgresql_ops={"bpjs_number": "varchar_pattern_ops"}),
+    )
+
     user = relationship(User, backref="patient_profile", uselist=False)
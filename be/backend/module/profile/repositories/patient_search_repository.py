@@ -0,0 +1,103 @@
+from typing import List, Optional
+
+from backend.module.common.enums import PatientMatchEnum
+from backend.module.profile.entity.models import Patient
+from backend.module.user.entity.user import User
+from sqlalchemy import Float, and_, func, literal, null, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class PatientSearchRepository:
+    """
+    Registration desk lookups. Every query reads a bounded set of candidates from an index
+    (prefix ranges of the NIK and BPJS number indexes, the trigram index on names) before ranking
+    them, so its cost does not grow with the number of patients.
+    """
+
+    _trigram: Optional[bool] = None  # Whether pg_trgm is installed; checked once per process
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def has_trigram(self) -> bool:
+        if PatientSearchRepository._trigram is None:
+            installed = await self.session.execute(text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"))
+            PatientSearchRepository._trigram = installed.first() is not None
+        return PatientSearchRepository._trigram
+
+    @staticmethod
+    def _result(matches) -> select:
+        return (
+            select(
+                Patient.id.label("patient_id"), Patient.user_id, User.full_name, Patient.nik, Patient.bpjs_number,
+                Patient.date_of_birth, Patient.gender, matches.c.matched_on, matches.c.score,
+            )
+            .join(Patient, Patient.id == matches.c.id)
+            .join(User, User.id == Patient.user_id)
+        )
+
+    async def find_by_number(self, number: str, limit: int, max_candidates: int) -> List:
+        """
+        Patients whose NIK or BPJS number starts with the digits `number`, best first: score is
+        the share of the number typed, so 1.0 for an exact match. A patient matching on both
+        appears twice.
+        """
+        # A prefix LIKE uses the pattern indexes only when planned with the prefix itself
+        await self.session.execute(text("SET LOCAL plan_cache_mode = force_custom_plan"))
+        candidates = [
+            select(
+                Patient.id,
+                Patient.nik,
+                literal(match.value).label("matched_on"),
+                (literal(len(number), Float) / func.length(column)).label("score"),
+            )
+            .where(column.like(f"{number}%"))
+            .limit(max_candidates)
+            for match, column in ((PatientMatchEnum.NIK, Patient.nik), (PatientMatchEnum.BPJS_NUMBER, Patient.bpjs_number))
+        ]
+        matches = union_all(*candidates).subquery()
+        # Rank before joining the names, so only the page is joined
+        ranked = select(matches).order_by(matches.c.score.desc(), matches.c.nik).limit(limit * 2).subquery()
+        stmt = self._result(ranked).order_by(ranked.c.score.desc(), ranked.c.nik)
+        return list((await self.session.execute(stmt)).all())
+
+    async def find_by_name(self, name: str, limit: int, max_candidates: int, min_similarity: float) -> List:
+        """
+        Patients whose full name contains a run of words similar to `name` (trigram word
+        similarity, so partial and misspelled names match), most similar first. Without pg_trgm,
+        names containing every word of `name`, unranked (score None).
+        """
+        if not await self.has_trigram():
+            words = [word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") for word in name.split()]
+            matches = (
+                select(Patient.id, literal(PatientMatchEnum.NAME.value).label("matched_on"), null().label("score"))
+                .join(User, User.id == Patient.user_id)
+                .where(and_(*(User.full_name.ilike(f"%{word}%", escape="\\") for word in words)))
+                .limit(max_candidates)
+                .subquery()
+            )
+            stmt = self._result(matches).order_by(User.full_name, Patient.nik).limit(limit)
+            return list((await self.session.execute(stmt)).all())
+
+        # `<%` (word similarity at least the threshold) is what the trigram GIN index serves
+        await self.session.execute(
+            select(func.set_config("pg_trgm.word_similarity_threshold", str(min_similarity), True))
+        )
+        matches = (
+            select(
+                Patient.id,
+                literal(PatientMatchEnum.NAME.value).label("matched_on"),
+                func.word_similarity(name, User.full_name).label("score"),
+                func.similarity(name, User.full_name).label("similarity"),
+            )
+            .join(User, User.id == Patient.user_id)
+            .where(literal(name).op("<%")(User.full_name))
+            .limit(max_candidates)
+            .subquery()
+        )
+        stmt = (
+            self._result(matches)
+            .order_by(matches.c.score.desc(), matches.c.similarity.desc(), User.full_name, Patient.nik)
+            .limit(limit)
+        )
+        return list((await self.session.execute(stmt)).all())
@@ -0,0 +1,50 @@
+"""
+Patient lookup for the registration desk: by NIK or BPJS number (whole or leading digits) or by
+name (partial or misspelled, ranked by trigram similarity where pg_trgm is installed).
+"""
+import re
+from typing import List
+
+from backend.infrastructure.config.settings import settings
+from backend.module.profile.entity.dao import PatientSearchResultDAO
+from backend.module.profile.repositories.patient_search_repository import PatientSearchRepository
+from backend.pkg.core.exceptions import BusinessLogicException
+
+MAX_PATIENT_SEARCH_LIMIT = 50
+MAX_PATIENT_QUERY_LENGTH = 100
+
+# Typed between digit groups of a NIK or BPJS number
+_NUMBER_SEPARATORS = re.compile(r"[\s.\-]")
+
+
+class PatientSearchUseCase:
+    def __init__(
+        self,
+        repository: PatientSearchRepository,
+        max_candidates: int = settings.PATIENT_SEARCH_MAX_CANDIDATES,
+        min_similarity: float = settings.PATIENT_SEARCH_MIN_SIMILARITY
+    ):
+        self.repository = repository
+        self.max_candidates = max_candidates
+        self.min_similarity = min_similarity
+
+    async def search_patients(self, q: str, limit: int = 10) -> List[PatientSearchResultDAO]:
+        """Best matches first; a query of digits looks up numbers, anything else names."""
+        query = " ".join(q.split())
+        if not 2 <= len(query) <= MAX_PATIENT_QUERY_LENGTH:
+            raise BusinessLogicException(f"q must be between 2 and {MAX_PATIENT_QUERY_LENGTH} characters")
+        if limit < 1 or limit > MAX_PATIENT_SEARCH_LIMIT:
+            raise BusinessLogicException(f"limit must be between 1 and {MAX_PATIENT_SEARCH_LIMIT}")
+
+        number = _NUMBER_SEPARATORS.sub("", query)
+        if number.isascii() and number.isdigit():
+            rows = await self.repository.find_by_number(number, limit, self.max_candidates)
+        else:
+            rows = await self.repository.find_by_name(query, limit, self.max_candidates, self.min_similarity)
+
+        results, seen = [], set()
+        for row in rows:
+            if row.patient_id not in seen:  # Matched on both numbers: keep the better match
+                seen.add(row.patient_id)
+                results.append(PatientSearchResultDAO.model_validate(row))
+        return results[:limit]
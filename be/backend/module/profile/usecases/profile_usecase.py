@@ -1,3 +1,7 @@
+from typing import Optional
+
+from backend.infrastructure.search.service import SearchIndexer
+from backend.module.common.search_indexes import USER_SEARCH
 from backend.module.profile.entity.dao import (
     DoctorProfileDAO,
     PatientProfileDAO,
@@ -19,10 +23,11 @@ from backend.pkg.core.exceptions import BusinessLogicException, NotFoundExceptio
 
 class ProfileUseCase:
     def __init__(
-        self, user_repo: UserRepository, profile_repo: ProfileRepository
+        self, user_repo: UserRepository, profile_repo: ProfileRepository, search: Optional[SearchIndexer] = None
     ):
         self.user_repo = user_repo
         self.profile_repo = profile_repo
+        self.search = search
 
     async def get_profile(self, user: User) -> UserProfileDAO:
         profile_dao = None
@@ -60,6 +65,8 @@ class ProfileUseCase:
     async def _update_common_fields(self, user: User, req: any):
         if req.full_name:
             user.full_name = req.full_name
+            if self.search:
+                await self.search.changed(USER_SEARCH, user.id)
         if req.email:
             # Check unique email usage if changed (omitted for brevity, assume repository handles or integrity error)
             user.email = req.email
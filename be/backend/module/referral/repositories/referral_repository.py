@@ -2,9 +2,11 @@
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from backend.infrastructure.search.service import get_search_service
+from backend.module.common.search_indexes import REFERRAL_SEARCH
 from backend.module.referral.entity.referral import Referral
 from backend.module.visit.entity.visit import Visit
-from sqlalchemy import desc, func, or_, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -59,13 +61,7 @@ class ReferralRepository:
 
         if search:
             # Search by facility name, diagnosis, or reason
-            stmt = stmt.where(
-                or_(
-                    Referral.referred_to_facility.ilike(f"%{search}%"),
-                    Referral.diagnosis.ilike(f"%{search}%"),
-                    Referral.reason.ilike(f"%{search}%")
-                )
-            )
+            stmt = stmt.where(await get_search_service().match(REFERRAL_SEARCH, search))
 
         stmt = stmt.order_by(desc(Referral.created_at))
 
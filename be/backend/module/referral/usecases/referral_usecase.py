@@ -2,7 +2,9 @@
 from typing import List, Optional, Tuple
 from uuid import UUID
 
+from backend.infrastructure.search.service import SearchIndexer
 from backend.module.common.enums import ReferralStatusEnum, RoleEnum
+from backend.module.common.search_indexes import REFERRAL_SEARCH
 from backend.module.referral.entity.referral import Referral
 from backend.module.referral.entity.referral_dto import (
     ReferralCreateDTO,
@@ -21,10 +23,12 @@ class ReferralUseCase:
     def __init__(
         self,
         repository: ReferralRepository,
-        visit_repository: VisitRepository
+        visit_repository: VisitRepository,
+        search: Optional[SearchIndexer] = None
     ):
         self.repository = repository
         self.visit_repository = visit_repository
+        self.search = search
 
     async def create_referral(self, req: ReferralCreateDTO, doctor_id: UUID) -> Referral:
         """Create referral. Authorization handled by middleware."""
@@ -50,7 +54,10 @@ class ReferralUseCase:
             notes=req.notes,
             referral_status=ReferralStatusEnum.PENDING.value
         )
-        return await self.repository.create(referral)
+        referral = await self.repository.create(referral)
+        if self.search:
+            await self.search.changed(REFERRAL_SEARCH, referral.id)
+        return referral
 
     async def list_referrals(
         self,
@@ -115,7 +122,10 @@ class ReferralUseCase:
         if attachment_url:
             referral.attachment_url = attachment_url
 
-        return await self.repository.update(referral)
+        referral = await self.repository.update(referral)
+        if self.search:
+            await self.search.changed(REFERRAL_SEARCH, referral.id)
+        return referral
 
     async def delete_referral(self, referral_id: UUID, doctor_id: UUID) -> None:
         """Delete referral. Authorization handled by middleware, ownership check here."""
@@ -128,3 +138,5 @@ class ReferralUseCase:
             raise AuthorizationException("Unauthorized")
 
         await self.repository.delete(referral)
+        if self.search:
+            await self.search.changed(REFERRAL_SEARCH, referral_id)
@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime
+
+from backend.infrastructure.database.connection import Base
+from sqlalchemy import CheckConstraint, Column, Date, DateTime, ForeignKey, Index, LargeBinary, SmallInteger, Time
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+
+class DoctorSchedule(Base):
+    """A weekly working block of a doctor in a clinic, e.g. Mondays 08:00-12:00."""
+    __tablename__ = "doctor_schedules"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    doctor_id = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), nullable=False)
+    clinic_id = Column(PG_UUID(as_uuid=True), ForeignKey("clinic.id", ondelete="CASCADE"), nullable=False)
+    weekday = Column(SmallInteger, nullable=False)  # 0 = Monday, as date.weekday()
+    start_time = Column(Time, nullable=False)  # Local time in HOSPITAL_TIMEZONE
+    end_time = Column(Time, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        CheckConstraint("weekday BETWEEN 0 AND 6", name="ck_doctor_schedules_weekday"),
+        CheckConstraint("end_time > start_time", name="ck_doctor_schedules_time_range"),
+        Index("ix_doctor_schedules_clinic_doctor", "clinic_id", "doctor_id"),
+    )
+
+
+class DoctorAvailability(Base):
+    """
+    Slot bitmaps of a doctor in a clinic for one local day: bit i of open_slots is the i-th
+    SCHEDULE_SLOT_MINUTES slot of the day inside the doctor's schedule, bit i of booked_slots a
+    slot taken by one of the doctor's visits (in any clinic). Both are little-endian bytes.
+    """
+    __tablename__ = "doctor_availability"
+
+    doctor_id = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    clinic_id = Column(PG_UUID(as_uuid=True), ForeignKey("clinic.id", ondelete="CASCADE"), primary_key=True)
+    open_slots = Column(LargeBinary, nullable=False)
+    booked_slots = Column(LargeBinary, nullable=False)
+
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        Index("ix_doctor_availability_clinic_day", "clinic_id", "day"),
+    )
@@ -0,0 +1,37 @@
+from datetime import datetime, time
+from typing import List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class DoctorScheduleCreateDTO(BaseModel):
+    doctor_id: UUID
+    weekday: int = Field(..., ge=0, le=6, description="0 = Monday ... 6 = Sunday")
+    start_time: time = Field(..., description="Local time (HOSPITAL_TIMEZONE)")
+    end_time: time
+
+
+class DoctorScheduleDTO(BaseModel):
+    id: UUID
+    doctor_id: UUID
+    clinic_id: UUID
+    weekday: int
+    start_time: time
+    end_time: time
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class SlotDoctorDTO(BaseModel):
+    id: UUID
+    full_name: str
+    specialty: Optional[str] = None
+
+
+class AvailableSlotDTO(BaseModel):
+    start: datetime
+    end: datetime
+    doctors: List[SlotDoctorDTO]
@@ -0,0 +1,126 @@
+from datetime import date, datetime
+from uuid import UUID
+
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.enums import VisitStatusEnum
+from backend.module.profile.entity.models import Doctor
+from backend.module.schedule.entity.schedule import DoctorAvailability, DoctorSchedule
+from backend.module.user.entity.user import User
+from backend.module.visit.entity.visit import Visit
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class ScheduleRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def create(self, schedule: DoctorSchedule) -> DoctorSchedule:
+        self.session.add(schedule)
+        await self.session.flush()
+        return schedule
+
+    async def get_by_id(self, schedule_id: UUID) -> DoctorSchedule | None:
+        stmt = select(DoctorSchedule).where(DoctorSchedule.id == schedule_id)
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def delete(self, schedule: DoctorSchedule) -> None:
+        await self.session.delete(schedule)
+        await self.session.flush()
+
+    async def clinic_exists(self, clinic_id: UUID) -> bool:
+        return (await self.session.execute(select(Clinic.id).where(Clinic.id == clinic_id))).first() is not None
+
+    async def doctor_exists(self, doctor_id: UUID) -> bool:
+        return (await self.session.execute(select(Doctor.id).where(Doctor.id == doctor_id))).first() is not None
+
+    async def list_clinic_schedules(self, clinic_id: UUID) -> list[DoctorSchedule]:
+        stmt = (
+            select(DoctorSchedule)
+            .where(DoctorSchedule.clinic_id == clinic_id)
+            .order_by(DoctorSchedule.doctor_id, DoctorSchedule.weekday, DoctorSchedule.start_time)
+        )
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def list_doctor_schedules(self, doctor_id: UUID, clinic_id: UUID) -> list[DoctorSchedule]:
+        stmt = select(DoctorSchedule).where(DoctorSchedule.doctor_id == doctor_id, DoctorSchedule.clinic_id == clinic_id)
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def list_scheduled_pairs(self) -> list:
+        """Every (doctor_id, clinic_id) with a schedule."""
+        stmt = select(DoctorSchedule.doctor_id, DoctorSchedule.clinic_id).distinct()
+        return list((await self.session.execute(stmt)).all())
+
+    async def lock_doctor(self, doctor_id: UUID) -> None:
+        """
+        Serialize availability writes of one doctor until commit. FOR NO KEY UPDATE does not
+        conflict with the key-share locks taken by inserting the doctor's visits.
+        """
+        await self.session.execute(select(Doctor.id).where(Doctor.id == doctor_id).with_for_update(key_share=True))
+
+    async def list_booked_visits(self, doctor_id: UUID, day_from: date, day_to: date) -> list:
+        """(queue_date, visit_datetime) of the doctor's visits that hold a slot, days inclusive."""
+        stmt = select(Visit.queue_date, Visit.visit_datetime).where(
+            Visit.doctor_id == doctor_id,
+            Visit.queue_date >= day_from,
+            Visit.queue_date <= day_to,
+            Visit.visit_status != VisitStatusEnum.CANCELED,
+        )
+        return list((await self.session.execute(stmt)).all())
+
+    async def list_availability_clinics(self, doctor_id: UUID, day: date) -> list[UUID]:
+        stmt = select(DoctorAvailability.clinic_id).where(
+            DoctorAvailability.doctor_id == doctor_id, DoctorAvailability.day == day
+        )
+        return list((await self.session.execute(stmt)).scalars().all())
+
+    async def set_booked_slots(self, doctor_id: UUID, day: date, booked_slots: bytes) -> None:
+        stmt = (
+            update(DoctorAvailability)
+            .where(DoctorAvailability.doctor_id == doctor_id, DoctorAvailability.day == day)
+            .values(booked_slots=booked_slots, updated_at=datetime.utcnow())
+        )
+        await self.session.execute(stmt)
+
+    async def replace_availability(
+        self, doctor_id: UUID, clinic_id: UUID, day_from: date, day_to: date, rows: list[dict]
+    ) -> None:
+        """Rewrite the doctor's availability in the clinic for days day_from..day_to inclusive."""
+        await self.session.execute(
+            delete(DoctorAvailability).where(
+                DoctorAvailability.doctor_id == doctor_id,
+                DoctorAvailability.clinic_id == clinic_id,
+                DoctorAvailability.day >= day_from,
+                DoctorAvailability.day <= day_to,
+            )
+        )
+        if rows:
+            await self.session.execute(
+                DoctorAvailability.__table__.insert(),
+                [
+                    {**row, "doctor_id": doctor_id, "clinic_id": clinic_id, "updated_at": datetime.utcnow()}
+                    for row in rows
+                ],
+            )
+
+    async def delete_availability_before(self, day: date) -> int:
+        result = await self.session.execute(delete(DoctorAvailability).where(DoctorAvailability.day < day))
+        return result.rowcount
+
+    async def list_clinic_availability(self, clinic_id: UUID, day_from: date, day_to: date) -> list:
+        """The clinic's availability rows for days day_from..day_to with each doctor's name and specialty."""
+        stmt = (
+            select(
+                DoctorAvailability.doctor_id, DoctorAvailability.day, DoctorAvailability.open_slots,
+                DoctorAvailability.booked_slots, Doctor.specialty, User.full_name,
+            )
+            .join(Doctor, Doctor.id == DoctorAvailability.doctor_id)
+            .join(User, User.id == Doctor.user_id)
+            .where(
+                DoctorAvailability.clinic_id == clinic_id,
+                DoctorAvailability.day >= day_from,
+                DoctorAvailability.day <= day_to,
+            )
+        )
+        return list((await self.session.execute(stmt)).all())
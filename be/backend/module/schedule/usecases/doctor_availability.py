@@ -0,0 +1,280 @@
+"""
+Appointment slot availability as per-doctor bitmaps.
+
+A day is split into SCHEDULE_SLOT_MINUTES slots of local time (HOSPITAL_TIMEZONE); a mask is an
+int with bit i set for slot i. For every doctor, clinic and day up to SCHEDULE_HORIZON_DAYS ahead
+a doctor_availability row holds the slots inside the doctor's schedule there (open) and the slots
+taken by the doctor's visits (booked; a visit holds the slot its time falls in).
+
+Writes are per doctor, serialized by a lock on the doctor row: schedule edits rematerialize the
+doctor's days in the clinic, visit changes recompute the booked mask of each doctor-day they
+touch from the visits themselves, so concurrent bookings cannot lose each other's bits. Each write
+is published after commit; searches run on per-clinic copies in memory that apply those updates,
+so finding the first free slots is bitwise work over a few thousand ints and no query.
+"""
+import json
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as day_time, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.pubsub import pg_notify
+from backend.infrastructure.pubsub.hub import get_pubsub_hub
+from backend.module.schedule.entity.schedule_dto import SlotDoctorDTO
+from backend.module.schedule.repositories.schedule_repository import ScheduleRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+AVAILABILITY_TOPIC_PREFIX = "schedule:availability:"
+
+SLOT_MINUTES = settings.SCHEDULE_SLOT_MINUTES
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+MASK_BYTES = (SLOTS_PER_DAY + 7) // 8
+
+_HOSPITAL_TZ = ZoneInfo(settings.HOSPITAL_TIMEZONE)
+
+# day, slot index, ids of the doctors free at it
+FreeSlot = Tuple[date, int, List[UUID]]
+
+
+def availability_topic(clinic_id: UUID) -> str:
+    return f"{AVAILABILITY_TOPIC_PREFIX}{clinic_id}"
+
+
+def encode_mask(mask: int) -> bytes:
+    return mask.to_bytes(MASK_BYTES, "little")
+
+
+def decode_mask(data: bytes) -> int:
+    return int.from_bytes(data, "little")
+
+
+def _local(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(_HOSPITAL_TZ)
+
+
+def slot_of(value: datetime) -> Tuple[date, int]:
+    """Local day and index of the slot `value` falls in."""
+    local = _local(value)
+    return local.date(), (local.hour * 60 + local.minute) // SLOT_MINUTES
+
+
+def first_slot_from(value: datetime) -> Tuple[date, int]:
+    """Local day and index of the first slot starting at or after `value`."""
+    local = _local(value)
+    seconds = local.hour * 3600 + local.minute * 60 + local.second + (local.microsecond > 0)
+    index = -(-seconds // (SLOT_MINUTES * 60))
+    if index >= SLOTS_PER_DAY:
+        return local.date() + timedelta(days=1), 0
+    return local.date(), index
+
+
+def slot_start(day: date, index: int) -> datetime:
+    minutes = index * SLOT_MINUTES
+    return datetime.combine(day, day_time(minutes // 60, minutes % 60), _HOSPITAL_TZ)
+
+
+def schedule_mask(blocks: Iterable[Tuple[day_time, day_time]]) -> int:
+    """Slots lying entirely within any of the (start, end) blocks."""
+    mask = 0
+    for start, end in blocks:
+        first = -(-(start.hour * 60 + start.minute) // SLOT_MINUTES)
+        last = (end.hour * 60 + end.minute) // SLOT_MINUTES
+        if last > first:
+            mask |= ((1 << (last - first)) - 1) << first
+    return mask
+
+
+def booked_masks(visits: Sequence) -> Dict[date, int]:
+    """(queue_date, visit_datetime) rows -> day -> slots they hold."""
+    masks: Dict[date, int] = {}
+    for row in visits:
+        day, index = slot_of(row.visit_datetime)
+        if day == row.queue_date:
+            masks[day] = masks.get(day, 0) | (1 << index)
+    return masks
+
+
+class ClinicAvailability:
+    """One clinic's availability: per day and doctor, [open mask, free mask]."""
+    __slots__ = ("clinic_id", "doctors", "by_specialty", "days", "loaded_at", "stale")
+
+    def __init__(self, clinic_id: UUID, rows: Sequence = ()):
+        self.clinic_id = clinic_id
+        self.doctors: Dict[UUID, SlotDoctorDTO] = {}
+        self.days: Dict[date, Dict[UUID, List[int]]] = {}
+        for row in rows:
+            if row.doctor_id not in self.doctors:
+                self.doctors[row.doctor_id] = SlotDoctorDTO(
+                    id=row.doctor_id, full_name=row.full_name, specialty=row.specialty
+                )
+            open_slots = decode_mask(row.open_slots)
+            self.days.setdefault(row.day, {})[row.doctor_id] = [open_slots, open_slots & ~decode_mask(row.booked_slots)]
+        self.by_specialty: Dict[str, List[UUID]] = {}
+        for doctor in sorted(self.doctors.values(), key=lambda doctor: doctor.full_name):
+            self.by_specialty.setdefault((doctor.specialty or "").casefold(), []).append(doctor.id)
+        self.loaded_at = time.monotonic()
+        self.stale = False  # Schedules changed: reload on next use
+
+    def apply(self, data: dict) -> None:
+        if data.get("reload"):
+            self.stale = True
+            return
+        slots = self.days.get(date.fromisoformat(data["day"]), {}).get(UUID(data["doctor_id"]))
+        if slots is not None:
+            slots[1] = slots[0] & ~int(data["booked"], 16)
+
+    def search(
+        self, specialty: Optional[str], start_day: date, first_slot: int, last_day: date, count: int
+    ) -> List[FreeSlot]:
+        """The first `count` slots from (start_day, first_slot) at which a matching doctor is free."""
+        if specialty:
+            doctor_ids = self.by_specialty.get(specialty.casefold(), [])
+        else:
+            doctor_ids = [doctor_id for ids in self.by_specialty.values() for doctor_id in ids]
+        found: List[FreeSlot] = []
+        day = start_day
+        while day <= last_day and len(found) < count and doctor_ids:
+            doctors = self.days.get(day)
+            if doctors:
+                free = [(doctor_id, doctors[doctor_id][1]) for doctor_id in doctor_ids if doctor_id in doctors]
+                union = 0
+                for _, mask in free:
+                    union |= mask
+                if day == start_day:
+                    union &= ~((1 << first_slot) - 1)
+                while union and len(found) < count:
+                    lowest = union & -union
+                    found.append((day, lowest.bit_length() - 1, [doctor_id for doctor_id, mask in free if mask & lowest]))
+                    union ^= lowest
+            day += timedelta(days=1)
+        return found
+
+
+class AvailabilityCache:
+    def __init__(self, max_clinics: int, ttl_seconds: float):
+        self.max_clinics = max_clinics
+        self.ttl_seconds = ttl_seconds
+        self._clinics: "OrderedDict[UUID, ClinicAvailability]" = OrderedDict()
+        # Updates published while a clinic is being loaded, replayed onto the loaded copy
+        self._loading: Dict[UUID, List[List[dict]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, clinic_id: UUID) -> Optional[ClinicAvailability]:
+        clinic = self._clinics.get(clinic_id)
+        if clinic is None:
+            return None
+        if clinic.stale or time.monotonic() - clinic.loaded_at > self.ttl_seconds:
+            del self._clinics[clinic_id]
+            return None
+        self._clinics.move_to_end(clinic_id)
+        return clinic
+
+    async def get_or_load(
+        self, clinic_id: UUID, loader: Callable[[], Awaitable[Sequence]]
+    ) -> ClinicAvailability:
+        """Cached availability, or one built from `loader()` -> the clinic's availability rows."""
+        clinic = self.get(clinic_id)
+        if clinic is not None:
+            self.hits += 1
+            return clinic
+
+        self.misses += 1
+        published: List[dict] = []
+        self._loading.setdefault(clinic_id, []).append(published)
+        try:
+            rows = await loader()
+        finally:
+            buffers = self._loading[clinic_id]
+            buffers.remove(published)
+            if not buffers:
+                del self._loading[clinic_id]
+
+        clinic = ClinicAvailability(clinic_id, rows)
+        for data in published:
+            clinic.apply(data)
+        self._clinics[clinic_id] = clinic
+        while len(self._clinics) > self.max_clinics:
+            self._clinics.popitem(last=False)
+        return clinic
+
+    def on_message(self, topic: str, message: str) -> None:
+        """Pub/sub listener for availability topics: apply a committed change to the cached clinic."""
+        data = json.loads(message)
+        clinic_id = UUID(data["clinic_id"])
+        for published in self._loading.get(clinic_id, ()):
+            published.append(data)
+        clinic = self._clinics.get(clinic_id)
+        if clinic is not None:
+            clinic.apply(data)
+
+    def stats(self) -> dict:
+        return {
+            "clinics": len(self._clinics), "max_clinics": self.max_clinics, "hits": self.hits, "misses": self.misses,
+        }
+
+
+class AvailabilityUpdater:
+    """Keeps doctor_availability in step with schedules and visits, and publishes each change."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.repository = ScheduleRepository(session)
+
+    async def materialize(self, doctor_id: UUID, clinic_id: UUID, today: date) -> int:
+        """Rewrite the doctor's availability in the clinic for the horizon from `today`; returns days written."""
+        await self.repository.lock_doctor(doctor_id)
+        last_day = today + timedelta(days=settings.SCHEDULE_HORIZON_DAYS - 1)
+        blocks: Dict[int, list] = {}
+        for schedule in await self.repository.list_doctor_schedules(doctor_id, clinic_id):
+            blocks.setdefault(schedule.weekday, []).append((schedule.start_time, schedule.end_time))
+        booked = booked_masks(await self.repository.list_booked_visits(doctor_id, today, last_day))
+
+        rows = []
+        for offset in range(settings.SCHEDULE_HORIZON_DAYS):
+            day = today + timedelta(days=offset)
+            open_slots = schedule_mask(blocks.get(day.weekday(), ()))
+            if open_slots:
+                rows.append({
+                    "day": day, "open_slots": encode_mask(open_slots), "booked_slots": encode_mask(booked.get(day, 0)),
+                })
+        await self.repository.replace_availability(doctor_id, clinic_id, today, last_day, rows)
+        await pg_notify.publish(
+            self.session, [availability_topic(clinic_id)], json.dumps({"clinic_id": str(clinic_id), "reload": True})
+        )
+        return len(rows)
+
+    async def refresh_booked(self, doctor_days: Iterable[Tuple[UUID, Optional[date]]]) -> None:
+        """Recompute the booked slots of each (doctor, day) from its visits, doctors locked in id order."""
+        for doctor_id, day in sorted({key for key in doctor_days if key[1] is not None}):
+            # Lock before looking: a schedule edit committing meanwhile may be adding the day
+            await self.repository.lock_doctor(doctor_id)
+            clinic_ids = await self.repository.list_availability_clinics(doctor_id, day)
+            if not clinic_ids:
+                continue  # Not scheduled that day
+            booked = booked_masks(await self.repository.list_booked_visits(doctor_id, day, day)).get(day, 0)
+            await self.repository.set_booked_slots(doctor_id, day, encode_mask(booked))
+            await pg_notify.publish_many(self.session, [
+                (
+                    [availability_topic(clinic_id)],
+                    json.dumps({
+                        "clinic_id": str(clinic_id), "doctor_id": str(doctor_id), "day": day.isoformat(),
+                        "booked": format(booked, "x"),
+                    }),
+                )
+                for clinic_id in clinic_ids
+            ])
+
+
+# Singleton instance
+availability_cache = AvailabilityCache(settings.SCHEDULE_CACHE_MAX_CLINICS, settings.SCHEDULE_CACHE_TTL_SECONDS)
+get_pubsub_hub().add_listener(AVAILABILITY_TOPIC_PREFIX, availability_cache.on_message)
+
+
+def get_availability_cache() -> AvailabilityCache:
+    return availability_cache
@@ -0,0 +1,91 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+from uuid import UUID
+
+from backend.infrastructure.config.settings import settings
+from backend.module.schedule.entity.schedule import DoctorSchedule
+from backend.module.schedule.entity.schedule_dto import AvailableSlotDTO, DoctorScheduleCreateDTO
+from backend.module.schedule.repositories.schedule_repository import ScheduleRepository
+from backend.module.schedule.usecases.doctor_availability import (
+    SLOT_MINUTES,
+    AvailabilityCache,
+    AvailabilityUpdater,
+    first_slot_from,
+    slot_start,
+)
+from backend.module.visit.usecases.visit_queue_board import hospital_today
+from backend.pkg.core.exceptions import BusinessLogicException, NotFoundException
+
+MAX_SLOT_COUNT = 100
+
+
+class ScheduleUseCase:
+    def __init__(
+        self,
+        schedule_repository: ScheduleRepository,
+        availability: AvailabilityUpdater,
+        cache: Optional[AvailabilityCache] = None
+    ):
+        self.schedule_repository = schedule_repository
+        self.availability = availability
+        self.cache = cache
+
+    async def create_schedule(self, clinic_id: UUID, req: DoctorScheduleCreateDTO) -> DoctorSchedule:
+        """Add a weekly block for a doctor in the clinic and rematerialize their availability there."""
+        if req.end_time <= req.start_time:
+            raise BusinessLogicException("end_time must be after start_time")
+        if not await self.schedule_repository.clinic_exists(clinic_id):
+            raise NotFoundException(f"Clinic with id {clinic_id} not found")
+        if not await self.schedule_repository.doctor_exists(req.doctor_id):
+            raise NotFoundException(f"Doctor with id {req.doctor_id} not found")
+
+        schedule = await self.schedule_repository.create(DoctorSchedule(
+            doctor_id=req.doctor_id,
+            clinic_id=clinic_id,
+            weekday=req.weekday,
+            start_time=req.start_time,
+            end_time=req.end_time
+        ))
+        await self.availability.materialize(req.doctor_id, clinic_id, hospital_today())
+        return schedule
+
+    async def list_schedules(self, clinic_id: UUID) -> List[DoctorSchedule]:
+        return await self.schedule_repository.list_clinic_schedules(clinic_id)
+
+    async def delete_schedule(self, clinic_id: UUID, schedule_id: UUID) -> None:
+        schedule = await self.schedule_repository.get_by_id(schedule_id)
+        if not schedule or schedule.clinic_id != clinic_id:
+            raise NotFoundException(f"Schedule with id {schedule_id} not found")
+        doctor_id = schedule.doctor_id
+        await self.schedule_repository.delete(schedule)
+        await self.availability.materialize(doctor_id, clinic_id, hospital_today())
+
+    async def search_slots(
+        self, clinic_id: UUID, specialty: Optional[str], count: int, start: Optional[datetime] = None
+    ) -> List[AvailableSlotDTO]:
+        """
+        The first `count` slots from `start` (default now) at which a doctor of the clinic, of the
+        specialty if given, is free, with the doctors free at each. Answered from memory after
+        the clinic's first search.
+        """
+        if count < 1 or count > MAX_SLOT_COUNT:
+            raise BusinessLogicException(f"count must be between 1 and {MAX_SLOT_COUNT}")
+        today = hospital_today()
+        last_day = today + timedelta(days=settings.SCHEDULE_HORIZON_DAYS - 1)
+        now = datetime.now(timezone.utc)
+        if start is not None and start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        start_day, first_slot = first_slot_from(max(start, now) if start else now)
+
+        async def loader():
+            return await self.schedule_repository.list_clinic_availability(clinic_id, today, last_day)
+
+        clinic = await self.cache.get_or_load(clinic_id, loader)
+        return [
+            AvailableSlotDTO(
+                start=slot_start(day, index),
+                end=slot_start(day, index) + timedelta(minutes=SLOT_MINUTES),
+                doctors=[clinic.doctors[doctor_id] for doctor_id in doctor_ids],
+            )
+            for day, index, doctor_ids in clinic.search(specialty, start_day, first_slot, last_day, count)
+        ]
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from backend.infrastructure.database.connection import Base
+from backend.module.common.enums import VisitStatusEnum, VisitTypeEnum
+from sqlalchemy import Column, Date, DateTime, Enum, Float, ForeignKey, Integer
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+
+class VisitDailyCounter(Base):
+    """
+    Number of visits per queue day (local day in HOSPITAL_TIMEZONE), clinic, doctor, type and
+    status, kept by the visit use case and recomputed from visits by the reconciliation job.
+    """
+    __tablename__ = "visit_daily_counters"
+
+    day = Column(Date, primary_key=True)
+    clinic_id = Column(PG_UUID(as_uuid=True), ForeignKey("clinic.id", ondelete="CASCADE"), primary_key=True)
+    doctor_id = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True)
+    visit_type = Column(Enum(VisitTypeEnum, name="visit_type_enum", create_type=False), primary_key=True)
+    visit_status = Column(Enum(VisitStatusEnum, name="visit_status_enum", create_type=False), primary_key=True)
+    visits = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class VisitDailyWait(Base):
+    """Waits from registration to examination per queue day, clinic and doctor: count and total."""
+    __tablename__ = "visit_daily_waits"
+
+    day = Column(Date, primary_key=True)
+    clinic_id = Column(PG_UUID(as_uuid=True), ForeignKey("clinic.id", ondelete="CASCADE"), primary_key=True)
+    doctor_id = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="CASCADE"), primary_key=True)
+    waits = Column(Integer, nullable=False, default=0)
+    wait_seconds = Column(Float, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,33 @@
+from datetime import date, datetime
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ClinicDailyStatsDTO(BaseModel):
+    clinic_id: UUID
+    clinic_name: str
+    total: int
+    by_status: Dict[str, int]
+    by_type: Dict[str, int]
+    average_wait_seconds: Optional[float] = None
+
+
+class DoctorDailyStatsDTO(BaseModel):
+    doctor_id: UUID
+    doctor_name: str
+    total: int
+    completed: int
+    average_wait_seconds: Optional[float] = None
+
+
+class DailyStatsDTO(BaseModel):
+    day: date
+    total: int
+    by_status: Dict[str, int]
+    by_type: Dict[str, int]
+    average_wait_seconds: Optional[float] = None
+    clinics: List[ClinicDailyStatsDTO]
+    doctors: List[DoctorDailyStatsDTO]
+    generated_at: datetime
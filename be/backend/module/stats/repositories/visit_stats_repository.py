@@ -0,0 +1,147 @@
+from datetime import date, datetime
+from typing import Dict, Tuple
+from uuid import UUID
+
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.enums import VisitStatusEnum, VisitTypeEnum
+from backend.module.profile.entity.models import Doctor
+from backend.module.stats.entity.visit_stats import VisitDailyCounter, VisitDailyWait
+from backend.module.user.entity.user import User
+from backend.module.visit.entity.visit import Visit
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# day, clinic_id, doctor_id, visit_type, visit_status
+CounterKey = Tuple[date, UUID, UUID, VisitTypeEnum, VisitStatusEnum]
+# day, clinic_id, doctor_id
+WaitKey = Tuple[date, UUID, UUID]
+
+# Counters per INSERT: 7 parameters each, well under the 32767 a statement may bind
+INSERT_CHUNK = 1000
+
+
+class VisitStatsRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add_counts(self, deltas: Dict[CounterKey, int]) -> None:
+        """
+        Add each delta to its counter, INSERT_CHUNK counters per statement (one for a visit
+        change); keys in sorted order to avoid deadlocks.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "day": day, "clinic_id": clinic_id, "doctor_id": doctor_id, "visit_type": visit_type,
+                "visit_status": visit_status, "visits": delta, "updated_at": now,
+            }
+            for (day, clinic_id, doctor_id, visit_type, visit_status), delta in sorted(deltas.items())
+        ]
+        for i in range(0, len(rows), INSERT_CHUNK):
+            stmt = insert(VisitDailyCounter).values(rows[i:i + INSERT_CHUNK])
+            await self.session.execute(stmt.on_conflict_do_update(
+                index_elements=["day", "clinic_id", "doctor_id", "visit_type", "visit_status"],
+                set_={
+                    "visits": VisitDailyCounter.visits + stmt.excluded.visits,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ))
+
+    async def add_waits(self, deltas: Dict[WaitKey, Tuple[int, float]]) -> None:
+        now = datetime.utcnow()
+        rows = [
+            {"day": day, "clinic_id": clinic_id, "doctor_id": doctor_id, "waits": waits, "wait_seconds": seconds,
+             "updated_at": now}
+            for (day, clinic_id, doctor_id), (waits, seconds) in sorted(deltas.items())
+        ]
+        for i in range(0, len(rows), INSERT_CHUNK):
+            stmt = insert(VisitDailyWait).values(rows[i:i + INSERT_CHUNK])
+            await self.session.execute(stmt.on_conflict_do_update(
+                index_elements=["day", "clinic_id", "doctor_id"],
+                set_={
+                    "waits": VisitDailyWait.waits + stmt.excluded.waits,
+                    "wait_seconds": VisitDailyWait.wait_seconds + stmt.excluded.wait_seconds,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+            ))
+
+    async def list_day_counts(self, day: date) -> list:
+        """The day's non-zero counters with clinic and doctor names."""
+        stmt = (
+            select(
+                VisitDailyCounter.clinic_id, Clinic.name.label("clinic_name"), VisitDailyCounter.doctor_id,
+                User.full_name.label("doctor_name"), VisitDailyCounter.visit_type, VisitDailyCounter.visit_status,
+                VisitDailyCounter.visits,
+            )
+            .join(Clinic, Clinic.id == VisitDailyCounter.clinic_id)
+            .join(Doctor, Doctor.id == VisitDailyCounter.doctor_id)
+            .join(User, User.id == Doctor.user_id)
+            .where(VisitDailyCounter.day == day, VisitDailyCounter.visits != 0)
+        )
+        return list((await self.session.execute(stmt)).all())
+
+    async def list_day_waits(self, day: date) -> list:
+        stmt = select(
+            VisitDailyWait.clinic_id, VisitDailyWait.doctor_id, VisitDailyWait.waits, VisitDailyWait.wait_seconds
+        ).where(VisitDailyWait.day == day, VisitDailyWait.waits > 0)
+        return list((await self.session.execute(stmt)).all())
+
+    # Reconciliation: counters recomputed from visits
+
+    async def count_visits(self, day_from: date, day_to: date) -> Dict[CounterKey, int]:
+        stmt = (
+            select(
+                Visit.queue_date, Visit.clinic_id, Visit.doctor_id, Visit.visit_type, Visit.visit_status,
+                func.count(),
+            )
+            .where(Visit.queue_date >= day_from, Visit.queue_date <= day_to)
+            .group_by(Visit.queue_date, Visit.clinic_id, Visit.doctor_id, Visit.visit_type, Visit.visit_status)
+        )
+        return {tuple(row[:5]): row[5] for row in (await self.session.execute(stmt)).all()}
+
+    async def sum_waits(self, day_from: date, day_to: date) -> Dict[WaitKey, Tuple[int, float]]:
+        wait = func.greatest(func.extract("epoch", Visit.examination_started_at - Visit.created_at), 0)
+        stmt = (
+            select(Visit.queue_date, Visit.clinic_id, Visit.doctor_id, func.count(), func.sum(wait))
+            .where(
+                Visit.queue_date >= day_from, Visit.queue_date <= day_to, Visit.examination_started_at.is_not(None)
+            )
+            .group_by(Visit.queue_date, Visit.clinic_id, Visit.doctor_id)
+        )
+        return {tuple(row[:3]): (row[3], float(row[4])) for row in (await self.session.execute(stmt)).all()}
+
+    async def get_counts(self, day_from: date, day_to: date) -> Dict[CounterKey, int]:
+        stmt = select(
+            VisitDailyCounter.day, VisitDailyCounter.clinic_id, VisitDailyCounter.doctor_id,
+            VisitDailyCounter.visit_type, VisitDailyCounter.visit_status, VisitDailyCounter.visits,
+        ).where(VisitDailyCounter.day >= day_from, VisitDailyCounter.day <= day_to, VisitDailyCounter.visits != 0)
+        return {tuple(row[:5]): row[5] for row in (await self.session.execute(stmt)).all()}
+
+    async def get_waits(self, day_from: date, day_to: date) -> Dict[WaitKey, Tuple[int, float]]:
+        stmt = select(
+            VisitDailyWait.day, VisitDailyWait.clinic_id, VisitDailyWait.doctor_id, VisitDailyWait.waits,
+            VisitDailyWait.wait_seconds,
+        ).where(VisitDailyWait.day >= day_from, VisitDailyWait.day <= day_to, VisitDailyWait.waits != 0)
+        return {tuple(row[:3]): (row[3], row[4]) for row in (await self.session.execute(stmt)).all()}
+
+    async def replace_counters(
+        self, day_from: date, day_to: date, counts: Dict[CounterKey, int], waits: Dict[WaitKey, Tuple[int, float]]
+    ) -> None:
+        await self.session.execute(
+            delete(VisitDailyCounter).where(VisitDailyCounter.day >= day_from, VisitDailyCounter.day <= day_to)
+        )
+        await self.session.execute(
+            delete(VisitDailyWait).where(VisitDailyWait.day >= day_from, VisitDailyWait.day <= day_to)
+        )
+        if counts:
+            await self.add_counts(counts)
+        if waits:
+            await self.add_waits(waits)
+
+    async def lock_counters(self) -> None:
+        """
+        Wait for transactions updating counters to commit and hold off new updates until this
+        one commits, so visits counted afterwards match the counters they updated.
+        """
+        await self.session.execute(text("LOCK TABLE visit_daily_counters, visit_daily_waits IN EXCLUSIVE MODE"))
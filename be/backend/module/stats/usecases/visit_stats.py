@@ -0,0 +1,203 @@
+"""
+Daily visit statistics from incrementally maintained counters.
+
+Every visit change adds its delta to per-day counters in the same transaction: the visit leaves
+its old (day, clinic, doctor, type, status) counter and joins the new one, and once examined its
+wait from registration moves along with it. Dashboards read the day's few counter rows instead
+of grouping visits, and responses are cached for STATS_CACHE_TTL_SECONDS. The reconciliation
+job recomputes the counters of recent days from visits and reports any drift, which also covers
+visits written around the use case (bulk imports, manual fixes).
+"""
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timezone
+from typing import Awaitable, Callable, Dict, NamedTuple, Optional
+from uuid import UUID
+
+from backend.infrastructure.config.settings import settings
+from backend.module.common.enums import VisitStatusEnum, VisitTypeEnum
+from backend.module.stats.entity.visit_stats_dto import (
+    ClinicDailyStatsDTO,
+    DailyStatsDTO,
+    DoctorDailyStatsDTO,
+)
+from backend.module.stats.repositories.visit_stats_repository import VisitStatsRepository
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class VisitStatsEntry(NamedTuple):
+    """What a visit contributes to the counters."""
+    day: date
+    clinic_id: UUID
+    doctor_id: UUID
+    visit_type: VisitTypeEnum
+    visit_status: VisitStatusEnum
+    wait_seconds: Optional[float]  # Registration to examination, once examined
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def visit_stats_entry(visit) -> Optional[VisitStatsEntry]:
+    if visit.queue_date is None:
+        return None
+    wait = None
+    if visit.examination_started_at is not None:
+        wait = max((_aware(visit.examination_started_at) - _aware(visit.created_at)).total_seconds(), 0.0)
+    return VisitStatsEntry(
+        visit.queue_date, visit.clinic_id, visit.doctor_id, VisitTypeEnum(visit.visit_type),
+        VisitStatusEnum(visit.visit_status), wait,
+    )
+
+
+def _average(seconds: float, waits: int) -> Optional[float]:
+    return round(seconds / waits, 1) if waits else None
+
+
+class VisitStatsRecorder:
+    """Applies a visit change to the daily counters, in the caller's transaction."""
+
+    def __init__(self, session: AsyncSession):
+        self.repository = VisitStatsRepository(session)
+
+    async def record(self, before: Optional[VisitStatsEntry], after: Optional[VisitStatsEntry]) -> None:
+        counts: Dict[tuple, int] = {}
+        waits: Dict[tuple, tuple] = {}
+        for entry, sign in ((before, -1), (after, 1)):
+            if entry is None:
+                continue
+            counts[entry[:5]] = counts.get(entry[:5], 0) + sign
+            if entry.wait_seconds is not None:
+                number, seconds = waits.get(entry[:3], (0, 0.0))
+                waits[entry[:3]] = (number + sign, seconds + sign * entry.wait_seconds)
+        counts = {key: delta for key, delta in counts.items() if delta}
+        waits = {key: delta for key, delta in waits.items() if delta != (0, 0.0)}
+        if counts:
+            await self.repository.add_counts(counts)
+        if waits:
+            await self.repository.add_waits(waits)
+
+
+class DailyStatsCache:
+    def __init__(self, ttl_seconds: float, max_days: int = 32):
+        self.ttl_seconds = ttl_seconds
+        self.max_days = max_days
+        self._days: "OrderedDict[date, tuple]" = OrderedDict()  # day -> (loaded at, stats)
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_load(self, day: date, loader: Callable[[], Awaitable[DailyStatsDTO]]) -> DailyStatsDTO:
+        cached = self._days.get(day)
+        if cached is not None and time.monotonic() - cached[0] <= self.ttl_seconds:
+            self.hits += 1
+            return cached[1]
+        self.misses += 1
+        stats = await loader()
+        self._days[day] = (time.monotonic(), stats)
+        self._days.move_to_end(day)
+        while len(self._days) > self.max_days:
+            self._days.popitem(last=False)
+        return stats
+
+
+class VisitStatsUseCase:
+    def __init__(self, repository: VisitStatsRepository, cache: Optional[DailyStatsCache] = None):
+        self.repository = repository
+        self.cache = cache
+
+    async def daily_stats(self, day: date) -> DailyStatsDTO:
+        """Census of a queue day, from the counters (two small queries) or the cache."""
+        if self.cache is None:
+            return await self._build(day)
+        return await self.cache.get_or_load(day, lambda: self._build(day))
+
+    async def _build(self, day: date) -> DailyStatsDTO:
+        statuses = [status.value for status in VisitStatusEnum]
+        types = [visit_type.value for visit_type in VisitTypeEnum]
+        totals = {"by_status": dict.fromkeys(statuses, 0), "by_type": dict.fromkeys(types, 0)}
+        clinics: Dict[UUID, dict] = {}
+        doctors: Dict[UUID, dict] = {}
+        for row in await self.repository.list_day_counts(day):
+            status, visit_type = VisitStatusEnum(row.visit_status).value, VisitTypeEnum(row.visit_type).value
+            clinic = clinics.setdefault(row.clinic_id, {
+                "clinic_id": row.clinic_id, "clinic_name": row.clinic_name, "total": 0,
+                "by_status": dict.fromkeys(statuses, 0), "by_type": dict.fromkeys(types, 0),
+            })
+            doctor = doctors.setdefault(row.doctor_id, {
+                "doctor_id": row.doctor_id, "doctor_name": row.doctor_name, "total": 0, "completed": 0,
+            })
+            for group in (totals, clinic):
+                group["by_status"][status] += row.visits
+                group["by_type"][visit_type] += row.visits
+            clinic["total"] += row.visits
+            doctor["total"] += row.visits
+            if status == VisitStatusEnum.COMPLETED.value:
+                doctor["completed"] += row.visits
+
+        wait_totals = [0, 0.0]
+        clinic_waits: Dict[UUID, list] = {}
+        doctor_waits: Dict[UUID, list] = {}
+        for row in await self.repository.list_day_waits(day):
+            for waits in (wait_totals, clinic_waits.setdefault(row.clinic_id, [0, 0.0]),
+                          doctor_waits.setdefault(row.doctor_id, [0, 0.0])):
+                waits[0] += row.waits
+                waits[1] += row.wait_seconds
+
+        return DailyStatsDTO(
+            day=day,
+            total=sum(totals["by_status"].values()),
+            by_status=totals["by_status"],
+            by_type=totals["by_type"],
+            average_wait_seconds=_average(wait_totals[1], wait_totals[0]),
+            clinics=sorted(
+                (
+                    ClinicDailyStatsDTO(
+                        **clinic, average_wait_seconds=_average(*reversed(clinic_waits.get(clinic_id, [0, 0.0])))
+                    )
+                    for clinic_id, clinic in clinics.items()
+                ),
+                key=lambda clinic: clinic.clinic_name,
+            ),
+            doctors=sorted(
+                (
+                    DoctorDailyStatsDTO(
+                        **doctor, average_wait_seconds=_average(*reversed(doctor_waits.get(doctor_id, [0, 0.0])))
+                    )
+                    for doctor_id, doctor in doctors.items()
+                ),
+                key=lambda doctor: doctor.doctor_name,
+            ),
+            generated_at=datetime.now(timezone.utc),
+        )
+
+    async def reconcile(self, day_from: date, day_to: date) -> Dict[str, int]:
+        """Recompute the counters of day_from..day_to from visits; returns how many differed."""
+        await self.repository.lock_counters()
+        counts = await self.repository.count_visits(day_from, day_to)
+        waits = await self.repository.sum_waits(day_from, day_to)
+        stored_counts = await self.repository.get_counts(day_from, day_to)
+        stored_waits = await self.repository.get_waits(day_from, day_to)
+        drift = {
+            "counters": sum(
+                counts.get(key, 0) != stored_counts.get(key, 0) for key in counts.keys() | stored_counts.keys()
+            ),
+            "waits": sum(
+                not _same_wait(waits.get(key), stored_waits.get(key)) for key in waits.keys() | stored_waits.keys()
+            ),
+        }
+        await self.repository.replace_counters(day_from, day_to, counts, waits)
+        return drift
+
+
+def _same_wait(computed: Optional[tuple], stored: Optional[tuple]) -> bool:
+    computed, stored = computed or (0, 0.0), stored or (0, 0.0)
+    return computed[0] == stored[0] and abs(computed[1] - stored[1]) < 0.5
+
+
+# Singleton instance
+daily_stats_cache = DailyStatsCache(settings.STATS_CACHE_TTL_SECONDS)
+
+
+def get_daily_stats_cache() -> DailyStatsCache:
+    return daily_stats_cache
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from backend.module.common.enums import TimelineSectionEnum
+from pydantic import BaseModel
+
+
+class TimelineEntryDTO(BaseModel):
+    type: TimelineSectionEnum
+    id: UUID  # Row id; the device id for wearables (one entry per device and day)
+    occurred_at: datetime
+    visit_id: Optional[UUID] = None
+    title: str
+    status: Optional[str] = None
+    details: Dict[str, Any] = {}
+
+
+class PatientTimelineDTO(BaseModel):
+    patient_id: UUID
+    sections: List[TimelineSectionEnum]
+    entries: List[TimelineEntryDTO] = []
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next (older) page
@@ -0,0 +1,167 @@
+from datetime import datetime
+from typing import Optional, Tuple
+from uuid import UUID
+
+from backend.module.invoice.entity.invoice import Invoice
+from backend.module.lab.entity.lab import LabOrder, LabResult, LabTest
+from backend.module.medical_record.entity.medical_record import MedicalRecord
+from backend.module.prescription.entity.prescription import Prescription, PrescriptionItem
+from backend.module.profile.entity.models import Patient
+from backend.module.referral.entity.referral import Referral
+from backend.module.visit.entity.visit import Visit
+from backend.module.wearable.entity.wearable import WearableDevice, WearableRollupDaily
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# occurred_at, section rank, id of the last entry already returned
+TimelineKey = Tuple[datetime, int, UUID]
+
+
+class PatientTimelineRepository:
+    """
+    One query per timeline section, each returning the newest `limit` rows of the patient older
+    than the keyset cursor as (id, occurred_at, visit_id, section columns...).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def patient_exists(self, patient_id: UUID) -> bool:
+        return (await self.session.execute(select(Patient.id).where(Patient.id == patient_id))).first() is not None
+
+    async def _page(
+        self, stmt, occurred_at, id_column, rank: int, limit: int, before: Optional[TimelineKey],
+        date_from: Optional[datetime], date_to: Optional[datetime]
+    ) -> list:
+        # Entries are ordered by (occurred_at, section rank, id) descending; within one section
+        # the rank is constant, so the keyset condition reduces to a comparison on occurred_at
+        # (and id, for the cursor's own section).
+        if before is not None:
+            before_at, before_rank, before_id = before
+            if rank < before_rank:
+                stmt = stmt.where(occurred_at <= before_at)
+            elif rank > before_rank:
+                stmt = stmt.where(occurred_at < before_at)
+            else:
+                stmt = stmt.where(tuple_(occurred_at, id_column) < tuple_(before_at, before_id))
+        if date_from:
+            stmt = stmt.where(occurred_at >= date_from)
+        if date_to:
+            stmt = stmt.where(occurred_at < date_to)
+        stmt = stmt.order_by(occurred_at.desc(), id_column.desc()).limit(limit)
+        return list((await self.session.execute(stmt)).all())
+
+    async def list_visits(self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window) -> list:
+        stmt = select(
+            Visit.id, Visit.visit_datetime.label("occurred_at"), Visit.id.label("visit_id"),
+            Visit.visit_type, Visit.visit_status, Visit.clinic_id, Visit.doctor_id, Visit.chief_complaint,
+        ).where(Visit.patient_id == patient_id)
+        if doctor_id:
+            stmt = stmt.where(Visit.doctor_id == doctor_id)
+        return await self._page(stmt, Visit.visit_datetime, Visit.id, rank, limit, *window)
+
+    async def list_medical_records(
+        self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window
+    ) -> list:
+        stmt = (
+            select(
+                MedicalRecord.id, MedicalRecord.created_at.label("occurred_at"), MedicalRecord.visit_id,
+                MedicalRecord.diagnosis, MedicalRecord.treatment_plan, MedicalRecord.outcome, Visit.doctor_id,
+            )
+            .join(Visit, Visit.id == MedicalRecord.visit_id)
+            .where(Visit.patient_id == patient_id)
+        )
+        if doctor_id:
+            stmt = stmt.where(Visit.doctor_id == doctor_id)
+        return await self._page(stmt, MedicalRecord.created_at, MedicalRecord.id, rank, limit, *window)
+
+    async def list_prescriptions(
+        self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window
+    ) -> list:
+        item_count = (
+            select(func.count(PrescriptionItem.id))
+            .where(PrescriptionItem.prescription_id == Prescription.id)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                Prescription.id, Prescription.created_at.label("occurred_at"), Prescription.visit_id,
+                Prescription.prescription_status, Prescription.doctor_id, Prescription.notes,
+                item_count.label("item_count"),
+            )
+            .join(Visit, Visit.id == Prescription.visit_id)
+            .where(Visit.patient_id == patient_id)
+        )
+        if doctor_id:
+            stmt = stmt.where(Prescription.doctor_id == doctor_id)
+        return await self._page(stmt, Prescription.created_at, Prescription.id, rank, limit, *window)
+
+    async def list_lab_orders(self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window) -> list:
+        stmt = (
+            select(
+                LabOrder.id, LabOrder.created_at.label("occurred_at"), LabOrder.visit_id, LabOrder.order_status,
+                LabOrder.doctor_id, LabOrder.notes, LabTest.test_name,
+            )
+            .join(Visit, Visit.id == LabOrder.visit_id)
+            .join(LabTest, LabTest.id == LabOrder.lab_test_id)
+            .where(Visit.patient_id == patient_id)
+        )
+        if doctor_id:
+            stmt = stmt.where(LabOrder.doctor_id == doctor_id)
+        return await self._page(stmt, LabOrder.created_at, LabOrder.id, rank, limit, *window)
+
+    async def list_lab_results(
+        self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window
+    ) -> list:
+        stmt = (
+            select(
+                LabResult.id, LabResult.created_at.label("occurred_at"), LabOrder.visit_id, LabResult.lab_order_id,
+                LabTest.test_name, LabResult.result_value, LabResult.result_unit, LabResult.interpretation,
+                LabResult.attachment_url,
+            )
+            .join(LabOrder, LabOrder.id == LabResult.lab_order_id)
+            .join(Visit, Visit.id == LabOrder.visit_id)
+            .join(LabTest, LabTest.id == LabOrder.lab_test_id)
+            .where(Visit.patient_id == patient_id)
+        )
+        if doctor_id:
+            stmt = stmt.where(LabOrder.doctor_id == doctor_id)
+        return await self._page(stmt, LabResult.created_at, LabResult.id, rank, limit, *window)
+
+    async def list_referrals(self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window) -> list:
+        stmt = select(
+            Referral.id, Referral.created_at.label("occurred_at"), Referral.visit_id, Referral.referral_status,
+            Referral.referred_to_facility, Referral.specialty, Referral.reason, Referral.referring_doctor_id,
+        ).where(Referral.patient_id == patient_id)
+        if doctor_id:
+            stmt = stmt.where(Referral.referring_doctor_id == doctor_id)
+        return await self._page(stmt, Referral.created_at, Referral.id, rank, limit, *window)
+
+    async def list_invoices(self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window) -> list:
+        stmt = (
+            select(
+                Invoice.id, Invoice.created_at.label("occurred_at"), Invoice.visit_id, Invoice.payment_status,
+                Invoice.total_amount, Invoice.amount_paid,
+            )
+            .join(Visit, Visit.id == Invoice.visit_id)
+            .where(Visit.patient_id == patient_id)
+        )
+        return await self._page(stmt, Invoice.created_at, Invoice.id, rank, limit, *window)
+
+    async def list_wearable_days(
+        self, patient_id: UUID, doctor_id: Optional[UUID], rank: int, limit: int, *window
+    ) -> list:
+        """Daily rollups of the patient's devices: one entry per device and day."""
+        daily = WearableRollupDaily
+        stmt = (
+            select(
+                daily.device_id.label("id"), daily.bucket_start.label("occurred_at"),
+                WearableDevice.device_name, WearableDevice.device_identifier, daily.sample_count,
+                daily.heart_rate_sum, daily.heart_rate_count, daily.heart_rate_min, daily.heart_rate_max,
+                daily.systolic_bp_sum, daily.systolic_bp_count, daily.diastolic_bp_sum, daily.diastolic_bp_count,
+                daily.spo2_sum, daily.spo2_count, daily.spo2_min, daily.steps_sum,
+            )
+            .join(WearableDevice, WearableDevice.id == daily.device_id)
+            .where(WearableDevice.patient_id == patient_id)
+        )
+        return await self._page(stmt, daily.bucket_start, daily.device_id, rank, limit, *window)
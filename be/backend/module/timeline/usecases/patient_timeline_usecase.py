@@ -0,0 +1,225 @@
+"""
+Patient longitudinal timeline: visits, medical records, prescriptions, lab orders and results,
+referrals, invoices and daily wearable summaries of one patient, merged newest first.
+
+Each included section is one query returning at most a page (plus one row) past the cursor, so
+a page costs the same fixed set of queries however long the history is. Entries are ordered by
+(occurred_at, section, id) descending and pages continue from an opaque keyset token of the last
+entry returned. The visibility rules of the individual list endpoints are applied once per
+request, as a per-section doctor filter.
+"""
+import base64
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from backend.module.common.enums import RoleEnum, TimelineSectionEnum
+from backend.module.timeline.entity.timeline_dto import TimelineEntryDTO
+from backend.module.timeline.repositories.patient_timeline_repository import (
+    PatientTimelineRepository,
+    TimelineKey,
+)
+from backend.pkg.core.exceptions import AuthorizationException, BusinessLogicException, NotFoundException
+
+MAX_TIMELINE_LIMIT = 200
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SECTIONS = list(TimelineSectionEnum)
+_RANK = {section: rank for rank, section in enumerate(_SECTIONS)}
+
+# Sections hidden from a role, and those a doctor sees only for their own visits or orders
+_HIDDEN = {RoleEnum.STAFF.value: {TimelineSectionEnum.WEARABLES}}
+_DOCTOR_OWN = {
+    TimelineSectionEnum.VISITS,
+    TimelineSectionEnum.PRESCRIPTIONS,
+    TimelineSectionEnum.LAB_ORDERS,
+    TimelineSectionEnum.LAB_RESULTS,
+    TimelineSectionEnum.REFERRALS,
+}
+
+
+def _micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def encode_cursor(entry: TimelineEntryDTO) -> str:
+    raw = f"{_micros(entry.occurred_at)}.{_RANK[entry.type]}.{entry.id.hex}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> TimelineKey:
+    """Token -> (occurred_at, section rank, id) of the last entry already returned."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        micros, rank, id_hex = raw.split(".")
+        if not 0 <= int(rank) < len(_SECTIONS):
+            raise ValueError(rank)
+        return _EPOCH + timedelta(microseconds=int(micros)), int(rank), UUID(hex=id_hex)
+    except (ValueError, UnicodeDecodeError, OverflowError):
+        raise BusinessLogicException("Invalid timeline cursor")
+
+
+def _average(total, count) -> Optional[float]:
+    return round(float(total) / count, 1) if count else None
+
+
+def _number(value) -> Optional[float]:
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _visit_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.VISITS, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title=f"{row.visit_type.value} visit", status=row.visit_status.value,
+        details={"clinic_id": row.clinic_id, "doctor_id": row.doctor_id, "chief_complaint": row.chief_complaint},
+    )
+
+
+def _medical_record_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.MEDICAL_RECORDS, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title=row.diagnosis or "Medical record", status=row.outcome.value if row.outcome else None,
+        details={"doctor_id": row.doctor_id, "treatment_plan": row.treatment_plan},
+    )
+
+
+def _prescription_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.PRESCRIPTIONS, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title=f"Prescription ({row.item_count} item{'s' if row.item_count != 1 else ''})",
+        status=row.prescription_status,
+        details={"doctor_id": row.doctor_id, "item_count": row.item_count, "notes": row.notes},
+    )
+
+
+def _lab_order_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.LAB_ORDERS, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title=row.test_name, status=row.order_status,
+        details={"doctor_id": row.doctor_id, "notes": row.notes},
+    )
+
+
+def _lab_result_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.LAB_RESULTS, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title=row.test_name,
+        details={
+            "lab_order_id": row.lab_order_id,
+            "result_value": row.result_value,
+            "result_unit": row.result_unit,
+            "interpretation": row.interpretation,
+            "attachment_url": row.attachment_url,
+        },
+    )
+
+
+def _referral_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.REFERRALS, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title=f"Referral to {row.referred_to_facility}", status=row.referral_status,
+        details={"doctor_id": row.referring_doctor_id, "specialty": row.specialty, "reason": row.reason},
+    )
+
+
+def _invoice_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.INVOICES, id=row.id, occurred_at=row.occurred_at, visit_id=row.visit_id,
+        title="Invoice", status=row.payment_status,
+        details={"total_amount": _number(row.total_amount), "amount_paid": _number(row.amount_paid)},
+    )
+
+
+def _wearable_entry(row) -> TimelineEntryDTO:
+    return TimelineEntryDTO(
+        type=TimelineSectionEnum.WEARABLES, id=row.id, occurred_at=row.occurred_at,
+        title=row.device_name or row.device_identifier,
+        details={
+            "sample_count": row.sample_count,
+            "heart_rate_avg": _average(row.heart_rate_sum, row.heart_rate_count),
+            "heart_rate_min": row.heart_rate_min,
+            "heart_rate_max": row.heart_rate_max,
+            "systolic_bp_avg": _average(row.systolic_bp_sum, row.systolic_bp_count),
+            "diastolic_bp_avg": _average(row.diastolic_bp_sum, row.diastolic_bp_count),
+            "spo2_avg": _average(row.spo2_sum, row.spo2_count),
+            "spo2_min": row.spo2_min,
+            "steps": row.steps_sum,
+        },
+    )
+
+
+class PatientTimelineUseCase:
+    def __init__(self, repository: PatientTimelineRepository):
+        self.repository = repository
+        self._sections = {
+            TimelineSectionEnum.VISITS: (repository.list_visits, _visit_entry),
+            TimelineSectionEnum.MEDICAL_RECORDS: (repository.list_medical_records, _medical_record_entry),
+            TimelineSectionEnum.PRESCRIPTIONS: (repository.list_prescriptions, _prescription_entry),
+            TimelineSectionEnum.LAB_ORDERS: (repository.list_lab_orders, _lab_order_entry),
+            TimelineSectionEnum.LAB_RESULTS: (repository.list_lab_results, _lab_result_entry),
+            TimelineSectionEnum.REFERRALS: (repository.list_referrals, _referral_entry),
+            TimelineSectionEnum.INVOICES: (repository.list_invoices, _invoice_entry),
+            TimelineSectionEnum.WEARABLES: (repository.list_wearable_days, _wearable_entry),
+        }
+
+    @staticmethod
+    def visible_sections(
+        patient_id: UUID, user_id: UUID, role: str, requested: Sequence[TimelineSectionEnum] = ()
+    ) -> Dict[TimelineSectionEnum, Optional[UUID]]:
+        """
+        Sections the user may see for the patient -> doctor id to restrict them to (None: all of
+        the patient's rows). Mirrors the list endpoints: patients see only themselves, doctors see
+        the patient's records and invoices but only their own visits, prescriptions, lab work and
+        referrals, and staff see everything but wearable data.
+        """
+        if role == RoleEnum.PATIENT.value and patient_id != user_id:
+            raise AuthorizationException("Unauthorized")
+        hidden = _HIDDEN.get(role, set())
+        forbidden = [section.value for section in requested if section in hidden]
+        if forbidden:
+            raise AuthorizationException(f"Not authorized to view: {', '.join(forbidden)}")
+
+        scope = {}
+        for section in _SECTIONS:
+            if section in hidden or (requested and section not in requested):
+                continue
+            own = role == RoleEnum.DOCTOR.value and section in _DOCTOR_OWN
+            scope[section] = user_id if own else None
+        return scope
+
+    async def patient_timeline(
+        self,
+        patient_id: UUID,
+        user_id: UUID,
+        role: str,
+        limit: int,
+        cursor: Optional[str] = None,
+        sections: Sequence[TimelineSectionEnum] = (),
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Tuple[List[TimelineSectionEnum], List[TimelineEntryDTO], Optional[str]]:
+        """
+        One page of the patient's history, newest first, with one query per included section.
+        Returns (sections included, page, token for the next page or None).
+        """
+        if limit < 1 or limit > MAX_TIMELINE_LIMIT:
+            raise BusinessLogicException(f"limit must be between 1 and {MAX_TIMELINE_LIMIT}")
+        scope = self.visible_sections(patient_id, user_id, role, sections)
+        before = decode_cursor(cursor) if cursor else None
+        if not await self.repository.patient_exists(patient_id):
+            raise NotFoundException("Patient not found")
+
+        keyed = []
+        for section, doctor_id in scope.items():
+            load, to_entry = self._sections[section]
+            # One extra row tells whether another page follows
+            rows = await load(patient_id, doctor_id, _RANK[section], limit + 1, before, date_from, date_to)
+            keyed.extend(((row.occurred_at, _RANK[section], row.id), to_entry(row)) for row in rows)
+        keyed.sort(key=lambda item: item[0], reverse=True)
+
+        entries = [entry for _, entry in keyed[:limit + 1]]
+        if len(entries) > limit:
+            return list(scope), entries[:limit], encode_cursor(entries[limit - 1])
+        return list(scope), entries, None
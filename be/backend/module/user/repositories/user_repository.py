@@ -3,6 +3,8 @@ from uuid import UUID
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.infrastructure.search.service import get_search_service
+from backend.module.common.search_indexes import USER_SEARCH
 from backend.module.user.entity.user import User
 
 
@@ -37,8 +39,8 @@ class UserRepository:
 
         filters = []
         if search:
-            # Case insensitive search on username or full_name
-            filters.append(User.username.ilike(f"%{search}%") | User.full_name.ilike(f"%{search}%"))
+            # Every word in the username or full_name
+            filters.append(await get_search_service().match(USER_SEARCH, search))
 
         if roles:
             # Filter by roles if provided
@@ -1,4 +1,8 @@
+from typing import Optional
+
+from backend.infrastructure.search.service import SearchIndexer
 from backend.infrastructure.security.password import get_password_hash
+from backend.module.common.search_indexes import USER_SEARCH
 from backend.module.user.entity.admin_dto import CreateUserDTO
 from backend.module.user.entity.user import RoleEnum, User
 from backend.module.user.entity.user_dao import UserDAO
@@ -7,8 +11,9 @@ from backend.pkg.core.exceptions import BusinessLogicException
 
 
 class AdminUseCase:
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository, search: Optional[SearchIndexer] = None):
         self.user_repository = user_repository
+        self.search = search
 
     async def create_user(self, req: CreateUserDTO) -> UserDAO:
         # Check if username exists
@@ -42,6 +47,8 @@ class AdminUseCase:
             is_active=True
         )
         created_user = await self.user_repository.create_user(new_user)
+        if self.search:
+            await self.search.changed(USER_SEARCH, created_user.id)
         return UserDAO.model_validate(created_user)
 
     async def list_users(self, page: int, limit: int, search: str = None, roles: list[str] = None) -> tuple[list[User], int]:
@@ -1,7 +1,9 @@
 from datetime import datetime, timedelta
+from typing import Optional
 from uuid import UUID
 
 from backend.infrastructure.config.settings import settings
+from backend.infrastructure.search.service import SearchIndexer
 from backend.infrastructure.security.hmac_utils import (
     create_access_token,
     create_refresh_token,
@@ -10,6 +12,7 @@ from backend.infrastructure.security.hmac_utils import (
     verify_password,
 )
 from backend.module.common.enums import RoleEnum
+from backend.module.common.search_indexes import USER_SEARCH
 from backend.module.profile.repositories.profile_repository import ProfileRepository
 from backend.module.session.models.session import UserSession
 from backend.module.session.repositories.session_repository import (
@@ -31,10 +34,12 @@ class AuthUseCase:
         user_repository: UserRepository,
         session_repository: SessionRepository,
         profile_repository: ProfileRepository,
+        search: Optional[SearchIndexer] = None,
     ):
         self.user_repository = user_repository
         self.session_repository = session_repository
         self.profile_repository = profile_repository
+        self.search = search
 
     async def _get_profile_claims(self, user_id: UUID, role: RoleEnum) -> dict:
         """Get profile claims (profile_id, department) for JWT token."""
@@ -135,6 +140,8 @@ class AuthUseCase:
             is_active=True
         )
         created_user = await self.user_repository.create_user(new_user)
+        if self.search:
+            await self.search.changed(USER_SEARCH, created_user.id)
         return UserDAO.model_validate(created_user)
 
     async def logout(self, refresh_token: str) -> None:
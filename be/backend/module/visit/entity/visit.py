@@ -4,7 +4,7 @@ from datetime import datetime
 
 from backend.infrastructure.database.connection import Base
 from backend.module.common.enums import VisitStatusEnum, VisitTypeEnum
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, Integer, Text
+from sqlalchemy import BigInteger, Column, Date, DateTime, Enum, ForeignKey, Index, Integer, Text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
 
@@ -18,7 +18,9 @@ class Visit(Base):
     registration_staff_id = Column(PG_UUID(as_uuid=True), ForeignKey("staff.id"), nullable=False)
     clinic_id = Column(PG_UUID(as_uuid=True), ForeignKey("clinic.id"), nullable=False)
 
-    queue_number = Column(Integer, nullable=True) # Serial in DB, but integer here. Maybe need to handle generation if not auto-incrementing in older postgres with simple insert
+    # Number within the clinic's queue for queue_date (local day in HOSPITAL_TIMEZONE), from ClinicQueueCounter
+    queue_number = Column(Integer, nullable=True)
+    queue_date = Column(Date, nullable=True)
     visit_datetime = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
 
     visit_type = Column(
@@ -29,6 +31,9 @@ class Visit(Base):
 
     chief_complaint = Column(Text, nullable=True)
 
+    # First time the visit entered examination; registration (created_at) to here is the wait
+    examination_started_at = Column(DateTime(timezone=True), nullable=True)
+
     visit_status = Column(
         Enum(VisitStatusEnum, name="visit_status_enum", create_type=False),
         nullable=False,
@@ -43,3 +48,22 @@ class Visit(Base):
     doctor = relationship("Doctor", backref="visits", lazy="select")
     # staff = relationship("Staff", foreign_keys=[registration_staff_id])
     clinic = relationship("Clinic", backref="visits", lazy="select")
+
+    __table_args__ = (
+        Index("ix_visits_clinic_queue", "clinic_id", "queue_date", "queue_number", unique=True),
+        Index("ix_visits_doctor_queue_date", "doctor_id", "queue_date"),
+        Index("ix_visits_patient_visit_datetime", "patient_id", "visit_datetime"),
+    )
+
+
+class ClinicQueueCounter(Base):
+    """
+    Last queue number handed out per clinic and day, and the id of the last change to that
+    queue (board event ids for streams); one row per (clinic_id, queue_date).
+    """
+    __tablename__ = "clinic_queue_counters"
+
+    clinic_id = Column(PG_UUID(as_uuid=True), ForeignKey("clinic.id", ondelete="CASCADE"), primary_key=True)
+    queue_date = Column(Date, primary_key=True)
+    last_number = Column(Integer, nullable=False, default=0)
+    last_event_id = Column(BigInteger, nullable=False, default=0)
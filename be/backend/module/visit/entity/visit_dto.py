@@ -1,9 +1,16 @@
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import List, Optional
 from uuid import UUID
 
-from backend.module.common.enums import VisitStatusEnum, VisitTypeEnum
+from backend.module.common.enums import (
+    GenderEnum,
+    OrderStatusEnum,
+    PaymentStatusEnum,
+    PrescriptionStatusEnum,
+    VisitStatusEnum,
+    VisitTypeEnum,
+)
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -36,8 +43,67 @@ class VisitDTO(VisitBase):
     registration_staff_id: UUID
     clinic_id: UUID
     queue_number: Optional[int]
+    queue_date: Optional[date] = None
     visit_status: VisitStatusEnum
+    examination_started_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class VisitListItemDTO(VisitDTO):
+    """A visit in list views, with the names the list shows."""
+    patient_name: str
+    doctor_name: str
+    clinic_name: str
+
+
+# --- Queue board DTOs ---
+
+class QueueBoardEntryDTO(BaseModel):
+    queue_number: int
+    doctor_id: UUID
+
+
+class QueueBoardDTO(BaseModel):
+    """A clinic's queue for one day as shown on display screens (queue numbers only, no patient data)."""
+    clinic_id: UUID
+    queue_date: date
+    waiting: List[QueueBoardEntryDTO]
+    examining: List[QueueBoardEntryDTO]
+    done: List[QueueBoardEntryDTO]
+    event_id: int = 0  # Last queue event reflected; streams continue after it
+    updated_at: Optional[datetime] = None  # Last change to any entry
+
+
+# --- Doctor worklist DTOs ---
+
+class WorklistPatientDTO(BaseModel):
+    id: UUID
+    full_name: str
+    age: int
+    gender: GenderEnum
+
+
+class WorklistLabOrderDTO(BaseModel):
+    id: UUID
+    test_name: str
+    order_status: OrderStatusEnum
+
+
+class WorklistItemDTO(BaseModel):
+    """One visit of a doctor's day with what is still open on it."""
+    visit_id: UUID
+    clinic_id: UUID
+    queue_number: Optional[int]
+    visit_datetime: datetime
+    visit_type: VisitTypeEnum
+    visit_status: VisitStatusEnum
+    chief_complaint: Optional[str]
+    patient: WorklistPatientDTO
+    medical_record_id: Optional[UUID] = None
+    record_status: str  # "not_started", "in_progress" or "completed" (outcome recorded)
+    prescription_status: Optional[PrescriptionStatusEnum] = None
+    pending_lab_orders: List[WorklistLabOrderDTO] = []
+    invoice_status: Optional[PaymentStatusEnum] = None
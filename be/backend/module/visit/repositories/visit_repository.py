@@ -1,11 +1,20 @@
 
-from datetime import datetime
+from datetime import date, datetime
 from uuid import UUID
 
-from backend.module.common.enums import VisitStatusEnum
-from backend.module.visit.entity.visit import Visit
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.enums import OrderStatusEnum, VisitStatusEnum
+from backend.module.invoice.entity.invoice import Invoice
+from backend.module.lab.entity.lab import LabOrder, LabTest
+from backend.module.medical_record.entity.medical_record import MedicalRecord
+from backend.module.prescription.entity.prescription import Prescription
+from backend.module.profile.entity.models import Doctor, Patient
+from backend.module.user.entity.user import User
+from backend.module.visit.entity.visit import ClinicQueueCounter, Visit
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 
 class VisitRepository:
@@ -13,17 +22,100 @@ class VisitRepository:
         self.session = session
 
     async def create(self, visit: Visit) -> Visit:
-        # Check for queue number generation if logic is needed here
-        # For now relying on DB sequence or we can query max
-
-        # If queue_number is SERIAL in Postgres, we don't need to pass it, it auto-increments
-        # But commonly in mapped classes we might want to ensure it's fetched back
-
         self.session.add(visit)
         await self.session.flush()
         await self.session.refresh(visit)
         return visit
 
+    async def _bump_queue_counter(self, clinic_id: UUID, queue_date: date, take_number: bool):
+        counter = ClinicQueueCounter
+        stmt = (
+            insert(counter)
+            .values(clinic_id=clinic_id, queue_date=queue_date, last_number=int(take_number), last_event_id=1)
+            .on_conflict_do_update(
+                index_elements=[counter.clinic_id, counter.queue_date],
+                set_={
+                    "last_number": counter.last_number + int(take_number),
+                    "last_event_id": counter.last_event_id + 1,
+                },
+            )
+            .returning(counter.last_number, counter.last_event_id)
+        )
+        return (await self.session.execute(stmt)).one()
+
+    async def next_queue_number(self, clinic_id: UUID, queue_date: date) -> tuple[int, int]:
+        """
+        Take the next number of a clinic's queue for a day in one statement; returns
+        (queue number, event id). Concurrent changes to the same clinic and day wait on the
+        counter row until this transaction ends, so numbers are never handed out twice and
+        event ids are published in commit order.
+        """
+        number, event_id = await self._bump_queue_counter(clinic_id, queue_date, take_number=True)
+        return number, event_id
+
+    async def next_queue_event_id(self, clinic_id: UUID, queue_date: date) -> int:
+        """Id for a change to a clinic's queue for a day (status, doctor, removal); see next_queue_number."""
+        _, event_id = await self._bump_queue_counter(clinic_id, queue_date, take_number=False)
+        return event_id
+
+    async def get_queue_event_id(self, clinic_id: UUID, queue_date: date) -> int:
+        stmt = select(ClinicQueueCounter.last_event_id).where(
+            ClinicQueueCounter.clinic_id == clinic_id,
+            ClinicQueueCounter.queue_date == queue_date,
+        )
+        return (await self.session.execute(stmt)).scalar() or 0
+
+    async def list_queue(self, clinic_id: UUID, queue_date: date) -> list:
+        """Queue entries of a clinic for a day (what the queue board shows), by queue number."""
+        stmt = (
+            select(Visit.id, Visit.queue_number, Visit.visit_status, Visit.doctor_id, Visit.updated_at)
+            .where(
+                Visit.clinic_id == clinic_id,
+                Visit.queue_date == queue_date,
+                Visit.queue_number.isnot(None),
+            )
+            .order_by(Visit.queue_number)
+        )
+        return list((await self.session.execute(stmt)).all())
+
+    async def list_worklist(self, doctor_id: UUID, queue_date: date) -> list:
+        """
+        A doctor's visits for a day with patient, record, prescription and invoice columns, in one
+        query: each of those is at most one row per visit, so the joins never multiply rows.
+        """
+        stmt = (
+            select(
+                Visit.id, Visit.clinic_id, Visit.queue_number, Visit.visit_datetime, Visit.visit_type,
+                Visit.visit_status, Visit.chief_complaint,
+                Patient.id.label("patient_id"), User.full_name, Patient.date_of_birth, Patient.gender,
+                MedicalRecord.id.label("medical_record_id"), MedicalRecord.outcome,
+                Prescription.prescription_status, Invoice.payment_status,
+            )
+            .join(Patient, Patient.id == Visit.patient_id)
+            .join(User, User.id == Patient.user_id)
+            .outerjoin(MedicalRecord, MedicalRecord.visit_id == Visit.id)
+            .outerjoin(Prescription, Prescription.visit_id == Visit.id)
+            .outerjoin(Invoice, Invoice.visit_id == Visit.id)
+            .where(Visit.doctor_id == doctor_id, Visit.queue_date == queue_date)
+            .order_by(Visit.queue_number, Visit.visit_datetime)
+        )
+        return list((await self.session.execute(stmt)).all())
+
+    async def list_open_lab_orders(self, visit_ids: list[UUID]) -> list:
+        """Pending or in-progress lab orders of the given visits, in one query."""
+        if not visit_ids:
+            return []
+        stmt = (
+            select(LabOrder.id, LabOrder.visit_id, LabOrder.order_status, LabTest.test_name)
+            .join(LabTest, LabTest.id == LabOrder.lab_test_id)
+            .where(
+                LabOrder.visit_id.in_(visit_ids),
+                LabOrder.order_status.in_([OrderStatusEnum.PENDING.value, OrderStatusEnum.IN_PROGRESS.value]),
+            )
+            .order_by(LabOrder.created_at)
+        )
+        return list((await self.session.execute(stmt)).all())
+
     async def get_by_id(self, visit_id: UUID) -> Visit | None:
         stmt = select(Visit).where(Visit.id == visit_id)
         result = await self.session.execute(stmt)
@@ -39,19 +131,15 @@ class VisitRepository:
         await self.session.delete(visit)
         await self.session.flush()
 
-    async def list_visits(
-        self,
-        page: int = 1,
-        limit: int = 10,
+    @staticmethod
+    def _list_filters(
         patient_id: UUID = None,
         doctor_id: UUID = None,
         clinic_id: UUID = None,
         status: VisitStatusEnum = None,
         date_from: datetime = None,
         date_to: datetime = None
-    ) -> tuple[list[Visit], int]:
-        stmt = select(Visit)
-
+    ) -> list:
         filters = []
         if patient_id:
             filters.append(Visit.patient_id == patient_id)
@@ -65,21 +153,34 @@ class VisitRepository:
             filters.append(Visit.visit_datetime >= date_from)
         if date_to:
             filters.append(Visit.visit_datetime <= date_to)
+        return filters
+
+    async def _count(self, filters: list) -> int:
+        count_stmt = select(func.count()).select_from(Visit)
+        for f in filters:
+            count_stmt = count_stmt.where(f)
+        return (await self.session.execute(count_stmt)).scalar() or 0
 
-        if filters:
-            for f in filters:
-                stmt = stmt.where(f)
+    async def list_visits(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: UUID = None,
+        doctor_id: UUID = None,
+        clinic_id: UUID = None,
+        status: VisitStatusEnum = None,
+        date_from: datetime = None,
+        date_to: datetime = None
+    ) -> tuple[list[Visit], int]:
+        filters = self._list_filters(patient_id, doctor_id, clinic_id, status, date_from, date_to)
+        stmt = select(Visit)
+        for f in filters:
+            stmt = stmt.where(f)
 
         # Order by datetime desc
         stmt = stmt.order_by(Visit.visit_datetime.desc())
 
-        # Total count
-        count_stmt = select(func.count()).select_from(Visit)
-        if filters:
-            for f in filters:
-                count_stmt = count_stmt.where(f)
-
-        total = (await self.session.execute(count_stmt)).scalar() or 0
+        total = await self._count(filters)
 
         # Paginate
         stmt = stmt.offset((page - 1) * limit).limit(limit)
@@ -87,3 +188,46 @@ class VisitRepository:
         visits = result.scalars().all()
 
         return visits, total
+
+    async def list_visit_rows(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: UUID = None,
+        doctor_id: UUID = None,
+        clinic_id: UUID = None,
+        status: VisitStatusEnum = None,
+        date_from: datetime = None,
+        date_to: datetime = None
+    ) -> tuple[list, int]:
+        """
+        list_visits as plain rows of the visit columns plus patient, doctor and clinic names,
+        joined in the same query instead of loading entities and resolving names per row. The
+        page of visits is picked first, so the name joins only touch the rows returned.
+        """
+        filters = self._list_filters(patient_id, doctor_id, clinic_id, status, date_from, date_to)
+        visits = select(Visit.__table__)
+        for f in filters:
+            visits = visits.where(f)
+        visits = visits.order_by(Visit.visit_datetime.desc()).offset((page - 1) * limit).limit(limit).subquery()
+
+        patient_user = aliased(User)
+        doctor_user = aliased(User)
+        stmt = (
+            select(
+                visits,
+                patient_user.full_name.label("patient_name"),
+                doctor_user.full_name.label("doctor_name"),
+                Clinic.name.label("clinic_name"),
+            )
+            .join(Patient, Patient.id == visits.c.patient_id)
+            .join(patient_user, patient_user.id == Patient.user_id)
+            .join(Doctor, Doctor.id == visits.c.doctor_id)
+            .join(doctor_user, doctor_user.id == Doctor.user_id)
+            .join(Clinic, Clinic.id == visits.c.clinic_id)
+            .order_by(visits.c.visit_datetime.desc())
+        )
+
+        total = await self._count(filters)
+        rows = (await self.session.execute(stmt)).all()
+        return list(rows), total
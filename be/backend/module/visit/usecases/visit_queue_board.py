@@ -0,0 +1,249 @@
+"""
+Live clinic queue boards.
+
+A board is one clinic's queue for one day, split into waiting (registered), examining and done
+(completed) visits by queue number. Boards are held in memory per (clinic, day), LRU-bounded:
+built from one query on first request, then kept current by the visit changes published after
+each commit (on every worker when the LISTEN/NOTIFY bridge is enabled), so display screens
+polling every second are answered without touching the database. A board is rebuilt once older
+than the TTL, which bounds staleness if a notification was missed.
+
+Every change to a queue carries an event id from the clinic's counter row for that day, so ids
+are increasing and identical on every worker. Boards keep their last QUEUE_BOARD_EVENT_LOG events
+for streams resuming from a Last-Event-ID.
+"""
+import json
+import time
+from collections import OrderedDict, deque
+from datetime import date, datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.pubsub import pg_notify
+from backend.infrastructure.pubsub.hub import get_pubsub_hub
+from backend.module.common.enums import VisitStatusEnum
+from backend.module.visit.entity.visit import Visit
+from backend.module.visit.entity.visit_dto import QueueBoardDTO, QueueBoardEntryDTO
+from sqlalchemy.ext.asyncio import AsyncSession
+
+QUEUE_TOPIC_PREFIX = "visit:queue:"
+REMOVED = "removed"  # Event status of a visit that left the queue (deleted or moved)
+
+_HOSPITAL_TZ = ZoneInfo(settings.HOSPITAL_TIMEZONE)
+
+BoardKey = Tuple[UUID, date]
+# queue_number, status, doctor_id, updated_at
+QueueEntry = Tuple[int, str, UUID, datetime]
+
+
+def queue_topic(clinic_id: UUID) -> str:
+    return f"{QUEUE_TOPIC_PREFIX}{clinic_id}"
+
+
+def queue_date_of(visit_datetime: datetime) -> date:
+    """Local day (HOSPITAL_TIMEZONE) whose queue a visit at `visit_datetime` joins."""
+    if visit_datetime.tzinfo is None:
+        visit_datetime = visit_datetime.replace(tzinfo=timezone.utc)
+    return visit_datetime.astimezone(_HOSPITAL_TZ).date()
+
+
+def hospital_today() -> date:
+    return datetime.now(_HOSPITAL_TZ).date()
+
+
+def _entry(visit) -> QueueEntry:
+    return visit.queue_number, VisitStatusEnum(visit.visit_status).value, visit.doctor_id, visit.updated_at
+
+
+class QueueEvent:
+    """A committed change to one board, as published between workers."""
+    __slots__ = ("event_id", "visit_id", "clinic_id", "queue_date", "queue_number", "entry")
+
+    def __init__(
+        self, event_id: int, visit_id: UUID, clinic_id: UUID, queue_date: date, queue_number: int,
+        entry: Optional[QueueEntry]
+    ):
+        self.event_id = event_id
+        self.visit_id = visit_id
+        self.clinic_id = clinic_id
+        self.queue_date = queue_date
+        self.queue_number = queue_number
+        self.entry = entry  # None: the visit left this board
+
+    def encode(self) -> str:
+        data = {
+            "event_id": self.event_id,
+            "id": str(self.visit_id),
+            "clinic_id": str(self.clinic_id),
+            "queue_date": self.queue_date.isoformat(),
+            "queue_number": self.queue_number,
+        }
+        if self.entry is not None:
+            _, status, doctor_id, updated_at = self.entry
+            data.update(status=status, doctor_id=str(doctor_id), updated_at=updated_at.isoformat())
+        return json.dumps(data)
+
+    @classmethod
+    def decode(cls, message: str) -> "QueueEvent":
+        data = json.loads(message)
+        entry = None
+        if "status" in data:
+            entry = (
+                data["queue_number"], data["status"], UUID(data["doctor_id"]),
+                datetime.fromisoformat(data["updated_at"]),
+            )
+        return cls(
+            data["event_id"], UUID(data["id"]), UUID(data["clinic_id"]),
+            date.fromisoformat(data["queue_date"]), data["queue_number"], entry,
+        )
+
+    def public(self) -> str:
+        """What screens receive: the queue number and its new state, no visit or patient ids."""
+        if self.entry is None:
+            return json.dumps({"queue_number": self.queue_number, "status": REMOVED, "doctor_id": None})
+        return json.dumps({"queue_number": self.queue_number, "status": self.entry[1], "doctor_id": str(self.entry[2])})
+
+
+class QueueBoard:
+    __slots__ = ("clinic_id", "queue_date", "entries", "event_id", "events", "loaded_at", "_snapshot")
+
+    def __init__(self, clinic_id: UUID, queue_date: date, event_id: int = 0, rows: Sequence = ()):
+        self.clinic_id = clinic_id
+        self.queue_date = queue_date
+        self.entries: Dict[UUID, QueueEntry] = {row.id: _entry(row) for row in rows}
+        self.event_id = event_id  # Last change reflected in entries
+        self.events: deque = deque(maxlen=settings.QUEUE_BOARD_EVENT_LOG)  # (event_id, public payload)
+        self.loaded_at = time.monotonic()
+        self._snapshot: Optional[QueueBoardDTO] = None
+
+    def apply(self, event: QueueEvent) -> None:
+        if event.event_id <= self.event_id:
+            return  # Already reflected (loaded after it committed, or a duplicate)
+        if event.entry is None:
+            self.entries.pop(event.visit_id, None)
+        else:
+            self.entries[event.visit_id] = event.entry
+        self.event_id = event.event_id
+        self.events.append((event.event_id, event.public()))
+        self._snapshot = None
+
+    def events_after(self, event_id: int) -> Optional[List[Tuple[int, str]]]:
+        """Events since `event_id`, or None when the log no longer reaches back that far."""
+        if event_id == self.event_id:
+            return []
+        if event_id > self.event_id or not self.events or self.events[0][0] > event_id + 1:
+            return None
+        return [event for event in self.events if event[0] > event_id]
+
+    def snapshot(self) -> QueueBoardDTO:
+        """The board as served to screens; rebuilt only after a change."""
+        if self._snapshot is None:
+            lists: Dict[str, List[QueueBoardEntryDTO]] = {
+                VisitStatusEnum.REGISTERED.value: [],
+                VisitStatusEnum.EXAMINING.value: [],
+                VisitStatusEnum.COMPLETED.value: [],
+            }
+            for number, status, doctor_id, _ in sorted(self.entries.values()):
+                if status in lists:  # Canceled visits leave the board
+                    lists[status].append(QueueBoardEntryDTO(queue_number=number, doctor_id=doctor_id))
+            self._snapshot = QueueBoardDTO(
+                clinic_id=self.clinic_id,
+                queue_date=self.queue_date,
+                waiting=lists[VisitStatusEnum.REGISTERED.value],
+                examining=lists[VisitStatusEnum.EXAMINING.value],
+                done=lists[VisitStatusEnum.COMPLETED.value],
+                event_id=self.event_id,
+                updated_at=max((entry[3] for entry in self.entries.values()), default=None),
+            )
+        return self._snapshot
+
+
+class QueueBoardCache:
+    def __init__(self, max_boards: int, ttl_seconds: float):
+        self.max_boards = max_boards
+        self.ttl_seconds = ttl_seconds
+        self._boards: "OrderedDict[BoardKey, QueueBoard]" = OrderedDict()
+        # Events published while a board is being loaded, replayed onto the loaded board
+        self._loading: Dict[BoardKey, List[List[QueueEvent]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: BoardKey) -> Optional[QueueBoard]:
+        board = self._boards.get(key)
+        if board is None:
+            return None
+        if time.monotonic() - board.loaded_at > self.ttl_seconds:
+            del self._boards[key]
+            return None
+        self._boards.move_to_end(key)
+        return board
+
+    async def get_or_load(self, key: BoardKey, loader: Callable[[], Awaitable[Tuple[int, Sequence]]]) -> QueueBoard:
+        """
+        Cached board, or one built from `loader()` -> (last event id, the day's queue rows of the
+        clinic), with the event id read before the rows.
+        """
+        board = self.get(key)
+        if board is not None:
+            self.hits += 1
+            return board
+
+        self.misses += 1
+        published: List[QueueEvent] = []
+        self._loading.setdefault(key, []).append(published)
+        try:
+            event_id, rows = await loader()
+        finally:
+            buffers = self._loading[key]
+            buffers.remove(published)
+            if not buffers:
+                del self._loading[key]
+
+        board = QueueBoard(*key, event_id, rows)
+        for event in published:
+            board.apply(event)
+        self._boards[key] = board
+        while len(self._boards) > self.max_boards:
+            self._boards.popitem(last=False)
+        return board
+
+    def on_message(self, topic: str, message: str) -> None:
+        """Pub/sub listener for queue topics: apply a committed visit change to its cached board."""
+        event = QueueEvent.decode(message)
+        key = (event.clinic_id, event.queue_date)
+        board = self._boards.get(key)
+        for published in self._loading.get(key, ()):
+            published.append(event)
+        if board is not None:
+            board.apply(event)
+
+    def stats(self) -> dict:
+        return {"boards": len(self._boards), "max_boards": self.max_boards, "hits": self.hits, "misses": self.misses}
+
+
+class VisitQueuePublisher:
+    """Pushes visit queue changes to boards and streams once the transaction commits."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def publish(self, visit: Visit, event_id: int) -> None:
+        event = QueueEvent(event_id, visit.id, visit.clinic_id, visit.queue_date, visit.queue_number, _entry(visit))
+        await pg_notify.publish(self.session, [queue_topic(visit.clinic_id)], event.encode())
+
+    async def publish_removed(
+        self, visit_id: UUID, clinic_id: UUID, queue_date: date, queue_number: int, event_id: int
+    ) -> None:
+        event = QueueEvent(event_id, visit_id, clinic_id, queue_date, queue_number, None)
+        await pg_notify.publish(self.session, [queue_topic(clinic_id)], event.encode())
+
+
+# Singleton instance
+queue_board_cache = QueueBoardCache(settings.QUEUE_BOARD_MAX_BOARDS, settings.QUEUE_BOARD_TTL_SECONDS)
+get_pubsub_hub().add_listener(QUEUE_TOPIC_PREFIX, queue_board_cache.on_message)
+
+
+def get_queue_board_cache() -> QueueBoardCache:
+    return queue_board_cache
@@ -1,21 +1,55 @@
 
-from datetime import datetime
+from datetime import date, datetime, timezone
 from typing import Optional
 from uuid import UUID
 
+from backend.infrastructure.config.settings import settings
 from backend.module.common.enums import RoleEnum, VisitStatusEnum
+from backend.module.schedule.usecases.doctor_availability import AvailabilityUpdater
+from backend.module.stats.usecases.visit_stats import VisitStatsRecorder, visit_stats_entry
 from backend.module.visit.entity.visit import Visit
-from backend.module.visit.entity.visit_dto import VisitCreateDTO, VisitUpdateDTO
+from backend.module.visit.entity.visit_dto import (
+    QueueBoardDTO,
+    VisitCreateDTO,
+    VisitUpdateDTO,
+    WorklistItemDTO,
+    WorklistLabOrderDTO,
+    WorklistPatientDTO,
+)
 from backend.module.visit.repositories.visit_repository import VisitRepository
-from backend.pkg.core.exceptions import AuthorizationException, NotFoundException
+from backend.module.visit.usecases.visit_queue_board import (
+    QueueBoard,
+    QueueBoardCache,
+    VisitQueuePublisher,
+    hospital_today,
+    queue_date_of,
+)
+from backend.pkg.core.exceptions import AuthorizationException, BusinessLogicException, NotFoundException
 
 
 class VisitUseCase:
-    def __init__(self, visit_repository: VisitRepository):
+    def __init__(
+        self,
+        visit_repository: VisitRepository,
+        publisher: Optional[VisitQueuePublisher] = None,
+        queue_boards: Optional[QueueBoardCache] = None,
+        availability: Optional[AvailabilityUpdater] = None,
+        stats: Optional[VisitStatsRecorder] = None
+    ):
         self.visit_repository = visit_repository
+        self.publisher = publisher
+        self.queue_boards = queue_boards
+        self.availability = availability
+        self.stats = stats
+
+    async def _assign_queue_number(self, visit: Visit) -> int:
+        """Put the visit at the back of its clinic's queue for the day; returns the queue event id."""
+        visit.queue_date = queue_date_of(visit.visit_datetime)
+        visit.queue_number, event_id = await self.visit_repository.next_queue_number(visit.clinic_id, visit.queue_date)
+        return event_id
 
     async def create_visit(self, req: VisitCreateDTO, staff_id: UUID) -> Visit:
-        """Create a visit. Authorization handled by middleware."""
+        """Create a visit with the next queue number of its clinic for the day. Authorization handled by middleware."""
         new_visit = Visit(
             patient_id=req.patient_id,
             doctor_id=req.doctor_id,
@@ -26,7 +60,15 @@ class VisitUseCase:
             chief_complaint=req.chief_complaint,
             visit_status=VisitStatusEnum.REGISTERED
         )
-        return await self.visit_repository.create(new_visit)
+        event_id = await self._assign_queue_number(new_visit)
+        visit = await self.visit_repository.create(new_visit)
+        if self.publisher:
+            await self.publisher.publish(visit, event_id)
+        if self.availability:
+            await self.availability.refresh_booked([(visit.doctor_id, visit.queue_date)])
+        if self.stats:
+            await self.stats.record(None, visit_stats_entry(visit))
+        return visit
 
     async def get_visit(self, visit_id: UUID, user_id: UUID, role: str) -> Visit:
         """Get visit with ownership check for patients/doctors."""
@@ -47,6 +89,10 @@ class VisitUseCase:
         visit = await self.visit_repository.get_by_id(visit_id)
         if not visit:
             raise NotFoundException(f"Visit with id {visit_id} not found")
+        previous_queue = (visit.clinic_id, visit.queue_date, visit.queue_number)
+        previous_entry = (visit.visit_status, visit.doctor_id)
+        previous_slot = (visit.doctor_id, visit.visit_datetime, visit.visit_status)
+        previous_stats = visit_stats_entry(visit)
 
         # Doctor can only update status of their own visits
         if role == RoleEnum.DOCTOR.value:
@@ -69,15 +115,53 @@ class VisitUseCase:
                 visit.doctor_id = req.doctor_id
             if req.clinic_id:
                 visit.clinic_id = req.clinic_id
+        if visit.visit_status == VisitStatusEnum.EXAMINING and visit.examination_started_at is None:
+            visit.examination_started_at = datetime.now(timezone.utc)
 
-        return await self.visit_repository.update(visit)
+        # Board changes get a queue event id: leaving the old queue, joining a new one, or a new
+        # status or doctor in the same queue. Other edits are not shown on boards.
+        left_queue = event_id = None
+        old_clinic_id, old_queue_date, old_queue_number = previous_queue
+        if (visit.clinic_id, queue_date_of(visit.visit_datetime)) != (old_clinic_id, old_queue_date):
+            if old_queue_date is not None:
+                left_queue = await self.visit_repository.next_queue_event_id(old_clinic_id, old_queue_date)
+            event_id = await self._assign_queue_number(visit)
+        elif (visit.visit_status, visit.doctor_id) != previous_entry:
+            event_id = await self.visit_repository.next_queue_event_id(visit.clinic_id, visit.queue_date)
+
+        visit = await self.visit_repository.update(visit)
+        if self.publisher:
+            if left_queue is not None:
+                await self.publisher.publish_removed(visit.id, old_clinic_id, old_queue_date, old_queue_number, left_queue)
+            if event_id is not None:
+                await self.publisher.publish(visit, event_id)
+        # A new doctor, time or status frees the old slot and takes (or not) a new one
+        if self.availability and (visit.doctor_id, visit.visit_datetime, visit.visit_status) != previous_slot:
+            await self.availability.refresh_booked([
+                (previous_slot[0], queue_date_of(previous_slot[1])), (visit.doctor_id, visit.queue_date),
+            ])
+        if self.stats:
+            await self.stats.record(previous_stats, visit_stats_entry(visit))
+        return visit
 
     async def delete_visit(self, visit_id: UUID) -> None:
         """Delete visit. Authorization handled by middleware."""
         visit = await self.visit_repository.get_by_id(visit_id)
         if not visit:
             raise NotFoundException(f"Visit with id {visit_id} not found")
+        if visit.queue_date is not None:
+            event_id = await self.visit_repository.next_queue_event_id(visit.clinic_id, visit.queue_date)
+            if self.publisher:
+                await self.publisher.publish_removed(
+                    visit.id, visit.clinic_id, visit.queue_date, visit.queue_number, event_id
+                )
+        doctor_day = (visit.doctor_id, visit.queue_date)
+        previous_stats = visit_stats_entry(visit)
         await self.visit_repository.delete(visit)
+        if self.availability:
+            await self.availability.refresh_booked([doctor_day])
+        if self.stats:
+            await self.stats.record(previous_stats, None)
 
     async def list_visits(
         self,
@@ -89,8 +173,8 @@ class VisitUseCase:
         status: Optional[VisitStatusEnum] = None,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None
-    ) -> tuple[list[Visit], int]:
-        """List visits filtered by role for ownership."""
+    ) -> tuple[list, int]:
+        """List visits filtered by role for ownership, as rows with patient, doctor and clinic names."""
         filter_patient_id = None
         filter_doctor_id = None
 
@@ -100,7 +184,7 @@ class VisitUseCase:
             filter_patient_id = user_id
         # Admin/Staff see all
 
-        return await self.visit_repository.list_visits(
+        return await self.visit_repository.list_visit_rows(
             page=page,
             limit=limit,
             patient_id=filter_patient_id,
@@ -110,3 +194,65 @@ class VisitUseCase:
             date_from=date_from,
             date_to=date_to
         )
+
+    async def doctor_worklist(self, doctor_id: UUID, day: date) -> list[WorklistItemDTO]:
+        """
+        A doctor's visits for the day with patient, record, prescription, lab and invoice state.
+        Two queries whatever the number of visits: the visits with their one-to-one rows, then
+        the open lab orders of all of them.
+        """
+        rows = await self.visit_repository.list_worklist(doctor_id, day)
+        lab_orders: dict[UUID, list[WorklistLabOrderDTO]] = {}
+        for order in await self.visit_repository.list_open_lab_orders([row.id for row in rows]):
+            lab_orders.setdefault(order.visit_id, []).append(
+                WorklistLabOrderDTO(id=order.id, test_name=order.test_name, order_status=order.order_status)
+            )
+
+        worklist = []
+        for row in rows:
+            if row.medical_record_id is None:
+                record_status = "not_started"
+            elif row.outcome is None:
+                record_status = "in_progress"
+            else:
+                record_status = "completed"
+            born = row.date_of_birth
+            worklist.append(WorklistItemDTO(
+                visit_id=row.id,
+                clinic_id=row.clinic_id,
+                queue_number=row.queue_number,
+                visit_datetime=row.visit_datetime,
+                visit_type=row.visit_type,
+                visit_status=row.visit_status,
+                chief_complaint=row.chief_complaint,
+                patient=WorklistPatientDTO(
+                    id=row.patient_id,
+                    full_name=row.full_name,
+                    age=day.year - born.year - ((day.month, day.day) < (born.month, born.day)),
+                    gender=row.gender,
+                ),
+                medical_record_id=row.medical_record_id,
+                record_status=record_status,
+                prescription_status=row.prescription_status,
+                pending_lab_orders=lab_orders.get(row.id, []),
+                invoice_status=row.payment_status,
+            ))
+        return worklist
+
+    async def queue_board(self, clinic_id: UUID, queue_date: date) -> QueueBoardDTO:
+        """A clinic's queue board for a day, from memory after the first request."""
+        board = await self.load_queue_board(clinic_id, queue_date)
+        return board.snapshot()
+
+    async def load_queue_board(self, clinic_id: UUID, queue_date: date) -> QueueBoard:
+        # Screens show today's queue; farther days would only fill the board cache
+        window = settings.QUEUE_BOARD_DATE_WINDOW_DAYS
+        if abs((queue_date - hospital_today()).days) > window:
+            raise BusinessLogicException(f"queue_date must be within {window} day(s) of today")
+
+        async def loader():
+            # Event id first: rows read afterwards reflect at least that event
+            event_id = await self.visit_repository.get_queue_event_id(clinic_id, queue_date)
+            return event_id, await self.visit_repository.list_queue(clinic_id, queue_date)
+
+        return await self.queue_boards.get_or_load((clinic_id, queue_date), loader)
@@ -3,16 +3,29 @@ import uuid
 from datetime import datetime
 
 from backend.infrastructure.database.connection import Base
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    PrimaryKeyConstraint,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import declared_attr, relationship
 
 
 class WearableDevice(Base):
     __tablename__ = "wearable_devices"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    patient_id = Column(PG_UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
+    patient_id = Column(PG_UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False, index=True)
     device_identifier = Column(String(100), unique=True, nullable=False)
     device_name = Column(String(100), nullable=True)
     device_type = Column(String(50), nullable=True)
@@ -23,15 +36,21 @@ class WearableDevice(Base):
 
     # Relationships
     # patient = relationship("Patient", backref="wearable_devices")
-    measurements = relationship("WearableMeasurement", back_populates="device", cascade="all, delete-orphan", lazy="selectin")
+    # Never eager-load: a device can hold millions of readings spread over monthly partitions.
+    # Deletes rely on ON DELETE CASCADE in the database.
+    measurements = relationship("WearableMeasurement", back_populates="device", lazy="write_only", passive_deletes=True)
 
 
 class WearableMeasurement(Base):
+    """
+    Range-partitioned by month on recorded_at (see WearablePartitionRepository).
+    The partition key must be part of the primary key, hence (id, recorded_at).
+    """
     __tablename__ = "wearable_measurements"
 
     id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     device_id = Column(PG_UUID(as_uuid=True), ForeignKey("wearable_devices.id", ondelete="CASCADE"), nullable=False)
-    recorded_at = Column(DateTime(timezone=True), nullable=False)
+    recorded_at = Column(DateTime(timezone=True), primary_key=True)
     heart_rate = Column(Integer, nullable=True)
     systolic_bp = Column(Integer, nullable=True)
     diastolic_bp = Column(Integer, nullable=True)
@@ -43,3 +62,131 @@ class WearableMeasurement(Base):
 
     # Relationships
     device = relationship("WearableDevice", back_populates="measurements")
+
+    __table_args__ = (
+        Index("ix_wearable_measurements_device_recorded_at", "device_id", "recorded_at"),
+        Index("ix_wearable_measurements_device_created_at", "device_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
+    )
+
+
+class WearableRollupMixin:
+    """
+    Partial aggregates of wearable_measurements per device and time bucket.
+    Sums and counts are stored instead of averages so buckets can be merged
+    (hourly -> daily, rollup + not-yet-rolled raw rows) without losing precision.
+    """
+
+    @declared_attr
+    def device_id(cls):
+        return Column(PG_UUID(as_uuid=True), ForeignKey("wearable_devices.id", ondelete="CASCADE"), nullable=False)
+
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    sample_count = Column(Integer, nullable=False, default=0)
+
+    heart_rate_sum = Column(BigInteger, nullable=True)
+    heart_rate_count = Column(Integer, nullable=False, default=0)
+    heart_rate_min = Column(Integer, nullable=True)
+    heart_rate_max = Column(Integer, nullable=True)
+
+    systolic_bp_sum = Column(BigInteger, nullable=True)
+    systolic_bp_count = Column(Integer, nullable=False, default=0)
+    systolic_bp_min = Column(Integer, nullable=True)
+    systolic_bp_max = Column(Integer, nullable=True)
+
+    diastolic_bp_sum = Column(BigInteger, nullable=True)
+    diastolic_bp_count = Column(Integer, nullable=False, default=0)
+    diastolic_bp_min = Column(Integer, nullable=True)
+    diastolic_bp_max = Column(Integer, nullable=True)
+
+    body_temperature_sum = Column(Numeric(14, 1), nullable=True)
+    body_temperature_count = Column(Integer, nullable=False, default=0)
+    body_temperature_min = Column(Numeric(4, 1), nullable=True)
+    body_temperature_max = Column(Numeric(4, 1), nullable=True)
+
+    spo2_sum = Column(BigInteger, nullable=True)
+    spo2_count = Column(Integer, nullable=False, default=0)
+    spo2_min = Column(Integer, nullable=True)
+    spo2_max = Column(Integer, nullable=True)
+
+    steps_sum = Column(BigInteger, nullable=True)
+    steps_count = Column(Integer, nullable=False, default=0)
+
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (PrimaryKeyConstraint("device_id", "bucket_start"),)
+
+
+class WearableRollupHourly(WearableRollupMixin, Base):
+    __tablename__ = "wearable_rollups_hourly"
+
+
+class WearableRollupDaily(WearableRollupMixin, Base):
+    __tablename__ = "wearable_rollups_daily"
+
+
+class WearableRollupWatermark(Base):
+    """Per-device high-water mark on wearable_measurements.created_at already folded into rollups."""
+    __tablename__ = "wearable_rollup_watermarks"
+
+    device_id = Column(PG_UUID(as_uuid=True), ForeignKey("wearable_devices.id", ondelete="CASCADE"), primary_key=True)
+    last_created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class WearableAlertThreshold(Base):
+    """Per-patient override of the default alert range for one metric. A NULL bound keeps the default."""
+    __tablename__ = "wearable_alert_thresholds"
+
+    patient_id = Column(PG_UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), primary_key=True)
+    metric = Column(String(30), primary_key=True)  # WearableMetricEnum
+    min_value = Column(Float, nullable=True)
+    max_value = Column(Float, nullable=True)
+    set_by = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="SET NULL"), nullable=True)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class WearableAlert(Base):
+    __tablename__ = "wearable_alerts"
+
+    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    device_id = Column(PG_UUID(as_uuid=True), ForeignKey("wearable_devices.id", ondelete="CASCADE"), nullable=False)
+    patient_id = Column(PG_UUID(as_uuid=True), ForeignKey("patients.id", ondelete="CASCADE"), nullable=False)
+    recorded_at = Column(DateTime(timezone=True), nullable=False)
+    metric = Column(String(30), nullable=False)  # WearableMetricEnum
+    rule = Column(String(30), nullable=False)  # WearableAlertRuleEnum
+    value = Column(Float, nullable=False)
+    limit_value = Column(Float, nullable=False)  # Bound crossed, z-score, or change vs the previous reading
+    message = Column(String(255), nullable=False)
+    acknowledged_at = Column(DateTime(timezone=True), nullable=True)
+    acknowledged_by = Column(PG_UUID(as_uuid=True), ForeignKey("doctors.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        # Re-evaluating a reading never duplicates its alerts
+        UniqueConstraint("device_id", "recorded_at", "metric", "rule", name="uq_wearable_alerts_reading_rule"),
+        Index("ix_wearable_alerts_patient_recorded_at", "patient_id", "recorded_at"),
+    )
+
+
+class WearableAlertWatermark(Base):
+    """Per-device high-water mark on wearable_measurements.created_at already evaluated for alerts."""
+    __tablename__ = "wearable_alert_watermarks"
+
+    device_id = Column(PG_UUID(as_uuid=True), ForeignKey("wearable_devices.id", ondelete="CASCADE"), primary_key=True)
+    last_created_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class WearableDeviceKey(Base):
+    """
+    API key a device (or its gateway) uses to sign ingestion requests. Only the public key id
+    is stored: the signing secret is derived from it with the server secret (see hmac_utils).
+    """
+    __tablename__ = "wearable_device_keys"
+
+    key_id = Column(String(40), primary_key=True)
+    device_id = Column(PG_UUID(as_uuid=True), ForeignKey("wearable_devices.id", ondelete="CASCADE"), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=True)  # Set on rotation: old key kept for a grace period
+    revoked_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
@@ -1,12 +1,24 @@
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict
+from backend.infrastructure.config.settings import settings
+from backend.module.common.enums import (
+    WearableAlertRuleEnum,
+    WearableBucketEnum,
+    WearableMetricEnum,
+    WearableResolutionEnum,
+)
+from pydantic import BaseModel, ConfigDict, Field
 
 # --- Measurement DTOs ---
 
+# What the measurement columns store: INTEGER metrics, body_temperature NUMERIC(4, 1)
+INT32_MAX = 2 ** 31 - 1
+TEMPERATURE_MAX = 999.9
+
+
 class WearableMeasurementBase(BaseModel):
     recorded_at: datetime
     heart_rate: Optional[int] = None
@@ -18,7 +30,23 @@ class WearableMeasurementBase(BaseModel):
 
 
 class WearableMeasurementCreateDTO(WearableMeasurementBase):
-    pass
+    heart_rate: Optional[int] = Field(None, ge=-INT32_MAX, le=INT32_MAX)
+    systolic_bp: Optional[int] = Field(None, ge=-INT32_MAX, le=INT32_MAX)
+    diastolic_bp: Optional[int] = Field(None, ge=-INT32_MAX, le=INT32_MAX)
+    body_temperature: Optional[float] = Field(None, ge=-TEMPERATURE_MAX, le=TEMPERATURE_MAX, allow_inf_nan=False)
+    steps: Optional[int] = Field(None, ge=-INT32_MAX, le=INT32_MAX)
+    spo2: Optional[int] = Field(None, ge=-INT32_MAX, le=INT32_MAX)
+
+
+class WearableMeasurementBatchCreateDTO(BaseModel):
+    readings: List[WearableMeasurementCreateDTO] = Field(
+        ..., min_length=1, max_length=settings.WEARABLE_INGEST_MAX_BATCH
+    )
+
+
+class WearableIngestResultDTO(BaseModel):
+    device_id: UUID
+    accepted: int
 
 
 class WearableMeasurementDTO(WearableMeasurementBase):
@@ -29,6 +57,41 @@ class WearableMeasurementDTO(WearableMeasurementBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class WearableVitalDTO(BaseModel):
+    metric: WearableMetricEnum
+    value: float
+    recorded_at: datetime
+
+
+class WearableLatestVitalsDTO(BaseModel):
+    device_id: UUID
+    patient_id: UUID
+    vitals: List[WearableVitalDTO] = []
+    readings: List[WearableMeasurementDTO] = []
+
+
+class WearableTimelineDTO(BaseModel):
+    patient_id: UUID
+    readings: List[WearableMeasurementDTO] = []
+    next_cursor: Optional[str] = None  # Pass back as `cursor` for the next (older) page
+
+
+class WearableIngestMetricsDTO(BaseModel):
+    write_behind_enabled: bool
+    pending_segments: int = 0
+    pending_bytes: int = 0
+    max_pending_bytes: int = 0
+    lag_seconds: float = 0.0
+    appended: int = 0
+    rejected: int = 0
+    flushed_records: int = 0
+    flushed_segments: int = 0
+    flush_errors: int = 0
+    last_flush_records: int = 0
+    last_flush_seconds: float = 0.0
+    flush_records_per_second: int = 0
+
+
 # --- Device DTOs ---
 
 class WearableDeviceBase(BaseModel):
@@ -57,3 +120,85 @@ class WearableDeviceDTO(WearableDeviceBase):
     # measurements: List[WearableMeasurementDTO] = []
 
     model_config = ConfigDict(from_attributes=True)
+
+
+# --- Device key DTOs ---
+
+class WearableDeviceKeyDTO(BaseModel):
+    key_id: str
+    device_id: UUID
+    created_at: datetime
+    expires_at: Optional[datetime] = None
+    revoked_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WearableDeviceKeyCreatedDTO(WearableDeviceKeyDTO):
+    # Returned once, at creation; only derivable server-side afterwards
+    secret: str
+
+
+# --- Aggregation DTOs ---
+
+class WearableAggregateBucketDTO(BaseModel):
+    bucket_start: datetime
+    sample_count: int
+    heart_rate_avg: Optional[float] = None
+    heart_rate_min: Optional[int] = None
+    heart_rate_max: Optional[int] = None
+    systolic_bp_avg: Optional[float] = None
+    systolic_bp_min: Optional[int] = None
+    systolic_bp_max: Optional[int] = None
+    diastolic_bp_avg: Optional[float] = None
+    diastolic_bp_min: Optional[int] = None
+    diastolic_bp_max: Optional[int] = None
+    body_temperature_avg: Optional[float] = None
+    body_temperature_min: Optional[float] = None
+    body_temperature_max: Optional[float] = None
+    spo2_avg: Optional[float] = None
+    spo2_min: Optional[int] = None
+    spo2_max: Optional[int] = None
+    steps_total: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WearableAggregateDTO(BaseModel):
+    device_id: UUID
+    bucket: WearableBucketEnum
+    resolution: WearableResolutionEnum
+    date_from: datetime
+    date_to: datetime
+    buckets: List[WearableAggregateBucketDTO] = []
+
+
+# --- Alert DTOs ---
+
+class WearableAlertDTO(BaseModel):
+    id: UUID
+    device_id: UUID
+    patient_id: UUID
+    recorded_at: datetime
+    metric: WearableMetricEnum
+    rule: WearableAlertRuleEnum
+    value: float
+    limit_value: float
+    message: str
+    acknowledged_at: Optional[datetime] = None
+    acknowledged_by: Optional[UUID] = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WearableAlertThresholdUpdateDTO(BaseModel):
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+
+
+class WearableAlertThresholdDTO(BaseModel):
+    metric: WearableMetricEnum
+    min_value: Optional[float] = None
+    max_value: Optional[float] = None
+    is_override: bool = False
@@ -0,0 +1,183 @@
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID
+
+from backend.module.common.enums import WearableMetricEnum
+from backend.module.profile.entity.models import Patient
+from backend.module.wearable.entity.wearable import (
+    WearableAlert,
+    WearableAlertThreshold,
+    WearableAlertWatermark,
+    WearableDevice,
+    WearableMeasurement,
+)
+from backend.module.wearable.repositories.wearable_rollup_repository import interval_expr
+from sqlalchemy import Float, and_, cast, delete, desc, exists, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+INSERT_CHUNK = 1000
+
+
+class WearableAlertRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    # --- Evaluation ---
+
+    async def list_pending_devices(self, until: datetime, limit: int = 500) -> List[Tuple[UUID, UUID]]:
+        """(device_id, patient_id) of devices with readings created after their alert watermark."""
+        m = WearableMeasurement
+        w = WearableAlertWatermark
+        since = func.coalesce(w.last_created_at, literal_column("'-infinity'::timestamptz"))
+        stmt = (
+            select(WearableDevice.id, WearableDevice.patient_id)
+            .outerjoin(w, w.device_id == WearableDevice.id)
+            .where(
+                exists().where(
+                    m.device_id == WearableDevice.id,
+                    m.created_at > since,
+                    m.created_at <= until,
+                )
+            )
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def load_window(self, device_ids: Sequence[UUID], until: datetime, lookback_seconds: int) -> list:
+        """
+        New readings of each device plus `lookback_seconds` of older context, ordered by
+        (device_id, recorded_at). Rows: device_id, recorded_at, epoch, is_new, *WearableMetricEnum.
+        """
+        m = WearableMeasurement
+        w = WearableAlertWatermark
+        since = func.coalesce(w.last_created_at, literal_column("'-infinity'::timestamptz"))
+        first_new = (
+            select(
+                m.device_id,
+                func.min(m.recorded_at).label("first_new"),
+                since.label("since"),
+            )
+            .outerjoin(w, w.device_id == m.device_id)
+            .where(m.device_id.in_(device_ids), m.created_at > since, m.created_at <= until)
+            .group_by(m.device_id, w.last_created_at)
+            .cte("first_new")
+        )
+        metrics = [getattr(m, metric.value) for metric in WearableMetricEnum]
+        stmt = (
+            select(
+                m.device_id,
+                m.recorded_at,
+                cast(func.extract("epoch", m.recorded_at), Float),
+                (m.created_at > first_new.c.since).label("is_new"),
+                *metrics,
+            )
+            .join(
+                first_new,
+                and_(
+                    m.device_id == first_new.c.device_id,
+                    m.recorded_at >= first_new.c.first_new - interval_expr(lookback_seconds),
+                ),
+            )
+            .where(m.created_at <= until)
+            .order_by(m.device_id, m.recorded_at)
+        )
+        return (await self.session.execute(stmt)).all()
+
+    async def insert_alerts(self, alerts: List[dict]) -> int:
+        """Insert alert rows, skipping ones already raised for the same reading and rule."""
+        inserted = 0
+        for i in range(0, len(alerts), INSERT_CHUNK):
+            stmt = (
+                insert(WearableAlert)
+                .values(alerts[i:i + INSERT_CHUNK])
+                .on_conflict_do_nothing(constraint="uq_wearable_alerts_reading_rule")
+            )
+            result = await self.session.execute(stmt)
+            inserted += result.rowcount or 0
+        return inserted
+
+    async def advance_watermarks(self, device_ids: Sequence[UUID], until: datetime) -> None:
+        stmt = insert(WearableAlertWatermark).values([
+            {"device_id": device_id, "last_created_at": until, "updated_at": func.now()}
+            for device_id in device_ids
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WearableAlertWatermark.device_id],
+            set_={"last_created_at": stmt.excluded.last_created_at, "updated_at": func.now()},
+        )
+        await self.session.execute(stmt)
+
+    # --- Thresholds ---
+
+    async def list_thresholds(self, patient_ids: Sequence[UUID]) -> List[WearableAlertThreshold]:
+        stmt = select(WearableAlertThreshold).where(WearableAlertThreshold.patient_id.in_(patient_ids))
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def get_threshold(self, patient_id: UUID, metric: str) -> Optional[WearableAlertThreshold]:
+        stmt = select(WearableAlertThreshold).where(
+            WearableAlertThreshold.patient_id == patient_id,
+            WearableAlertThreshold.metric == metric,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def save_threshold(self, threshold: WearableAlertThreshold) -> WearableAlertThreshold:
+        self.session.add(threshold)
+        await self.session.flush()
+        await self.session.refresh(threshold)
+        return threshold
+
+    async def delete_threshold(self, patient_id: UUID, metric: str) -> int:
+        stmt = delete(WearableAlertThreshold).where(
+            WearableAlertThreshold.patient_id == patient_id,
+            WearableAlertThreshold.metric == metric,
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def patient_exists(self, patient_id: UUID) -> bool:
+        stmt = select(exists().where(Patient.id == patient_id))
+        return bool((await self.session.execute(stmt)).scalar())
+
+    # --- Alerts ---
+
+    async def list_alerts(
+        self,
+        page: int = 1,
+        limit: int = 10,
+        patient_id: Optional[UUID] = None,
+        device_id: Optional[UUID] = None,
+        unacknowledged_only: bool = False
+    ) -> Tuple[List[WearableAlert], int]:
+        stmt = select(WearableAlert)
+
+        if patient_id:
+            stmt = stmt.where(WearableAlert.patient_id == patient_id)
+
+        if device_id:
+            stmt = stmt.where(WearableAlert.device_id == device_id)
+
+        if unacknowledged_only:
+            stmt = stmt.where(WearableAlert.acknowledged_at.is_(None))
+
+        stmt = stmt.order_by(desc(WearableAlert.recorded_at))
+
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        total = (await self.session.execute(count_stmt)).scalar() or 0
+
+        stmt = stmt.offset((page - 1) * limit).limit(limit)
+        result = await self.session.execute(stmt)
+        return result.scalars().all(), total
+
+    async def get_alert_by_id(self, alert_id: UUID) -> Optional[WearableAlert]:
+        stmt = select(WearableAlert).where(WearableAlert.id == alert_id)
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def update_alert(self, alert: WearableAlert) -> WearableAlert:
+        await self.session.flush()
+        await self.session.refresh(alert)
+        return alert
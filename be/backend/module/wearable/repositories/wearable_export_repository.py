@@ -0,0 +1,59 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+from uuid import UUID
+
+from backend.module.wearable.entity.wearable import WearableDevice, WearableMeasurement
+from sqlalchemy import BigInteger, Float, String, cast, extract, select
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+
+# Column name -> SQL expression, in export order. Values come back as str/int/float so they
+# convert straight into Arrow arrays (no UUID, datetime or Decimal objects per row).
+_m = WearableMeasurement
+EXPORT_COLUMNS = {
+    "id": cast(_m.id, String),
+    "device_id": cast(_m.device_id, String),
+    "recorded_at": cast(extract("epoch", _m.recorded_at) * 1_000_000, BigInteger),  # epoch µs
+    "heart_rate": _m.heart_rate,
+    "systolic_bp": _m.systolic_bp,
+    "diastolic_bp": _m.diastolic_bp,
+    "body_temperature": cast(_m.body_temperature, Float),
+    "steps": _m.steps,
+    "spo2": _m.spo2,
+}
+
+
+class WearableExportRepository:
+    """Read side of the research export: bulk, cursor-based scans of wearable_measurements."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_patient_devices(self, patient_ids: Optional[Sequence[UUID]] = None) -> Dict[UUID, List[UUID]]:
+        """patient id -> device ids, for all patients with devices (or the given ones)."""
+        stmt = select(WearableDevice.patient_id, WearableDevice.id).order_by(WearableDevice.patient_id)
+        if patient_ids:
+            stmt = stmt.where(WearableDevice.patient_id.in_(patient_ids))
+        devices = defaultdict(list)
+        for patient_id, device_id in (await self.session.execute(stmt)).all():
+            devices[patient_id].append(device_id)
+        return dict(devices)
+
+    async def stream_rows(
+        self, device_ids: Sequence[UUID], date_from: datetime, date_to: datetime, batch_size: int
+    ) -> AsyncResult:
+        """
+        Server-side cursor over the devices' readings with date_from <= recorded_at < date_to,
+        in EXPORT_COLUMNS order; iterate `.partitions()` for batches of `batch_size` rows.
+        """
+        stmt = (
+            select(*EXPORT_COLUMNS.values())
+            .where(
+                _m.device_id.in_(device_ids),
+                _m.recorded_at >= date_from,
+                _m.recorded_at < date_to,
+            )
+            .order_by(_m.device_id, _m.recorded_at)
+            .execution_options(yield_per=batch_size)
+        )
+        return await self.session.stream(stmt)
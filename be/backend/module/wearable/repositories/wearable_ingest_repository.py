@@ -0,0 +1,45 @@
+from typing import Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+STAGING_TABLE = "wearable_ingest_staging"
+
+COPY_COLUMNS = (
+    "id", "device_id", "recorded_at", "heart_rate", "systolic_bp", "diastolic_bp",
+    "body_temperature", "steps", "spo2",
+)
+
+
+class WearableIngestRepository:
+    """Bulk loading of write-behind readings into wearable_measurements."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def copy_measurements(self, records: Sequence[tuple]) -> int:
+        """
+        COPY records (in COPY_COLUMNS order) into a session-local staging table, then move them
+        into wearable_measurements. Idempotent: readings already stored (a segment replayed after
+        a crash) and readings of devices deleted meanwhile are skipped. created_at is the time
+        the rows become visible, which is what the rollup and alert watermarks rely on.
+        Returns the number of rows inserted.
+        """
+        columns = ", ".join(COPY_COLUMNS)
+        # Same column types, no constraints; lives as long as the pooled connection
+        await self.session.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} ON COMMIT DELETE ROWS "
+            f"AS SELECT {columns} FROM wearable_measurements WITH NO DATA"
+        ))
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(STAGING_TABLE, records=records, columns=COPY_COLUMNS)
+
+        result = await self.session.execute(text(f"""
+            INSERT INTO wearable_measurements ({columns}, created_at)
+            SELECT {", ".join(f"s.{c}" for c in COPY_COLUMNS)}, now()
+            FROM {STAGING_TABLE} s
+            JOIN wearable_devices d ON d.id = s.device_id
+            ON CONFLICT DO NOTHING
+        """))
+        return result.rowcount
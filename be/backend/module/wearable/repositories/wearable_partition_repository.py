@@ -0,0 +1,137 @@
+import re
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+PARENT_TABLE = "wearable_measurements"
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+_PARTITION_NAME = re.compile(rf"^{PARENT_TABLE}_(\d{{4}})_(\d{{2}})$")
+
+COLUMNS = (
+    "id, device_id, recorded_at, heart_rate, systolic_bp, diastolic_bp, "
+    "body_temperature, steps, spo2, created_at"
+)
+
+
+def month_start(value: datetime) -> datetime:
+    """First instant of the (UTC) month containing `value`."""
+    value = value.astimezone(timezone.utc) if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARENT_TABLE}_{month.year:04d}_{month.month:02d}"
+
+
+def quote_ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+class WearablePartitionRepository:
+    """
+    DDL helpers for the monthly partitions of wearable_measurements.
+
+    Partitions are named wearable_measurements_YYYY_MM and cover [month, next month) in UTC.
+    A default partition catches readings outside every monthly range (e.g. bad device clocks).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_partitions(self) -> List[Tuple[str, datetime]]:
+        """Monthly partitions currently attached, oldest first."""
+        result = await self.session.execute(
+            text("""
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = CAST(:parent AS regclass)
+            """),
+            {"parent": PARENT_TABLE},
+        )
+        partitions = []
+        for (name,) in result.all():
+            match = _PARTITION_NAME.match(name)
+            if match:
+                partitions.append((name, datetime(int(match[1]), int(match[2]), 1, tzinfo=timezone.utc)))
+        return sorted(partitions, key=lambda p: p[1])
+
+    async def ensure_partition(self, month: datetime) -> bool:
+        """Create the partition for `month` if missing. Returns True when it was created."""
+        name = partition_name(month)
+        exists = await self.session.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+        if exists.scalar():
+            return False
+
+        lower, upper = month, add_months(month, 1)
+        bounds = {"lower": lower, "upper": upper}
+        # Postgres refuses to create a partition while the default partition holds rows in its range,
+        # so park those rows, create the partition, then route them back through the parent.
+        stray = await self.session.execute(
+            text(f"""
+                SELECT EXISTS (
+                    SELECT 1 FROM {DEFAULT_PARTITION}
+                    WHERE recorded_at >= :lower AND recorded_at < :upper
+                )
+            """),
+            bounds,
+        )
+        has_stray = stray.scalar()
+        if has_stray:
+            await self.session.execute(
+                text(f"""
+                    CREATE TEMP TABLE wearable_partition_stray ON COMMIT DROP AS
+                    WITH moved AS (
+                        DELETE FROM {DEFAULT_PARTITION}
+                        WHERE recorded_at >= :lower AND recorded_at < :upper
+                        RETURNING {COLUMNS}
+                    )
+                    SELECT * FROM moved
+                """),
+                bounds,
+            )
+
+        await self.session.execute(
+            text(
+                f"CREATE TABLE {quote_ident(name)} PARTITION OF {PARENT_TABLE} "
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        )
+
+        if has_stray:
+            await self.session.execute(
+                text(f"INSERT INTO {PARENT_TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM wearable_partition_stray")
+            )
+            await self.session.execute(text("DROP TABLE wearable_partition_stray"))
+        return True
+
+    async def is_rolled_up(self, name: str) -> bool:
+        """True when every reading in the partition is at or below its device's rollup watermark."""
+        result = await self.session.execute(
+            text(f"""
+                SELECT NOT EXISTS (
+                    SELECT 1
+                    FROM {quote_ident(name)} m
+                    LEFT JOIN wearable_rollup_watermarks w ON w.device_id = m.device_id
+                    WHERE w.last_created_at IS NULL OR m.created_at > w.last_created_at
+                )
+            """)
+        )
+        return bool(result.scalar())
+
+    async def detach_partition(self, name: str) -> None:
+        await self.session.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {quote_ident(name)}"))
+
+    async def drop_table(self, name: str) -> None:
+        await self.session.execute(text(f"DROP TABLE {quote_ident(name)}"))
+
+    async def move_to_schema(self, name: str, schema: str) -> None:
+        await self.session.execute(text(f"CREATE SCHEMA IF NOT EXISTS {quote_ident(schema)}"))
+        await self.session.execute(text(f"ALTER TABLE {quote_ident(name)} SET SCHEMA {quote_ident(schema)}"))
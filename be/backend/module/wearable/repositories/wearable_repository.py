@@ -1,11 +1,28 @@
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from uuid import UUID
 
-from backend.module.wearable.entity.wearable import WearableDevice, WearableMeasurement
-from sqlalchemy import desc, func, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from backend.module.common.enums import WearableResolutionEnum
+from backend.module.wearable.entity.wearable import (
+    WearableDevice,
+    WearableDeviceKey,
+    WearableMeasurement,
+    WearableRollupDaily,
+    WearableRollupHourly,
+    WearableRollupWatermark,
+)
+from backend.module.wearable.repositories.wearable_rollup_repository import (
+    ROLLUP_METRICS,
+    bucket_start_expr,
+    raw_partial_columns,
+    rollup_partial_columns,
+)
+from sqlalchemy import Float, cast, desc, func, literal_column, or_, select, tuple_, union_all, update
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+
+# Rows per round trip of a timeline cursor
+TIMELINE_FETCH_SIZE = 200
 
 
 class WearableRepository:
@@ -59,6 +76,61 @@ class WearableRepository:
         await self.session.delete(device)
         await self.session.flush()
 
+    # --- Device keys ---
+
+    async def get_device_key_grant(self, key_id: str) -> Optional[Tuple[WearableDeviceKey, UUID, bool]]:
+        """Key with its device's patient id and active flag, in one query."""
+        stmt = (
+            select(WearableDeviceKey, WearableDevice.patient_id, WearableDevice.is_active)
+            .join(WearableDevice, WearableDevice.id == WearableDeviceKey.device_id)
+            .where(WearableDeviceKey.key_id == key_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.first()
+
+    async def get_device_key(self, device_id: UUID, key_id: str) -> Optional[WearableDeviceKey]:
+        stmt = select(WearableDeviceKey).where(
+            WearableDeviceKey.device_id == device_id,
+            WearableDeviceKey.key_id == key_id,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
+    async def list_device_keys(self, device_id: UUID) -> List[WearableDeviceKey]:
+        stmt = (
+            select(WearableDeviceKey)
+            .where(WearableDeviceKey.device_id == device_id)
+            .order_by(desc(WearableDeviceKey.created_at))
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def create_device_key(self, key: WearableDeviceKey) -> WearableDeviceKey:
+        self.session.add(key)
+        await self.session.flush()
+        await self.session.refresh(key)
+        return key
+
+    async def expire_device_keys(self, device_id: UUID, expires_at: datetime) -> List[str]:
+        """Cap the validity of the device's live keys at `expires_at`. Returns affected key ids."""
+        stmt = (
+            update(WearableDeviceKey)
+            .where(
+                WearableDeviceKey.device_id == device_id,
+                WearableDeviceKey.revoked_at.is_(None),
+                or_(WearableDeviceKey.expires_at.is_(None), WearableDeviceKey.expires_at > expires_at),
+            )
+            .values(expires_at=expires_at)
+            .returning(WearableDeviceKey.key_id)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().all()
+
+    async def update_device_key(self, key: WearableDeviceKey) -> WearableDeviceKey:
+        await self.session.flush()
+        await self.session.refresh(key)
+        return key
+
     # --- Measurement ---
 
     async def create_measurement(self, measurement: WearableMeasurement) -> WearableMeasurement:
@@ -67,14 +139,9 @@ class WearableRepository:
         await self.session.refresh(measurement)
         return measurement
 
-    async def list_measurements(
-        self,
-        device_id: UUID,
-        page: int = 1,
-        limit: int = 10,
-        date_from: Optional[datetime] = None,
-        date_to: Optional[datetime] = None
-    ) -> Tuple[List[WearableMeasurement], int]:
+    @staticmethod
+    def measurements_query(device_id: UUID, date_from: Optional[datetime] = None, date_to: Optional[datetime] = None):
+        """Newest-first readings of a device. Bounds on recorded_at let Postgres prune monthly partitions."""
         stmt = select(WearableMeasurement).where(WearableMeasurement.device_id == device_id)
 
         if date_from:
@@ -83,7 +150,17 @@ class WearableRepository:
         if date_to:
             stmt = stmt.where(WearableMeasurement.recorded_at <= date_to)
 
-        stmt = stmt.order_by(desc(WearableMeasurement.recorded_at))
+        return stmt.order_by(desc(WearableMeasurement.recorded_at))
+
+    async def list_measurements(
+        self,
+        device_id: UUID,
+        page: int = 1,
+        limit: int = 10,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None
+    ) -> Tuple[List[WearableMeasurement], int]:
+        stmt = self.measurements_query(device_id, date_from, date_to)
 
         count_stmt = select(func.count()).select_from(stmt.subquery())
         total = (await self.session.execute(count_stmt)).scalar() or 0
@@ -91,3 +168,112 @@ class WearableRepository:
         stmt = stmt.offset((page - 1) * limit).limit(limit)
         result = await self.session.execute(stmt)
         return result.scalars().all(), total
+
+    async def list_patient_device_ids(self, patient_id: UUID) -> List[UUID]:
+        result = await self.session.execute(
+            select(WearableDevice.id).where(WearableDevice.patient_id == patient_id)
+        )
+        return list(result.scalars().all())
+
+    async def stream_timeline(
+        self,
+        device_id: UUID,
+        limit: int,
+        before: Optional[Tuple[datetime, UUID]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        metrics: Sequence[str] = ()
+    ) -> AsyncScalarResult:
+        """
+        Server-side cursor over a device's readings, newest first by (recorded_at, id), starting
+        after the `before` key. Rows are fetched `yield_per` at a time; close the result when done.
+        """
+        m = WearableMeasurement
+        stmt = self.measurements_query(device_id, date_from, date_to).order_by(None)
+        if before is not None:
+            stmt = stmt.where(tuple_(m.recorded_at, m.id) < tuple_(*before))
+        if metrics:
+            # Readings carrying at least one of the requested metrics
+            stmt = stmt.where(or_(*(getattr(m, metric).isnot(None) for metric in metrics)))
+        stmt = (
+            stmt.order_by(desc(m.recorded_at), desc(m.id))
+            .limit(limit)
+            .execution_options(yield_per=min(limit, TIMELINE_FETCH_SIZE))
+        )
+        return await self.session.stream_scalars(stmt)
+
+    async def list_recent_readings(self, device_id: UUID, limit: int) -> List:
+        """Newest-first (id, recorded_at, created_at, *metrics) rows, without building ORM objects."""
+        m = WearableMeasurement
+        stmt = (
+            select(
+                m.id, m.recorded_at, m.created_at,
+                m.heart_rate, m.systolic_bp, m.diastolic_bp, m.spo2, m.body_temperature, m.steps,
+            )
+            .where(m.device_id == device_id)
+            .order_by(desc(m.recorded_at))
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def aggregate_measurements(
+        self,
+        device_id: UUID,
+        bucket_seconds: int,
+        date_from: datetime,
+        date_to: datetime,
+        resolution: WearableResolutionEnum = WearableResolutionEnum.RAW
+    ) -> List:
+        """
+        Aggregate measurements into epoch-aligned buckets over [date_from, date_to).
+
+        With a rollup resolution, rolled-up buckets are merged with raw rows created after the
+        device's rollup watermark, so results are exact even before the rollup job catches up.
+        """
+        m = WearableMeasurement
+        raw_stmt = (
+            select(bucket_start_expr(m.recorded_at, bucket_seconds).label("bucket_start"), *raw_partial_columns())
+            .where(
+                m.device_id == device_id,
+                m.recorded_at >= date_from,
+                m.recorded_at < date_to,
+            )
+        )
+
+        if resolution == WearableResolutionEnum.RAW:
+            partials = raw_stmt.group_by(literal_column("1")).subquery()
+        else:
+            rollup = WearableRollupDaily if resolution == WearableResolutionEnum.DAILY else WearableRollupHourly
+            watermark = (
+                select(WearableRollupWatermark.last_created_at)
+                .where(WearableRollupWatermark.device_id == device_id)
+                .scalar_subquery()
+            )
+            rollup_stmt = (
+                select(bucket_start_expr(rollup.bucket_start, bucket_seconds).label("bucket_start"), *rollup_partial_columns(rollup))
+                .where(
+                    rollup.device_id == device_id,
+                    rollup.bucket_start >= date_from,
+                    rollup.bucket_start < date_to,
+                )
+                .group_by(literal_column("1"))
+            )
+            tail_stmt = raw_stmt.where(
+                m.created_at > func.coalesce(watermark, literal_column("'-infinity'::timestamptz"))
+            ).group_by(literal_column("1"))
+            partials = union_all(rollup_stmt, tail_stmt).subquery()
+
+        p = partials.c
+        columns = [p.bucket_start, func.sum(p.sample_count).label("sample_count")]
+        for metric in ROLLUP_METRICS:
+            columns += [
+                (cast(func.sum(getattr(p, f"{metric}_sum")), Float) / func.nullif(func.sum(getattr(p, f"{metric}_count")), 0)).label(f"{metric}_avg"),
+                func.min(getattr(p, f"{metric}_min")).label(f"{metric}_min"),
+                func.max(getattr(p, f"{metric}_max")).label(f"{metric}_max"),
+            ]
+        columns.append(func.sum(p.steps_sum).label("steps_total"))
+
+        stmt = select(*columns).group_by(p.bucket_start).order_by(p.bucket_start)
+        result = await self.session.execute(stmt)
+        return result.all()
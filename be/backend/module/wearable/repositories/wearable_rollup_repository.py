@@ -0,0 +1,244 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from backend.module.wearable.entity.wearable import (
+    WearableDevice,
+    WearableMeasurement,
+    WearableRollupDaily,
+    WearableRollupHourly,
+    WearableRollupWatermark,
+)
+from sqlalchemy import and_, exists, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+HOUR_SECONDS = 3600
+DAY_SECONDS = 86400
+
+# Metrics stored as (sum, count, min, max) partials in the rollup tables. Steps are summed only.
+ROLLUP_METRICS = ("heart_rate", "systolic_bp", "diastolic_bp", "body_temperature", "spo2")
+
+
+def interval_expr(seconds: int):
+    """SQL interval literal. `seconds` always comes from a fixed bucket table, never user input."""
+    return literal_column(f"interval '{int(seconds)} seconds'")
+
+
+def bucket_start_expr(column, seconds: int):
+    """Epoch-aligned bucket start for a timestamptz column (independent of the session TimeZone)."""
+    return func.date_bin(
+        interval_expr(seconds),
+        column,
+        literal_column("'1970-01-01 00:00:00+00'::timestamptz"),
+    )
+
+
+def raw_partial_columns():
+    """Partial aggregate columns computed from wearable_measurements rows."""
+    m = WearableMeasurement
+    columns = [func.count().label("sample_count")]
+    for metric in ROLLUP_METRICS:
+        col = getattr(m, metric)
+        columns += [
+            func.sum(col).label(f"{metric}_sum"),
+            func.count(col).label(f"{metric}_count"),
+            func.min(col).label(f"{metric}_min"),
+            func.max(col).label(f"{metric}_max"),
+        ]
+    columns += [func.sum(m.steps).label("steps_sum"), func.count(m.steps).label("steps_count")]
+    return columns
+
+
+def rollup_partial_columns(model):
+    """Partial aggregate columns re-combined from an existing rollup table."""
+    columns = [func.sum(model.sample_count).label("sample_count")]
+    for metric in ROLLUP_METRICS:
+        columns += [
+            func.sum(getattr(model, f"{metric}_sum")).label(f"{metric}_sum"),
+            func.sum(getattr(model, f"{metric}_count")).label(f"{metric}_count"),
+            func.min(getattr(model, f"{metric}_min")).label(f"{metric}_min"),
+            func.max(getattr(model, f"{metric}_max")).label(f"{metric}_max"),
+        ]
+    columns += [func.sum(model.steps_sum).label("steps_sum"), func.sum(model.steps_count).label("steps_count")]
+    return columns
+
+
+def _new_rows_filter(device_id: UUID, since: Optional[datetime], until: datetime) -> list:
+    m = WearableMeasurement
+    conditions = [m.device_id == device_id, m.created_at <= until]
+    if since is not None:
+        conditions.append(m.created_at > since)
+    return conditions
+
+
+def _rollup_value_columns() -> List[str]:
+    names = ["sample_count"]
+    for metric in ROLLUP_METRICS:
+        names += [f"{metric}_sum", f"{metric}_count", f"{metric}_min", f"{metric}_max"]
+    names += ["steps_sum", "steps_count"]
+    return names
+
+
+class WearableRollupRepository:
+    """Maintains hourly/daily rollups of wearable_measurements incrementally."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def list_pending_devices(self, until: datetime, limit: int = 500) -> List[Tuple[UUID, Optional[datetime]]]:
+        """Devices that have readings created after their watermark and up to `until`."""
+        m = WearableMeasurement
+        w = WearableRollupWatermark
+        since = func.coalesce(w.last_created_at, literal_column("'-infinity'::timestamptz"))
+        stmt = (
+            select(WearableDevice.id, w.last_created_at)
+            .outerjoin(w, w.device_id == WearableDevice.id)
+            .where(
+                exists().where(
+                    m.device_id == WearableDevice.id,
+                    m.created_at > since,
+                    m.created_at <= until,
+                )
+            )
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_watermark(self, device_id: UUID) -> Optional[datetime]:
+        stmt = select(WearableRollupWatermark.last_created_at).where(WearableRollupWatermark.device_id == device_id)
+        return (await self.session.execute(stmt)).scalar()
+
+    async def rollup_device(
+        self,
+        device_id: UUID,
+        since: Optional[datetime],
+        until: datetime,
+        raw_floor: Optional[datetime] = None,
+    ) -> int:
+        """
+        Re-aggregate every hourly and daily bucket touched by readings created in (since, until].
+
+        Touched buckets are recomputed from all raw rows with created_at <= until (not just the new
+        ones), so late-arriving readings for old buckets are folded in correctly. Rollups therefore
+        always equal the aggregate of raw rows with created_at <= watermark.
+
+        Hourly buckets before `raw_floor` may belong to retired partitions, so new readings there are
+        merged into the existing partials instead of recomputing the bucket.
+        Returns the number of hourly buckets rewritten.
+        """
+        hourly = await self._rollup_buckets(WearableRollupHourly, HOUR_SECONDS, device_id, since, until, raw_floor)
+        if raw_floor is not None:
+            hourly += await self._merge_hourly(device_id, since, until, raw_floor)
+        await self._rollup_buckets(WearableRollupDaily, DAY_SECONDS, device_id, since, until)
+
+        stmt = insert(WearableRollupWatermark).values(
+            device_id=device_id,
+            last_created_at=until,
+            updated_at=func.now(),
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[WearableRollupWatermark.device_id],
+            set_={"last_created_at": stmt.excluded.last_created_at, "updated_at": func.now()},
+        )
+        await self.session.execute(stmt)
+        return hourly
+
+    async def _rollup_buckets(
+        self,
+        model,
+        seconds: int,
+        device_id: UUID,
+        since: Optional[datetime],
+        until: datetime,
+        raw_floor: Optional[datetime] = None,
+    ) -> int:
+        m = WearableMeasurement
+        new_rows = _new_rows_filter(device_id, since, until)
+        if raw_floor is not None:
+            new_rows.append(m.recorded_at >= raw_floor)
+
+        touched = (
+            select(bucket_start_expr(m.recorded_at, seconds).label("bucket_start"))
+            .where(*new_rows)
+            .distinct()
+            .cte(f"touched_{model.__tablename__}")
+        )
+
+        if model is WearableRollupDaily:
+            # Days are rebuilt from the (already refreshed) hourly rollups instead of raw rows.
+            h = WearableRollupHourly
+            source = (
+                select(
+                    h.device_id,
+                    touched.c.bucket_start,
+                    *rollup_partial_columns(h),
+                )
+                .select_from(touched)
+                .join(
+                    h,
+                    and_(
+                        h.device_id == device_id,
+                        h.bucket_start >= touched.c.bucket_start,
+                        h.bucket_start < touched.c.bucket_start + interval_expr(seconds),
+                    ),
+                )
+                .group_by(h.device_id, touched.c.bucket_start)
+            )
+        else:
+            source = (
+                select(
+                    m.device_id,
+                    touched.c.bucket_start,
+                    *raw_partial_columns(),
+                )
+                .select_from(touched)
+                .join(
+                    m,
+                    and_(
+                        m.device_id == device_id,
+                        m.recorded_at >= touched.c.bucket_start,
+                        m.recorded_at < touched.c.bucket_start + interval_expr(seconds),
+                    ),
+                )
+                .where(m.created_at <= until)
+                .group_by(m.device_id, touched.c.bucket_start)
+            )
+
+        value_columns = _rollup_value_columns()
+        stmt = insert(model).from_select(["device_id", "bucket_start", *value_columns], source)
+        update_set = {name: getattr(stmt.excluded, name) for name in value_columns}
+        update_set["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[model.device_id, model.bucket_start],
+            set_=update_set,
+        )
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
+
+    async def _merge_hourly(self, device_id: UUID, since: Optional[datetime], until: datetime, raw_floor: datetime) -> int:
+        """Add partials of the new readings before `raw_floor` onto the existing hourly buckets."""
+        m = WearableMeasurement
+        h = WearableRollupHourly
+        bucket = bucket_start_expr(m.recorded_at, HOUR_SECONDS).label("bucket_start")
+        source = (
+            select(m.device_id, bucket, *raw_partial_columns())
+            .where(*_new_rows_filter(device_id, since, until), m.recorded_at < raw_floor)
+            .group_by(m.device_id, bucket)
+        )
+
+        stmt = insert(h).from_select(["device_id", "bucket_start", *_rollup_value_columns()], source)
+        update_set = {"sample_count": h.sample_count + stmt.excluded.sample_count}
+        for metric in ROLLUP_METRICS:
+            old_sum, new_sum = getattr(h, f"{metric}_sum"), getattr(stmt.excluded, f"{metric}_sum")
+            update_set[f"{metric}_sum"] = func.coalesce(old_sum + new_sum, old_sum, new_sum)
+            update_set[f"{metric}_count"] = getattr(h, f"{metric}_count") + getattr(stmt.excluded, f"{metric}_count")
+            update_set[f"{metric}_min"] = func.least(getattr(h, f"{metric}_min"), getattr(stmt.excluded, f"{metric}_min"))
+            update_set[f"{metric}_max"] = func.greatest(getattr(h, f"{metric}_max"), getattr(stmt.excluded, f"{metric}_max"))
+        update_set["steps_sum"] = func.coalesce(h.steps_sum + stmt.excluded.steps_sum, h.steps_sum, stmt.excluded.steps_sum)
+        update_set["steps_count"] = h.steps_count + stmt.excluded.steps_count
+        update_set["updated_at"] = func.now()
+        stmt = stmt.on_conflict_do_update(index_elements=[h.device_id, h.bucket_start], set_=update_set)
+        result = await self.session.execute(stmt)
+        return result.rowcount or 0
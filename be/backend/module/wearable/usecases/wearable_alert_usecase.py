@@ -0,0 +1,218 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from backend.module.common.enums import RoleEnum, WearableAlertRuleEnum, WearableMetricEnum
+from backend.module.wearable.entity.wearable import WearableAlert, WearableAlertThreshold
+from backend.module.wearable.entity.wearable_dto import WearableAlertThresholdUpdateDTO
+from backend.module.wearable.repositories.wearable_alert_repository import WearableAlertRepository
+from backend.module.wearable.usecases.wearable_anomaly_detector import (
+    DEFAULT_THRESHOLDS,
+    AnomalyHits,
+    VitalsWindow,
+    detect_anomalies,
+)
+from backend.pkg.core.exceptions import (
+    AuthorizationException,
+    BusinessLogicException,
+    NotFoundException,
+)
+
+METRIC_LABELS = {
+    WearableMetricEnum.HEART_RATE: "Heart rate",
+    WearableMetricEnum.SYSTOLIC_BP: "Systolic BP",
+    WearableMetricEnum.DIASTOLIC_BP: "Diastolic BP",
+    WearableMetricEnum.BODY_TEMPERATURE: "Body temperature",
+    WearableMetricEnum.SPO2: "SpO2",
+}
+
+
+def build_window(rows: list) -> Tuple[List[UUID], VitalsWindow]:
+    """Turn load_window rows (sorted by device) into column arrays. Returns (device ids by index, window)."""
+    if not rows:
+        empty = np.zeros(0)
+        return [], VitalsWindow(
+            device_index=np.zeros(0, dtype=np.int64),
+            timestamps=empty,
+            is_new=np.zeros(0, dtype=bool),
+            values={metric: empty for metric in WearableMetricEnum},
+        )
+
+    columns = list(zip(*rows))
+    positions: Dict[UUID, int] = {}
+    for device_id in columns[0]:
+        positions.setdefault(device_id, len(positions))
+    device_index = np.fromiter((positions[d] for d in columns[0]), dtype=np.int64, count=len(rows))
+
+    window = VitalsWindow(
+        device_index=device_index,
+        timestamps=np.asarray(columns[2], dtype=np.float64),
+        is_new=np.asarray(columns[3], dtype=bool),
+        # None -> NaN
+        values={
+            metric: np.array(columns[4 + i], dtype=np.float64)
+            for i, metric in enumerate(WearableMetricEnum)
+        },
+    )
+    return list(positions), window
+
+
+def format_message(metric: WearableMetricEnum, rule: WearableAlertRuleEnum, value: float, limit: float) -> str:
+    label = METRIC_LABELS[metric]
+    if rule == WearableAlertRuleEnum.THRESHOLD_LOW:
+        return f"{label} {value:g} below {limit:g}"
+    if rule == WearableAlertRuleEnum.THRESHOLD_HIGH:
+        return f"{label} {value:g} above {limit:g}"
+    if rule == WearableAlertRuleEnum.ZSCORE:
+        return f"{label} {value:g} deviates from recent readings (z={limit:.1f})"
+    return f"{label} changed by {limit:+g} since the previous reading"
+
+
+class WearableAlertUseCase:
+    def __init__(self, repository: WearableAlertRepository):
+        self.repository = repository
+
+    # --- Evaluation ---
+
+    async def evaluate_pending(self, until: datetime, limit: int, lookback_seconds: int) -> Tuple[int, int, int]:
+        """
+        Evaluate readings created up to `until` for a batch of devices in one vectorized pass.
+        Returns (devices, readings evaluated, alerts raised).
+        """
+        pending = await self.repository.list_pending_devices(until, limit)
+        if not pending:
+            return 0, 0, 0
+        patient_of = dict(pending)
+
+        rows = await self.repository.load_window(list(patient_of), until, lookback_seconds)
+        device_ids, window = build_window(rows)
+        recorded_at = [row[1] for row in rows]
+
+        low, high = await self._device_bounds([patient_of[d] for d in device_ids])
+        hits = detect_anomalies(window, low, high)
+
+        alerts = self._alert_rows(hits, window, device_ids, patient_of, recorded_at)
+        raised = await self.repository.insert_alerts(alerts)
+        await self.repository.advance_watermarks(list(patient_of), until)
+        return len(pending), int(window.is_new.sum()), raised
+
+    async def _device_bounds(self, patient_ids: Sequence[UUID]) -> Tuple[Dict, Dict]:
+        """Per-device low/high arrays: defaults, replaced by the patient's overrides where set."""
+        low = {m: np.full(len(patient_ids), np.nan if lo is None else lo, dtype=np.float64) for m, (lo, _) in DEFAULT_THRESHOLDS.items()}
+        high = {m: np.full(len(patient_ids), np.nan if hi is None else hi, dtype=np.float64) for m, (_, hi) in DEFAULT_THRESHOLDS.items()}
+        if not patient_ids:
+            return low, high
+
+        overrides = await self.repository.list_thresholds(list(set(patient_ids)))
+        by_patient: Dict[UUID, List[int]] = {}
+        for i, patient_id in enumerate(patient_ids):
+            by_patient.setdefault(patient_id, []).append(i)
+        for override in overrides:
+            metric = WearableMetricEnum(override.metric)
+            devices = by_patient.get(override.patient_id, [])
+            if override.min_value is not None:
+                low[metric][devices] = override.min_value
+            if override.max_value is not None:
+                high[metric][devices] = override.max_value
+        return low, high
+
+    @staticmethod
+    def _alert_rows(
+        hits: List[AnomalyHits],
+        window: VitalsWindow,
+        device_ids: List[UUID],
+        patient_of: Dict[UUID, UUID],
+        recorded_at: list,
+    ) -> List[dict]:
+        alerts = []
+        for hit in hits:
+            devices = window.device_index[hit.rows]
+            for row, device, value, limit in zip(hit.rows.tolist(), devices.tolist(), hit.values.tolist(), hit.limits.tolist()):
+                device_id = device_ids[device]
+                alerts.append({
+                    "device_id": device_id,
+                    "patient_id": patient_of[device_id],
+                    "recorded_at": recorded_at[row],
+                    "metric": hit.metric.value,
+                    "rule": hit.rule.value,
+                    "value": value,
+                    "limit_value": limit,
+                    "message": format_message(hit.metric, hit.rule, value, limit),
+                })
+        return alerts
+
+    # --- Alerts ---
+
+    async def list_alerts(
+        self,
+        page: int,
+        limit: int,
+        user_id: UUID,
+        role: str,
+        patient_id: Optional[UUID] = None,
+        device_id: Optional[UUID] = None,
+        unacknowledged_only: bool = False
+    ) -> Tuple[List[WearableAlert], int]:
+        if role == RoleEnum.PATIENT.value:
+            patient_id = user_id
+        elif role not in (RoleEnum.DOCTOR.value, RoleEnum.ADMIN.value):
+            raise AuthorizationException("Only doctors can review wearable alerts")
+
+        return await self.repository.list_alerts(page, limit, patient_id, device_id, unacknowledged_only)
+
+    async def acknowledge_alert(self, alert_id: UUID, doctor_id: UUID) -> WearableAlert:
+        alert = await self.repository.get_alert_by_id(alert_id)
+        if not alert:
+            raise NotFoundException("Alert not found")
+
+        if alert.acknowledged_at is not None:
+            raise BusinessLogicException("Alert already acknowledged")
+
+        alert.acknowledged_at = datetime.now(timezone.utc)
+        alert.acknowledged_by = doctor_id
+        return await self.repository.update_alert(alert)
+
+    # --- Thresholds ---
+
+    async def list_thresholds(self, patient_id: UUID, user_id: UUID, role: str) -> List[dict]:
+        """Effective alert range per metric for a patient."""
+        if role == RoleEnum.PATIENT.value and patient_id != user_id:
+            raise AuthorizationException("Unauthorized")
+
+        overrides = {t.metric: t for t in await self.repository.list_thresholds([patient_id])}
+        result = []
+        for metric, (low, high) in DEFAULT_THRESHOLDS.items():
+            override = overrides.get(metric.value)
+            result.append({
+                "metric": metric,
+                "min_value": override.min_value if override and override.min_value is not None else low,
+                "max_value": override.max_value if override and override.max_value is not None else high,
+                "is_override": override is not None,
+            })
+        return result
+
+    async def set_threshold(
+        self, patient_id: UUID, metric: WearableMetricEnum, req: WearableAlertThresholdUpdateDTO, doctor_id: UUID
+    ) -> WearableAlertThreshold:
+        if req.min_value is None and req.max_value is None:
+            raise BusinessLogicException("Provide min_value and/or max_value")
+        if req.min_value is not None and req.max_value is not None and req.min_value >= req.max_value:
+            raise BusinessLogicException("min_value must be lower than max_value")
+
+        if not await self.repository.patient_exists(patient_id):
+            raise NotFoundException("Patient not found")
+
+        threshold = await self.repository.get_threshold(patient_id, metric.value)
+        if not threshold:
+            threshold = WearableAlertThreshold(patient_id=patient_id, metric=metric.value)
+        threshold.min_value = req.min_value
+        threshold.max_value = req.max_value
+        threshold.set_by = doctor_id
+        return await self.repository.save_threshold(threshold)
+
+    async def delete_threshold(self, patient_id: UUID, metric: WearableMetricEnum) -> None:
+        deleted = await self.repository.delete_threshold(patient_id, metric.value)
+        if not deleted:
+            raise NotFoundException("Threshold override not found")
@@ -0,0 +1,126 @@
+"""
+Vectorized vitals anomaly rules.
+
+Readings of many devices are evaluated together: every input array is one row per reading,
+sorted by (device, recorded_at), and `device_index` says which device a row belongs to.
+Rolling statistics never cross a device boundary.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.module.common.enums import WearableAlertRuleEnum, WearableMetricEnum
+
+# Normal ranges from the wearable_measurements column comments; BP allows the usual margin around 120/80.
+DEFAULT_THRESHOLDS: Dict[WearableMetricEnum, Tuple[Optional[float], Optional[float]]] = {
+    WearableMetricEnum.HEART_RATE: (60, 100),
+    WearableMetricEnum.SYSTOLIC_BP: (90, 140),
+    WearableMetricEnum.DIASTOLIC_BP: (60, 90),
+    WearableMetricEnum.BODY_TEMPERATURE: (36.5, 37.5),
+    WearableMetricEnum.SPO2: (95, 100),
+}
+
+# (max change, within seconds) between consecutive readings of the same device
+RATE_OF_CHANGE: Dict[WearableMetricEnum, Tuple[float, float]] = {
+    WearableMetricEnum.HEART_RATE: (30, 300),
+    WearableMetricEnum.SYSTOLIC_BP: (30, 900),
+    WearableMetricEnum.DIASTOLIC_BP: (20, 900),
+    WearableMetricEnum.BODY_TEMPERATURE: (1.0, 1800),
+    WearableMetricEnum.SPO2: (5, 300),
+}
+
+ZSCORE_WINDOW = 30  # Previous readings per device used for the rolling mean/std
+ZSCORE_MIN_PERIODS = 10
+ZSCORE_LIMIT = 4.0
+
+
+@dataclass
+class VitalsWindow:
+    device_index: np.ndarray  # int, non-decreasing
+    timestamps: np.ndarray  # float seconds since epoch
+    is_new: np.ndarray  # bool: only new readings raise alerts, older ones are context
+    values: Dict[WearableMetricEnum, np.ndarray]  # float, NaN where the metric was not measured
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+
+@dataclass
+class AnomalyHits:
+    metric: WearableMetricEnum
+    rule: WearableAlertRuleEnum
+    rows: np.ndarray  # Row indexes into the window
+    values: np.ndarray
+    limits: np.ndarray
+
+
+def rolling_zscore(values: np.ndarray, group_start: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """
+    z-score of each value against the previous `window` values of the same group.
+
+    Uses prefix sums, so the cost is O(n) regardless of the window size. NaN inputs are skipped;
+    rows without enough history (or a flat history) get NaN.
+    """
+    valid = ~np.isnan(values)
+    # Centering keeps the prefix sums small and the variance numerically stable
+    centered = np.where(valid, values - (np.nanmean(values) if valid.any() else 0.0), 0.0)
+    n = len(values)
+    csum = np.concatenate(([0.0], np.cumsum(centered)))
+    csq = np.concatenate(([0.0], np.cumsum(centered * centered)))
+    ccount = np.concatenate(([0], np.cumsum(valid)))
+
+    idx = np.arange(n)
+    start = np.maximum(idx - window, group_start)
+    count = ccount[idx] - ccount[start]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (csum[idx] - csum[start]) / count
+        var = (csq[idx] - csq[start]) / count - mean * mean
+        std = np.sqrt(np.maximum(var, 0.0))
+        z = (centered - mean) / std
+    z[(count < min_periods) | ~valid | (std < 1e-9)] = np.nan
+    return z
+
+
+def detect_anomalies(
+    window: VitalsWindow,
+    low: Dict[WearableMetricEnum, np.ndarray],
+    high: Dict[WearableMetricEnum, np.ndarray],
+) -> List[AnomalyHits]:
+    """
+    Apply threshold, rolling z-score and rate-of-change rules to every metric.
+
+    `low` / `high` hold one bound per device (indexed by device_index); NaN disables a bound.
+    """
+    hits: List[AnomalyHits] = []
+    if not len(window):
+        return hits
+
+    device_index = window.device_index
+    group_start = np.searchsorted(device_index, device_index, side="left")
+    same_device_as_prev = np.zeros(len(window), dtype=bool)
+    same_device_as_prev[1:] = device_index[1:] == device_index[:-1]
+    elapsed = np.full(len(window), np.inf)
+    elapsed[1:] = window.timestamps[1:] - window.timestamps[:-1]
+
+    def add(metric, rule, mask, values, limits):
+        rows = np.flatnonzero(mask & window.is_new)
+        if len(rows):
+            hits.append(AnomalyHits(metric, rule, rows, values[rows], limits[rows]))
+
+    for metric, values in window.values.items():
+        row_low = low[metric][device_index]
+        row_high = high[metric][device_index]
+        with np.errstate(invalid="ignore"):
+            add(metric, WearableAlertRuleEnum.THRESHOLD_LOW, values < row_low, values, row_low)
+            add(metric, WearableAlertRuleEnum.THRESHOLD_HIGH, values > row_high, values, row_high)
+
+            z = rolling_zscore(values, group_start, ZSCORE_WINDOW, ZSCORE_MIN_PERIODS)
+            add(metric, WearableAlertRuleEnum.ZSCORE, np.abs(z) >= ZSCORE_LIMIT, values, z)
+
+            max_delta, within = RATE_OF_CHANGE[metric]
+            delta = np.full(len(values), np.nan)
+            delta[1:] = values[1:] - values[:-1]
+            jump = same_device_as_prev & (elapsed <= within) & (np.abs(delta) > max_delta)
+            add(metric, WearableAlertRuleEnum.RATE_OF_CHANGE, jump, values, delta)
+    return hits
@@ -0,0 +1,157 @@
+"""
+Authentication of signed device ingestion requests.
+
+A request carries its key id, a timestamp and an HMAC of "<timestamp>.<body>". Keys are resolved
+through an in-process cache (key id -> device, patient, derived secret, validity), so a cached key
+costs one HMAC over the body and no database access; unknown key ids are cached too, so guessing
+cannot turn into a query per request. Cache entries expire after a TTL, which bounds how long a
+revocation made on another worker takes to apply.
+
+A signature is accepted once: accepted signatures are remembered until their timestamp leaves the
+allowed window, after which the request is refused for its age anyway. Each worker remembers the
+requests it served.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+from uuid import UUID
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.security.hmac_utils import (
+    derive_device_secret,
+    verify_device_signature,
+)
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.pkg.core.exceptions import AuthenticationException
+
+
+@dataclass(frozen=True)
+class DeviceKeyGrant:
+    key_id: str
+    device_id: UUID
+    patient_id: UUID
+    secret: str
+    expires_at: Optional[float]  # Epoch seconds; None while the key is current
+
+
+class DeviceKeyCache:
+    def __init__(self, ttl_seconds: float, max_keys: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_keys = max_keys
+        self._entries: "OrderedDict[str, Tuple[float, Optional[DeviceKeyGrant]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key_id: str) -> Tuple[bool, Optional[DeviceKeyGrant]]:
+        """(cached, grant); a cached None means the key is unknown or no longer valid."""
+        entry = self._entries.get(key_id)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key_id)
+        self.hits += 1
+        return True, entry[1]
+
+    def put(self, key_id: str, grant: Optional[DeviceKeyGrant]) -> None:
+        self._entries[key_id] = (time.monotonic(), grant)
+        self._entries.move_to_end(key_id)
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key_id: str) -> None:
+        self._entries.pop(key_id, None)
+
+
+class DeviceReplayCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        # Signature digest -> epoch second after which its timestamp is out of the window anyway.
+        # The digest stands for (key id, timestamp, body): it is an HMAC of them under the key.
+        self._seen: "OrderedDict[bytes, float]" = OrderedDict()
+
+    def add(self, digest: bytes, expires_at: float, now: float) -> bool:
+        """Remember an accepted signature; False if it was already seen."""
+        # Mostly in expiry order (timestamps arrive roughly in order), so expired ones are in front
+        while self._seen and next(iter(self._seen.values())) <= now:
+            self._seen.popitem(last=False)
+        if digest in self._seen:
+            return False
+        self._seen[digest] = expires_at
+        while len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        self._seen.clear()
+
+
+class WearableDeviceAuthUseCase:
+    def __init__(self, repository: WearableRepository, cache: DeviceKeyCache, replays: DeviceReplayCache):
+        self.repository = repository
+        self.cache = cache
+        self.replays = replays
+
+    async def _grant(self, key_id: str) -> Optional[DeviceKeyGrant]:
+        cached, grant = self.cache.get(key_id)
+        if cached:
+            return grant
+
+        row = await self.repository.get_device_key_grant(key_id)
+        grant = None
+        if row is not None:
+            key, patient_id, is_active = row
+            if key.revoked_at is None and is_active:
+                grant = DeviceKeyGrant(
+                    key_id=key.key_id,
+                    device_id=key.device_id,
+                    patient_id=patient_id,
+                    secret=derive_device_secret(key.key_id),
+                    expires_at=key.expires_at.timestamp() if key.expires_at else None,
+                )
+        self.cache.put(key_id, grant)
+        return grant
+
+    async def authenticate(
+        self, key_id: Optional[str], timestamp: Optional[str], signature: Optional[str], body: bytes
+    ) -> DeviceKeyGrant:
+        if not key_id or not timestamp or not signature:
+            raise AuthenticationException("Missing device signature headers")
+
+        # Whole epoch seconds only: no sign, spaces, fractions, nan or inf
+        if not (timestamp.isascii() and timestamp.isdigit()) or len(timestamp) > 12:
+            raise AuthenticationException("Invalid device request timestamp")
+        sent_at = int(timestamp)
+        now = datetime.now(timezone.utc).timestamp()
+        if abs(now - sent_at) > settings.WEARABLE_DEVICE_KEY_MAX_SKEW_SECONDS:
+            raise AuthenticationException("Device request timestamp outside the allowed window")
+
+        grant = await self._grant(key_id)
+        if grant is None or not verify_device_signature(grant.secret, timestamp, body, signature):
+            raise AuthenticationException("Invalid device signature")
+        if grant.expires_at is not None and now >= grant.expires_at:
+            raise AuthenticationException("Device key expired")
+        # The signature matched, so it is the hex digest and decodes
+        expires_at = sent_at + settings.WEARABLE_DEVICE_KEY_MAX_SKEW_SECONDS
+        if not self.replays.add(bytes.fromhex(signature), expires_at, now):
+            raise AuthenticationException("Device request already received")
+        return grant
+
+
+# Singleton instance
+device_key_cache = DeviceKeyCache(
+    settings.WEARABLE_DEVICE_KEY_CACHE_TTL_SECONDS,
+    settings.WEARABLE_DEVICE_KEY_CACHE_SIZE,
+)
+
+
+device_replay_cache = DeviceReplayCache(settings.WEARABLE_DEVICE_REPLAY_CACHE_SIZE)
+
+
+def get_device_key_cache() -> DeviceKeyCache:
+    return device_key_cache
+
+
+def get_device_replay_cache() -> DeviceReplayCache:
+    return device_replay_cache
@@ -0,0 +1,204 @@
+"""
+Research export of wearable readings to Parquet.
+
+Readings are scanned through a server-side cursor, WEARABLE_EXPORT_BATCH_ROWS at a time, turned
+into Arrow record batches and written as row groups of WEARABLE_EXPORT_ROW_GROUP_ROWS to one Parquet
+file per patient and month, so memory stays bounded by a row group however large the export. Files use Hive-style paths that Spark, DuckDB,
+pandas and Arrow datasets read as partition columns:
+
+    <prefix>/<export_id>/patient_id=<uuid>/month=<YYYY-MM>/part-00000.parquet
+    <prefix>/<export_id>/_manifest.json
+
+Files are staged in a temporary file and uploaded when complete, to the private
+WEARABLE_EXPORT_BUCKET or, with WEARABLE_EXPORT_STORAGE=local, under WEARABLE_EXPORT_LOCAL_DIR.
+pyarrow is an optional dependency needed only here.
+"""
+import io
+import json
+import logging
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import List, Optional, Sequence
+from uuid import UUID, uuid4
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.storage.local_service import LocalStorageService
+from backend.infrastructure.storage.models import StorageConfig
+from backend.module.wearable.repositories.wearable_export_repository import (
+    EXPORT_COLUMNS,
+    WearableExportRepository,
+)
+from backend.module.wearable.repositories.wearable_partition_repository import add_months, month_start
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Optional: only the export needs it
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+
+
+def export_schema() -> "pa.Schema":
+    return pa.schema([
+        ("id", pa.string()),
+        ("device_id", pa.string()),
+        ("recorded_at", pa.timestamp("us", tz="UTC")),
+        ("heart_rate", pa.int32()),
+        ("systolic_bp", pa.int32()),
+        ("diastolic_bp", pa.int32()),
+        ("body_temperature", pa.float64()),
+        ("steps", pa.int32()),
+        ("spo2", pa.int32()),
+    ])
+
+
+def to_record_batch(rows: Sequence, schema: "pa.Schema") -> "pa.RecordBatch":
+    """Rows in EXPORT_COLUMNS order -> one Arrow array per column."""
+    columns = list(zip(*rows))
+    arrays = []
+    for index, arrow_field in enumerate(schema):
+        if pa.types.is_timestamp(arrow_field.type):
+            arrays.append(pa.array(columns[index], pa.int64()).cast(arrow_field.type))
+        else:
+            arrays.append(pa.array(columns[index], arrow_field.type))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+@dataclass
+class ExportFile:
+    patient_id: str
+    month: str
+    path: str
+    rows: int
+    bytes: int
+
+
+@dataclass
+class ExportSummary:
+    export_id: str
+    date_from: str
+    date_to: str
+    files: List[ExportFile] = field(default_factory=list)
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class WearableExportUseCase:
+    def __init__(
+        self,
+        storage,
+        prefix: str = settings.WEARABLE_EXPORT_PREFIX,
+        batch_rows: int = settings.WEARABLE_EXPORT_BATCH_ROWS,
+        row_group_rows: int = settings.WEARABLE_EXPORT_ROW_GROUP_ROWS
+    ):
+        if pa is None:
+            raise RuntimeError("The wearable export needs pyarrow (install the backend with the `export` extra)")
+        self.storage = storage
+        self.prefix = prefix.strip("/")
+        self.batch_rows = batch_rows
+        self.row_group_rows = row_group_rows
+        self.compression = settings.WEARABLE_EXPORT_COMPRESSION
+        self.schema = export_schema()
+
+    async def _export_partition(
+        self, export_id: str, patient_id: UUID, device_ids: List[UUID], month: datetime,
+        date_from: datetime, date_to: datetime
+    ) -> Optional[ExportFile]:
+        path = f"{self.prefix}/{export_id}/patient_id={patient_id}/month={month:%Y-%m}/part-00000.parquet"
+        with tempfile.TemporaryFile() as staging:
+            writer = None
+            pending = []  # Arrow batches of the row group being built (compact, unlike fetched rows)
+            pending_rows = rows = 0
+            async for session in db_manager.get_session():
+                result = await WearableExportRepository(session).stream_rows(
+                    device_ids, date_from, date_to, self.batch_rows
+                )
+                async for batch in result.partitions():
+                    pending.append(to_record_batch(batch, self.schema))
+                    pending_rows += len(batch)
+                    rows += len(batch)
+                    if pending_rows >= self.row_group_rows:
+                        writer = writer or pq.ParquetWriter(staging, self.schema, compression=self.compression)
+                        writer.write_table(pa.Table.from_batches(pending), row_group_size=pending_rows)
+                        pending, pending_rows = [], 0
+            if not rows:
+                return None  # No readings: no file
+            writer = writer or pq.ParquetWriter(staging, self.schema, compression=self.compression)
+            if pending:
+                writer.write_table(pa.Table.from_batches(pending), row_group_size=pending_rows)
+            writer.close()
+
+            upload = await self.storage.upload_file(staging, path, PARQUET_CONTENT_TYPE, {"rows": rows})
+            if not upload.success:
+                raise RuntimeError(f"Uploading {path} failed: {upload.error}")
+            return ExportFile(str(patient_id), f"{month:%Y-%m}", path, rows, upload.metadata.size)
+
+    async def export(
+        self,
+        date_from: datetime,
+        date_to: datetime,
+        patient_ids: Optional[Sequence[UUID]] = None,
+        export_id: Optional[str] = None
+    ) -> ExportSummary:
+        """Export readings with date_from <= recorded_at < date_to, one file per patient and month."""
+        export_id = export_id or f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{uuid4().hex[:8]}"
+        summary = ExportSummary(export_id, date_from.isoformat(), date_to.isoformat())
+        started = time.perf_counter()
+
+        async for session in db_manager.get_session():
+            devices = await WearableExportRepository(session).list_patient_devices(patient_ids)
+        months = []
+        month = month_start(date_from)
+        while month < date_to:
+            months.append(month)
+            month = add_months(month, 1)
+
+        total = len(devices) * len(months)
+        done = 0
+        for patient_id, device_ids in devices.items():
+            for month in months:
+                exported = await self._export_partition(
+                    export_id, patient_id, device_ids, month, max(month, date_from), min(add_months(month, 1), date_to)
+                )
+                done += 1
+                if exported:
+                    summary.files.append(exported)
+                    summary.rows += exported.rows
+                    summary.bytes += exported.bytes
+                summary.seconds = time.perf_counter() - started
+                logger.info(
+                    f"Export {export_id}: {done}/{total} patient-months, {len(summary.files)} file(s), "
+                    f"{summary.rows} rows, {summary.rows_per_second:,.0f} rows/s"
+                )
+
+        manifest = {
+            **asdict(summary),
+            "schema": {name: str(self.schema.field(name).type) for name in EXPORT_COLUMNS},
+        }
+        path = f"{self.prefix}/{export_id}/_manifest.json"
+        upload = await self.storage.upload_file(
+            io.BytesIO(json.dumps(manifest, indent=2).encode()), path, "application/json"
+        )
+        if not upload.success:
+            raise RuntimeError(f"Uploading {path} failed: {upload.error}")
+        summary.seconds = time.perf_counter() - started
+        return summary
+
+
+def create_export_storage(kind: str = settings.WEARABLE_EXPORT_STORAGE):
+    """Storage for export files: the private export bucket, or a local directory."""
+    if kind == "local":
+        return LocalStorageService(settings.WEARABLE_EXPORT_LOCAL_DIR)
+    from backend.infrastructure.storage.s3_service import S3StorageService  # Connects on import
+    return S3StorageService(StorageConfig(bucket_name=settings.WEARABLE_EXPORT_BUCKET), public_read=False)
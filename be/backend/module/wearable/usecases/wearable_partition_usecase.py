@@ -0,0 +1,70 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from backend.infrastructure.config.settings import settings
+from backend.module.wearable.repositories.wearable_partition_repository import (
+    WearablePartitionRepository,
+    add_months,
+    month_start,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def retention_cutoff(now: datetime) -> Optional[datetime]:
+    """Partitions that end on or before this instant are eligible for retention. None when disabled."""
+    if settings.WEARABLE_RAW_RETENTION_MONTHS <= 0:
+        return None
+    return add_months(month_start(now), -settings.WEARABLE_RAW_RETENTION_MONTHS)
+
+
+def rollup_raw_floor(now: datetime) -> Optional[datetime]:
+    """
+    Oldest recorded_at whose raw readings are guaranteed to still exist.
+
+    Looks one day ahead so a rollup pass never straddles the moment a partition is retired.
+    Buckets older than this must be merged incrementally instead of recomputed from raw rows.
+    """
+    return retention_cutoff(now + timedelta(days=1))
+
+
+class WearablePartitionUseCase:
+    def __init__(self, repository: WearablePartitionRepository):
+        self.repository = repository
+
+    async def create_future_partitions(self, now: datetime, months_ahead: int) -> List[str]:
+        created = []
+        current = month_start(now)
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if await self.repository.ensure_partition(month):
+                created.append(month.strftime("%Y-%m"))
+        return created
+
+    async def apply_retention(self, now: datetime, mode: str, archive_schema: str) -> Dict[str, List[str]]:
+        """
+        Retire whole monthly partitions older than the retention window.
+
+        A partition is only retired once the rollups cover every reading in it, so the
+        hourly/daily aggregates stay complete after the raw rows are gone.
+        """
+        retired, pending = [], []
+        cutoff = retention_cutoff(now)
+        if cutoff is None:
+            return {"retired": retired, "pending": pending}
+
+        for name, month in await self.repository.list_partitions():
+            if add_months(month, 1) > cutoff:
+                break
+            if not await self.repository.is_rolled_up(name):
+                logger.warning(f"Keeping {name}: readings not yet rolled up")
+                pending.append(name)
+                continue
+            await self.repository.detach_partition(name)
+            if mode == "drop":
+                await self.repository.drop_table(name)
+            else:
+                await self.repository.move_to_schema(name, archive_schema)
+            retired.append(name)
+        return {"retired": retired, "pending": pending}
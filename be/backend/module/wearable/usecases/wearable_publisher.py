@@ -0,0 +1,38 @@
+from typing import List
+from uuid import UUID
+
+from backend.infrastructure.pubsub import pg_notify
+from backend.module.wearable.entity.wearable import WearableMeasurement
+from backend.module.wearable.entity.wearable_dto import WearableMeasurementDTO
+from sqlalchemy.ext.asyncio import AsyncSession
+
+DEVICE_TOPIC_PREFIX = "wearable:device:"
+
+
+def device_topic(device_id: UUID) -> str:
+    return f"{DEVICE_TOPIC_PREFIX}{device_id}"
+
+
+def patient_topic(patient_id: UUID) -> str:
+    return f"wearable:patient:{patient_id}"
+
+
+class VitalsPublisher:
+    """Pushes newly ingested readings to live viewers once the ingesting transaction commits."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def publish(self, measurement: WearableMeasurement, patient_id: UUID) -> None:
+        # Encoded once here; viewers receive the same string
+        message = WearableMeasurementDTO.model_validate(measurement).model_dump_json()
+        await pg_notify.publish(
+            self.session,
+            [device_topic(measurement.device_id), patient_topic(patient_id)],
+            message,
+        )
+
+    async def publish_many(self, device_id: UUID, patient_id: UUID, messages: List[str]) -> None:
+        """Publish a batch of one device's readings, already encoded as WearableMeasurementDTO JSON."""
+        topics = [device_topic(device_id), patient_topic(patient_id)]
+        await pg_notify.publish_many(self.session, [(topics, message) for message in messages])
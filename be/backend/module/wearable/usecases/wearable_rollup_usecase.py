@@ -0,0 +1,18 @@
+from datetime import datetime
+from typing import Optional
+
+from backend.module.wearable.repositories.wearable_rollup_repository import (
+    WearableRollupRepository,
+)
+
+
+class WearableRollupUseCase:
+    def __init__(self, repository: WearableRollupRepository):
+        self.repository = repository
+
+    async def rollup_pending(self, until: datetime, limit: int, raw_floor: Optional[datetime] = None) -> int:
+        """Fold readings created up to `until` into the hourly/daily rollups. Returns devices processed."""
+        devices = await self.repository.list_pending_devices(until, limit)
+        for device_id, since in devices:
+            await self.repository.rollup_device(device_id, since, until, raw_floor)
+        return len(devices)
@@ -0,0 +1,68 @@
+"""
+Patient vitals timeline: newest-first readings of all a patient's devices as one sequence.
+
+Each device contributes a server-side cursor already ordered by (recorded_at, id) descending, so
+the timeline is a k-way merge that holds one pending reading per device and stops after the
+page. Pages continue from an opaque keyset token (the last reading's recorded_at and id), which
+stays stable while new readings arrive, unlike offsets.
+"""
+import base64
+import heapq
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Sequence, Tuple
+from uuid import UUID
+
+from backend.module.wearable.entity.wearable import WearableMeasurement
+from backend.pkg.core.exceptions import BusinessLogicException
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+TimelineKey = Tuple[datetime, UUID]
+
+
+def _micros(value: datetime) -> int:
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def encode_cursor(measurement: WearableMeasurement) -> str:
+    raw = f"{_micros(measurement.recorded_at)}.{measurement.id.hex}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> TimelineKey:
+    """Token -> (recorded_at, id) of the last reading already returned."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        micros, id_hex = raw.split(".")
+        return _EPOCH + timedelta(microseconds=int(micros)), UUID(hex=id_hex)
+    except (ValueError, UnicodeDecodeError, OverflowError):
+        raise BusinessLogicException("Invalid timeline cursor")
+
+
+async def merge_newest_first(
+    streams: Sequence[AsyncIterator[WearableMeasurement]], limit: int
+) -> List[WearableMeasurement]:
+    """
+    Up to `limit` readings from per-device streams, each ordered by (recorded_at, id) descending.
+    Pulls one reading at a time from whichever stream holds the newest pending reading.
+    """
+    heap = []
+
+    async def advance(index: int) -> None:
+        measurement = await anext(streams[index], None)
+        if measurement is not None:
+            # heapq is a min-heap: negate the sort key for newest first
+            heapq.heappush(heap, (-_micros(measurement.recorded_at), -measurement.id.int, index, measurement))
+
+    for index in range(len(streams)):
+        await advance(index)
+
+    merged = []
+    while heap:
+        *_, index, measurement = heapq.heappop(heap)
+        merged.append(measurement)
+        if len(merged) == limit:
+            break
+        await advance(index)
+    return merged
@@ -1,26 +1,100 @@
 
-from datetime import datetime
-from typing import List, Optional, Tuple
-from uuid import UUID
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
 
-from backend.module.common.enums import RoleEnum
-from backend.module.wearable.entity.wearable import WearableDevice, WearableMeasurement
+from backend.module.common.enums import (
+    RoleEnum,
+    WearableBucketEnum,
+    WearableMetricEnum,
+    WearableResolutionEnum,
+)
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.security.hmac_utils import derive_device_secret, generate_device_key_id
+from backend.module.wearable.entity.wearable import (
+    WearableDevice,
+    WearableDeviceKey,
+    WearableMeasurement,
+)
 from backend.module.wearable.entity.wearable_dto import (
     WearableDeviceCreateDTO,
     WearableDeviceUpdateDTO,
     WearableMeasurementCreateDTO,
 )
+from backend.module.wearable.repositories.wearable_ingest_repository import WearableIngestRepository
 from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.repositories.wearable_rollup_repository import (
+    DAY_SECONDS,
+    HOUR_SECONDS,
+)
+from backend.module.wearable.usecases.wearable_columnar import ReadingColumns, uuid4_strings
+from backend.module.wearable.usecases.wearable_device_auth import DeviceKeyCache
+from backend.module.wearable.usecases.wearable_publisher import VitalsPublisher
+from backend.module.wearable.usecases.wearable_timeline import (
+    decode_cursor,
+    encode_cursor,
+    merge_newest_first,
+)
+from backend.module.wearable.usecases.wearable_vitals_cache import DeviceRing, LatestVitalsCache
+from backend.module.wearable.usecases.wearable_write_behind import WearableWriteBehind
 from backend.pkg.core.exceptions import (
     AuthorizationException,
     BusinessLogicException,
     NotFoundException,
 )
 
+BUCKET_SECONDS = {
+    WearableBucketEnum.MINUTE_5: 5 * 60,
+    WearableBucketEnum.MINUTE_15: 15 * 60,
+    WearableBucketEnum.HOUR_1: HOUR_SECONDS,
+    WearableBucketEnum.HOUR_6: 6 * HOUR_SECONDS,
+    WearableBucketEnum.DAY_1: DAY_SECONDS,
+    WearableBucketEnum.DAY_7: 7 * DAY_SECONDS,
+}
+
+# Coarsest first: the first resolution that divides the bucket and aligns with the range wins.
+ROLLUP_RESOLUTIONS = (
+    (WearableResolutionEnum.DAILY, DAY_SECONDS),
+    (WearableResolutionEnum.HOURLY, HOUR_SECONDS),
+)
+
+MAX_AGGREGATE_BUCKETS = 5000
+MAX_TIMELINE_LIMIT = 1000
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def select_resolution(bucket_seconds: int, date_from: datetime, date_to: datetime) -> WearableResolutionEnum:
+    """Pick the coarsest rollup whose buckets tile both the output buckets and the requested range."""
+    for resolution, seconds in ROLLUP_RESOLUTIONS:
+        if bucket_seconds % seconds:
+            continue
+        if date_from.timestamp() % seconds or date_to.timestamp() % seconds:
+            continue
+        return resolution
+    return WearableResolutionEnum.RAW
+
 
 class WearableUseCase:
-    def __init__(self, repository: WearableRepository):
+    def __init__(
+        self,
+        repository: WearableRepository,
+        publisher: Optional[VitalsPublisher] = None,
+        vitals_cache: Optional[LatestVitalsCache] = None,
+        write_behind: Optional[WearableWriteBehind] = None,
+        device_key_cache: Optional[DeviceKeyCache] = None,
+        ingest_repository: Optional[WearableIngestRepository] = None
+    ):
         self.repository = repository
+        self.publisher = publisher
+        self.vitals_cache = vitals_cache
+        self.write_behind = write_behind
+        self.device_key_cache = device_key_cache
+        self.ingest_repository = ingest_repository
 
     async def create_device(self, req: WearableDeviceCreateDTO, user_id: UUID, role: str) -> WearableDevice:
         if role != RoleEnum.PATIENT.value:
@@ -83,6 +157,14 @@ class WearableUseCase:
 
         return device
 
+    async def authorize_patient(self, patient_id: UUID, user_id: UUID, role: str) -> None:
+        """Patients may only watch themselves; doctors and admins may watch any patient."""
+        if role == RoleEnum.PATIENT.value:
+            if patient_id != user_id:
+                raise AuthorizationException("Unauthorized")
+        elif role not in (RoleEnum.DOCTOR.value, RoleEnum.ADMIN.value):
+            raise AuthorizationException("Only doctors can watch patient vitals")
+
     async def update_device(self, device_id: UUID, req: WearableDeviceUpdateDTO, user_id: UUID, role: str) -> WearableDevice:
         if role != RoleEnum.PATIENT.value:
              raise AuthorizationException("Only owner can update device")
@@ -115,6 +197,75 @@ class WearableUseCase:
              raise AuthorizationException("Unauthorized")
 
         await self.repository.delete_device(device)
+        if self.vitals_cache:
+            self.vitals_cache.invalidate(device_id)
+
+    async def _get_owned_device(self, device_id: UUID, user_id: UUID, role: str) -> WearableDevice:
+        if role != RoleEnum.PATIENT.value:
+            raise AuthorizationException("Only owner can manage device keys")
+
+        device = await self.repository.get_device_by_id(device_id)
+        if not device:
+            raise NotFoundException("Device not found")
+
+        if device.patient_id != user_id:
+            raise AuthorizationException("Unauthorized")
+        return device
+
+    async def create_device_key(self, device_id: UUID, user_id: UUID, role: str) -> Tuple[WearableDeviceKey, str]:
+        """
+        Issue a new signing key. Existing keys stay valid for the rotation grace period so
+        devices can switch over. Returns (key, secret); the secret is not retrievable later.
+        """
+        await self._get_owned_device(device_id, user_id, role)
+
+        grace_until = datetime.now(timezone.utc) + timedelta(seconds=settings.WEARABLE_DEVICE_KEY_ROTATION_GRACE_SECONDS)
+        for key_id in await self.repository.expire_device_keys(device_id, grace_until):
+            if self.device_key_cache:
+                self.device_key_cache.invalidate(key_id)
+
+        key = await self.repository.create_device_key(WearableDeviceKey(
+            key_id=generate_device_key_id(),
+            device_id=device_id,
+        ))
+        return key, derive_device_secret(key.key_id)
+
+    async def list_device_keys(self, device_id: UUID, user_id: UUID, role: str) -> List[WearableDeviceKey]:
+        await self._get_owned_device(device_id, user_id, role)
+        return await self.repository.list_device_keys(device_id)
+
+    async def revoke_device_key(self, device_id: UUID, key_id: str, user_id: UUID, role: str) -> WearableDeviceKey:
+        await self._get_owned_device(device_id, user_id, role)
+
+        key = await self.repository.get_device_key(device_id, key_id)
+        if not key:
+            raise NotFoundException("Device key not found")
+
+        if key.revoked_at is not None:
+            raise BusinessLogicException("Device key already revoked")
+
+        key.revoked_at = datetime.now(timezone.utc)
+        key = await self.repository.update_device_key(key)
+        if self.device_key_cache:
+            self.device_key_cache.invalidate(key_id)
+        return key
+
+    async def ingest_readings(self, device_id: UUID, patient_id: UUID, columns: ReadingColumns) -> int:
+        """
+        Store a batch from an authenticated device. The device and its patient come from the
+        verified key, so no user, session or device lookup is needed; the rows are COPYed
+        (or buffered by write-behind) straight from the decoded columns.
+        """
+        ids = uuid4_strings(len(columns))
+        records = columns.records(device_id, ids)
+        if self.write_behind:
+            await self.write_behind.enqueue_records(records)
+        else:
+            await self.ingest_repository.copy_measurements(records)
+        if self.publisher:
+            messages = columns.messages(device_id, ids, datetime.now(timezone.utc))
+            await self.publisher.publish_many(device_id, patient_id, messages)
+        return len(records)
 
     async def add_measurement(self, device_id: UUID, req: WearableMeasurementCreateDTO, user_id: UUID, role: str) -> WearableMeasurement:
         # Simulation: Patient adds measurement, or System (if we had API keys).
@@ -139,7 +290,16 @@ class WearableUseCase:
             steps=req.steps,
             spo2=req.spo2
         )
-        return await self.repository.create_measurement(measurement)
+        if self.write_behind:
+            # Acknowledged once durable locally; stored by the next flush
+            measurement.id = uuid4()
+            measurement.created_at = datetime.now(timezone.utc)
+            await self.write_behind.enqueue(measurement)
+        else:
+            measurement = await self.repository.create_measurement(measurement)
+        if self.publisher:
+            await self.publisher.publish(measurement, device.patient_id)
+        return measurement
 
     async def list_measurements(
         self,
@@ -162,3 +322,85 @@ class WearableUseCase:
         # Doctor can view
 
         return await self.repository.list_measurements(device_id, page, limit, date_from, date_to)
+
+    async def latest_readings(self, device_id: UUID, limit: int, user_id: UUID, role: str) -> Tuple[DeviceRing, bool]:
+        """
+        Last readings of a device from the hot cache. On a miss the device is authorized and
+        loaded from the database; on a hit ownership is checked against the cached patient.
+        Returns (ring, served from cache).
+        """
+        if limit < 1 or limit > self.vitals_cache.capacity:
+            raise BusinessLogicException(f"limit must be between 1 and {self.vitals_cache.capacity}")
+
+        async def load():
+            device = await self.get_device(device_id, user_id, role)
+            rows = await self.repository.list_recent_readings(device_id, self.vitals_cache.capacity)
+            return device.patient_id, rows
+
+        ring, cached = await self.vitals_cache.get_or_load(device_id, load)
+        if cached and role == RoleEnum.PATIENT.value and ring.patient_id != user_id:
+            raise AuthorizationException("Unauthorized")
+        return ring, cached
+
+    async def patient_timeline(
+        self,
+        patient_id: UUID,
+        limit: int,
+        user_id: UUID,
+        role: str,
+        cursor: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        metrics: Sequence[WearableMetricEnum] = ()
+    ) -> Tuple[List[WearableMeasurement], Optional[str]]:
+        """
+        Newest-first readings across all the patient's devices, authorized once for the patient.
+        Returns (page, token for the next page or None).
+        """
+        if limit < 1 or limit > MAX_TIMELINE_LIMIT:
+            raise BusinessLogicException(f"limit must be between 1 and {MAX_TIMELINE_LIMIT}")
+        await self.authorize_patient(patient_id, user_id, role)
+        before = decode_cursor(cursor) if cursor else None
+
+        streams = []
+        try:
+            for device_id in await self.repository.list_patient_device_ids(patient_id):
+                # One extra row tells whether another page follows
+                streams.append(await self.repository.stream_timeline(
+                    device_id, limit + 1, before, date_from, date_to, [m.value for m in metrics]
+                ))
+            readings = await merge_newest_first(streams, limit + 1)
+        finally:
+            for stream in streams:
+                await stream.close()
+
+        if len(readings) > limit:
+            return readings[:limit], encode_cursor(readings[limit - 1])
+        return readings, None
+
+    async def aggregate_measurements(
+        self,
+        device_id: UUID,
+        bucket: WearableBucketEnum,
+        date_from: datetime,
+        date_to: datetime,
+        user_id: UUID,
+        role: str
+    ) -> Tuple[WearableResolutionEnum, datetime, datetime, List]:
+        date_from = _as_utc(date_from)
+        date_to = _as_utc(date_to)
+        if date_to <= date_from:
+            raise BusinessLogicException("date_to must be after date_from")
+
+        bucket_seconds = BUCKET_SECONDS[bucket]
+        if (date_to - date_from).total_seconds() / bucket_seconds > MAX_AGGREGATE_BUCKETS:
+            raise BusinessLogicException(f"Range too large for bucket {bucket.value}: max {MAX_AGGREGATE_BUCKETS} buckets")
+
+        # Same ownership rules as viewing the device
+        await self.get_device(device_id, user_id, role)
+
+        resolution = select_resolution(bucket_seconds, date_from, date_to)
+        rows = await self.repository.aggregate_measurements(
+            device_id, bucket_seconds, date_from, date_to, resolution
+        )
+        return resolution, date_from, date_to, rows
@@ -0,0 +1,249 @@
+"""
+Hot cache of the latest readings per device.
+
+Each cached device keeps its last `capacity` readings in a fixed-size NumPy record array used as a
+ring buffer (64 bytes per reading, no ORM objects), and the number of cached devices is LRU-bounded,
+so memory stays below max_devices x capacity x 64 bytes.
+
+Entries are loaded from the database on a miss and then kept current by the readings published
+after each ingest commit (on every worker when the LISTEN/NOTIFY bridge is enabled). An entry is
+reloaded once it is older than the TTL, which bounds staleness if a notification was missed.
+"""
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.pubsub.hub import get_pubsub_hub
+from backend.module.common.enums import WearableMetricEnum
+from backend.module.wearable.usecases.wearable_publisher import DEVICE_TOPIC_PREFIX
+
+METRIC_FIELDS = ("heart_rate", "systolic_bp", "diastolic_bp", "body_temperature", "steps", "spo2")
+FLOAT_FIELDS = {"body_temperature"}
+
+# Timestamps as epoch microseconds (exact); missing metrics as NaN
+READING_DTYPE = np.dtype([
+    ("id", "V16"),
+    ("recorded_at", "i8"),
+    ("created_at", "i8"),
+    ("heart_rate", "f4"),
+    ("systolic_bp", "f4"),
+    ("diastolic_bp", "f4"),
+    ("spo2", "f4"),
+    ("body_temperature", "f8"),
+    ("steps", "f8"),
+])
+_RECORD_FIELDS = READING_DTYPE.names
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _datetime(micros: int) -> datetime:
+    return datetime.fromtimestamp(micros // 1_000_000, tz=timezone.utc).replace(microsecond=micros % 1_000_000)
+
+
+def record_from_row(row) -> tuple:
+    """(id, recorded_at, created_at, *metrics) row or mapping -> record tuple in READING_DTYPE order."""
+    return (
+        row["id"].bytes,
+        _micros(row["recorded_at"]),
+        _micros(row["created_at"]),
+        *(np.nan if row[name] is None else row[name] for name in _RECORD_FIELDS[3:]),
+    )
+
+
+def record_from_message(message: str) -> tuple:
+    data = json.loads(message)
+    data["id"] = UUID(data["id"])
+    data["recorded_at"] = datetime.fromisoformat(data["recorded_at"])
+    data["created_at"] = datetime.fromisoformat(data["created_at"])
+    return record_from_row(data)
+
+
+class DeviceRing:
+    __slots__ = ("patient_id", "data", "head", "count", "loaded_at")
+
+    def __init__(self, patient_id: UUID, capacity: int):
+        self.patient_id = patient_id
+        self.data = np.zeros(capacity, dtype=READING_DTYPE)
+        self.head = 0  # Next slot to write
+        self.count = 0
+        self.loaded_at = time.monotonic()
+
+    @classmethod
+    def from_rows(cls, patient_id: UUID, rows: Sequence, capacity: int) -> "DeviceRing":
+        """Build from newest-first database rows."""
+        ring = cls(patient_id, capacity)
+        rows = rows[:capacity]
+        if rows:
+            ring.data[:len(rows)] = [record_from_row(row._mapping) for row in reversed(rows)]
+        ring.count = len(rows)
+        ring.head = len(rows) % capacity
+        return ring
+
+    def append(self, record: tuple) -> bool:
+        """
+        Add a newly ingested reading. Returns False when it lands between readings already held,
+        in which case the ring no longer reflects the database order and must be reloaded.
+        """
+        capacity = len(self.data)
+        if self.count:
+            if (self.data["id"][:self.count] == np.void(record[0])).any():
+                return True
+            newest = self.data["recorded_at"][(self.head - 1) % capacity]
+            if record[1] < newest:
+                oldest = self.data["recorded_at"][(self.head - self.count) % capacity]
+                # A backfilled reading older than everything kept does not change the last N
+                return self.count == capacity and record[1] <= oldest
+        self.data[self.head] = record
+        self.head = (self.head + 1) % capacity
+        self.count = min(self.count + 1, capacity)
+        return True
+
+    def newest_first(self, limit: int) -> np.ndarray:
+        n = min(limit, self.count)
+        return self.data[(self.head - 1 - np.arange(n)) % len(self.data)]
+
+    def readings(self, device_id: UUID, limit: int) -> List[dict]:
+        result = []
+        for record in self.newest_first(limit).tolist():
+            reading = dict(zip(_RECORD_FIELDS, record))
+            reading["id"] = UUID(bytes=bytes(reading["id"]))
+            reading["device_id"] = device_id
+            reading["recorded_at"] = _datetime(reading["recorded_at"])
+            reading["created_at"] = _datetime(reading["created_at"])
+            for name in METRIC_FIELDS:
+                value = reading[name]
+                if value != value:  # NaN
+                    reading[name] = None
+                elif name not in FLOAT_FIELDS:
+                    reading[name] = int(value)
+            result.append(reading)
+        return result
+
+    def vitals(self) -> List[dict]:
+        """Most recent reported value of each vital sign, with when it was recorded."""
+        records = self.newest_first(self.count)
+        result = []
+        for metric in WearableMetricEnum:
+            reported = ~np.isnan(records[metric.value])
+            if not reported.any():
+                continue
+            i = int(reported.argmax())
+            result.append({
+                "metric": metric,
+                "value": round(float(records[metric.value][i]), 2),
+                "recorded_at": _datetime(int(records["recorded_at"][i])),
+            })
+        return result
+
+
+class LatestVitalsCache:
+    def __init__(self, capacity: int, max_devices: int, ttl_seconds: float):
+        self.capacity = capacity
+        self.max_devices = max_devices
+        self.ttl_seconds = ttl_seconds
+        self._rings: "OrderedDict[UUID, DeviceRing]" = OrderedDict()
+        # Readings published while a device is being loaded, replayed onto the loaded ring
+        self._loading: Dict[UUID, List[List[tuple]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, device_id: UUID) -> Optional[DeviceRing]:
+        ring = self._rings.get(device_id)
+        if ring is None:
+            return None
+        if time.monotonic() - ring.loaded_at > self.ttl_seconds:
+            del self._rings[device_id]
+            return None
+        self._rings.move_to_end(device_id)
+        return ring
+
+    async def get_or_load(
+        self, device_id: UUID, loader: Callable[[], Awaitable[Tuple[UUID, Sequence]]]
+    ) -> Tuple[DeviceRing, bool]:
+        """
+        Cached ring of a device, or one built from `loader()` -> (patient_id, newest-first rows
+        of at least `capacity` readings when available). Returns (ring, served from cache).
+        """
+        ring = self.get(device_id)
+        if ring is not None:
+            self.hits += 1
+            return ring, True
+
+        self.misses += 1
+        published: List[tuple] = []
+        self._loading.setdefault(device_id, []).append(published)
+        try:
+            patient_id, rows = await loader()
+        finally:
+            buffers = self._loading[device_id]
+            buffers.remove(published)
+            if not buffers:
+                del self._loading[device_id]
+
+        ring = DeviceRing.from_rows(patient_id, rows, self.capacity)
+        if all(ring.append(record) for record in published):
+            self._store(device_id, ring)
+        return ring, False
+
+    def _store(self, device_id: UUID, ring: DeviceRing) -> None:
+        self._rings[device_id] = ring
+        self._rings.move_to_end(device_id)
+        while len(self._rings) > self.max_devices:
+            self._rings.popitem(last=False)
+            self.evictions += 1
+
+    def on_message(self, topic: str, message: str) -> None:
+        """Pub/sub listener for device topics: apply a committed reading to its cached ring."""
+        device_id = UUID(topic[len(DEVICE_TOPIC_PREFIX):])
+        ring = self._rings.get(device_id)
+        buffers = self._loading.get(device_id)
+        if ring is None and not buffers:
+            return  # Not cached: skip decoding
+
+        record = record_from_message(message)
+        for published in buffers or ():
+            published.append(record)
+        if ring is not None and not ring.append(record):
+            del self._rings[device_id]
+
+    def invalidate(self, device_id: UUID) -> None:
+        self._rings.pop(device_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "devices": len(self._rings),
+            "max_devices": self.max_devices,
+            "capacity": self.capacity,
+            "memory_bytes": len(self._rings) * self.capacity * READING_DTYPE.itemsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Singleton instance
+vitals_cache = LatestVitalsCache(
+    settings.WEARABLE_VITALS_CACHE_SIZE,
+    settings.WEARABLE_VITALS_CACHE_DEVICES,
+    settings.WEARABLE_VITALS_CACHE_TTL_SECONDS,
+)
+get_pubsub_hub().add_listener(DEVICE_TOPIC_PREFIX, vitals_cache.on_message)
+
+
+def get_vitals_cache() -> LatestVitalsCache:
+    return vitals_cache
@@ -0,0 +1,182 @@
+"""
+Write-behind ingestion for wearable readings.
+
+With WEARABLE_WRITE_BEHIND_ENABLED, an accepted reading is appended to a local segment log and
+acknowledged once it is on disk; a background flusher in each API worker seals segments every
+WEARABLE_WRITE_BEHIND_FLUSH_SECONDS and COPYs them into wearable_measurements. Segments left by a
+crashed worker are picked up by the next flusher (or `python -m backend.scripts.wearable_ingest_flush`),
+and replays are idempotent. When unflushed data exceeds WEARABLE_WRITE_BEHIND_MAX_BYTES, new
+readings are refused with 429 until the flusher catches up.
+"""
+import asyncio
+import json
+import logging
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.ingest.segment_log import BacklogFullError, SegmentLog, claim
+from backend.module.wearable.entity.wearable import WearableMeasurement
+from backend.module.wearable.repositories.wearable_ingest_repository import WearableIngestRepository
+from backend.pkg.core.exceptions import RateLimitException
+
+logger = logging.getLogger(__name__)
+
+
+def encode_record(record: tuple) -> bytes:
+    """Record in WearableIngestRepository.COPY_COLUMNS order -> segment payload."""
+    id_, device_id, recorded_at, hr, sbp, dbp, temperature, steps, spo2 = record
+    return json.dumps([
+        str(id_),
+        str(device_id),
+        recorded_at.isoformat(),
+        hr, sbp, dbp,
+        None if temperature is None else str(temperature),
+        steps, spo2,
+    ], separators=(",", ":")).encode()
+
+
+def encode(measurement: WearableMeasurement) -> bytes:
+    return encode_record((
+        measurement.id,
+        measurement.device_id,
+        measurement.recorded_at,
+        measurement.heart_rate,
+        measurement.systolic_bp,
+        measurement.diastolic_bp,
+        measurement.body_temperature,
+        measurement.steps,
+        measurement.spo2,
+    ))
+
+
+def decode(payload: bytes) -> tuple:
+    """Segment payload -> record in WearableIngestRepository.COPY_COLUMNS order."""
+    id_, device_id, recorded_at, hr, sbp, dbp, temperature, steps, spo2 = json.loads(payload)
+    return (
+        UUID(id_),
+        UUID(device_id),
+        datetime.fromisoformat(recorded_at),
+        hr, sbp, dbp,
+        None if temperature is None else Decimal(temperature),
+        steps, spo2,
+    )
+
+
+class WearableWriteBehind:
+    def __init__(self, log: SegmentLog, flush_seconds: float):
+        self.log = log
+        self.flush_seconds = flush_seconds
+        self._task: Optional[asyncio.Task] = None
+        self.flushed_records = 0
+        self.flushed_segments = 0
+        self.flush_errors = 0
+        self.last_flush_records = 0
+        self.last_flush_seconds = 0.0
+
+    async def enqueue(self, measurement: WearableMeasurement) -> None:
+        """Durably buffer a validated reading; it reaches the database on the next flush."""
+        try:
+            await self.log.append(encode(measurement))
+        except BacklogFullError:
+            raise RateLimitException("Ingestion backlog is full, retry later")
+
+    async def enqueue_records(self, records: List[tuple]) -> None:
+        """Durably buffer a batch of records in COPY_COLUMNS order, all or none."""
+        try:
+            await self.log.append_many([encode_record(r) for r in records])
+        except BacklogFullError:
+            raise RateLimitException("Ingestion backlog is full, retry later")
+
+    async def flush_once(self) -> int:
+        """Seal the active segment and load every claimable segment. Returns rows inserted."""
+        await self.log.seal()
+        started = time.perf_counter()
+        records = inserted = 0
+        for segment in self.log.refresh_pending():
+            claimed = claim(segment)
+            if claimed is None:
+                continue  # Being written or flushed by another worker
+            try:
+                batch = [decode(payload) for payload in claimed.read()]
+                if batch:
+                    async for session in db_manager.get_session():
+                        count = await WearableIngestRepository(session).copy_measurements(batch)
+                    inserted += count
+                    records += len(batch)
+                claimed.complete()
+                self.flushed_segments += 1
+            finally:
+                claimed.release()
+
+        self.log.refresh_pending()
+        self.flushed_records += records
+        self.last_flush_records = records
+        self.last_flush_seconds = time.perf_counter() - started
+        return inserted
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.flush_once()
+            except Exception as e:
+                self.flush_errors += 1
+                logger.error(f"Write-behind flush failed, segments kept for retry: {e}")
+            await asyncio.sleep(self.flush_seconds)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        try:
+            await self.flush_once()
+        except Exception as e:
+            logger.error(f"Final write-behind flush failed, segments kept for recovery: {e}")
+
+    def metrics(self) -> dict:
+        segments = self.log.refresh_pending()
+        return {
+            "pending_segments": len(segments),
+            "pending_bytes": self.log.pending_bytes,
+            "max_pending_bytes": self.log.max_pending_bytes,
+            "lag_seconds": round(time.time() - segments[0].created_at, 3) if segments else 0.0,
+            "appended": self.log.appended,
+            "rejected": self.log.rejected,
+            "flushed_records": self.flushed_records,
+            "flushed_segments": self.flushed_segments,
+            "flush_errors": self.flush_errors,
+            "last_flush_records": self.last_flush_records,
+            "last_flush_seconds": round(self.last_flush_seconds, 4),
+            "flush_records_per_second": round(self.last_flush_records / self.last_flush_seconds)
+            if self.last_flush_seconds else 0,
+        }
+
+
+def create_write_behind(directory: str = settings.WEARABLE_WRITE_BEHIND_DIR) -> WearableWriteBehind:
+    log = SegmentLog(
+        directory,
+        segment_bytes=settings.WEARABLE_WRITE_BEHIND_SEGMENT_BYTES,
+        max_pending_bytes=settings.WEARABLE_WRITE_BEHIND_MAX_BYTES,
+        fsync=settings.WEARABLE_WRITE_BEHIND_FSYNC,
+    )
+    return WearableWriteBehind(log, settings.WEARABLE_WRITE_BEHIND_FLUSH_SECONDS)
+
+
+# Singleton instance (None when readings are written synchronously)
+write_behind = create_write_behind() if settings.WEARABLE_WRITE_BEHIND_ENABLED else None
+
+
+def get_write_behind() -> Optional[WearableWriteBehind]:
+    return write_behind
@@ -101,6 +101,19 @@ class BusinessLogicException(BaseAPIException):
         )
 
 
+class UnsupportedMediaTypeException(BaseAPIException):
+    """Exception for request bodies in an unsupported format"""
+
+    def __init__(
+        self,
+        message: str = "Unsupported media type",
+    ):
+        super().__init__(
+            message=message,
+            code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
+
+
 class ExternalServiceException(BaseAPIException):
     """Exception for external service errors"""
 
@@ -0,0 +1,45 @@
+from typing import AsyncIterator, Callable, ContextManager, Optional
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering (nginx)
+}
+
+
+def sse_event(event: str, data: str, event_id: Optional[int] = None) -> str:
+    """One server-sent event; with an id, a reconnecting EventSource sends it back as Last-Event-ID."""
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event}\ndata: {data}\n\n"
+
+
+async def event_stream(
+    request: Request,
+    subscribe: Callable[[], ContextManager],
+    event: str,
+    heartbeat_seconds: float,
+) -> AsyncIterator[str]:
+    """
+    Relay pre-encoded messages from a subscription as server-sent events.
+
+    Sends a comment line every `heartbeat_seconds` of silence to keep proxies from closing
+    the connection, and a `dropped` event when the subscriber fell behind and lost messages.
+    """
+    with subscribe() as subscription:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            message = await subscription.get(timeout=heartbeat_seconds)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            dropped = subscription.take_dropped()
+            if dropped:
+                yield f"event: dropped\ndata: {dropped}\n\n"
+            yield f"event: {event}\ndata: {message}\n\n"
+
+
+def sse_response(stream: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(stream, media_type="text/event-stream", headers=SSE_HEADERS)
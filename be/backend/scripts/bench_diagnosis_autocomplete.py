@@ -0,0 +1,122 @@
+"""
+Benchmark: ICD-10 diagnosis autocomplete index, memory and latency.
+
+Builds the DiagnosisIndex from the catalog (--catalog, default ICD10_CATALOG_PATH or the bundled
+subset) and, with --entries, from a synthetic catalog of that many codes grown from it the way
+the full classifications grow (subcodes qualifying their category: laterality, episode of care,
+complications), so that the footprint and latency of a full ICD-10 (~12,000 codes) or
+ICD-10-CM (~72,000) can be measured without the file. For each it reports the build time, the
+memory the index holds (tracemalloc), and p50 and p99 latency of typical queries (code
+prefixes, description words, a word being typed, misspellings) over --repeat runs each.
+
+Exits with an error if a query's p99 exceeds --target-ms. Needs no database.
+
+    python -m backend.scripts.bench_diagnosis_autocomplete --entries 72000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Tuple
+
+from backend.module.diagnosis.usecases.diagnosis_catalog import DiagnosisIndex, get_diagnosis_catalog, read_catalog
+
+_QUALIFIERS = [
+    "left", "right", "bilateral", "unspecified side", "initial encounter", "subsequent encounter", "sequela",
+    "with complication", "without complication", "acute", "chronic", "recurrent", "mild", "moderate", "severe",
+    "in remission", "with haemorrhage", "without haemorrhage", "with obstruction", "without obstruction",
+    "of upper limb", "of lower limb", "of trunk", "of head", "in pregnancy", "in childbirth", "of newborn",
+    "due to drug", "due to infection", "with coma", "without coma", "intractable", "not intractable",
+]
+
+QUERIES = [
+    ("code", "J06.9"),  # Exact
+    ("code", "E1"),  # Prefix of several categories
+    ("code", "j069"),  # As typed, without the dot
+    ("word", "diabetes"),
+    ("word", "pneu"),  # Being typed
+    ("words", "acute upper respiratory"),
+    ("words", "type 2 diabetes renal"),
+    ("code+word", "E11 renal"),
+    ("word", "a"),  # One letter: a whole word only (hepatitis A)
+    ("common words", "with pneumonia"),
+    ("misspelled", "pnemonia"),
+    ("misspelled", "hipertensi"),
+    ("none", "xyzzy"),
+]
+
+
+def synthetic(base: List[Tuple[str, str]], entries: int) -> List[Tuple[str, str]]:
+    """`entries` codes: the base catalog, then qualified subcodes of its codes."""
+    catalog = list(base[:entries])
+    n = 0
+    while len(catalog) < entries:
+        code, description = base[n % len(base)]
+        variant = n // len(base)
+        qualifiers = _QUALIFIERS[variant % len(_QUALIFIERS)], _QUALIFIERS[(variant * 7 + 3) % len(_QUALIFIERS)]
+        catalog.append((f"{code}{'' if '.' in code else '.'}{variant:03d}", f"{description}, {', '.join(qualifiers)}"))
+        n += 1
+    return catalog
+
+
+def build(catalog: List[Tuple[str, str]]) -> Tuple[DiagnosisIndex, float, int]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    index = DiagnosisIndex(catalog)
+    seconds = time.perf_counter() - started
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return index, seconds, held
+
+
+def measure(index: DiagnosisIndex, query: str, limit: int, repeat: int) -> dict:
+    matches = len(index.search(query, limit))  # Warm up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        index.search(query, limit)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "matches": matches,
+        "p50_ms": round(timings[len(timings) // 2] * 1000, 3),
+        "p99_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000, 3),
+    }
+
+
+def run(name: str, catalog: List[Tuple[str, str]], args, failed: list) -> dict:
+    index, seconds, held = build(catalog)
+    results = []
+    for kind, query in QUERIES:
+        result = {"kind": kind, "query": query, **measure(index, query, args.limit, args.repeat)}
+        if result["p99_ms"] > args.target_ms:
+            failed.append(f"{query} ({name})")
+        results.append(result)
+    return {
+        "catalog": name, "entries": len(index), "words": len(index.words), "trigrams": len(index.word_trigrams),
+        "build_seconds": round(seconds, 2), "memory_mb": round(held / 2**20, 2), "results": results,
+    }
+
+
+def main(args) -> None:
+    path = Path(args.catalog) if args.catalog else get_diagnosis_catalog().path
+    base = list(read_catalog(path))
+    failed: list = []
+    reports = [run(str(path), base, args, failed)]
+    if args.entries:
+        reports.append(run(f"synthetic from {path.name}", synthetic(base, args.entries), args, failed))
+
+    print(json.dumps({"target_p99_ms": args.target_ms, "limit": args.limit, "reports": reports}, indent=2))
+    if failed:
+        raise SystemExit(f"p99 above {args.target_ms} ms for: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the ICD-10 diagnosis autocomplete index")
+    parser.add_argument("--catalog", help="code<TAB>description file (default: the configured catalog)")
+    parser.add_argument("--entries", type=int, default=12000, help="Also bench a synthetic catalog this large (0: skip)")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=1000)
+    parser.add_argument("--target-ms", type=float, default=1.0)
+    main(parser.parse_args())
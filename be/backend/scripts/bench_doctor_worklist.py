@@ -0,0 +1,158 @@
+"""
+Benchmark: queries and latency of the doctor worklist as the day grows.
+
+Creates a temporary clinic and, for each size in --sizes, that many visits of the first doctor on
+a day of their own (with a medical record on half, a prescription and an invoice on a third and
+an open lab order on a quarter of them), then loads the worklist and counts the SQL statements it
+sends. The worklist must send the same number of statements at every size; the script exits with
+an error if it does not. For comparison it assembles the same data the way a client of the
+per-visit endpoints does (visit list, then record, prescription, invoice, patient and lab orders
+of each visit).
+
+    python -m backend.scripts.bench_doctor_worklist --sizes 1 10 100
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import date, datetime, time as day_time, timedelta, timezone
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.enums import OutcomeEnum, VisitStatusEnum
+from backend.module.invoice.entity.invoice import Invoice
+from backend.module.invoice.repositories.invoice_repository import InvoiceRepository
+from backend.module.lab.entity.lab import LabOrder, LabTest
+from backend.module.medical_record.entity.medical_record import MedicalRecord
+from backend.module.medical_record.repositories.medical_record_repository import MedicalRecordRepository
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.prescription.entity.prescription import Prescription
+from backend.module.prescription.repositories.prescription_repository import PrescriptionRepository
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.visit.entity.visit import Visit
+from backend.module.visit.repositories.visit_repository import VisitRepository
+from backend.module.visit.usecases.visit_usecase import VisitUseCase
+from sqlalchemy import delete, event, select
+from sqlalchemy.engine import Engine
+
+
+class StatementCounter:
+    def __init__(self):
+        self.count = 0
+        event.listen(Engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+async def per_visit_worklist(session, doctor_id, day: date) -> int:
+    """The worklist assembled from the per-visit lookups; returns the visits seen."""
+    start = datetime.combine(day, day_time.min, timezone.utc)
+    visits, _ = await VisitRepository(session).list_visits(
+        limit=10000, doctor_id=doctor_id, date_from=start, date_to=start + timedelta(days=1)
+    )
+    for visit in visits:
+        await MedicalRecordRepository(session).get_by_visit_id(visit.id)
+        await PrescriptionRepository(session).get_by_visit_id(visit.id)
+        await InvoiceRepository(session).get_by_visit_id(visit.id)
+        await session.get(Patient, visit.patient_id)
+        (await session.execute(select(LabOrder).where(LabOrder.visit_id == visit.id))).unique().scalars().all()
+        session.expunge_all()  # As separate requests would: nothing comes from the identity map
+    return len(visits)
+
+
+async def create_day(clinic_id, doctor_id, patient_id, staff_id, lab_test_id, day: date, size: int) -> None:
+    async for session in db_manager.get_session():
+        start = datetime.combine(day, day_time(8), timezone.utc)
+        visits = [
+            Visit(
+                patient_id=patient_id, doctor_id=doctor_id, registration_staff_id=staff_id, clinic_id=clinic_id,
+                queue_date=day, queue_number=i + 1, visit_datetime=start + timedelta(minutes=5 * i),
+                visit_status=VisitStatusEnum.REGISTERED, chief_complaint="Benchmark visit",
+            )
+            for i in range(size)
+        ]
+        session.add_all(visits)
+        await session.flush()
+        for i, visit in enumerate(visits):
+            if i % 2 == 0:
+                session.add(MedicalRecord(visit_id=visit.id, outcome=OutcomeEnum.RECOVERED if i % 4 == 0 else None))
+            if i % 3 == 0:
+                session.add(Prescription(visit_id=visit.id, doctor_id=doctor_id))
+                session.add(Invoice(visit_id=visit.id, cashier_id=staff_id))
+            if i % 4 == 1:
+                session.add(LabOrder(visit_id=visit.id, doctor_id=doctor_id, lab_test_id=lab_test_id))
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    counter = StatementCounter()
+    async for session in db_manager.get_session():
+        doctor_id = (await session.execute(select(Doctor.id).limit(1))).scalar()
+        patient_id = (await session.execute(select(Patient.id).limit(1))).scalar()
+        staff_id = (await session.execute(select(Staff.id).limit(1))).scalar()
+        lab_test_id = (await session.execute(select(LabTest.id).limit(1))).scalar()
+        if not all((doctor_id, patient_id, staff_id, lab_test_id)):
+            raise SystemExit("Needs a doctor, a patient, a staff member and a lab test (run backend.scripts.seed)")
+        clinic = Clinic(name="Worklist benchmark")
+        session.add(clinic)
+        await session.flush()
+        clinic_id = clinic.id
+
+    results = []
+    try:
+        for offset, size in enumerate(args.sizes):
+            day = date(2099, 1, 1) + timedelta(days=offset)
+            await create_day(clinic_id, doctor_id, patient_id, staff_id, lab_test_id, day, size)
+
+            async for session in db_manager.get_session():
+                usecase = VisitUseCase(VisitRepository(session))
+                counter.count = 0
+                worklist = await usecase.doctor_worklist(doctor_id, day)
+                worklist_statements = counter.count
+                timings = []
+                for _ in range(args.repeat):
+                    started = time.perf_counter()
+                    await usecase.doctor_worklist(doctor_id, day)
+                    timings.append(time.perf_counter() - started)
+
+                counter.count = 0
+                visits = await per_visit_worklist(session, doctor_id, day)
+                per_visit_statements = counter.count
+                started = time.perf_counter()
+                await per_visit_worklist(session, doctor_id, day)
+                per_visit_seconds = time.perf_counter() - started
+
+            results.append({
+                "visits": size,
+                "worklist": {
+                    "items": len(worklist),
+                    "statements": worklist_statements,
+                    "p50_ms": round(statistics.median(timings) * 1000, 2),
+                },
+                "per_visit": {
+                    "items": visits,
+                    "statements": per_visit_statements,
+                    "ms": round(per_visit_seconds * 1000, 2),
+                },
+            })
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(Visit).where(Visit.clinic_id == clinic_id))
+            await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+        await db_manager.close()
+
+    print(json.dumps(results, indent=2))
+    if len({result["worklist"]["statements"] for result in results}) > 1:
+        raise SystemExit("The worklist's statement count grows with the number of visits")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the doctor worklist")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100], help="Visits per day")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,185 @@
+"""
+Benchmark: legacy import throughput on generated data.
+
+Writes --patients patients (CSV) and --visits visits (NDJSON, half of them with a medical record)
+of the first doctor in a temporary clinic, with --invalid of the rows broken, and imports them
+with LegacyImportUseCase. Reports rows/s and rows/hour per file, checks that the broken rows were
+rejected and that importing the visits again inserts nothing, and for comparison creates
+--baseline visits one at a time through VisitUseCase.create_visit. Everything created is deleted
+afterwards.
+
+    python -m backend.scripts.bench_legacy_import --patients 20000 --visits 100000
+"""
+import argparse
+import asyncio
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.enums import VisitTypeEnum
+from backend.module.legacy_import.usecases.legacy_import import PATIENTS, VISITS, LegacyImportUseCase
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.user.entity.user import User
+from backend.module.visit.entity.visit_dto import VisitCreateDTO
+from backend.module.visit.repositories.visit_repository import VisitRepository
+from backend.module.visit.usecases.visit_usecase import VisitUseCase
+from sqlalchemy import delete, select
+
+PATIENT_FIELDS = ("nik", "full_name", "date_of_birth", "gender", "blood_type", "address", "phone_number")
+
+
+def nik_of(prefix: str, i: int) -> str:
+    return f"{prefix}{i:010d}"
+
+
+def write_patients(path: str, prefix: str, count: int, invalid: float, rng: random.Random) -> int:
+    broken = 0
+    with open(path, "w", newline="") as output:
+        writer = csv.DictWriter(output, PATIENT_FIELDS)
+        writer.writeheader()
+        for i in range(count):
+            row = {
+                "nik": nik_of(prefix, i),
+                "full_name": f"Legacy Patient {i}",
+                "date_of_birth": (date(1950, 1, 1) + timedelta(days=rng.randrange(25000))).isoformat(),
+                "gender": rng.choice("LP"),
+                "blood_type": rng.choice(["A", "B", "AB", "O", ""]),
+                "address": f"Jl. Legacy No. {i}",
+                "phone_number": f"08{rng.randrange(10**9):09d}",
+            }
+            if rng.random() < invalid:
+                row["nik"] = row["nik"][:10]
+                broken += 1
+            writer.writerow(row)
+    return broken
+
+
+def write_visits(
+    path: str, prefix: str, patients: int, count: int, doctor: str, clinic: str, invalid: float, rng: random.Random
+) -> int:
+    broken = 0
+    start = datetime(2015, 1, 1, 8)
+    with open(path, "w") as output:
+        for i in range(count):
+            row = {
+                "legacy_id": f"{prefix}-V{i}",
+                "patient_nik": nik_of(prefix, rng.randrange(patients)),
+                "doctor": doctor,
+                "clinic": clinic,
+                "visit_datetime": (start + timedelta(minutes=37 * i)).isoformat(),
+                "visit_type": rng.choice(list(VisitTypeEnum)).value,
+                "chief_complaint": "Fever and cough",
+            }
+            if i % 2 == 0:
+                row.update(
+                    anamnesis="3 days of fever", diagnosis="J06.9 Acute upper respiratory infection",
+                    treatment_plan="Paracetamol 500 mg", outcome="recovered",
+                )
+            if rng.random() < invalid:
+                row["clinic"] = "Closed clinic"
+                broken += 1
+            output.write(json.dumps(row) + "\n")
+    return broken
+
+
+async def run_import(kind: str, path: str, staff: str | None, restart: bool = False) -> dict:
+    usecase = LegacyImportUseCase(kind, staff_username=staff)
+    summary = await usecase.run(
+        path, "csv" if path.endswith(".csv") else "ndjson", f"{path}.checkpoint.json", f"{path}.rejects.ndjson",
+        restart,
+    )
+    return {
+        "rows": summary.rows,
+        "imported": summary.imported,
+        "skipped": summary.skipped,
+        "rejected": summary.rejected,
+        "seconds": round(summary.seconds, 2),
+        "rows_per_second": round(summary.rows_per_second),
+        "rows_per_hour": round(summary.rows_per_second * 3600),
+    }
+
+
+async def baseline(count: int, prefix: str, doctor_id, clinic_id, staff_id) -> dict:
+    async for session in db_manager.get_session():
+        patient_ids = (await session.execute(
+            select(Patient.id).where(Patient.nik.like(f"{prefix}%")).limit(count)
+        )).scalars().all()
+    started = time.perf_counter()
+    async for session in db_manager.get_session():
+        usecase = VisitUseCase(VisitRepository(session))
+        for i, patient_id in enumerate(patient_ids):
+            await usecase.create_visit(VisitCreateDTO(
+                patient_id=patient_id, doctor_id=doctor_id, clinic_id=clinic_id,
+                visit_datetime=datetime(2014, 1, 1, 8) + timedelta(minutes=5 * i), chief_complaint="Baseline",
+            ), staff_id)
+    seconds = time.perf_counter() - started
+    return {"rows": len(patient_ids), "rows_per_second": round(len(patient_ids) / seconds)}
+
+
+async def main(args) -> None:
+    rng = random.Random(args.seed)
+    prefix = f"99{rng.randrange(10**4):04d}"
+    db_manager.init_db()
+    async for session in db_manager.get_session():
+        doctor = (await session.execute(
+            select(Doctor.id, User.username).join(User, User.id == Doctor.user_id).limit(1)
+        )).first()
+        staff = (await session.execute(
+            select(Staff.id, User.username).join(User, User.id == Staff.user_id).limit(1)
+        )).first()
+        if not doctor or not staff:
+            raise SystemExit("Needs a doctor and a staff member (run backend.scripts.seed)")
+        clinic = Clinic(name=f"Legacy import benchmark {prefix}")
+        session.add(clinic)
+        await session.flush()
+        clinic_id, clinic_name = clinic.id, clinic.name
+
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            patients_path = os.path.join(directory, "patients.csv")
+            visits_path = os.path.join(directory, "visits.ndjson")
+            broken_patients = write_patients(patients_path, prefix, args.patients, args.invalid, rng)
+            broken_visits = write_visits(
+                visits_path, prefix, args.patients, args.visits, doctor.username, clinic_name, args.invalid, rng
+            )
+
+            results["patients"] = await run_import(PATIENTS, patients_path, None)
+            results["visits"] = await run_import(VISITS, visits_path, staff.username)
+            results["visits_again"] = await run_import(VISITS, visits_path, staff.username, restart=True)
+        results["baseline_create_visit"] = await baseline(args.baseline, prefix, doctor.id, clinic_id, staff.id)
+    finally:
+        async for session in db_manager.get_session():
+            user_ids = select(Patient.user_id).where(Patient.nik.like(f"{prefix}%")).scalar_subquery()
+            users = (await session.execute(select(User.id).where(User.id.in_(user_ids)))).scalars().all()
+            await session.execute(delete(Patient).where(Patient.nik.like(f"{prefix}%")))  # Cascades to visits
+            await session.execute(delete(User).where(User.id.in_(users)))
+            await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+        await db_manager.close()
+
+    print(json.dumps(results, indent=2))
+    # Broken patient rows can also orphan visits, which are then rejected as well
+    if results["patients"]["rejected"] != broken_patients or results["visits"]["rejected"] < broken_visits:
+        raise SystemExit("Broken rows were not all rejected")
+    if results["visits_again"]["imported"]:
+        raise SystemExit("Importing the same visits again inserted rows")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the legacy import")
+    parser.add_argument("--patients", type=int, default=20000)
+    parser.add_argument("--visits", type=int, default=100000)
+    parser.add_argument("--invalid", type=float, default=0.01, help="Share of broken rows")
+    parser.add_argument("--baseline", type=int, default=500, help="Visits created one at a time for comparison")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,165 @@
+"""
+Benchmark: medical record list screens, full records against summaries.
+
+Creates a temporary clinic with --records visits of the first doctor and patient, each with a
+medical record whose anamnesis, physical exam, treatment plan and notes are about --text-chars
+characters each (a diagnosis of a line or two), and a temporary admin to call the API as. Then
+requests the patient's records --repeat times a page of --limit, in-process through the API
+(auth, query, validation, serialization):
+
+- full: `GET /api/medical-records`, every column of every record;
+- summary: `GET /api/medical-records/summaries`, metadata and the start of the diagnosis.
+
+Reports the response size and p50 and p95 latency of each.
+
+    python -m backend.scripts.bench_medical_record_list --records 10000 --limit 100
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from uuid import uuid4
+
+from backend.api.server.app import app
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.infrastructure.security.password import get_password_hash
+from backend.module.common.enums import RoleEnum
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession
+from backend.module.user.entity.user import User
+from backend.module.visit.entity.visit import Visit
+from backend.scripts.bench_wearable_fleet import AsgiClient
+from sqlalchemy import delete, select, text
+
+API = settings.API_V1_STR
+
+_SENTENCES = [
+    "Pasien datang dengan keluhan demam sejak tiga hari disertai batuk berdahak dan pilek.",
+    "Nyeri kepala berdenyut terutama sore hari, mual tanpa muntah, nafsu makan menurun.",
+    "Riwayat hipertensi sejak lima tahun, kontrol tidak teratur, obat amlodipine 1x5 mg.",
+    "Keadaan umum tampak sakit sedang, kesadaran compos mentis, konjungtiva tidak anemis.",
+    "Pemeriksaan paru vesikuler kanan kiri, ronki basah halus di basal paru kanan.",
+    "Abdomen supel, nyeri tekan epigastrium, bising usus normal, hepar lien tidak teraba.",
+    "Edukasi minum air putih cukup, istirahat, kontrol ulang tiga hari atau bila memburuk.",
+    "Follow up in three days; refer to internal medicine if fever persists beyond a week.",
+]
+
+
+def _text(chars: int) -> str:
+    """SQL for about `chars` characters of clinical sentences, different per row."""
+    sentences = ", ".join("'" + sentence.replace("'", "''") + "'" for sentence in _SENTENCES)
+    count = max(chars // 85, 1)
+    return (
+        f"(SELECT string_agg((ARRAY[{sentences}])[1 + floor(random() * {len(_SENTENCES)})::int], ' ') "
+        f"FROM generate_series(1, {count} + (g.id IS NULL)::int))"
+    )
+
+
+async def seed(clinic_id, doctor_id, patient_id, staff_id, records: int, chars: int) -> None:
+    async for session in db_manager.get_session():
+        await session.execute(text("""
+            INSERT INTO visits (id, patient_id, doctor_id, registration_staff_id, clinic_id, visit_datetime,
+                                visit_type, visit_status, created_at, updated_at)
+            SELECT gen_random_uuid(), :patient_id, :doctor_id, :staff_id, :clinic_id,
+                   now() - g * interval '1 hour', 'GENERAL', 'COMPLETED', now(), now()
+            FROM generate_series(1, :records) g
+        """), {
+            "patient_id": patient_id, "doctor_id": doctor_id, "staff_id": staff_id, "clinic_id": clinic_id,
+            "records": records,
+        })
+        # The g.id reference makes each row's text a fresh draw rather than one shared subquery
+        await session.execute(text(f"""
+            INSERT INTO medical_records (id, visit_id, anamnesis, physical_exam, diagnosis, diagnosis_codes,
+                                         treatment_plan, doctor_notes, outcome, created_at, updated_at)
+            SELECT gen_random_uuid(), g.id, {_text(chars)}, {_text(chars)},
+                   'Infeksi saluran pernapasan akut dengan demam, suspek pneumonia komunitas; '
+                       || 'hipertensi esensial terkontrol sebagian, evaluasi ulang setelah terapi',
+                   ARRAY['J06.9', 'I10'], {_text(chars)}, {_text(chars)}, 'RECOVERED',
+                   g.visit_datetime, g.visit_datetime
+            FROM visits g WHERE g.clinic_id = :clinic_id
+        """), {"clinic_id": clinic_id})
+        await session.execute(text("ANALYZE visits"))
+        await session.execute(text("ANALYZE medical_records"))
+
+
+async def measure(client: AsgiClient, path: str, headers: dict, params: dict, repeat: int) -> dict:
+    status, body = await client.request("GET", path, headers=headers, params=params)  # Warm up
+    if status != 200:
+        raise SystemExit(f"GET {path} failed ({status}): {body[:200]!r}")
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await client.request("GET", path, headers=headers, params=params)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "records": len(json.loads(body)["data"]),
+        "response_bytes": len(body),
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+    }
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    username = f"bench-mrl-{uuid4().hex[:8]}"
+    async for session in db_manager.get_session():
+        doctor_id = (await session.execute(select(Doctor.id).limit(1))).scalar()
+        patient_id = (await session.execute(select(Patient.id).limit(1))).scalar()
+        staff_id = (await session.execute(select(Staff.id).limit(1))).scalar()
+        if not all((doctor_id, patient_id, staff_id)):
+            raise SystemExit("Needs a doctor, a patient and a staff member (run backend.scripts.seed)")
+        clinic = Clinic(name="Medical record list benchmark")
+        admin = User(
+            username=username, full_name="List Benchmark Admin", password_hash=get_password_hash("bench"),
+            role=RoleEnum.ADMIN, is_active=True
+        )
+        session.add_all([clinic, admin])
+        await session.flush()
+        clinic_id, admin_id = clinic.id, admin.id
+
+    client = AsgiClient(app)
+    try:
+        started = time.perf_counter()
+        await seed(clinic_id, doctor_id, patient_id, staff_id, args.records, args.text_chars)
+        seed_seconds = time.perf_counter() - started
+        async with app.router.lifespan_context(app):
+            status, body = await client.request(
+                "POST", f"{API}/auth/login", json.dumps({"username": username, "password": "bench"}).encode(),
+                {"content-type": "application/json"},
+            )
+            if status != 200:
+                raise SystemExit(f"Login failed ({status}): {body[:200]!r}")
+            headers = {"authorization": f"Bearer {json.loads(body)['data']['access_token']}"}
+            params = {"patient_id": str(patient_id), "limit": args.limit}
+            full = await measure(client, f"{API}/medical-records", headers, params, args.repeat)
+            summary = await measure(client, f"{API}/medical-records/summaries", headers, params, args.repeat)
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(Visit).where(Visit.clinic_id == clinic_id))
+            await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+            await session.execute(delete(UserSession).where(UserSession.user_id == admin_id))
+            await session.execute(delete(User).where(User.id == admin_id))
+        await db_manager.close()
+
+    print(json.dumps({
+        "records": args.records, "text_chars": args.text_chars, "seed_seconds": round(seed_seconds, 1),
+        "page_size": args.limit, "full": full, "summary": summary,
+        "response_ratio": round(summary["response_bytes"] / full["response_bytes"], 3),
+        "p50_speedup": round(full["p50_ms"] / summary["p50_ms"], 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark medical record lists: full records against summaries")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--text-chars", type=int, default=1500, help="Approximate length of each note column")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args))
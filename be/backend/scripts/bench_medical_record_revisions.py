@@ -0,0 +1,191 @@
+"""
+Benchmark: medical record revision history, storage growth and reconstruction latency.
+
+Creates a temporary clinic with --records visits of the first doctor and patient, creates a
+medical record for each (anamnesis, exam, plan and notes of about --text-chars characters)
+and edits each --edits times through MedicalRecordUseCase, one transaction per edit, the way a
+doctor revises notes: a sentence added, reworded or removed in one or two fields, sometimes the
+outcome. Snapshots are taken every --interval revisions (default
+MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL).
+
+Reports update latency, the stored size of the revisions (pg_column_size, so after TOAST
+compression) against the same history kept as full copies of every version, and p50/p95
+latency of rebuilding --reads random versions (one query plus the diffs), by distance from the
+nearest snapshot.
+
+    python -m backend.scripts.bench_medical_record_revisions --records 200 --edits 30
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.medical_record.entity.medical_record_dto import MedicalRecordCreateDTO, MedicalRecordUpdateDTO
+from backend.module.medical_record.repositories.medical_record_repository import MedicalRecordRepository
+from backend.module.medical_record.usecases.medical_record_revisions import TEXT_FIELDS, rebuild
+from backend.module.medical_record.usecases.medical_record_usecase import MedicalRecordUseCase
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.visit.entity.visit import Visit
+from backend.module.visit.repositories.visit_repository import VisitRepository
+from sqlalchemy import delete, select, text
+
+SENTENCES = [
+    "Pasien datang dengan keluhan demam sejak tiga hari disertai batuk berdahak dan pilek.",
+    "Nyeri kepala berdenyut terutama sore hari, mual tanpa muntah, nafsu makan menurun.",
+    "Riwayat hipertensi sejak lima tahun, kontrol tidak teratur, obat amlodipine 1x5 mg.",
+    "Keadaan umum tampak sakit sedang, kesadaran compos mentis, konjungtiva tidak anemis.",
+    "Pemeriksaan paru vesikuler kanan kiri, ronki basah halus di basal paru kanan.",
+    "Abdomen supel, nyeri tekan epigastrium, bising usus normal, hepar lien tidak teraba.",
+    "Tekanan darah 150/95 mmHg, nadi 88 kali per menit, suhu 38.2 C, saturasi 97 persen.",
+    "Edukasi minum air putih cukup, istirahat, kontrol ulang tiga hari atau bila memburuk.",
+    "Paracetamol 3x500 mg bila demam, ambroxol 3x30 mg, amoxicillin 3x500 mg lima hari.",
+    "Follow up in three days; refer to internal medicine if fever persists beyond a week.",
+]
+OUTCOMES = ["recovered", "follow_up", "referred"]
+
+
+def note(chars: int) -> str:
+    return " ".join(random.choice(SENTENCES) for _ in range(max(chars // 85, 1)))
+
+
+def revise(text_value: str) -> str:
+    """The note with a sentence added, reworded or removed."""
+    sentences = text_value.split(". ")
+    position = random.randrange(len(sentences))
+    action = random.random()
+    if action < 0.5:
+        sentences.insert(position, random.choice(SENTENCES).rstrip("."))
+    elif action < 0.8 or len(sentences) < 2:
+        words = sentences[position].split()
+        words[random.randrange(len(words))] = random.choice(["membaik", "menetap", "memberat", "tidak ada"])
+        sentences[position] = " ".join(words)
+    else:
+        del sentences[position]
+    return ". ".join(sentences)
+
+
+def percentiles(timings: list) -> dict:
+    timings = sorted(timings)
+    return {
+        "count": len(timings),
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+    }
+
+
+async def main(args) -> None:
+    random.seed(args.seed)
+    if args.interval:
+        settings.MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL = args.interval
+    db_manager.init_db()
+    async for session in db_manager.get_session():
+        doctor_id = (await session.execute(select(Doctor.id).limit(1))).scalar()
+        patient_id = (await session.execute(select(Patient.id).limit(1))).scalar()
+        staff_id = (await session.execute(select(Staff.id).limit(1))).scalar()
+        if not all((doctor_id, patient_id, staff_id)):
+            raise SystemExit("Needs a doctor, a patient and a staff member (run backend.scripts.seed)")
+        clinic = Clinic(name="Medical record revision benchmark")
+        session.add(clinic)
+        await session.flush()
+        clinic_id = clinic.id
+        visit_ids = (await session.execute(text("""
+            INSERT INTO visits (id, patient_id, doctor_id, registration_staff_id, clinic_id, visit_datetime,
+                                visit_type, visit_status, created_at, updated_at)
+            SELECT gen_random_uuid(), :patient_id, :doctor_id, :staff_id, :clinic_id,
+                   now() - g * interval '1 hour', 'GENERAL', 'COMPLETED', now(), now()
+            FROM generate_series(1, :records) g
+            RETURNING id
+        """), {
+            "patient_id": patient_id, "doctor_id": doctor_id, "staff_id": staff_id, "clinic_id": clinic_id,
+            "records": args.records,
+        })).scalars().all()
+
+    try:
+        record_ids, update_timings = [], []
+        for visit_id in visit_ids:
+            fields = {field: note(args.text_chars) for field in TEXT_FIELDS if field != "diagnosis"}
+            async for session in db_manager.get_session():
+                usecase = MedicalRecordUseCase(MedicalRecordRepository(session), VisitRepository(session))
+                record = await usecase.create_medical_record(MedicalRecordCreateDTO(
+                    visit_id=visit_id, diagnosis="Infeksi saluran pernapasan akut", **fields
+                ), doctor_id)
+                record_ids.append(record.id)
+            for _ in range(args.edits):
+                changes = {field: revise(fields[field]) for field in random.sample(sorted(fields), random.randint(1, 2))}
+                fields.update(changes)
+                if random.random() < 0.1:
+                    changes["outcome"] = random.choice(OUTCOMES)
+                started = time.perf_counter()
+                async for session in db_manager.get_session():
+                    usecase = MedicalRecordUseCase(MedicalRecordRepository(session), VisitRepository(session))
+                    await usecase.update_medical_record(record.id, MedicalRecordUpdateDTO(**changes), doctor_id)
+                update_timings.append(time.perf_counter() - started)
+
+        async for session in db_manager.get_session():
+            repository = MedicalRecordRepository(session)
+            stored = (await session.execute(text("""
+                SELECT count(*), count(*) FILTER (WHERE snapshot), sum(pg_column_size(changes))
+                FROM medical_record_revisions WHERE record_id = ANY(:ids)
+            """), {"ids": record_ids})).one()
+
+            # The same history as full copies: every version rebuilt, stored the way a snapshot is
+            await session.execute(text("CREATE TEMP TABLE full_history (version jsonb) ON COMMIT DROP"))
+            for record_id in record_ids:
+                versions = [
+                    {field: value for field, value in rebuild(await repository.get_revision_chain(record_id, n)).items()
+                     if value is not None}
+                    for n in range(1, args.edits + 2)
+                ]
+                await session.execute(
+                    text("INSERT INTO full_history SELECT jsonb_array_elements(CAST(:versions AS jsonb))"),
+                    {"versions": json.dumps(versions)}
+                )
+            full_bytes = (await session.execute(text("SELECT sum(pg_column_size(version)) FROM full_history"))).scalar()
+
+            rebuild_timings, by_depth = [], defaultdict(list)
+            for _ in range(args.reads):
+                record_id, revision = random.choice(record_ids), random.randint(1, args.edits + 1)
+                started = time.perf_counter()
+                chain = await repository.get_revision_chain(record_id, revision)
+                rebuild(chain)
+                elapsed = time.perf_counter() - started
+                rebuild_timings.append(elapsed)
+                by_depth[len(chain) - 1].append(elapsed)
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(Visit).where(Visit.clinic_id == clinic_id))
+            await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+        await db_manager.close()
+
+    revisions, snapshots, revision_bytes = stored
+    print(json.dumps({
+        "records": args.records, "edits": args.edits, "text_chars": args.text_chars,
+        "snapshot_interval": settings.MEDICAL_RECORD_REVISION_SNAPSHOT_INTERVAL,
+        "update": percentiles(update_timings),
+        "revisions": revisions, "snapshots": snapshots,
+        "revision_bytes": revision_bytes, "full_copy_bytes": full_bytes,
+        "storage_ratio": round(revision_bytes / full_bytes, 3),
+        "bytes_per_revision": round(revision_bytes / revisions),
+        "rebuild": percentiles(rebuild_timings),
+        "rebuild_by_diffs_applied": {depth: percentiles(timings) for depth, timings in sorted(by_depth.items())},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark medical record revision storage and reconstruction")
+    parser.add_argument("--records", type=int, default=200)
+    parser.add_argument("--edits", type=int, default=30, help="Updates per record")
+    parser.add_argument("--text-chars", type=int, default=1500, help="Approximate length of each note column")
+    parser.add_argument("--interval", type=int, help="Snapshot interval (default: the setting)")
+    parser.add_argument("--reads", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,173 @@
+"""
+Benchmark: full-text search of medical records against substring matching.
+
+Creates a temporary clinic with --records visits of the first doctor and patient, each with a
+generated medical record mixing Indonesian and English phrases (common, occasional and rare
+terms), then runs each query --repeat times two ways:
+
+- fts: MedicalRecordRepository.search_medical_records, as the search endpoint does (GIN index,
+  ranking, highlights of the page, total count);
+- ilike: the records whose text contains every word (`ilike '%word%'` on the five columns),
+  newest first, with the same page size and count.
+
+Reports p50 latency and the number of matches of each.
+
+    python -m backend.scripts.bench_medical_record_search --records 1000000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.medical_record.entity.medical_record import SEARCH_FIELDS, MedicalRecord
+from backend.module.medical_record.repositories.medical_record_repository import MedicalRecordRepository
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.visit.entity.visit import Visit
+from sqlalchemy import and_, delete, func, or_, select, text
+
+QUERIES = [
+    "demam",  # In about a third of the records
+    "demam berdarah dengue",  # A few percent
+    "acute bronchitis",  # English, a few percent
+    "batuk -pilek",  # Exclusion
+    "leptospirosis",  # Rare
+]
+
+_DIAGNOSES = [
+    "Demam berdarah dengue", "Infeksi saluran pernapasan akut", "Hipertensi esensial", "Diabetes melitus tipe 2",
+    "Gastritis akut", "Common cold", "Acute bronchitis", "Essential hypertension", "Low back pain",
+    "Dermatitis kontak", "Otitis media akut", "Migraine without aura", "Vertigo perifer", "Asma bronkial",
+    "Faringitis akut", "Konjungtivitis", "Gastroenteritis akut", "Tension type headache", "Anemia defisiensi besi",
+    "Infeksi saluran kemih",
+]
+_COMPLAINTS = [
+    "demam sejak tiga hari", "batuk berdahak", "pilek dan hidung tersumbat", "nyeri kepala berdenyut",
+    "mual dan muntah", "nyeri ulu hati", "sesak napas saat malam", "ruam kemerahan gatal", "pusing berputar",
+    "nyeri pinggang", "fever for two days", "productive cough", "sore throat", "shortness of breath",
+    "abdominal pain", "lemas dan nafsu makan turun", "nyeri sendi", "diare cair", "telinga berdenging",
+    "penglihatan kabur",
+]
+_PLANS = [
+    "Paracetamol 3x500 mg, istirahat cukup", "Amoxicillin 3x500 mg selama lima hari", "Kontrol tekanan darah",
+    "Edukasi diet rendah garam", "Omeprazole 2x20 mg", "Rehydration and follow up in three days",
+    "Cetirizine 1x10 mg", "Salbutamol inhaler bila sesak", "Metformin 2x500 mg", "Rujuk ke spesialis bila memburuk",
+]
+
+
+def _pick(words: list) -> str:
+    array = ", ".join("'" + word.replace("'", "''") + "'" for word in words)
+    return f"(ARRAY[{array}])[1 + floor(random() * {len(words)})::int]"
+
+
+async def seed(clinic_id, doctor_id, patient_id, staff_id, records: int) -> None:
+    async for session in db_manager.get_session():
+        await session.execute(text("""
+            INSERT INTO visits (id, patient_id, doctor_id, registration_staff_id, clinic_id, visit_datetime,
+                                visit_type, visit_status, created_at, updated_at)
+            SELECT gen_random_uuid(), :patient_id, :doctor_id, :staff_id, :clinic_id,
+                   now() - g * interval '1 minute', 'GENERAL', 'COMPLETED', now(), now()
+            FROM generate_series(1, :records) g
+        """), {
+            "patient_id": patient_id, "doctor_id": doctor_id, "staff_id": staff_id, "clinic_id": clinic_id,
+            "records": records,
+        })
+        await session.execute(text(f"""
+            INSERT INTO medical_records (id, visit_id, anamnesis, physical_exam, diagnosis, treatment_plan,
+                                         doctor_notes, created_at, updated_at)
+            SELECT gen_random_uuid(), id,
+                   'Pasien datang dengan keluhan ' || {_pick(_COMPLAINTS)} || ', ' || {_pick(_COMPLAINTS)},
+                   'Tekanan darah ' || (100 + floor(random() * 60)::int) || '/' || (60 + floor(random() * 40)::int)
+                       || ' mmHg, suhu ' || round((36 + random() * 3)::numeric, 1) || ' C',
+                   {_pick(_DIAGNOSES)} || CASE WHEN random() < 0.0002 THEN ', suspek leptospirosis' ELSE '' END,
+                   {_pick(_PLANS)},
+                   CASE WHEN random() < 0.3 THEN {_pick(_COMPLAINTS)} END,
+                   visit_datetime, visit_datetime
+            FROM visits WHERE clinic_id = :clinic_id
+        """), {"clinic_id": clinic_id})
+        await session.execute(text("ANALYZE visits"))
+        await session.execute(text("ANALYZE medical_records"))
+
+
+async def ilike_page(session, query: str, limit: int) -> int:
+    columns = [getattr(MedicalRecord, field) for field, _ in SEARCH_FIELDS]
+    words = [word for word in query.split() if not word.startswith("-")]
+    condition = and_(*(or_(*(column.ilike(f"%{word}%") for column in columns)) for word in words))
+    stmt = (
+        select(MedicalRecord.id, MedicalRecord.diagnosis)
+        .join(Visit, MedicalRecord.visit_id == Visit.id)
+        .where(condition)
+        .order_by(MedicalRecord.created_at.desc())
+        .limit(limit)
+    )
+    (await session.execute(stmt)).all()
+    count = select(func.count()).select_from(MedicalRecord).join(Visit, MedicalRecord.visit_id == Visit.id)
+    return (await session.execute(count.where(condition))).scalar()
+
+
+async def fts_page(session, query: str, limit: int) -> int:
+    repository = MedicalRecordRepository(session)
+    _, total = await repository.search_medical_records(query, settings.MEDICAL_RECORD_SEARCH_MAX_MATCHES, limit=limit)
+    return total
+
+
+async def measure(search, query: str, limit: int, repeat: int) -> dict:
+    async for session in db_manager.get_session():
+        matches = await search(session, query, limit)  # Warm up
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await search(session, query, limit)
+            timings.append(time.perf_counter() - started)
+    return {"matches": matches, "p50_ms": round(statistics.median(timings) * 1000, 2)}
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    async for session in db_manager.get_session():
+        doctor_id = (await session.execute(select(Doctor.id).limit(1))).scalar()
+        patient_id = (await session.execute(select(Patient.id).limit(1))).scalar()
+        staff_id = (await session.execute(select(Staff.id).limit(1))).scalar()
+        if not all((doctor_id, patient_id, staff_id)):
+            raise SystemExit("Needs a doctor, a patient and a staff member (run backend.scripts.seed)")
+        clinic = Clinic(name="Medical record search benchmark")
+        session.add(clinic)
+        await session.flush()
+        clinic_id = clinic.id
+
+    try:
+        started = time.perf_counter()
+        await seed(clinic_id, doctor_id, patient_id, staff_id, args.records)
+        seed_seconds = time.perf_counter() - started
+        results = []
+        for query in QUERIES:
+            results.append({
+                "query": query,
+                "fts": await measure(fts_page, query, args.limit, args.repeat),
+                "ilike": await measure(ilike_page, query, args.limit, args.ilike_repeat),
+            })
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(Visit).where(Visit.clinic_id == clinic_id))
+            await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+        await db_manager.close()
+
+    print(json.dumps({
+        "records": args.records, "seed_seconds": round(seed_seconds, 1), "page_size": args.limit, "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark full-text search of medical records")
+    parser.add_argument("--records", type=int, default=200000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--ilike-repeat", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,191 @@
+"""
+Benchmark: registration desk patient lookup at scale.
+
+Seeds --patients synthetic patients (Indonesian names from a few dozen first, middle and last
+names, so common names match many patients; region-coded NIKs; BPJS numbers on 70%), then runs
+each lookup --repeat times two ways:
+
+- lookup: PatientSearchUseCase.search_patients, as `GET /api/patients/search` does (NIK and
+  BPJS prefix indexes, trigram index on names where pg_trgm is installed);
+- ilike: the user list search filtered to patients (`ilike '%word%'` on username and full name,
+  with its total count), as the desk had to do before.
+
+Reports p50 and p95 latency and exits with an error if a lookup's p95 exceeds --target-ms.
+Without pg_trgm name lookups fall back to scans and are reported but not held to the target.
+Seeded patients are removed afterwards unless --keep; a later run reuses kept ones.
+
+    python -m backend.scripts.bench_patient_search --patients 5000000 --keep
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.common.enums import RoleEnum
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.profile.entity.models import Patient
+from backend.module.profile.repositories.patient_search_repository import PatientSearchRepository
+from backend.module.profile.usecases.patient_search import PatientSearchUseCase
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.user.entity.user import User
+from backend.module.user.repositories.user_repository import UserRepository
+from backend.module.visit.entity.visit import Visit  # noqa: F401
+from sqlalchemy import delete, func, select, text
+
+USERNAME_PREFIX = "bench-ps-"
+SEED_BATCH = 500000
+
+_FIRST = [
+    "Siti", "Muhammad", "Nur", "Dewi", "Agus", "Budi", "Sri", "Ahmad", "Putri", "Rina", "Andi", "Eko", "Wahyu",
+    "Dian", "Indah", "Hendra", "Rizky", "Fitri", "Yusuf", "Ayu", "Bambang", "Lestari", "Joko", "Ratna", "Fajar",
+    "Maya", "Rudi", "Wulan", "Teguh", "Kartika", "Hadi", "Nia", "Arif", "Sinta", "Dedi", "Yuni", "Irfan", "Ani",
+]
+_MIDDLE = [
+    "", "", "", "Nur", "Dwi", "Tri", "Adi", "Eka", "Sari", "Putra", "Putri", "Indra", "Ayu", "Surya", "Bayu",
+    "Cahya", "Dharma", "Kusuma", "Wijaya", "Rahma", "Aulia", "Permata", "Intan", "Pratama",
+]
+_LAST = [
+    "Santoso", "Rahmawati", "Wijaya", "Saputra", "Hidayat", "Kurniawan", "Setiawan", "Lestari", "Susanto",
+    "Pratiwi", "Nugroho", "Hartono", "Siregar", "Nasution", "Simanjuntak", "Sitompul", "Harahap", "Lubis",
+    "Purnomo", "Wibowo", "Gunawan", "Permana", "Suryadi", "Halim", "Kusnadi", "Firmansyah", "Ramadhan",
+    "Maulana", "Anggraini", "Handayani", "Utami", "Wulandari", "Syahputra", "Tanjung", "Daulay", "Manurung",
+]
+_REGIONS = [
+    "317101", "317201", "317301", "317401", "317501", "320101", "320401", "320501", "327301", "327501",
+    "330101", "331201", "337401", "340101", "347101", "350101", "351501", "357801", "360301", "367101",
+    "510101", "517101", "120101", "127101", "130101", "137101", "160101", "167101", "180101", "187101",
+    "610101", "617101", "640101", "647101", "710101", "717101", "730101", "737101", "810101", "817101",
+]
+
+
+def _pick(words: list, seed: str) -> str:
+    """A deterministic pick per row (hash of `seed`), so kept data answers the same queries."""
+    array = ", ".join("'" + word.replace("'", "''") + "'" for word in words)
+    return f"(ARRAY[{array}])[1 + abs(hashtext({seed})) % {len(words)}]"
+
+
+def nik_of(g: int) -> str:
+    return _REGIONS[g % len(_REGIONS)] + str(g // len(_REGIONS)).zfill(10)
+
+
+def bpjs_of(g: int) -> str:
+    return "000" + str(g).zfill(10)
+
+
+async def seed(patients: int) -> int:
+    """Top the benchmark patients up to `patients` (1..n); returns how many were inserted."""
+    async for session in db_manager.get_session():
+        existing = (await session.execute(
+            select(func.count()).select_from(User).where(User.username.like(f"{USERNAME_PREFIX}%"))
+        )).scalar()
+    regions = ", ".join(f"'{region}'" for region in _REGIONS)
+    for start in range(existing + 1, patients + 1, SEED_BATCH):
+        end = min(start + SEED_BATCH - 1, patients)
+        async for session in db_manager.get_session():
+            await session.execute(text(f"""
+                WITH new_users AS (
+                    INSERT INTO users (id, username, password_hash, full_name, role, is_active, created_at, updated_at)
+                    SELECT gen_random_uuid(), '{USERNAME_PREFIX}' || g, '!',
+                           concat_ws(' ', {_pick(_FIRST, "g::text || 'f'")},
+                                     nullif({_pick(_MIDDLE, "g::text || 'm'")}, ''), {_pick(_LAST, "g::text || 'l'")}),
+                           'PATIENT', true, now(), now()
+                    FROM generate_series(CAST(:start AS int), CAST(:end AS int)) g
+                    RETURNING id, substr(username, {len(USERNAME_PREFIX) + 1})::int AS g
+                )
+                INSERT INTO patients (id, user_id, nik, bpjs_number, date_of_birth, gender)
+                SELECT gen_random_uuid(), id,
+                       (ARRAY[{regions}])[1 + g % {len(_REGIONS)}] || lpad((g / {len(_REGIONS)})::text, 10, '0'),
+                       CASE WHEN g % 10 < 7 THEN '000' || lpad(g::text, 10, '0') END,
+                       date '1950-01-01' + g % 25000,
+                       CASE WHEN g % 2 = 0 THEN 'MALE' ELSE 'FEMALE' END::gender_enum
+                FROM new_users
+            """), {"start": start, "end": end})
+    async for session in db_manager.get_session():
+        await session.execute(text("ANALYZE users"))
+        await session.execute(text("ANALYZE patients"))
+    return max(patients - existing, 0)
+
+
+async def lookup(session, query: str, limit: int) -> int:
+    return len(await PatientSearchUseCase(PatientSearchRepository(session)).search_patients(query, limit))
+
+
+async def ilike(session, query: str, limit: int) -> int:
+    users, _ = await UserRepository(session).list_users(1, limit, query, [RoleEnum.PATIENT.value])
+    return len(users)
+
+
+async def measure(search, query: str, limit: int, repeat: int) -> dict:
+    async for session in db_manager.get_session():
+        matches = await search(session, query, limit)  # Warm up
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await search(session, query, limit)
+            timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "matches": matches,
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+    }
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    g = max(args.patients // 2, 1)
+    queries = [
+        ("nik", nik_of(g)),  # Exact
+        ("nik", nik_of(g)[:10]),  # Leading digits
+        ("bpjs", bpjs_of(g - g % 10)),  # Exact (patients numbered n % 10 < 7 have one)
+        ("name", "Siti Rahmawati"),
+        ("name", "rahmaw"),  # Partial
+        ("name", "Sity Rahmawaty"),  # Misspelled
+        ("name", "Siti"),  # One of the commonest first names
+        ("name", "Simanjuntak Kusnadi"),  # Unusual combination
+    ]
+    try:
+        started = time.perf_counter()
+        inserted = await seed(args.patients)
+        seed_seconds = time.perf_counter() - started
+        async for session in db_manager.get_session():
+            trigram = await PatientSearchRepository(session).has_trigram()
+
+        results, failed = [], []
+        for kind, query in queries:
+            result = {"kind": kind, "query": query, "lookup": await measure(lookup, query, args.limit, args.repeat)}
+            if kind == "name":
+                result["ilike"] = await measure(ilike, query, args.limit, args.ilike_repeat)
+            held = kind != "name" or trigram
+            if held and result["lookup"]["p95_ms"] > args.target_ms:
+                failed.append(query)
+            results.append(result)
+    finally:
+        if not args.keep:
+            async for session in db_manager.get_session():
+                bench_users = select(User.id).where(User.username.like(f"{USERNAME_PREFIX}%"))
+                await session.execute(delete(Patient).where(Patient.user_id.in_(bench_users)))
+                await session.execute(delete(User).where(User.username.like(f"{USERNAME_PREFIX}%")))
+        await db_manager.close()
+
+    print(json.dumps({
+        "patients": args.patients, "inserted": inserted, "seed_seconds": round(seed_seconds, 1),
+        "trigram": trigram, "target_p95_ms": args.target_ms, "results": results,
+    }, indent=2))
+    if failed:
+        raise SystemExit(f"p95 above {args.target_ms} ms for: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark patient lookup by NIK, BPJS number and name")
+    parser.add_argument("--patients", type=int, default=1000000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--ilike-repeat", type=int, default=3)
+    parser.add_argument("--target-ms", type=float, default=50.0)
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded patients for the next run")
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,150 @@
+"""
+Benchmark: first-free-slot search over cached availability bitmaps.
+
+Builds an in-memory clinic of --doctors doctors over --specialties specialties, each scheduled
+08:00-16:00 on weekdays for SCHEDULE_HORIZON_DAYS, with --booked of their slots taken, and runs
+--repeat searches for the first --count free slots of one specialty from a random day, two ways:
+
+- bitmaps: ClinicAvailability.search, as GET /clinics/{clinic_id}/slots does;
+- slot scan: walking the days slot by slot and checking each doctor's open and booked slot sets,
+  as a search over schedule blocks and visits without bitmaps would.
+
+Also reports the memory held by the clinic's cached bitmaps (tracemalloc) and the cost of
+applying one booked-slot update. Needs no database.
+
+    python -m backend.scripts.bench_slot_search --doctors 300 --booked 0.9
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import date, time as day_time, timedelta
+from types import SimpleNamespace
+
+from backend.infrastructure.config.settings import settings
+from backend.module.schedule.usecases.doctor_availability import (
+    SLOTS_PER_DAY,
+    ClinicAvailability,
+    decode_mask,
+    encode_mask,
+    schedule_mask,
+)
+
+
+def build_rows(args, today: date) -> list:
+    rng = random.Random(args.seed)
+    open_slots = schedule_mask([(day_time(8), day_time(16))])
+    open_indexes = [i for i in range(SLOTS_PER_DAY) if open_slots >> i & 1]
+    rows = []
+    for n in range(args.doctors):
+        doctor_id = uuid.uuid4()
+        specialty = f"Specialty {n % args.specialties}"
+        for offset in range(settings.SCHEDULE_HORIZON_DAYS):
+            day = today + timedelta(days=offset)
+            if day.weekday() >= 5:
+                continue
+            booked = 0
+            for i in open_indexes:
+                if rng.random() < args.booked:
+                    booked |= 1 << i
+            rows.append(SimpleNamespace(
+                doctor_id=doctor_id, day=day, open_slots=encode_mask(open_slots), booked_slots=encode_mask(booked),
+                specialty=specialty, full_name=f"Doctor {n:04d}",
+            ))
+    return rows
+
+
+def slot_scan(index: dict, doctor_ids: list, start_day: date, last_day: date, count: int) -> list:
+    """index: (doctor, day) -> (open slot set, booked slot set)."""
+    found = []
+    day = start_day
+    while day <= last_day and len(found) < count:
+        for slot in range(SLOTS_PER_DAY):
+            free = []
+            for doctor_id in doctor_ids:
+                slots = index.get((doctor_id, day))
+                if slots and slot in slots[0] and slot not in slots[1]:
+                    free.append(doctor_id)
+            if free:
+                found.append((day, slot, free))
+                if len(found) == count:
+                    break
+        day += timedelta(days=1)
+    return found
+
+
+def timed(search, starts: list) -> tuple:
+    timings, results = [], []
+    for start_day in starts:
+        started = time.perf_counter()
+        results.append(search(start_day))
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), results
+
+
+def main(args) -> None:
+    today = date.today()
+    last_day = today + timedelta(days=settings.SCHEDULE_HORIZON_DAYS - 1)
+    rows = build_rows(args, today)
+
+    tracemalloc.start()
+    clinic = ClinicAvailability(uuid.uuid4(), rows)
+    cache_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    index = {}
+    for row in rows:
+        open_slots, booked = decode_mask(row.open_slots), decode_mask(row.booked_slots)
+        index[(row.doctor_id, row.day)] = (
+            {i for i in range(SLOTS_PER_DAY) if open_slots >> i & 1},
+            {i for i in range(SLOTS_PER_DAY) if booked >> i & 1},
+        )
+
+    specialty = "Specialty 0"
+    doctor_ids = clinic.by_specialty[specialty.casefold()]
+    rng = random.Random(args.seed)
+    starts = [today + timedelta(days=rng.randrange(settings.SCHEDULE_HORIZON_DAYS // 2)) for _ in range(args.repeat)]
+
+    bitmap_p50, bitmap_results = timed(
+        lambda start_day: clinic.search(specialty, start_day, 0, last_day, args.count), starts
+    )
+    scan_p50, scan_results = timed(
+        lambda start_day: slot_scan(index, doctor_ids, start_day, last_day, args.count), starts
+    )
+    if bitmap_results != scan_results:
+        raise SystemExit("Bitmap search and slot scan disagree")
+
+    row = rows[0]
+    message = {"doctor_id": str(row.doctor_id), "day": row.day.isoformat(), "booked": format(decode_mask(row.booked_slots), "x")}
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        clinic.apply(message)
+    apply_us = (time.perf_counter() - started) / args.repeat * 1e6
+
+    print(json.dumps({
+        "doctors": args.doctors,
+        "doctors_in_specialty": len(doctor_ids),
+        "horizon_days": settings.SCHEDULE_HORIZON_DAYS,
+        "doctor_days": len(rows),
+        "booked_ratio": args.booked,
+        "count": args.count,
+        "bitmap_search_p50_ms": round(bitmap_p50 * 1000, 3),
+        "slot_scan_p50_ms": round(scan_p50 * 1000, 3),
+        "apply_update_us": round(apply_us, 2),
+        "cache_memory_kb": round(cache_bytes / 1024, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the appointment slot search")
+    parser.add_argument("--doctors", type=int, default=300)
+    parser.add_argument("--specialties", type=int, default=10)
+    parser.add_argument("--booked", type=float, default=0.9, help="Share of open slots already booked")
+    parser.add_argument("--count", type=int, default=10, help="Slots per search")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    main(args)
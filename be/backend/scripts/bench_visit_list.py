@@ -0,0 +1,146 @@
+"""
+Benchmark: visit list page as a column projection vs loading entities.
+
+Creates a temporary clinic with --visits visits of the first doctor and patient and serves the
+first page of --page-size from it, --repeat times, three ways:
+
+- projection: VisitRepository.list_visit_rows (visit columns plus patient, doctor and clinic
+  names in one query), as the list endpoint does;
+- entities: Visit entities with patient, doctor and clinic (and their users) eager-loaded
+  to get the same names;
+- bare entities: Visit entities without names, as the endpoint returned before.
+
+Reports p50 latency, statements and the peak Python memory (tracemalloc) of building one page.
+
+    python -m backend.scripts.bench_visit_list --visits 1000 --page-size 100
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.common.enums import VisitStatusEnum
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.visit.entity.visit import Visit
+from backend.module.visit.entity.visit_dto import VisitDTO, VisitListItemDTO
+from backend.module.visit.repositories.visit_repository import VisitRepository
+from backend.scripts.bench_doctor_worklist import StatementCounter
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import joinedload
+
+
+async def projection_page(session, clinic_id, page_size: int) -> list:
+    rows, _ = await VisitRepository(session).list_visit_rows(page=1, limit=page_size, clinic_id=clinic_id)
+    return [VisitListItemDTO.model_validate(row).model_dump(mode="json") for row in rows]
+
+
+async def entity_page(session, clinic_id, page_size: int) -> list:
+    stmt = (
+        select(Visit)
+        .options(
+            joinedload(Visit.patient).joinedload(Patient.user),
+            joinedload(Visit.doctor).joinedload(Doctor.user),
+            joinedload(Visit.clinic),
+        )
+        .where(Visit.clinic_id == clinic_id)
+        .order_by(Visit.visit_datetime.desc())
+        .limit(page_size)
+    )
+    visits = (await session.execute(stmt)).scalars().all()
+    page = [
+        VisitListItemDTO(
+            **VisitDTO.model_validate(visit).model_dump(),
+            patient_name=visit.patient.user.full_name,
+            doctor_name=visit.doctor.user.full_name,
+            clinic_name=visit.clinic.name,
+        ).model_dump(mode="json")
+        for visit in visits
+    ]
+    session.expunge_all()  # As a new request would: nothing comes from the identity map
+    return page
+
+
+async def bare_entity_page(session, clinic_id, page_size: int) -> list:
+    visits, _ = await VisitRepository(session).list_visits(page=1, limit=page_size, clinic_id=clinic_id)
+    page = [VisitDTO.model_validate(visit).model_dump(mode="json") for visit in visits]
+    session.expunge_all()
+    return page
+
+
+async def measure(name: str, build, clinic_id, page_size: int, repeat: int, counter: StatementCounter) -> dict:
+    async for session in db_manager.get_session():
+        await build(session, clinic_id, page_size)  # Warm up statement caches
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await build(session, clinic_id, page_size)
+            timings.append(time.perf_counter() - started)
+
+        counter.count = 0
+        tracemalloc.start()
+        page = await build(session, clinic_id, page_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return {
+        "method": name,
+        "rows": len(page),
+        "statements": counter.count,
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "response_bytes": len(json.dumps(page)),
+    }
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    counter = StatementCounter()
+    async for session in db_manager.get_session():
+        doctor_id = (await session.execute(select(Doctor.id).limit(1))).scalar()
+        patient_id = (await session.execute(select(Patient.id).limit(1))).scalar()
+        staff_id = (await session.execute(select(Staff.id).limit(1))).scalar()
+        if not all((doctor_id, patient_id, staff_id)):
+            raise SystemExit("Needs a doctor, a patient and a staff member (run backend.scripts.seed)")
+        clinic = Clinic(name="Visit list benchmark")
+        session.add(clinic)
+        await session.flush()
+        clinic_id = clinic.id
+        start = datetime.now(timezone.utc) - timedelta(minutes=args.visits)
+        await session.execute(insert(Visit), [
+            {
+                "patient_id": patient_id, "doctor_id": doctor_id, "registration_staff_id": staff_id,
+                "clinic_id": clinic_id, "visit_datetime": start + timedelta(minutes=i),
+                "visit_status": VisitStatusEnum.REGISTERED, "chief_complaint": f"Benchmark visit {i}",
+            }
+            for i in range(args.visits)
+        ])
+
+    try:
+        results = [
+            await measure(name, build, clinic_id, args.page_size, args.repeat, counter)
+            for name, build in (
+                ("projection", projection_page),
+                ("entities", entity_page),
+                ("bare_entities", bare_entity_page),
+            )
+        ]
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(Visit).where(Visit.clinic_id == clinic_id))
+            await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+        await db_manager.close()
+
+    print(json.dumps({"visits": args.visits, "page_size": args.page_size, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the visit list projection")
+    parser.add_argument("--visits", type=int, default=1000)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args))
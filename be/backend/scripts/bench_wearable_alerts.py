@@ -0,0 +1,157 @@
+"""
+Benchmark: readings evaluated per second by the vitals anomaly rules.
+
+Builds a synthetic batch (N devices x M readings, with injected spikes) and times the vectorized
+detector against a straightforward per-reading loop implementing the same rules. With --db it also
+times one end-to-end alert pass (load window, detect, insert alerts) over whatever is pending in
+the configured database, e.g. after `bench_wearable_rollup` generated readings.
+
+    python -m backend.scripts.bench_wearable_alerts --devices 500 --readings 2000
+    python -m backend.scripts.bench_wearable_alerts --db
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+
+import numpy as np
+
+from backend.module.common.enums import WearableMetricEnum
+from backend.module.wearable.usecases.wearable_anomaly_detector import (
+    DEFAULT_THRESHOLDS,
+    RATE_OF_CHANGE,
+    ZSCORE_LIMIT,
+    ZSCORE_MIN_PERIODS,
+    ZSCORE_WINDOW,
+    VitalsWindow,
+    detect_anomalies,
+)
+
+BASELINE = {
+    WearableMetricEnum.HEART_RATE: (75, 6),
+    WearableMetricEnum.SYSTOLIC_BP: (118, 6),
+    WearableMetricEnum.DIASTOLIC_BP: (78, 4),
+    WearableMetricEnum.BODY_TEMPERATURE: (36.9, 0.2),
+    WearableMetricEnum.SPO2: (97.5, 1),
+}
+
+
+def synthetic_window(devices: int, readings: int, interval: int, seed: int = 7) -> VitalsWindow:
+    rng = np.random.default_rng(seed)
+    n = devices * readings
+    values = {}
+    for metric, (mean, std) in BASELINE.items():
+        series = rng.normal(mean, std, n)
+        spikes = rng.random(n) < 0.002
+        series[spikes] += rng.choice([-1, 1], spikes.sum()) * std * 8
+        series[rng.random(n) < 0.05] = np.nan  # Metric not reported by every reading
+        values[metric] = np.round(series, 1)
+    return VitalsWindow(
+        device_index=np.repeat(np.arange(devices), readings),
+        timestamps=np.tile(np.arange(readings, dtype=np.float64) * interval, devices),
+        is_new=np.ones(n, dtype=bool),
+        values=values,
+    )
+
+
+def default_bounds(devices: int):
+    low = {m: np.full(devices, np.nan if lo is None else lo) for m, (lo, _) in DEFAULT_THRESHOLDS.items()}
+    high = {m: np.full(devices, np.nan if hi is None else hi) for m, (_, hi) in DEFAULT_THRESHOLDS.items()}
+    return low, high
+
+
+def loop_detect(window: VitalsWindow, low, high) -> int:
+    """Reference per-reading implementation of the same rules."""
+    hits = 0
+    device = window.device_index.tolist()
+    ts = window.timestamps.tolist()
+    for metric, array in window.values.items():
+        values = array.tolist()
+        lows, highs = low[metric].tolist(), high[metric].tolist()
+        max_delta, within = RATE_OF_CHANGE[metric]
+        history = []
+        for i, value in enumerate(values):
+            if i and device[i] != device[i - 1]:
+                history = []
+            if not math.isnan(value):
+                hits += value < lows[device[i]]
+                hits += value > highs[device[i]]
+                recent = [v for v in history[-ZSCORE_WINDOW:] if not math.isnan(v)]
+                if len(recent) >= ZSCORE_MIN_PERIODS:
+                    mean = sum(recent) / len(recent)
+                    std = math.sqrt(max(sum(v * v for v in recent) / len(recent) - mean * mean, 0.0))
+                    hits += std > 1e-9 and abs(value - mean) / std >= ZSCORE_LIMIT
+                if i and device[i] == device[i - 1] and ts[i] - ts[i - 1] <= within:
+                    prev = values[i - 1]
+                    hits += not math.isnan(prev) and abs(value - prev) > max_delta
+            history.append(value)
+    return hits
+
+
+def bench_memory(devices: int, readings: int, interval: int, repeat: int) -> dict:
+    window = synthetic_window(devices, readings, interval)
+    low, high = default_bounds(devices)
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        hits = detect_anomalies(window, low, high)
+        samples.append(time.perf_counter() - started)
+    vectorized = min(samples)
+    vectorized_hits = sum(len(h.rows) for h in hits)
+
+    # The loop is slow; evaluate a slice of devices and extrapolate the rate
+    loop_devices = max(1, min(devices, 20_000 // readings))
+    subset = synthetic_window(loop_devices, readings, interval)
+    sub_low, sub_high = default_bounds(loop_devices)
+    started = time.perf_counter()
+    loop_hits = loop_detect(subset, sub_low, sub_high)
+    loop_seconds = time.perf_counter() - started
+    subset_hits = sum(len(h.rows) for h in detect_anomalies(subset, sub_low, sub_high))
+
+    return {
+        "devices": devices,
+        "readings": len(window),
+        "alerts": vectorized_hits,
+        "vectorized_seconds": round(vectorized, 4),
+        "vectorized_readings_per_second": round(len(window) / vectorized),
+        "loop_readings_per_second": round(len(subset) / loop_seconds),
+        "speedup": round((len(window) / vectorized) / (len(subset) / loop_seconds), 1),
+        "loop_matches_vectorized": loop_hits == subset_hits,
+    }
+
+
+async def bench_db() -> dict:
+    from backend.infrastructure.database.connection import db_manager
+    from backend.scripts.wearable_alerts import run_alert_pass
+
+    db_manager.init_db()
+    try:
+        started = time.perf_counter()
+        devices, readings, alerts = await run_alert_pass()
+        elapsed = time.perf_counter() - started
+    finally:
+        await db_manager.close()
+    return {
+        "devices": devices,
+        "readings": readings,
+        "alerts": alerts,
+        "seconds": round(elapsed, 3),
+        "readings_per_second": round(readings / elapsed) if readings else 0,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark vitals anomaly detection throughput")
+    parser.add_argument("--devices", type=int, default=500)
+    parser.add_argument("--readings", type=int, default=2000, help="Readings per device")
+    parser.add_argument("--interval", type=int, default=60, help="Seconds between synthetic readings")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db", action="store_true", help="Also time one end-to-end alert pass against the database")
+    args = parser.parse_args()
+
+    results = {"in_memory": bench_memory(args.devices, args.readings, args.interval, args.repeat)}
+    if args.db:
+        results["end_to_end"] = asyncio.run(bench_db())
+    print(json.dumps(results, indent=2))
@@ -0,0 +1,126 @@
+"""
+Benchmark: authentication overhead per ingestion batch, patient JWT vs device API key.
+
+The JWT path is what an upload costs today before any reading is stored: token decode, the
+user_sessions and users lookups in get_current_user, and the device ownership fetch in
+add_measurement. The device-key path verifies an HMAC over the raw batch body against the key
+cache (hit), and once against the database (miss). Uses the `bench_wearable_rollup` patient.
+
+    python -m backend.scripts.bench_wearable_device_auth --batches 1,100,1000 --iterations 500
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from backend.api.middleware.auth import get_current_user
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.security.hmac_utils import (
+    decode_access_token,
+    derive_device_secret,
+    generate_device_key_id,
+    sign_device_request,
+)
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.profile.repositories.profile_repository import ProfileRepository
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.repositories.session_repository import SessionRepository
+from backend.module.user.entity.auth_dto import LoginDTO
+from backend.module.user.repositories.user_repository import UserRepository
+from backend.module.user.usecases.auth_usecase import AuthUseCase
+from backend.module.visit.entity.visit import Visit  # noqa: F401
+from backend.module.wearable.entity.wearable import WearableDevice, WearableDeviceKey
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.usecases.wearable_device_auth import (
+    DeviceKeyCache,
+    DeviceReplayCache,
+    WearableDeviceAuthUseCase,
+)
+from backend.scripts.bench_wearable_rollup import BENCH_USERNAME
+from sqlalchemy import delete, select
+
+
+def batch_body(size: int) -> bytes:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return json.dumps({"readings": [
+        {"recorded_at": (start + timedelta(seconds=i)).isoformat(), "heart_rate": 72, "spo2": 98, "steps": 10}
+        for i in range(size)
+    ]}).encode()
+
+
+def summarize(samples: list, size: int) -> dict:
+    samples = sorted(samples)
+    p50 = statistics.median(samples)
+    return {
+        "p50_us": round(p50 * 1e6, 1),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 1),
+        "per_reading_us": round(p50 * 1e6 / size, 2),
+    }
+
+
+async def main(batches, iterations: int) -> None:
+    db_manager.init_db()
+    key_id = generate_device_key_id()
+    try:
+        async for session in db_manager.get_session():
+            auth = AuthUseCase(UserRepository(session), SessionRepository(session), ProfileRepository(session))
+            token = (await auth.login(LoginDTO(username=BENCH_USERNAME, password="bench"))).access_token
+            patient_id = decode_access_token(token)["profile_id"]
+            device_id = (await session.execute(
+                select(WearableDevice.id).where(WearableDevice.patient_id == patient_id)
+            )).scalars().first()
+            session.add(WearableDeviceKey(key_id=key_id, device_id=device_id))
+
+        secret = derive_device_secret(key_id)
+        results = {}
+        async for session in db_manager.get_session():
+            repository = WearableRepository(session)
+
+            async def jwt_auth(_body):
+                decode_access_token(token)
+                await get_current_user(token, session)
+                await repository.get_device_by_id(device_id)
+
+            cache = DeviceKeyCache(ttl_seconds=3600, max_keys=10)
+            replays = DeviceReplayCache(max_entries=10)
+            device_auth = WearableDeviceAuthUseCase(repository, cache, replays)
+
+            async def key_auth(body, timestamp, signature, cold=False):
+                if cold:
+                    cache.invalidate(key_id)
+                replays.clear()  # The same signed request is sent every iteration
+                await device_auth.authenticate(key_id, timestamp, signature, body)
+
+            for size in batches:
+                body = batch_body(size)
+                timestamp = str(int(time.time()))
+                signature = sign_device_request(secret, timestamp, body)
+                row = {}
+                for name, call in (
+                    ("jwt", lambda: jwt_auth(body)),
+                    ("device_key_cached", lambda: key_auth(body, timestamp, signature)),
+                    ("device_key_uncached", lambda: key_auth(body, timestamp, signature, cold=True)),
+                ):
+                    samples = []
+                    for _ in range(iterations):
+                        t0 = time.perf_counter()
+                        await call()
+                        samples.append(time.perf_counter() - t0)
+                    row[name] = summarize(samples, size)
+                row["speedup_cached_vs_jwt"] = round(row["jwt"]["p50_us"] / row["device_key_cached"]["p50_us"], 1)
+                results[f"batch_{size}"] = row
+        print(json.dumps(results, indent=2))
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(WearableDeviceKey).where(WearableDeviceKey.key_id == key_id))
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ingestion auth overhead per batch")
+    parser.add_argument("--batches", default="1,100,1000", help="Comma-separated readings per batch")
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main([int(b) for b in args.batches.split(",")], args.iterations))
@@ -0,0 +1,125 @@
+"""
+Benchmark: research export throughput, Parquet export vs paging the JSON API.
+
+Generates readings for a temporary device of the `bench_wearable_rollup` patient over the last
+--months months, exports that patient with the Parquet exporter to a local directory, then pages
+the same device the way a client of GET /devices/{id}/measurements does (1000 per page, DTO JSON)
+for up to --baseline-rows rows. Reports rows/s, bytes written and the peak RSS growth of the export.
+
+    python -m backend.scripts.bench_wearable_export --rows 1000000 --months 3
+"""
+import argparse
+import asyncio
+import json
+import resource
+import tempfile
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.storage.local_service import LocalStorageService
+from backend.module.wearable.entity.wearable import WearableDevice
+from backend.module.wearable.entity.wearable_dto import WearableMeasurementDTO
+from backend.module.wearable.repositories.wearable_partition_repository import add_months, month_start
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.usecases.wearable_export import WearableExportUseCase
+from backend.scripts.bench_wearable_rollup import GENERATE_READINGS_SQL, existing_devices
+from sqlalchemy import delete, select, text
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    bench_devices = await existing_devices()
+    if not bench_devices:
+        raise SystemExit("Run backend.scripts.bench_wearable_rollup first to create the benchmark patient")
+
+    end = month_start(datetime.now(timezone.utc))
+    start = add_months(end, -args.months)
+    interval = max(1, int((end - start).total_seconds() / args.rows))
+    async for session in db_manager.get_session():
+        patient_id = (await session.execute(
+            select(WearableDevice.patient_id).where(WearableDevice.id == bench_devices[0])
+        )).scalar_one()
+        device = WearableDevice(patient_id=patient_id, device_identifier=f"bench-export-{uuid4().hex}")
+        session.add(device)
+        await session.flush()
+        device_id = device.id
+
+    try:
+        month = start
+        while month < end:
+            async for session in db_manager.get_session():
+                await session.execute(GENERATE_READINGS_SQL, {
+                    "device_id": device_id, "start": month, "end": add_months(month, 1), "step": interval,
+                })
+            month = add_months(month, 1)
+        async for session in db_manager.get_session():
+            await session.execute(text("ANALYZE wearable_measurements"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            rss_before = peak_rss_mb()
+            usecase = WearableExportUseCase(
+                LocalStorageService(directory), batch_rows=args.batch_rows, row_group_rows=args.row_group_rows
+            )
+            summary = await usecase.export(start, end, [patient_id])
+            export = {
+                "files": len(summary.files),
+                "rows": summary.rows,
+                "seconds": round(summary.seconds, 2),
+                "rows_per_second": round(summary.rows_per_second),
+                "bytes": summary.bytes,
+                "bytes_per_row": round(summary.bytes / summary.rows, 1) if summary.rows else 0,
+                "peak_rss_growth_mb": round(peak_rss_mb() - rss_before, 1),
+            }
+
+        rows = json_bytes = 0
+        page = 1
+        started = time.perf_counter()
+        while rows < args.baseline_rows:
+            async for session in db_manager.get_session():
+                measurements, _ = await WearableRepository(session).list_measurements(
+                    device_id, page, 1000, start, end
+                )
+                json_bytes += sum(len(WearableMeasurementDTO.model_validate(m).model_dump_json()) for m in measurements)
+            if not measurements:
+                break
+            rows += len(measurements)
+            page += 1
+        seconds = time.perf_counter() - started
+        baseline = {
+            "rows": rows,
+            "seconds": round(seconds, 2),
+            "rows_per_second": round(rows / seconds) if seconds else 0,
+            "bytes_per_row": round(json_bytes / rows, 1) if rows else 0,
+        }
+
+        print(json.dumps({
+            "generated_rows": args.rows,
+            "batch_rows": args.batch_rows,
+            "row_group_rows": args.row_group_rows,
+            "parquet_export": export,
+            "json_api_paging": baseline,
+            "speedup": round(export["rows_per_second"] / baseline["rows_per_second"], 1)
+            if baseline["rows_per_second"] else None,
+        }, indent=2))
+    finally:
+        async for session in db_manager.get_session():
+            await session.execute(delete(WearableDevice).where(WearableDevice.id == device_id))
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the wearable Parquet export")
+    parser.add_argument("--rows", type=int, default=1000000, help="Readings to generate")
+    parser.add_argument("--months", type=int, default=3)
+    parser.add_argument("--batch-rows", type=int, default=settings.WEARABLE_EXPORT_BATCH_ROWS)
+    parser.add_argument("--row-group-rows", type=int, default=settings.WEARABLE_EXPORT_ROW_GROUP_ROWS)
+    parser.add_argument("--baseline-rows", type=int, default=50000, help="Rows to page through the JSON path")
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,468 @@
+"""
+Benchmark harness: a synthetic wearable fleet against the ASGI app, for capacity planning.
+
+Creates a synthetic patient with `--devices` devices, each with a device API key and its own
+reading stream (heart rate random walk with a daily rhythm and activity bursts, SpO2, blood
+pressure every 15th reading, temperature every 60th, steps). The fleet is split across three
+ingestion styles that run concurrently through the full app (routing, auth, validation, handlers)
+in-process, with no HTTP server in between:
+
+- single:    closed-loop clients POSTing one reading per request with the patient's JWT
+             (POST /wearables/devices/{id}/measurements)
+- batch:     closed-loop clients uploading `--batch-size` buffered readings per request, signed with
+             the device key (POST /wearables/ingest; columnar MessagePack when installed, else JSON)
+- streaming: every remaining device uploading what it recorded since its last upload every
+             `--stream-interval` seconds, at one reading per second (paced, like a live fleet)
+
+Each round first backfills `--backfill-days` older days of history per device (server side, so
+history accumulates quickly), then ingests for `--seconds` and measures ingest rows/s and p50/p99
+request latency per style, the growth of wearable_measurements on disk, and the p50/p99 latency of
+the aggregate, list and latest endpoints for random devices. Results go to `--output` as JSON for
+trend tracking between runs and hardware.
+
+    python -m backend.scripts.bench_wearable_fleet --devices 1000 --rounds 5 --seconds 30
+
+Everything runs in one process and one event loop, like one API worker: multiply by workers
+(and check the database side) when sizing. Use a disposable database; the synthetic patient and
+its data are deleted at the end unless --keep is given.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from backend.api.server.app import app
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.security.hmac_utils import (
+    derive_device_secret,
+    generate_device_key_id,
+    sign_device_request,
+)
+from backend.infrastructure.security.password import get_password_hash
+from backend.module.common.enums import GenderEnum, RoleEnum
+from backend.module.profile.entity.models import Patient
+
+from backend.module.session.models.session import UserSession
+from backend.module.user.entity.user import User
+from backend.module.wearable.entity.wearable import WearableDevice, WearableDeviceKey
+from backend.scripts.bench_wearable_rollup import GENERATE_READINGS_SQL
+from sqlalchemy import delete, text
+
+try:
+    import msgpack
+except ImportError:  # Optional: batches fall back to JSON
+    msgpack = None
+
+API = settings.API_V1_STR
+
+TABLE_SIZE_SQL = text("""
+    SELECT coalesce(sum(pg_total_relation_size(relid)), 0)
+    FROM pg_partition_tree('wearable_measurements')
+""")
+
+
+class AsgiClient:
+    """Minimal in-process HTTP client: calls the ASGI app directly, one request per call."""
+
+    def __init__(self, asgi_app):
+        self.app = asgi_app
+
+    async def request(
+        self, method: str, path: str, body: bytes = b"", headers: Optional[Dict[str, str]] = None,
+        params: Optional[dict] = None
+    ) -> Tuple[int, bytes]:
+        headers = {"host": "bench", "content-length": str(len(body)), **(headers or {})}
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": urlencode(params or {}, doseq=True).encode(),
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+            "client": ("127.0.0.1", 0),
+            "server": ("bench", 80),
+        }
+        sent = False
+        status, chunks = 500, []
+
+        async def receive():
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await asyncio.Event().wait()  # No disconnect until the response is done
+
+        async def send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return status, b"".join(chunks)
+
+
+class SyntheticDevice:
+    """One device's reading stream, one reading per second of its own clock."""
+
+    def __init__(self, device_id, key_id: str, clock: datetime, rng: random.Random):
+        self.device_id = device_id
+        self.key_id = key_id
+        self.secret = derive_device_secret(key_id)
+        self.clock = clock
+        self.rng = rng
+        self.resting_hr = rng.uniform(55, 85)
+        self.baseline_sbp = rng.uniform(105, 145)
+        self.heart_rate = self.resting_hr
+        self.activity = 0.0  # 0 at rest, up to 1 while exercising
+        self.sequence = 0
+
+    def next_reading(self) -> dict:
+        rng = self.rng
+        if self.activity == 0 and rng.random() < 0.002:
+            self.activity = rng.uniform(0.3, 1.0)  # Start of a walk or workout
+        elif self.activity and rng.random() < 0.01:
+            self.activity = 0.0
+        hour = self.clock.hour + self.clock.minute / 60
+        circadian = 6 * math.sin((hour - 10) / 24 * 2 * math.pi)  # Lower at night
+        target = self.resting_hr + circadian + 70 * self.activity
+        self.heart_rate += 0.1 * (target - self.heart_rate) + rng.gauss(0, 1.5)
+        reading = {
+            "recorded_at": self.clock,
+            "heart_rate": round(self.heart_rate),
+            "spo2": None if rng.random() < 0.02 else min(100, round(rng.gauss(97.5 - 2 * self.activity, 1))),
+            "steps": round(rng.uniform(1.5, 3) * self.activity) if self.activity else 0,
+            "systolic_bp": None,
+            "diastolic_bp": None,
+            "body_temperature": None,
+        }
+        if self.sequence % 15 == 0:
+            systolic = self.baseline_sbp + 25 * self.activity + rng.gauss(0, 5)
+            reading["systolic_bp"] = round(systolic)
+            reading["diastolic_bp"] = round(systolic * 0.62 + rng.gauss(0, 3))
+        if self.sequence % 60 == 0:
+            reading["body_temperature"] = round(36.6 + 0.6 * self.activity + rng.gauss(0, 0.15), 1)
+        self.sequence += 1
+        self.clock += timedelta(seconds=1)
+        return reading
+
+    def take(self, count: int) -> List[dict]:
+        return [self.next_reading() for _ in range(count)]
+
+
+def json_batch(readings: List[dict]) -> bytes:
+    return json.dumps({"readings": [{**r, "recorded_at": r["recorded_at"].isoformat()} for r in readings]}).encode()
+
+
+def msgpack_batch(readings: List[dict]) -> bytes:
+    epoch_ms = [int(r["recorded_at"].timestamp() * 1000) for r in readings]
+    document = {"t0": epoch_ms[0], "dt": [0] + [b - a for a, b in zip(epoch_ms, epoch_ms[1:])]}
+    for name in ("heart_rate", "systolic_bp", "diastolic_bp", "body_temperature", "steps", "spo2"):
+        document[name] = [r[name] for r in readings]
+    return msgpack.packb(document)
+
+
+def percentiles(samples: List[float]) -> dict:
+    if not samples:
+        return {"p50_ms": None, "p99_ms": None, "max_ms": None}
+    samples = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(samples) * 1000, 2),
+        "p99_ms": round(samples[max(0, math.ceil(len(samples) * 0.99) - 1)] * 1000, 2),
+        "max_ms": round(samples[-1] * 1000, 2),
+    }
+
+
+class StyleStats:
+    def __init__(self):
+        self.samples: List[float] = []
+        self.rows = 0
+        self.errors: Dict[int, int] = {}
+
+    def record(self, started: float, status: int, rows: int) -> None:
+        self.samples.append(time.perf_counter() - started)
+        if status == 200:
+            self.rows += rows
+        else:
+            self.errors[status] = self.errors.get(status, 0) + 1
+
+    def summary(self, seconds: float) -> dict:
+        return {
+            "requests": len(self.samples),
+            "rows": self.rows,
+            "rows_per_second": round(self.rows / seconds),
+            **percentiles(self.samples),
+            "errors": {str(k): v for k, v in sorted(self.errors.items())},
+        }
+
+
+class Fleet:
+    def __init__(self, client: AsgiClient, devices: List[SyntheticDevice], token: str, args):
+        self.client = client
+        self.token = token
+        self.args = args
+        count = len(devices)
+        single_end = round(count * args.single_share)
+        batch_end = single_end + round(count * args.batch_share)
+        self.single, self.batch, self.streaming = devices[:single_end], devices[single_end:batch_end], devices[batch_end:]
+        self.all = devices
+        self.use_msgpack = msgpack is not None and args.batch_format == "msgpack"
+
+    async def send_batch(self, device: SyntheticDevice, readings: List[dict], binary: bool) -> int:
+        body = msgpack_batch(readings) if binary else json_batch(readings)
+        timestamp = str(int(time.time()))
+        status, _ = await self.client.request("POST", f"{API}/wearables/ingest", body, {
+            "content-type": "application/msgpack" if binary else "application/json",
+            "x-device-key": device.key_id,
+            "x-device-timestamp": timestamp,
+            "x-device-signature": sign_device_request(device.secret, timestamp, body),
+        })
+        return status
+
+    async def single_client(self, devices: List[SyntheticDevice], deadline: float, stats: StyleStats) -> None:
+        headers = {"authorization": f"Bearer {self.token}", "content-type": "application/json"}
+        index = 0
+        while time.perf_counter() < deadline:
+            device = devices[index % len(devices)]
+            index += 1
+            reading = device.next_reading()
+            body = json.dumps({**reading, "recorded_at": reading["recorded_at"].isoformat()}).encode()
+            started = time.perf_counter()
+            status, _ = await self.client.request(
+                "POST", f"{API}/wearables/devices/{device.device_id}/measurements", body, headers
+            )
+            stats.record(started, status, 1)
+
+    async def batch_client(self, devices: List[SyntheticDevice], deadline: float, stats: StyleStats) -> None:
+        index = 0
+        while time.perf_counter() < deadline:
+            device = devices[index % len(devices)]
+            index += 1
+            readings = device.take(self.args.batch_size)
+            started = time.perf_counter()
+            status = await self.send_batch(device, readings, self.use_msgpack)
+            stats.record(started, status, len(readings))
+
+    async def streaming_device(self, device: SyntheticDevice, deadline: float, stats: StyleStats) -> None:
+        interval = self.args.stream_interval
+        next_upload = time.perf_counter() + device.rng.uniform(0, interval)  # Devices are not in lockstep
+        while next_upload < deadline:
+            await asyncio.sleep(max(0.0, next_upload - time.perf_counter()))
+            next_upload += interval
+            readings = device.take(max(1, round(interval)))
+            started = time.perf_counter()
+            status = await self.send_batch(device, readings, binary=False)
+            stats.record(started, status, len(readings))
+
+    async def ingest(self, seconds: float) -> dict:
+        args = self.args
+        stats = {"single": StyleStats(), "batch": StyleStats(), "streaming": StyleStats()}
+        started = time.perf_counter()
+        deadline = started + seconds
+        tasks = []
+        for style, devices, clients, worker in (
+            ("single", self.single, args.single_clients, self.single_client),
+            ("batch", self.batch, args.batch_clients, self.batch_client),
+        ):
+            for i in range(min(clients, len(devices))):
+                tasks.append(worker(devices[i::clients], deadline, stats[style]))
+        tasks += [self.streaming_device(device, deadline, stats["streaming"]) for device in self.streaming]
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+        total = sum(s.rows for s in stats.values())
+        return {
+            "seconds": round(elapsed, 2),
+            "rows": total,
+            "rows_per_second": round(total / elapsed),
+            **{style: s.summary(elapsed) for style, s in stats.items()},
+        }
+
+    async def queries(self, samples: int) -> dict:
+        headers = {"authorization": f"Bearer {self.token}"}
+        now = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+        queries = {
+            "aggregate_24h_hourly": lambda d: (f"/wearables/devices/{d}/measurements/aggregate", {
+                "date_from": (now - timedelta(days=1)).isoformat(), "date_to": now.isoformat(), "bucket": "1h",
+            }),
+            "aggregate_30d_daily": lambda d: (f"/wearables/devices/{d}/measurements/aggregate", {
+                "date_from": (now - timedelta(days=30)).isoformat(), "date_to": now.isoformat(), "bucket": "1d",
+            }),
+            "list_100": lambda d: (f"/wearables/devices/{d}/measurements", {"limit": 100}),
+            "latest": lambda d: (f"/wearables/devices/{d}/latest", {}),
+        }
+        results = {}
+        for name, build in queries.items():
+            timings, errors = [], 0
+            for _ in range(samples):
+                path, params = build(random.choice(self.all).device_id)
+                started = time.perf_counter()
+                status, _ = await self.client.request("GET", f"{API}{path}", headers=headers, params=params)
+                timings.append(time.perf_counter() - started)
+                errors += status != 200
+            results[name] = {**percentiles(timings), "errors": errors}
+        return results
+
+
+async def table_bytes() -> int:
+    async for session in db_manager.get_session():
+        size = (await session.execute(TABLE_SIZE_SQL)).scalar()
+    return int(size)
+
+
+async def setup(username: str, devices: int, clock: datetime, seed: int) -> Tuple[list, List[SyntheticDevice]]:
+    rng = random.Random(seed)
+    async for session in db_manager.get_session():
+        user = User(
+            id=uuid4(), username=username, full_name="Fleet Benchmark Patient",
+            password_hash=get_password_hash("bench"), role=RoleEnum.PATIENT, is_active=True
+        )
+        session.add(user)
+        await session.flush()
+        patient = Patient(
+            user_id=user.id, nik=str(rng.randint(10**15, 10**16 - 1)),
+            date_of_birth=date(1980, 1, 1), gender=GenderEnum.FEMALE
+        )
+        session.add(patient)
+        await session.flush()
+        fleet = []
+        for i in range(devices):
+            device_id, key_id = uuid4(), generate_device_key_id()
+            session.add(WearableDevice(
+                id=device_id, patient_id=patient.id, device_identifier=f"fleet-{uuid4().hex}", device_name=f"Fleet {i}"
+            ))
+            fleet.append(SyntheticDevice(device_id, key_id, clock, random.Random(rng.random())))
+        await session.flush()
+        session.add_all(WearableDeviceKey(key_id=d.key_id, device_id=d.device_id) for d in fleet)
+    return user.id, fleet
+
+
+async def backfill(fleet: List[SyntheticDevice], start: datetime, end: datetime, interval: int) -> int:
+    rows = 0
+    for device in fleet:
+        async for session in db_manager.get_session():
+            result = await session.execute(GENERATE_READINGS_SQL, {
+                "device_id": device.device_id, "start": start, "end": end - timedelta(microseconds=1), "step": interval,
+            })
+            rows += result.rowcount
+    async for session in db_manager.get_session():
+        await session.execute(text("ANALYZE wearable_measurements"))
+    return rows
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    client = AsgiClient(app)
+    username = f"bench-fleet-{uuid4().hex[:8]}"
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    user_id, devices = await setup(username, args.devices, now, args.seed)
+    rounds = []
+    fleet_rows = 0
+    try:
+        async with app.router.lifespan_context(app):
+            status, body = await client.request(
+                "POST", f"{API}/auth/login", json.dumps({"username": username, "password": "bench"}).encode(),
+                {"content-type": "application/json"},
+            )
+            if status != 200:
+                raise SystemExit(f"Login failed ({status}): {body[:200]!r}")
+            fleet = Fleet(client, devices, json.loads(body)["data"]["access_token"], args)
+
+            for number in range(1, args.rounds + 1):
+                backfilled = 0
+                if args.backfill_days:
+                    end = now - timedelta(days=args.backfill_days * (number - 1))
+                    backfilled = await backfill(
+                        devices, end - timedelta(days=args.backfill_days), end, args.backfill_interval
+                    )
+                size_before = await table_bytes()
+                ingest = await fleet.ingest(args.seconds)
+                size_after = await table_bytes()
+                fleet_rows += backfilled + ingest["rows"]
+                result = {
+                    "round": number,
+                    "fleet_rows": fleet_rows,
+                    "backfilled_rows": backfilled,
+                    "ingest": ingest,
+                    "table_bytes": size_after,
+                    "ingest_bytes_per_row": round((size_after - size_before) / ingest["rows"], 1)
+                    if ingest["rows"] else None,
+                    "queries": await fleet.queries(args.query_samples),
+                }
+                rounds.append(result)
+                print(
+                    f"round {number}/{args.rounds}: {fleet_rows:,} fleet rows, "
+                    f"{ingest['rows_per_second']:,} ingest rows/s, table {size_after / 2**20:,.0f} MiB",
+                    flush=True,
+                )
+    finally:
+        if not args.keep:
+            async for session in db_manager.get_session():
+                await session.execute(delete(UserSession).where(UserSession.user_id == user_id))
+                await session.execute(delete(Patient).where(Patient.user_id == user_id))
+                await session.execute(delete(User).where(User.id == user_id))
+        await db_manager.close()
+
+    report = {
+        "benchmark": "wearable_fleet",
+        "started_at": now.isoformat(),
+        "host": {"python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count()},
+        "config": {
+            "devices": args.devices,
+            "single_devices": len(fleet.single),
+            "batch_devices": len(fleet.batch),
+            "streaming_devices": len(fleet.streaming),
+            "single_clients": args.single_clients,
+            "batch_clients": args.batch_clients,
+            "batch_size": args.batch_size,
+            "batch_format": "msgpack" if fleet.use_msgpack else "json",
+            "stream_interval": args.stream_interval,
+            "rounds": args.rounds,
+            "seconds": args.seconds,
+            "backfill_days": args.backfill_days,
+            "backfill_interval": args.backfill_interval,
+            "write_behind": settings.WEARABLE_WRITE_BEHIND_ENABLED,
+        },
+        "rounds": rounds,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Wearable ingestion and query benchmark with a synthetic device fleet")
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--single-share", type=float, default=0.05, help="Fraction of devices uploading single readings")
+    parser.add_argument("--batch-share", type=float, default=0.25, help="Fraction of devices uploading large batches")
+    parser.add_argument("--single-clients", type=int, default=20)
+    parser.add_argument("--batch-clients", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=600, help="Readings per batch upload")
+    parser.add_argument("--batch-format", choices=["msgpack", "json"], default="msgpack")
+    parser.add_argument("--stream-interval", type=float, default=10.0, help="Seconds between streaming uploads")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seconds", type=float, default=30.0, help="Ingestion time per round")
+    parser.add_argument("--backfill-days", type=int, default=7, help="Days of history added per device per round")
+    parser.add_argument("--backfill-interval", type=int, default=60, help="Seconds between backfilled readings")
+    parser.add_argument("--query-samples", type=int, default=50, help="Requests per query type per round")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="Keep the synthetic patient and its data")
+    parser.add_argument(
+        "--output", default=f"bench-results/wearable_fleet_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    )
+    asyncio.run(main(parser.parse_args()))
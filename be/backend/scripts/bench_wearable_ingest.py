@@ -0,0 +1,147 @@
+"""
+Benchmark: wearable ingest latency, synchronous insert vs write-behind.
+
+Runs `--readings` simulated uploads from `--concurrency` concurrent clients against an existing
+device (e.g. from `bench_wearable_rollup`). The synchronous path is what an upload request does
+today: WearableRepository.create_measurement and a commit per reading. The write-behind path
+appends to a segment log in `--dir` with the flusher running, then waits for the backlog to drain
+and checks every reading landed. Readings are written to one hour starting at `--at` and deleted
+afterwards.
+
+    python -m backend.scripts.bench_wearable_ingest --readings 5000 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.ingest.segment_log import SegmentLog
+
+# Import all models for relationship resolution
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.user.entity.user import User  # noqa: F401
+from backend.module.wearable.entity.wearable import WearableDevice, WearableMeasurement
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.usecases.wearable_write_behind import WearableWriteBehind
+from sqlalchemy import select, text
+
+
+def reading(device_id, recorded_at: datetime) -> WearableMeasurement:
+    return WearableMeasurement(
+        device_id=device_id, recorded_at=recorded_at,
+        heart_rate=72, systolic_bp=118, diastolic_bp=78, body_temperature=36.8, steps=12, spo2=98,
+    )
+
+
+def summarize(samples: list, elapsed: float) -> dict:
+    samples = sorted(samples)
+    return {
+        "readings_per_second": round(len(samples) / elapsed),
+        "p50_ms": round(statistics.median(samples) * 1000, 3),
+        "p99_ms": round(samples[int(len(samples) * 0.99) - 1] * 1000, 3),
+        "max_ms": round(samples[-1] * 1000, 3),
+    }
+
+
+async def run_clients(readings: int, concurrency: int, ingest) -> tuple:
+    samples = []
+
+    async def client(offsets):
+        for offset in offsets:
+            t0 = time.perf_counter()
+            await ingest(offset)
+            samples.append(time.perf_counter() - t0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client(range(i, readings, concurrency)) for i in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+async def count_window(start: datetime, end: datetime) -> int:
+    async for session in db_manager.get_session():
+        count = (await session.execute(
+            text("SELECT count(*) FROM wearable_measurements WHERE recorded_at >= :start AND recorded_at < :end"),
+            {"start": start, "end": end},
+        )).scalar()
+    return count
+
+
+async def cleanup(start: datetime, end: datetime) -> None:
+    async for session in db_manager.get_session():
+        await session.execute(
+            text("DELETE FROM wearable_measurements WHERE recorded_at >= :start AND recorded_at < :end"),
+            {"start": start, "end": end},
+        )
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    directory = args.dir or tempfile.mkdtemp(prefix="wearable-ingest-")
+    start = datetime.fromisoformat(args.at).replace(tzinfo=timezone.utc)
+    sync_start, wb_start = start, start + timedelta(minutes=30)
+    step = timedelta(seconds=1800) / args.readings
+    try:
+        async for session in db_manager.get_session():
+            device_id = (await session.execute(select(WearableDevice.id))).scalars().first()
+        if device_id is None:
+            raise SystemExit("No wearable device found; run bench_wearable_rollup first")
+
+        async def sync_ingest(i):
+            async for session in db_manager.get_session():
+                await WearableRepository(session).create_measurement(reading(device_id, sync_start + step * i))
+
+        sync_samples, sync_elapsed = await run_clients(args.readings, args.concurrency, sync_ingest)
+
+        write_behind = WearableWriteBehind(
+            SegmentLog(directory, args.segment_bytes, max_pending_bytes=1 << 40, fsync=not args.no_fsync),
+            args.flush_seconds,
+        )
+        write_behind.start()
+
+        async def write_behind_ingest(i):
+            m = reading(device_id, wb_start + step * i)
+            m.id = uuid4()
+            await write_behind.enqueue(m)
+
+        wb_samples, wb_elapsed = await run_clients(args.readings, args.concurrency, write_behind_ingest)
+        max_lag = write_behind.metrics()["lag_seconds"]
+        drain_started = time.perf_counter()
+        await write_behind.stop()
+        drain_seconds = time.perf_counter() - drain_started
+
+        print(json.dumps({
+            "readings": args.readings,
+            "concurrency": args.concurrency,
+            "fsync": not args.no_fsync,
+            "synchronous": summarize(sync_samples, sync_elapsed),
+            "write_behind": {
+                **summarize(wb_samples, wb_elapsed),
+                "lag_seconds_at_end": max_lag,
+                "final_drain_seconds": round(drain_seconds, 3),
+                "flushed_segments": write_behind.flushed_segments,
+                "stored": await count_window(wb_start, wb_start + timedelta(minutes=30)),
+            },
+        }, indent=2))
+    finally:
+        await cleanup(start, start + timedelta(hours=1))
+        if not args.dir:
+            shutil.rmtree(directory, ignore_errors=True)
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark synchronous vs write-behind wearable ingestion")
+    parser.add_argument("--readings", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--at", default="2026-01-01T00:00:00", help="Start of the hour used for benchmark readings (UTC)")
+    parser.add_argument("--dir", help="Segment directory (default: a temporary directory)")
+    parser.add_argument("--segment-bytes", type=int, default=8 * 1024 * 1024)
+    parser.add_argument("--flush-seconds", type=float, default=1.0)
+    parser.add_argument("--no-fsync", action="store_true", help="Skip fsync (measures the log without disk flushes)")
+    asyncio.run(main(parser.parse_args()))
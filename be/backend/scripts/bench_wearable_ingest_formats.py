@@ -0,0 +1,114 @@
+"""
+Benchmark: bytes on the wire and server CPU per ingestion batch, JSON vs columnar MessagePack/CBOR.
+
+Each format is decoded and validated by `decode_batch`, then turned into COPY records and live
+stream messages: the work the /wearables/ingest handler does per batch besides the COPY itself.
+CPU is process time, so it is comparable across formats. Needs no database; binary formats whose
+codec is not installed are skipped.
+
+    python -m backend.scripts.bench_wearable_ingest_formats --readings 10000 --iterations 20
+"""
+import argparse
+import gzip
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.module.wearable.usecases.wearable_columnar import (
+    CBOR_CONTENT_TYPES,
+    METRIC_COLUMNS,
+    MSGPACK_CONTENT_TYPES,
+    cbor2,
+    decode_batch,
+    msgpack,
+    uuid4_strings,
+)
+
+
+def synthetic_readings(count: int, seed: int = 7) -> list:
+    """One reading per second from a wrist device: heart rate and steps always, the rest sparse."""
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    readings = []
+    for i in range(count):
+        reading = {
+            "recorded_at": start + timedelta(seconds=i, milliseconds=rng.randint(0, 20)),
+            "heart_rate": rng.randint(55, 110),
+            "steps": rng.randint(0, 3),
+        }
+        if i % 60 == 0:
+            reading.update(spo2=rng.randint(94, 99), body_temperature=round(rng.uniform(36.1, 37.4), 1))
+        if i % 300 == 0:
+            reading.update(systolic_bp=rng.randint(105, 140), diastolic_bp=rng.randint(65, 90))
+        readings.append(reading)
+    return readings
+
+
+def json_body(readings: list) -> bytes:
+    return json.dumps({"readings": [
+        {**r, "recorded_at": r["recorded_at"].isoformat()} for r in readings
+    ]}, separators=(",", ":")).encode()
+
+
+def columnar_document(readings: list) -> dict:
+    """What a device sends: epoch-ms base, millisecond deltas, one array per present metric."""
+    epoch_ms = [int(r["recorded_at"].timestamp() * 1000) for r in readings]
+    document = {"t0": epoch_ms[0], "dt": [0] + [b - a for a, b in zip(epoch_ms, epoch_ms[1:])]}
+    for name in METRIC_COLUMNS:
+        column = [r.get(name) for r in readings]
+        if any(v is not None for v in column):
+            document[name] = column
+    return document
+
+
+def main(count: int, iterations: int) -> None:
+    readings = synthetic_readings(count)
+    bodies = {"json": ("application/json", json_body(readings))}
+    document = columnar_document(readings)
+    if msgpack is not None:
+        bodies["msgpack"] = (MSGPACK_CONTENT_TYPES[0], msgpack.packb(document))
+    if cbor2 is not None:
+        bodies["cbor"] = (CBOR_CONTENT_TYPES[0], cbor2.dumps(document))
+
+    device_id = uuid4()
+
+    def handle(content_type: str, body: bytes) -> list:
+        columns = decode_batch(content_type, body)
+        ids = uuid4_strings(len(columns))
+        columns.messages(device_id, ids, datetime.now(timezone.utc))
+        return columns.records(device_id, ids)
+
+    results = {}
+    for name, (content_type, body) in bodies.items():
+        assert len(handle(content_type, body)) == count
+
+        samples = []
+        for _ in range(iterations):
+            t0 = time.process_time()
+            handle(content_type, body)
+            samples.append(time.process_time() - t0)
+        results[name] = {
+            "bytes": len(body),
+            "bytes_gzip": len(gzip.compress(body)),
+            "bytes_per_reading": round(len(body) / count, 1),
+            "cpu_ms_p50": round(statistics.median(samples) * 1000, 2),
+            "cpu_ms_per_10k": round(statistics.median(samples) * 1000 * 10000 / count, 2),
+        }
+
+    baseline = results["json"]
+    for name, row in results.items():
+        if name != "json":
+            row["size_vs_json"] = round(row["bytes"] / baseline["bytes"], 3)
+            row["cpu_speedup_vs_json"] = round(baseline["cpu_ms_p50"] / row["cpu_ms_p50"], 1)
+    print(json.dumps({"readings": count, "formats": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark ingestion payload formats")
+    parser.add_argument("--readings", type=int, default=10000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    main(args.readings, args.iterations)
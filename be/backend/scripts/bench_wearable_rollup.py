@@ -0,0 +1,185 @@
+"""
+Benchmark: raw vs rolled-up wearable aggregation latency on synthetic data.
+
+Generates a synthetic patient with N devices and readings every `--interval` seconds
+over `--days` days (server side, via generate_series), runs one rollup pass and then
+times the aggregation query for each resolution. Results are printed as JSON.
+
+    python -m backend.scripts.bench_wearable_rollup --devices 20 --days 90 --interval 60
+    # ~1B rows: --devices 1000 --days 90 --interval 8  (allow hours for data generation)
+
+Use a disposable database; pass --cleanup to remove the synthetic data afterwards.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.security.password import get_password_hash
+from backend.module.common.enums import GenderEnum, RoleEnum, WearableResolutionEnum
+from backend.module.profile.entity.models import Patient
+
+# Import all models for relationship resolution
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.user.entity.user import User
+from backend.module.wearable.entity.wearable import WearableDevice
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.repositories.wearable_rollup_repository import (
+    DAY_SECONDS,
+    HOUR_SECONDS,
+    WearableRollupRepository,
+)
+from sqlalchemy import delete, select, text
+
+BENCH_USERNAME = "bench-rollup"
+
+GENERATE_READINGS_SQL = text("""
+    INSERT INTO wearable_measurements
+        (id, device_id, recorded_at, heart_rate, systolic_bp, diastolic_bp, body_temperature, steps, spo2, created_at)
+    SELECT gen_random_uuid(), :device_id, ts,
+           60 + (random() * 40)::int,
+           110 + (random() * 25)::int,
+           70 + (random() * 15)::int,
+           round((36.3 + random() * 1.2)::numeric, 1),
+           (random() * 120)::int,
+           94 + (random() * 6)::int,
+           ts
+    FROM generate_series(CAST(:start AS timestamptz), CAST(:end AS timestamptz), make_interval(secs => :step)) AS ts
+""")
+
+
+async def setup(devices: int, days: int, interval: int, end: datetime) -> list:
+    async for session in db_manager.get_session():
+        user = User(
+            id=uuid4(), username=BENCH_USERNAME, full_name="Benchmark Patient",
+            password_hash=get_password_hash("bench"), role=RoleEnum.PATIENT, is_active=True
+        )
+        session.add(user)
+        await session.flush()
+        patient = Patient(
+            user_id=user.id, nik=str(random.randint(10**15, 10**16 - 1)),
+            date_of_birth=date(1980, 1, 1), gender=GenderEnum.MALE
+        )
+        session.add(patient)
+        await session.flush()
+        device_ids = []
+        for i in range(devices):
+            device = WearableDevice(patient_id=patient.id, device_identifier=f"bench-{uuid4().hex}", device_name=f"Bench {i}")
+            session.add(device)
+            await session.flush()
+            device_ids.append(device.id)
+
+    start = end - timedelta(days=days)
+    for device_id in device_ids:
+        # One transaction per device-day keeps WAL and lock duration bounded at large scale
+        for day in range(days):
+            day_start = start + timedelta(days=day)
+            async for session in db_manager.get_session():
+                await session.execute(GENERATE_READINGS_SQL, {
+                    "device_id": device_id,
+                    "start": day_start,
+                    "end": day_start + timedelta(days=1) - timedelta(microseconds=1),
+                    "step": interval,
+                })
+    async for session in db_manager.get_session():
+        await session.execute(text("ANALYZE wearable_measurements"))
+    return device_ids
+
+
+async def existing_devices() -> list:
+    async for session in db_manager.get_session():
+        stmt = (
+            select(WearableDevice.id)
+            .join(Patient, Patient.id == WearableDevice.patient_id)
+            .join(User, User.id == Patient.user_id)
+            .where(User.username == BENCH_USERNAME)
+        )
+        return list((await session.execute(stmt)).scalars().all())
+
+
+async def rollup(device_ids: list, until: datetime) -> float:
+    started = time.perf_counter()
+    for device_id in device_ids:
+        async for session in db_manager.get_session():
+            repository = WearableRollupRepository(session)
+            since = await repository.get_watermark(device_id)
+            await repository.rollup_device(device_id, since, until)
+    async for session in db_manager.get_session():
+        await session.execute(text("ANALYZE wearable_rollups_hourly"))
+        await session.execute(text("ANALYZE wearable_rollups_daily"))
+    return time.perf_counter() - started
+
+
+async def time_query(device_ids: list, resolution, bucket_seconds: int, date_from: datetime, date_to: datetime, repeat: int) -> dict:
+    samples = []
+    for _ in range(repeat):
+        device_id = random.choice(device_ids)
+        async for session in db_manager.get_session():
+            repository = WearableRepository(session)
+            started = time.perf_counter()
+            await repository.aggregate_measurements(device_id, bucket_seconds, date_from, date_to, resolution)
+            samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "resolution": resolution.value,
+        "p50_ms": round(statistics.median(samples), 3),
+        "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+async def cleanup() -> None:
+    async for session in db_manager.get_session():
+        user_ids = select(User.id).where(User.username == BENCH_USERNAME)
+        await session.execute(delete(Patient).where(Patient.user_id.in_(user_ids)))
+        await session.execute(delete(User).where(User.username == BENCH_USERNAME))
+
+
+async def main(args) -> None:
+    db_manager.init_db()
+    # Align to midnight UTC so the 90-day range can be answered from daily rollups
+    end = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    try:
+        device_ids = await existing_devices()
+        started = time.perf_counter()
+        if not device_ids:
+            device_ids = await setup(args.devices, args.days, args.interval, end)
+        generate_seconds = time.perf_counter() - started
+
+        rollup_seconds = await rollup(device_ids, datetime.now(timezone.utc))
+
+        long_range = (end - timedelta(days=args.days), end)
+        short_range = (end - timedelta(days=7), end)
+        results = {
+            "devices": len(device_ids),
+            "rows": len(device_ids) * args.days * DAY_SECONDS // args.interval,
+            "generate_seconds": round(generate_seconds, 2),
+            "rollup_seconds": round(rollup_seconds, 2),
+            f"{args.days}d_by_day": [
+                await time_query(device_ids, r, DAY_SECONDS, *long_range, args.repeat)
+                for r in (WearableResolutionEnum.RAW, WearableResolutionEnum.HOURLY, WearableResolutionEnum.DAILY)
+            ],
+            "7d_by_hour": [
+                await time_query(device_ids, r, HOUR_SECONDS, *short_range, args.repeat)
+                for r in (WearableResolutionEnum.RAW, WearableResolutionEnum.HOURLY)
+            ],
+        }
+        print(json.dumps(results, indent=2))
+        if args.cleanup:
+            await cleanup()
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark wearable rollup queries")
+    parser.add_argument("--devices", type=int, default=20)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--interval", type=int, default=60, help="Seconds between synthetic readings")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,85 @@
+"""
+Benchmark: live vitals fan-out through the in-process pub/sub hub.
+
+Simulates `--viewers` SSE subscribers spread over `--devices` device topics and publishes
+`--readings` readings. Reports publish cost, delivery rate and how a deliberately slow viewer
+is handled (bounded buffer, oldest messages dropped). No database is involved: viewers cost
+nothing per reading beyond a buffer append.
+
+    python -m backend.scripts.bench_wearable_stream --viewers 500 --devices 50 --readings 20000
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from uuid import uuid4
+
+from backend.infrastructure.pubsub.hub import PubSubHub
+from backend.module.wearable.usecases.wearable_publisher import device_topic
+
+
+async def viewer(subscription, received: list, delay: float) -> None:
+    while True:
+        await subscription.get()
+        received[0] += 1
+        if delay:
+            await asyncio.sleep(delay)
+
+
+async def main(args) -> None:
+    hub = PubSubHub(args.queue_size)
+    devices = [uuid4() for _ in range(args.devices)]
+    message = json.dumps({"heart_rate": 72, "spo2": 98, "recorded_at": "2026-01-01T00:00:00Z"})
+
+    contexts, tasks, counters = [], [], []
+    for i in range(args.viewers):
+        context = hub.subscribe([device_topic(devices[i % len(devices)])])
+        subscription = context.__enter__()
+        contexts.append((context, subscription))
+        counters.append([0])
+        # The first viewer is a slow consumer to exercise drop-oldest backpressure
+        tasks.append(asyncio.create_task(viewer(subscription, counters[-1], 0.01 if i == 0 else 0)))
+
+    publish_ns = []
+    started = time.perf_counter()
+    deliveries = 0
+    for n in range(args.readings):
+        t0 = time.perf_counter_ns()
+        deliveries += hub.publish([device_topic(random.choice(devices))], message)
+        publish_ns.append(time.perf_counter_ns() - t0)
+        if n % 100 == 0:
+            await asyncio.sleep(0)  # Let viewers drain, as the event loop would between requests
+    while any(s._buffer for i, (_, s) in enumerate(contexts) if i):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - started
+
+    slow = contexts[0][1]
+    for task in tasks:
+        task.cancel()
+    for context, _ in contexts:
+        context.__exit__(None, None, None)
+
+    publish_ns.sort()
+    print(json.dumps({
+        "viewers": args.viewers,
+        "devices": args.devices,
+        "readings": args.readings,
+        "deliveries": deliveries,
+        "deliveries_per_second": round(deliveries / elapsed),
+        "publish_p50_us": round(statistics.median(publish_ns) / 1000, 2),
+        "publish_p99_us": round(publish_ns[int(len(publish_ns) * 0.99) - 1] / 1000, 2),
+        "slow_viewer_received": counters[0][0],
+        "slow_viewer_dropped": slow.dropped,
+        "db_queries_per_reading": 0,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark live vitals fan-out")
+    parser.add_argument("--viewers", type=int, default=500)
+    parser.add_argument("--devices", type=int, default=50)
+    parser.add_argument("--readings", type=int, default=20000)
+    parser.add_argument("--queue-size", type=int, default=256)
+    asyncio.run(main(parser.parse_args()))
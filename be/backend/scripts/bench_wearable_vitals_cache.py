@@ -0,0 +1,147 @@
+"""
+Benchmark: latest-vitals reads from the in-memory ring buffer vs Postgres.
+
+The in-memory part fills the cache with a synthetic fleet up to its device limit and times a hit
+(lookup, per-metric latest values, last `--limit` readings and DTO construction), then reports
+memory use. With --db it also times the `ORDER BY recorded_at DESC LIMIT n` query the endpoint
+replaces, for devices already in the configured database (e.g. from `bench_wearable_rollup`).
+
+    python -m backend.scripts.bench_wearable_vitals_cache --devices 10000 --limit 10
+    python -m backend.scripts.bench_wearable_vitals_cache --db
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.module.wearable.entity.wearable_dto import WearableLatestVitalsDTO
+from backend.module.wearable.usecases.wearable_vitals_cache import LatestVitalsCache, READING_DTYPE
+
+
+class _Row:
+    """Stand-in for a SQLAlchemy Row: only `_mapping` is used when loading a ring."""
+
+    def __init__(self, mapping: dict):
+        self._mapping = mapping
+
+
+def synthetic_rows(count: int, end: datetime) -> list:
+    return [
+        _Row({
+            "id": uuid4(),
+            "recorded_at": end - timedelta(minutes=i),
+            "created_at": end - timedelta(minutes=i),
+            "heart_rate": random.randint(60, 100),
+            "systolic_bp": random.randint(110, 135),
+            "diastolic_bp": random.randint(70, 85),
+            "spo2": random.randint(94, 100),
+            "body_temperature": round(random.uniform(36.3, 37.5), 1),
+            "steps": random.randint(0, 120),
+        })
+        for i in range(count)
+    ]
+
+
+def percentiles(samples: list) -> dict:
+    samples = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(samples) * 1e6, 1),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 1),
+    }
+
+
+def serve(cache: LatestVitalsCache, device_id, limit: int) -> WearableLatestVitalsDTO:
+    ring = cache.get(device_id)
+    return WearableLatestVitalsDTO(
+        device_id=device_id,
+        patient_id=ring.patient_id,
+        vitals=ring.vitals(),
+        readings=ring.readings(device_id, limit),
+    )
+
+
+async def bench_memory(devices: int, capacity: int, limit: int, requests: int) -> dict:
+    cache = LatestVitalsCache(capacity, devices, ttl_seconds=3600)
+    end = datetime.now(timezone.utc)
+    rows = synthetic_rows(capacity, end)  # Shared rows: loading cost is not what is measured
+    device_ids = [uuid4() for _ in range(devices)]
+    patient_id = uuid4()
+
+    started = time.perf_counter()
+    for device_id in device_ids:
+        await cache.get_or_load(device_id, lambda: _loaded(patient_id, rows))
+    load_seconds = time.perf_counter() - started
+
+    samples = []
+    for _ in range(requests):
+        device_id = random.choice(device_ids)
+        t0 = time.perf_counter()
+        serve(cache, device_id, limit)
+        samples.append(time.perf_counter() - t0)
+
+    stats = cache.stats()
+    return {
+        "devices": devices,
+        "capacity": capacity,
+        "limit": limit,
+        "bytes_per_reading": READING_DTYPE.itemsize,
+        "memory_mb": round(stats["memory_bytes"] / 2**20, 1),
+        "load_per_device_us": round(load_seconds / devices * 1e6, 1),
+        "cache_hit": percentiles(samples),
+    }
+
+
+async def _loaded(patient_id, rows):
+    return patient_id, rows
+
+
+async def bench_db(limit: int, requests: int) -> dict:
+    from backend.infrastructure.database.connection import db_manager
+    from backend.module.wearable.entity.wearable import WearableDevice
+    from backend.module.wearable.repositories.wearable_repository import WearableRepository
+    from sqlalchemy import select
+
+    db_manager.init_db()
+    try:
+        async for session in db_manager.get_session():
+            device_ids = (await session.execute(select(WearableDevice.id))).scalars().all()
+            repository = WearableRepository(session)
+            orm, columns = [], []
+            for _ in range(requests if device_ids else 0):
+                device_id = random.choice(device_ids)
+                t0 = time.perf_counter()
+                (await session.execute(repository.measurements_query(device_id).limit(limit))).scalars().all()
+                orm.append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                await repository.list_recent_readings(device_id, limit)
+                columns.append(time.perf_counter() - t0)
+    finally:
+        await db_manager.close()
+    if not orm:
+        return {"devices": 0}
+    return {
+        "devices": len(device_ids),
+        "orm_query": percentiles(orm),
+        "column_query": percentiles(columns),
+    }
+
+
+async def main(args) -> None:
+    results = {"in_memory": await bench_memory(args.devices, args.capacity, args.limit, args.requests)}
+    if args.db:
+        results["database"] = await bench_db(args.limit, min(args.requests, 2000))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the latest-vitals ring buffer cache")
+    parser.add_argument("--devices", type=int, default=10000)
+    parser.add_argument("--capacity", type=int, default=60, help="Readings kept per device")
+    parser.add_argument("--limit", type=int, default=10, help="Readings returned per request")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--db", action="store_true", help="Also time the equivalent Postgres query")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,64 @@
+"""
+Import patients or visits from a legacy HIS export.
+
+Files are CSV with a header row or NDJSON, one patient or visit per row (see
+backend.module.legacy_import.entity.legacy_import_dto for the columns). Import patients first:
+visits find their patient by NIK. Progress is checkpointed after every batch to
+<file>.checkpoint.json and a rerun resumes from it; rejected rows are written with the reason
+to <file>.rejects.ndjson.
+
+Usage:
+    python -m backend.scripts.legacy_import patients legacy/patients.csv
+    python -m backend.scripts.legacy_import visits legacy/visits.ndjson --staff staff1
+    python -m backend.scripts.legacy_import visits legacy/visits.csv --staff staff1 --restart
+"""
+import argparse
+import asyncio
+import logging
+import os
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.module.legacy_import.usecases.legacy_import import FORMATS, PATIENTS, VISITS, LegacyImportUseCase
+
+# Import all models for relationship resolution
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main(args: argparse.Namespace) -> None:
+    fmt = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    usecase = LegacyImportUseCase(args.kind, args.staff, args.source, args.batch_rows)
+    db_manager.init_db()
+    try:
+        summary = await usecase.run(
+            args.path, fmt, f"{args.path}.checkpoint.json", f"{args.path}.rejects.ndjson", args.restart
+        )
+        logger.info(
+            f"Import of {summary.source} done: {summary.rows} rows, {summary.imported} imported, "
+            f"{summary.skipped} already present, {summary.rejected} rejected "
+            f"({summary.rows_per_second:,.0f} rows/s this run)"
+        )
+        if summary.rejected:
+            logger.warning(f"Rejected rows: {os.path.abspath(args.path)}.rejects.ndjson")
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import patients or visits from a legacy HIS export")
+    parser.add_argument("kind", choices=(PATIENTS, VISITS))
+    parser.add_argument("path", help="CSV or NDJSON file")
+    parser.add_argument("--format", choices=FORMATS, help="Default: from the file extension (.ndjson/.jsonl, else csv)")
+    parser.add_argument("--staff", help="Username of the staff member recorded as registering imported visits")
+    parser.add_argument("--source", help="Source name for ids of visits without legacy_id (default: file name)")
+    parser.add_argument("--batch-rows", type=int, default=settings.LEGACY_IMPORT_BATCH_ROWS)
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first row")
+    args = parser.parse_args()
+    if args.kind == VISITS and not args.staff:
+        parser.error("visits imports need --staff")
+    asyncio.run(main(args))
@@ -0,0 +1,51 @@
+"""
+Daily job for doctor slot availability.
+
+Rematerializes every scheduled doctor's availability in each clinic for SCHEDULE_HORIZON_DAYS
+from today, which adds the day entering the horizon (and applies a changed
+SCHEDULE_SLOT_MINUTES), then deletes availability of past days.
+
+Usage:
+    python -m backend.scripts.schedule_availability   # run daily (cron), shortly after midnight
+"""
+import asyncio
+import logging
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.schedule.repositories.schedule_repository import ScheduleRepository
+from backend.module.schedule.usecases.doctor_availability import AvailabilityUpdater
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.visit.usecases.visit_queue_board import hospital_today
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run(today) -> None:
+    async for session in db_manager.get_session():
+        pairs = await ScheduleRepository(session).list_scheduled_pairs()
+
+    days = 0
+    # One transaction per doctor and clinic, so doctor locks are held briefly
+    for doctor_id, clinic_id in pairs:
+        async for session in db_manager.get_session():
+            days += await AvailabilityUpdater(session).materialize(doctor_id, clinic_id, today)
+    logger.info(f"Materialized {days} doctor-days for {len(pairs)} doctor schedules from {today}")
+
+    async for session in db_manager.get_session():
+        pruned = await ScheduleRepository(session).delete_availability_before(today)
+    logger.info(f"Deleted {pruned} past doctor-days")
+
+
+async def main() -> None:
+    db_manager.init_db()
+    try:
+        await run(hospital_today())
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
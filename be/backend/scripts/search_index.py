@@ -0,0 +1,79 @@
+"""
+Search index maintenance for the Elasticsearch backend (SEARCH_BACKEND).
+
+`check` compares every index (or --index) with its table by document fingerprints and logs the
+ids missing from the index, indexed with outdated text, or no longer in the table; with --repair
+it re-indexes them. Write events keep the indexes current on their own; differences mean an
+update was lost (the search cluster was down, a worker stopped mid-refresh) or rows were written
+around the use cases (a legacy import, a manual fix in SQL). `rebuild` re-indexes every row.
+
+The postgres backend has no separate index, and the memory backend is rebuilt by each worker at
+startup, so for those there is nothing to check.
+
+Usage:
+    python -m backend.scripts.search_index check                   # cron, nightly
+    python -m backend.scripts.search_index check --repair
+    python -m backend.scripts.search_index rebuild --index users   # after a legacy import
+"""
+import argparse
+import asyncio
+import logging
+
+from backend.infrastructure.database.connection import db_manager
+from backend.infrastructure.search.service import get_search_service
+from backend.module.common.search_indexes import SEARCH_INDEXES
+from backend.module.session.models.session import UserSession  # noqa: F401
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run(command: str, names, repair: bool) -> bool:
+    """Returns whether every index checked was (or was left) consistent."""
+    service = get_search_service()
+    specs = [spec for spec in SEARCH_INDEXES if not names or spec.name in names]
+    if not service.backend.indexes_documents or service.backend.in_process:
+        logger.info("The configured search backend keeps no separate index; nothing to do")
+        return True
+
+    await service.start()
+    consistent = True
+    try:
+        for spec in specs:
+            if command == "rebuild":
+                await service.rebuild(spec)
+                continue
+            report = await service.check(spec, repair)
+            if report.consistent:
+                logger.info(f"Search index '{spec.name}': {report.documents} documents, consistent")
+                continue
+            consistent = consistent and report.repaired
+            logger.warning(
+                f"Search index '{spec.name}': {report.documents} documents, {len(report.missing)} missing, "
+                f"{len(report.stale)} stale, {len(report.orphaned)} orphaned"
+                f"{' (repaired)' if report.repaired else ''}"
+            )
+    finally:
+        await service.close()
+    return consistent
+
+
+async def main(args) -> None:
+    unknown = set(args.index or ()) - {spec.name for spec in SEARCH_INDEXES}
+    if unknown:
+        raise SystemExit(f"Unknown search index: {', '.join(sorted(unknown))}")
+    db_manager.init_db()
+    try:
+        consistent = await run(args.command, args.index, args.repair)
+    finally:
+        await db_manager.close()
+    if not consistent:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check or rebuild the search indexes")
+    parser.add_argument("command", choices=("check", "rebuild"))
+    parser.add_argument("--index", action="append", help="Index name (repeatable; default all)")
+    parser.add_argument("--repair", action="store_true", help="Re-index the differences found by check")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,59 @@
+"""
+Nightly reconciliation of the daily visit statistics.
+
+Recomputes the per-day visit counters and waits of recent queue days from the visits and
+replaces the stored ones, logging how many differed. Visit changes keep the counters current on
+their own; drift means visits were written around the visit use case (a legacy import, a manual
+fix in SQL). Counter updates wait while a day range is being reconciled.
+
+Usage:
+    python -m backend.scripts.visit_stats_reconcile                 # today and the previous day (cron, nightly)
+    python -m backend.scripts.visit_stats_reconcile --days 30
+    python -m backend.scripts.visit_stats_reconcile --from 2020-01-01 --to 2024-12-31   # after a legacy import
+"""
+import argparse
+import asyncio
+import logging
+from datetime import date, timedelta
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
+from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.stats.repositories.visit_stats_repository import VisitStatsRepository
+from backend.module.stats.usecases.visit_stats import VisitStatsUseCase
+from backend.module.visit.usecases.visit_queue_board import hospital_today
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run(day_from: date, day_to: date) -> None:
+    async for session in db_manager.get_session():
+        drift = await VisitStatsUseCase(VisitStatsRepository(session)).reconcile(day_from, day_to)
+    level = logging.WARNING if any(drift.values()) else logging.INFO
+    logger.log(
+        level,
+        f"Reconciled visit statistics {day_from}..{day_to}: "
+        f"{drift['counters']} counters and {drift['waits']} waits corrected",
+    )
+
+
+async def main(args) -> None:
+    day_to = args.day_to or hospital_today()
+    day_from = args.day_from or day_to - timedelta(days=args.days - 1)
+    if day_from > day_to:
+        raise SystemExit("--from must not be after --to")
+    db_manager.init_db()
+    try:
+        await run(day_from, day_to)
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute daily visit statistics from visits")
+    parser.add_argument("--days", type=int, default=2, help="Queue days up to --to (default today)")
+    parser.add_argument("--from", dest="day_from", type=date.fromisoformat)
+    parser.add_argument("--to", dest="day_to", type=date.fromisoformat)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,65 @@
+"""
+Background job that evaluates new wearable readings against the vitals anomaly rules.
+
+Each pass loads a batch of devices' new readings (plus recent context) as NumPy arrays and
+evaluates the whole batch at once; alerts land in wearable_alerts.
+
+Usage:
+    python -m backend.scripts.wearable_alerts          # run forever
+    python -m backend.scripts.wearable_alerts --once   # single pass (cron style)
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+
+# Import all models for relationship resolution
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.user.entity.user import User  # noqa: F401
+from backend.module.wearable.repositories.wearable_alert_repository import (
+    WearableAlertRepository,
+)
+from backend.module.wearable.usecases.wearable_alert_usecase import (
+    WearableAlertUseCase,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run_alert_pass(batch_size: int = settings.WEARABLE_ALERT_BATCH_SIZE):
+    """Evaluate every device with new readings. Each batch of devices is committed separately."""
+    until = datetime.now(timezone.utc) - timedelta(seconds=settings.WEARABLE_ALERT_SETTLE_SECONDS)
+    totals = [0, 0, 0]
+    while True:
+        async for session in db_manager.get_session():
+            usecase = WearableAlertUseCase(WearableAlertRepository(session))
+            result = await usecase.evaluate_pending(until, batch_size, settings.WEARABLE_ALERT_LOOKBACK_SECONDS)
+        totals = [t + r for t, r in zip(totals, result)]
+        if result[0] < batch_size:
+            return tuple(totals)
+
+
+async def main(once: bool) -> None:
+    db_manager.init_db()
+    try:
+        while True:
+            started = datetime.now(timezone.utc)
+            devices, readings, alerts = await run_alert_pass()
+            elapsed = (datetime.now(timezone.utc) - started).total_seconds()
+            logger.info(f"Wearable alert pass: {devices} device(s), {readings} reading(s), {alerts} alert(s) in {elapsed:.2f}s")
+            if once:
+                break
+            await asyncio.sleep(max(settings.WEARABLE_ALERT_INTERVAL_SECONDS - elapsed, 1))
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evaluate wearable readings for vitals alerts")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    args = parser.parse_args()
+    asyncio.run(main(args.once))
@@ -0,0 +1,40 @@
+"""
+Drain the wearable write-behind segment log into the database.
+
+API workers flush their own segments (and those left by crashed workers) while running; use this
+to recover readings after a shutdown with the API down, or to drain before disabling write-behind.
+Segments still locked by a running worker are left to it.
+
+Usage:
+    python -m backend.scripts.wearable_ingest_flush
+"""
+import asyncio
+import logging
+
+from backend.infrastructure.database.connection import db_manager
+
+# Import all models for relationship resolution
+from backend.module.session.models.session import UserSession  # noqa: F401
+from backend.module.user.entity.user import User  # noqa: F401
+from backend.module.wearable.usecases.wearable_write_behind import create_write_behind
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    db_manager.init_db()
+    try:
+        write_behind = create_write_behind()
+        inserted = await write_behind.flush_once()
+        metrics = write_behind.metrics()
+        logger.info(
+            f"Write-behind drain: {metrics['flushed_records']} record(s) from {metrics['flushed_segments']} "
+            f"segment(s), {inserted} inserted, {metrics['pending_segments']} segment(s) still pending"
+        )
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
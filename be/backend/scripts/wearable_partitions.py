@@ -0,0 +1,85 @@
+"""
+Maintenance job for the monthly partitions of wearable_measurements.
+
+Creates the partitions for the current month and WEARABLE_PARTITION_MONTHS_AHEAD months ahead,
+then retires partitions older than WEARABLE_RAW_RETENTION_MONTHS once rollups cover them
+(archived into WEARABLE_ARCHIVE_SCHEMA or dropped, per WEARABLE_RETENTION_MODE).
+
+Usage:
+    python -m backend.scripts.wearable_partitions             # run daily (cron)
+    python -m backend.scripts.wearable_partitions --explain   # check list_measurements partition pruning
+"""
+import argparse
+import asyncio
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.module.wearable.repositories.wearable_partition_repository import (
+    WearablePartitionRepository,
+    add_months,
+    month_start,
+)
+from backend.module.wearable.repositories.wearable_repository import WearableRepository
+from backend.module.wearable.usecases.wearable_partition_usecase import (
+    WearablePartitionUseCase,
+)
+from sqlalchemy import text
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run_maintenance(now: datetime) -> None:
+    async for session in db_manager.get_session():
+        usecase = WearablePartitionUseCase(WearablePartitionRepository(session))
+        created = await usecase.create_future_partitions(now, settings.WEARABLE_PARTITION_MONTHS_AHEAD)
+    logger.info(f"Created partitions: {created or 'none'}")
+
+    # Retention runs in its own transaction so a failure never rolls back partition creation
+    async for session in db_manager.get_session():
+        usecase = WearablePartitionUseCase(WearablePartitionRepository(session))
+        result = await usecase.apply_retention(now, settings.WEARABLE_RETENTION_MODE, settings.WEARABLE_ARCHIVE_SCHEMA)
+    logger.info(f"Retired partitions ({settings.WEARABLE_RETENTION_MODE}): {result['retired'] or 'none'}")
+    if result["pending"]:
+        logger.warning(f"Partitions past retention awaiting rollup: {result['pending']}")
+
+
+async def explain_pruning(now: datetime) -> bool:
+    """EXPLAIN a one-week list_measurements query and check it only touches the matching partition(s)."""
+    date_from = month_start(now) + timedelta(days=3)
+    date_to = date_from + timedelta(days=7)
+    stmt = WearableRepository.measurements_query(uuid4(), date_from, date_to).limit(10)
+    async for session in db_manager.get_session():
+        partitions = await WearablePartitionRepository(session).list_partitions()
+        sql = str(stmt.compile(session.bind, compile_kwargs={"literal_binds": True}))
+        plan = [row[0] for row in (await session.execute(text(f"EXPLAIN {sql}"))).all()]
+
+    print("\n".join(plan))
+    expected = {name for name, month in partitions if month <= date_to and add_months(month, 1) > date_from}
+    scanned = set(re.findall(r" on (wearable_measurements_\w+)", "\n".join(plan)))
+    pruned = bool(scanned) and scanned <= expected
+    logger.info(f"Partitions: {len(partitions)}, scanned: {sorted(scanned)}, pruning {'OK' if pruned else 'NOT applied'}")
+    return pruned
+
+
+async def main(explain: bool) -> None:
+    db_manager.init_db()
+    try:
+        now = datetime.now(timezone.utc)
+        if explain:
+            await explain_pruning(now)
+        else:
+            await run_maintenance(now)
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain wearable measurement partitions")
+    parser.add_argument("--explain", action="store_true", help="Show the list_measurements plan and check partition pruning")
+    args = parser.parse_args()
+    asyncio.run(main(args.explain))
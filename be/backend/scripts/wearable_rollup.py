@@ -0,0 +1,63 @@
+"""
+Background job that keeps the wearable hourly/daily rollup tables up to date.
+
+Usage:
+    python -m backend.scripts.wearable_rollup          # run forever
+    python -m backend.scripts.wearable_rollup --once   # single pass (cron style)
+"""
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from backend.infrastructure.config.settings import settings
+from backend.infrastructure.database.connection import db_manager
+from backend.module.wearable.repositories.wearable_rollup_repository import (
+    WearableRollupRepository,
+)
+from backend.module.wearable.usecases.wearable_partition_usecase import (
+    rollup_raw_floor,
+)
+from backend.module.wearable.usecases.wearable_rollup_usecase import (
+    WearableRollupUseCase,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def run_rollup_pass(batch_size: int = settings.WEARABLE_ROLLUP_BATCH_SIZE) -> int:
+    """Roll up every device with new readings. Each batch of devices is committed separately."""
+    now = datetime.now(timezone.utc)
+    until = now - timedelta(seconds=settings.WEARABLE_ROLLUP_SETTLE_SECONDS)
+    raw_floor = rollup_raw_floor(now)
+    processed = 0
+    while True:
+        async for session in db_manager.get_session():
+            usecase = WearableRollupUseCase(WearableRollupRepository(session))
+            count = await usecase.rollup_pending(until, batch_size, raw_floor)
+        processed += count
+        if count < batch_size:
+            return processed
+
+
+async def main(once: bool) -> None:
+    db_manager.init_db()
+    try:
+        while True:
+            started = datetime.now(timezone.utc)
+            processed = await run_rollup_pass()
+            elapsed = (datetime.now(timezone.utc) - started).total_seconds()
+            logger.info(f"Wearable rollup pass: {processed} device(s) in {elapsed:.2f}s")
+            if once:
+                break
+            await asyncio.sleep(max(settings.WEARABLE_ROLLUP_INTERVAL_SECONDS - elapsed, 1))
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Maintain wearable measurement rollups")
+    parser.add_argument("--once", action="store_true", help="Run a single pass and exit")
+    args = parser.parse_args()
+    asyncio.run(main(args.once))
@@ -34,6 +34,7 @@ from backend.module.lab.entity.lab import (  # noqa: F401
 from backend.module.medical_record.entity.medical_record import (
     MedicalRecord,  # noqa: F401
 )
+from backend.module.medical_record.entity.medical_record_revision import MedicalRecordRevision  # noqa: F401
 
 # Medicine
 from backend.module.medicine.entity.medicine import Medicine  # noqa: F401
@@ -53,6 +54,8 @@ from backend.module.profile.entity.models import (  # noqa: F401
 
 # Referral
 from backend.module.referral.entity.referral import Referral  # noqa: F401
+from backend.module.schedule.entity.schedule import DoctorAvailability, DoctorSchedule  # noqa: F401
+from backend.module.stats.entity.visit_stats import VisitDailyCounter, VisitDailyWait  # noqa: F401
 from backend.module.session.models.session import UserSession  # noqa: F401
 
 # =============================================================================
@@ -63,12 +66,19 @@ from backend.module.session.models.session import UserSession  # noqa: F401
 from backend.module.user.entity.user import User  # noqa: F401
 
 # Visit
-from backend.module.visit.entity.visit import Visit  # noqa: F401
+from backend.module.visit.entity.visit import ClinicQueueCounter, Visit  # noqa: F401
 
 # Wearable
 from backend.module.wearable.entity.wearable import (  # noqa: F401
+    WearableAlert,
+    WearableAlertThreshold,
+    WearableAlertWatermark,
     WearableDevice,
+    WearableDeviceKey,
     WearableMeasurement,
+    WearableRollupDaily,
+    WearableRollupHourly,
+    WearableRollupWatermark,
 )
 
 # =============================================================================
@@ -86,6 +96,24 @@ database_url = settings.DATABASE_URL
 # Target metadata from Base
 target_metadata = Base.metadata
 
+# Partitions of wearable_measurements are managed by backend.scripts.wearable_partitions
+PARTITION_PREFIX = "wearable_measurements_"
+# Trigram indexes exist only where the pg_trgm extension is available, so they are not in the models
+TRIGRAM_INDEX_SUFFIX = "_trgm"
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Keep autogenerate from proposing to drop partitions and their inherited indexes, or the
+    trigram indexes.
+    """
+    table_name = object.table.name if type_ == "index" else name
+    if reflected and compare_to is None and type_ in ("table", "index"):
+        if type_ == "index" and (name or "").endswith(TRIGRAM_INDEX_SUFFIX):
+            return False
+        return not (table_name or "").startswith(PARTITION_PREFIX)
+    return True
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -101,6 +129,7 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -114,6 +143,7 @@ def do_run_migrations(connection):
         target_metadata=target_metadata,
         compare_type=True,
         compare_server_default=True,
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -0,0 +1,59 @@
+"""patient search indexes
+
+Revision ID: a3d8f1b7c5e2
+Revises: f2c7a4e9b1d6
+Create Date: 2026-10-19 18:10:12.581034
+
+Trigram indexes on users.full_name and users.username need the pg_trgm extension (in contrib,
+trusted since Postgres 13); where it is not available they are skipped with a warning and
+name searches fall back to ILIKE scans. Re-run this migration (downgrade, upgrade) after
+installing the extension.
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d8f1b7c5e2'
+down_revision: Union[str, None] = 'f2c7a4e9b1d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+TRIGRAM_INDEXES = (
+    ("ix_users_full_name_trgm", "full_name"),
+    ("ix_users_username_trgm", "username"),
+)
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_patients_nik_pattern', 'patients', ['nik'], unique=False, postgresql_ops={'nik': 'varchar_pattern_ops'}
+    )
+    op.create_index(
+        'ix_patients_bpjs_number_pattern', 'patients', ['bpjs_number'], unique=False,
+        postgresql_ops={'bpjs_number': 'varchar_pattern_ops'}
+    )
+
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first()
+    if available is None:
+        logger.warning("pg_trgm is not available: skipping trigram indexes, name searches will scan users")
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name, 'users', [column], unique=False, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    # The extension stays installed; other objects may depend on it
+    for name, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_index('ix_patients_bpjs_number_pattern', table_name='patients')
+    op.drop_index('ix_patients_nik_pattern', table_name='patients')
@@ -0,0 +1,27 @@
+"""clinic queue events
+
+Revision ID: a7c4e2f9b1d6
+Revises: f5b2d8e1c3a7
+Create Date: 2026-10-19 17:31:40.207615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c4e2f9b1d6'
+down_revision: Union[str, None] = 'f5b2d8e1c3a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('clinic_queue_counters', sa.Column('last_event_id', sa.BigInteger(), server_default='0', nullable=False))
+    op.alter_column('clinic_queue_counters', 'last_event_id', server_default=None)
+
+
+def downgrade() -> None:
+    op.drop_column('clinic_queue_counters', 'last_event_id')
@@ -0,0 +1,32 @@
+"""medical record diagnosis codes
+
+Revision ID: b6e2c9d4a8f1
+Revises: a3d8f1b7c5e2
+Create Date: 2026-10-19 19:02:37.446120
+
+A nullable column without a default is added without rewriting medical_records.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2c9d4a8f1'
+down_revision: Union[str, None] = 'a3d8f1b7c5e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('medical_records', sa.Column('diagnosis_codes', postgresql.ARRAY(sa.String(length=10)), nullable=True))
+    op.create_index(
+        'ix_medical_records_diagnosis_codes', 'medical_records', ['diagnosis_codes'], unique=False,
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_medical_records_diagnosis_codes', table_name='medical_records', postgresql_using='gin')
+    op.drop_column('medical_records', 'diagnosis_codes')
@@ -0,0 +1,105 @@
+"""partition wearable_measurements by month
+
+Revision ID: c4e7a19d2f53
+Revises: b1b8f9eff626
+Create Date: 2026-10-19 18:12:09.402117
+
+Rebuilds wearable_measurements as a RANGE (recorded_at) partitioned table with one partition per
+UTC month plus a default partition. Existing rows are copied, so on large installations run this
+in a maintenance window. Later partitions are created by backend.scripts.wearable_partitions.
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e7a19d2f53'
+down_revision: Union[str, None] = 'b1b8f9eff626'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = (
+    "id, device_id, recorded_at, heart_rate, systolic_bp, diastolic_bp, "
+    "body_temperature, steps, spo2, created_at"
+)
+MONTHS_AHEAD = 3
+
+
+def _measurement_columns():
+    return [
+        sa.Column('id', sa.UUID(), nullable=False),
+        sa.Column('device_id', sa.UUID(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('heart_rate', sa.Integer(), nullable=True),
+        sa.Column('systolic_bp', sa.Integer(), nullable=True),
+        sa.Column('diastolic_bp', sa.Integer(), nullable=True),
+        sa.Column('body_temperature', sa.Numeric(precision=4, scale=1), nullable=True),
+        sa.Column('steps', sa.Integer(), nullable=True),
+        sa.Column('spo2', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['device_id'], ['wearable_devices.id'], ondelete='CASCADE'),
+    ]
+
+
+def _create_indexes():
+    op.create_index('ix_wearable_measurements_device_recorded_at', 'wearable_measurements', ['device_id', 'recorded_at'], unique=False)
+    op.create_index('ix_wearable_measurements_device_created_at', 'wearable_measurements', ['device_id', 'created_at'], unique=False)
+
+
+def _drop_indexes(table_name):
+    op.drop_index('ix_wearable_measurements_device_created_at', table_name=table_name)
+    op.drop_index('ix_wearable_measurements_device_recorded_at', table_name=table_name)
+
+
+def _add_months(month, months):
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    op.rename_table('wearable_measurements', 'wearable_measurements_legacy')
+    op.execute('ALTER TABLE wearable_measurements_legacy RENAME CONSTRAINT wearable_measurements_pkey TO wearable_measurements_legacy_pkey')
+    _drop_indexes('wearable_measurements_legacy')
+
+    op.create_table('wearable_measurements',
+    *_measurement_columns(),
+    sa.PrimaryKeyConstraint('id', 'recorded_at'),
+    postgresql_partition_by='RANGE (recorded_at)'
+    )
+    _create_indexes()
+
+    now = datetime.now(timezone.utc)
+    first = conn.execute(sa.text("SELECT date_trunc('month', min(recorded_at) AT TIME ZONE 'UTC') FROM wearable_measurements_legacy")).scalar()
+    month = (first or now).replace(day=1, hour=0, minute=0, second=0, microsecond=0, tzinfo=timezone.utc)
+    last = _add_months(now.replace(day=1, hour=0, minute=0, second=0, microsecond=0), MONTHS_AHEAD)
+    while month <= last:
+        upper = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE wearable_measurements_{month.year:04d}_{month.month:02d} PARTITION OF wearable_measurements "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        month = upper
+    op.execute('CREATE TABLE wearable_measurements_default PARTITION OF wearable_measurements DEFAULT')
+
+    op.execute(f'INSERT INTO wearable_measurements ({COLUMNS}) SELECT {COLUMNS} FROM wearable_measurements_legacy')
+    op.drop_table('wearable_measurements_legacy')
+    op.execute('ANALYZE wearable_measurements')
+
+
+def downgrade() -> None:
+    op.rename_table('wearable_measurements', 'wearable_measurements_partitioned')
+    op.execute('ALTER TABLE wearable_measurements_partitioned RENAME CONSTRAINT wearable_measurements_pkey TO wearable_measurements_partitioned_pkey')
+    _drop_indexes('wearable_measurements_partitioned')
+
+    op.create_table('wearable_measurements',
+    *_measurement_columns(),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(f'INSERT INTO wearable_measurements ({COLUMNS}) SELECT {COLUMNS} FROM wearable_measurements_partitioned')
+    _create_indexes()
+    # Dropping the parent drops every attached partition
+    op.drop_table('wearable_measurements_partitioned')
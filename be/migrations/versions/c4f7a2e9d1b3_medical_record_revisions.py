@@ -0,0 +1,42 @@
+"""medical record revisions
+
+Revision ID: c4f7a2e9d1b3
+Revises: b6e2c9d4a8f1
+Create Date: 2026-10-19 20:14:05.218733
+
+Existing records start at revision 0 (a constant default, so medical_records is not rewritten);
+their first update stores the version they had as revision 1.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f7a2e9d1b3'
+down_revision: Union[str, None] = 'b6e2c9d4a8f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('medical_records', sa.Column('revision', sa.Integer(), server_default='0', nullable=False))
+    op.create_table(
+        'medical_record_revisions',
+        sa.Column('record_id', sa.UUID(), nullable=False),
+        sa.Column('revision', sa.Integer(), nullable=False),
+        sa.Column('snapshot', sa.Boolean(), nullable=False),
+        sa.Column('changes', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('changed_fields', postgresql.ARRAY(sa.String(length=20)), nullable=False),
+        sa.Column('changed_by', sa.UUID(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['changed_by'], ['doctors.id'], ),
+        sa.ForeignKeyConstraint(['record_id'], ['medical_records.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('record_id', 'revision')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('medical_record_revisions')
+    op.drop_column('medical_records', 'revision')
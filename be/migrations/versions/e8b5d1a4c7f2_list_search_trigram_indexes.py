@@ -0,0 +1,56 @@
+"""list search trigram indexes
+
+Revision ID: e8b5d1a4c7f2
+Revises: c4f7a2e9d1b3
+Create Date: 2026-10-20 09:12:47.305216
+
+Trigram indexes on the columns the postgres search backend matches with ILIKE (clinic, lab test,
+medicine, prescription and referral lists; the user columns got theirs in a3d8f1b7c5e2), so a
+search is an index scan instead of a scan of the table. Like there, they need the pg_trgm
+extension and are skipped with a warning where it is not available; re-run this migration
+(downgrade, upgrade) after installing it.
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b5d1a4c7f2'
+down_revision: Union[str, None] = 'c4f7a2e9d1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+TRIGRAM_INDEXES = (
+    ("ix_clinic_name_trgm", "clinic", "name"),
+    ("ix_lab_tests_test_name_trgm", "lab_tests", "test_name"),
+    ("ix_lab_tests_test_code_trgm", "lab_tests", "test_code"),
+    ("ix_medicines_medicine_name_trgm", "medicines", "medicine_name"),
+    ("ix_prescriptions_notes_trgm", "prescriptions", "notes"),
+    ("ix_referrals_referred_to_facility_trgm", "referrals", "referred_to_facility"),
+    ("ix_referrals_diagnosis_trgm", "referrals", "diagnosis"),
+    ("ix_referrals_reason_trgm", "referrals", "reason"),
+)
+
+
+def upgrade() -> None:
+    available = op.get_bind().execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).first()
+    if available is None:
+        logger.warning("pg_trgm is not available: skipping trigram indexes, list searches will scan their tables")
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name, table, [column], unique=False, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    # The extension stays installed; other objects may depend on it
+    for name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
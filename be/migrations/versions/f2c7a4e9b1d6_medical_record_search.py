@@ -0,0 +1,52 @@
+"""medical record full text search
+
+Revision ID: f2c7a4e9b1d6
+Revises: e6a1c9d3f7b2
+Create Date: 2026-10-19 17:29:42.297456
+
+Adding the stored generated column rewrites medical_records and building the GIN index reads
+all of it; on a large table run this migration in a maintenance window.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7a4e9b1d6'
+down_revision: Union[str, None] = 'e6a1c9d3f7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = " || ".join(
+    f"setweight(to_tsvector('{config}'::regconfig, coalesce({field}, '')), '{weight}')"
+    for field, weight in (
+        ("diagnosis", "A"),
+        ("anamnesis", "B"),
+        ("physical_exam", "C"),
+        ("treatment_plan", "C"),
+        ("doctor_notes", "D"),
+    )
+    for config in ("indonesian", "english")
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'medical_records',
+        sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True)
+    )
+    op.create_index(
+        'ix_medical_records_search_vector', 'medical_records', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+    op.create_index('ix_medical_records_created_at', 'medical_records', ['created_at'], unique=False)
+    # Statistics on more lexemes, so the planner can tell rare terms (GIN index) from common ones
+    # (newest records first)
+    op.execute("ALTER TABLE medical_records ALTER COLUMN search_vector SET STATISTICS 1000")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_medical_records_created_at', table_name='medical_records')
+    op.drop_index('ix_medical_records_search_vector', table_name='medical_records', postgresql_using='gin')
+    op.drop_column('medical_records', 'search_vector')
@@ -0,0 +1,61 @@
+"""clinic queue counters
+
+Revision ID: f5b2d8e1c3a7
+Revises: e3a91c7d4b28
+Create Date: 2026-10-19 17:05:12.418233
+
+Existing visits (which never got a queue number) are numbered per clinic and local day
+in visit_datetime order, and the counters start after them.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from backend.infrastructure.config.settings import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b2d8e1c3a7'
+down_revision: Union[str, None] = 'e3a91c7d4b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('clinic_queue_counters',
+    sa.Column('clinic_id', sa.UUID(), nullable=False),
+    sa.Column('queue_date', sa.Date(), nullable=False),
+    sa.Column('last_number', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['clinic_id'], ['clinic.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('clinic_id', 'queue_date')
+    )
+    op.add_column('visits', sa.Column('queue_date', sa.Date(), nullable=True))
+
+    op.execute(sa.text("""
+        UPDATE visits v
+        SET queue_date = n.queue_date, queue_number = n.queue_number
+        FROM (
+            SELECT id,
+                   (visit_datetime AT TIME ZONE :tz)::date AS queue_date,
+                   row_number() OVER (
+                       PARTITION BY clinic_id, (visit_datetime AT TIME ZONE :tz)::date
+                       ORDER BY visit_datetime, created_at, id
+                   ) AS queue_number
+            FROM visits
+        ) n
+        WHERE v.id = n.id
+    """).bindparams(tz=settings.HOSPITAL_TIMEZONE))
+    op.execute("""
+        INSERT INTO clinic_queue_counters (clinic_id, queue_date, last_number)
+        SELECT clinic_id, queue_date, max(queue_number)
+        FROM visits
+        GROUP BY clinic_id, queue_date
+    """)
+    op.create_index('ix_visits_clinic_queue', 'visits', ['clinic_id', 'queue_date', 'queue_number'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_visits_clinic_queue', table_name='visits')
+    op.drop_column('visits', 'queue_date')
+    op.drop_table('clinic_queue_counters')
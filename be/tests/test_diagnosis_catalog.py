@@ -0,0 +1,25 @@
+"""Diagnosis code autocomplete over the bundled ICD-10 subset."""
+import pytest
+
+from backend.module.diagnosis.usecases.diagnosis_catalog import BUNDLED_CATALOG, DiagnosisIndex, read_catalog
+
+
+@pytest.fixture(scope="module")
+def index() -> DiagnosisIndex:
+    return DiagnosisIndex(read_catalog(BUNDLED_CATALOG))
+
+
+@pytest.mark.parametrize("query", ["J", "j", " J "])
+def test_lone_category_letter_is_a_code_prefix(index, query):
+    results = index.search(query, 10)
+    assert len(results) == 10
+    assert all(result.code.startswith("J") for result in results)
+    assert [result.code for result in results] == sorted(result.code for result in results)
+
+
+def test_letter_with_other_words_stays_a_word(index):
+    assert "B15" in [result.code for result in index.search("hepatitis a", 10)]
+
+
+def test_code_prefix(index):
+    assert index.search("j06.9", 10)[0].code == "J06.9"
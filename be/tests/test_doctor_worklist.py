@@ -0,0 +1,80 @@
+"""
+The doctor worklist loads a day with the same number of SQL statements however many visits it has.
+
+Runs against the database at DATABASE_URL and needs the seed data (backend.scripts.seed); skipped
+when either is missing. `python -m backend.scripts.bench_doctor_worklist` measures the same day
+sizes with timings and the per-visit alternative.
+"""
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import delete, event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from backend.infrastructure.database.connection import db_manager
+from backend.module.clinic.entity.clinic import Clinic
+from backend.module.lab.entity.lab import LabTest
+from backend.module.profile.entity.models import Doctor, Patient, Staff
+from backend.module.visit.entity.visit import Visit
+from backend.module.visit.repositories.visit_repository import VisitRepository
+from backend.module.visit.usecases.visit_usecase import VisitUseCase
+from backend.scripts.bench_doctor_worklist import create_day
+
+SIZES = (1, 10, 100)
+# The visits with their one-to-one rows, then the open lab orders of all of them
+WORKLIST_STATEMENTS = 2
+
+
+async def worklist_statements() -> dict:
+    """Statements sent by the worklist of a day of each size, by size."""
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    db_manager.init_db()
+    try:
+        try:
+            async for session in db_manager.get_session():
+                doctor_id = (await session.execute(select(Doctor.id).limit(1))).scalar()
+                patient_id = (await session.execute(select(Patient.id).limit(1))).scalar()
+                staff_id = (await session.execute(select(Staff.id).limit(1))).scalar()
+                lab_test_id = (await session.execute(select(LabTest.id).limit(1))).scalar()
+                if not all((doctor_id, patient_id, staff_id, lab_test_id)):
+                    pytest.skip("Needs a doctor, a patient, a staff member and a lab test (run backend.scripts.seed)")
+                clinic = Clinic(name="Worklist statement count test")
+                session.add(clinic)
+                await session.flush()
+                clinic_id = clinic.id
+        except (OSError, DBAPIError) as e:
+            pytest.skip(f"Database not reachable: {e}")
+
+        results = {}
+        try:
+            for offset, size in enumerate(SIZES):
+                day = date(2099, 6, 1) + timedelta(days=offset)
+                await create_day(clinic_id, doctor_id, patient_id, staff_id, lab_test_id, day, size)
+                async for session in db_manager.get_session():
+                    usecase = VisitUseCase(VisitRepository(session))
+                    statements = 0
+                    event.listen(Engine, "before_cursor_execute", count)
+                    try:
+                        worklist = await usecase.doctor_worklist(doctor_id, day)
+                    finally:
+                        event.remove(Engine, "before_cursor_execute", count)
+                    assert len(worklist) == size
+                    results[size] = statements
+        finally:
+            async for session in db_manager.get_session():
+                await session.execute(delete(Visit).where(Visit.clinic_id == clinic_id))
+                await session.execute(delete(Clinic).where(Clinic.id == clinic_id))
+        return results
+    finally:
+        await db_manager.close()
+
+
+def test_worklist_statement_count_is_fixed():
+    assert asyncio.run(worklist_statements()) == {size: WORKLIST_STATEMENTS for size in SIZES}
@@ -0,0 +1,84 @@
+"""
+Queue board polls check the caller's session in the database once per AUTH_SESSION_CACHE_TTL_SECONDS.
+
+Runs against the database at DATABASE_URL and needs the seed data (backend.scripts.seed); skipped
+when either is missing.
+"""
+import asyncio
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError
+
+from backend.api.middleware.auth import SessionCache, session_cache
+from backend.api.middleware.auth_dto import AuthenticatedProfile
+from backend.api.server.app import app
+from backend.infrastructure.database.connection import db_manager
+from backend.scripts.bench_wearable_fleet import AsgiClient
+
+POLLS = 3
+
+
+async def poll_statements() -> list:
+    """Statements sent by each of POLLS queue board polls with one token."""
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    async with app.router.lifespan_context(app):
+        try:
+            async for session in db_manager.get_session():
+                await session.execute(text("SELECT 1"))
+        except (OSError, DBAPIError) as e:
+            pytest.skip(f"Database not reachable: {e}")
+        client = AsgiClient(app)
+        status, body = await client.request(
+            "POST", "/api/auth/login", json.dumps({"username": "staff1", "password": "staff123"}).encode(),
+            {"content-type": "application/json"},
+        )
+        if status != 200:
+            pytest.skip("Needs the staff1 login (run backend.scripts.seed)")
+        headers = {"authorization": f"Bearer {json.loads(body)['data']['access_token']}"}
+        status, body = await client.request("GET", "/api/clinics", b"", headers)
+        clinics = json.loads(body)["data"]
+        if not clinics:
+            pytest.skip("Needs a clinic (run backend.scripts.seed)")
+
+        session_cache.clear()
+        results = []
+        event.listen(Engine, "before_cursor_execute", count)
+        try:
+            for _ in range(POLLS):
+                statements = 0
+                status, _ = await client.request("GET", f"/api/clinics/{clinics[0]['id']}/queue", b"", headers)
+                assert status == 200
+                results.append(statements)
+        finally:
+            event.remove(Engine, "before_cursor_execute", count)
+        status, _ = await client.request("GET", f"/api/clinics/{clinics[0]['id']}/queue", b"", {})
+        assert status == 401
+        return results
+
+
+def test_repeated_polls_read_no_database():
+    first, *repeated = asyncio.run(poll_statements())
+    assert first > 0
+    assert repeated == [0] * (POLLS - 1)
+
+
+def test_session_cache_expires(monkeypatch):
+    cache = SessionCache(ttl_seconds=30, max_tokens=1)
+    profile = AuthenticatedProfile(id=uuid4(), role="staff", user_id=uuid4())
+    now = 1000.0
+    monkeypatch.setattr("backend.api.middleware.auth.time.monotonic", lambda: now)
+    cache.put("a", profile)
+    assert cache.get("a") is profile
+    now += 31
+    assert cache.get("a") is None
+    cache.put("b", profile)
+    assert cache.get("a") is None  # Evicted: one token at most
@@ -0,0 +1,64 @@
+"""Segments are only claimed once sealed or orphaned, never while a worker is opening or writing them."""
+import asyncio
+import fcntl
+import time
+
+from backend.infrastructure.ingest.segment_log import SegmentLog, claim
+
+
+def flush(log: SegmentLog) -> list:
+    """Claim, read and consume every claimable segment, like the write-behind flusher."""
+    frames = []
+    for segment in log.refresh_pending():
+        claimed = claim(segment)
+        if claimed is not None:
+            frames.append(claimed.read())
+            claimed.complete()
+    return frames
+
+
+def test_open_is_not_claimed_before_it_is_locked(tmp_path, monkeypatch):
+    writer = SegmentLog(str(tmp_path), 1 << 20, 1 << 30, fsync=False)
+    other = SegmentLog(str(tmp_path), 1 << 20, 1 << 30, fsync=False)
+    flock = fcntl.flock
+    claimed_during_open = []
+
+    def flush_then_flock(fd, operation):
+        monkeypatch.setattr(fcntl, "flock", flock)
+        # The other worker's flusher runs just before the writer takes its lock
+        claimed_during_open.extend(flush(other))
+        flock(fd, operation)
+
+    async def append_and_seal():
+        await writer.append(b"reading")
+        await writer.seal()
+
+    monkeypatch.setattr(fcntl, "flock", flush_then_flock)
+    asyncio.run(append_and_seal())
+
+    assert claimed_during_open == []
+    assert flush(other) == [[b"reading"]]
+
+
+def test_open_segment_is_held(tmp_path):
+    writer = SegmentLog(str(tmp_path), 1 << 20, 1 << 30, fsync=False)
+    other = SegmentLog(str(tmp_path), 1 << 20, 1 << 30, fsync=False)
+
+    async def append():
+        await writer.append(b"reading")
+
+    asyncio.run(append())
+    assert [s.path for s in other.refresh_pending()] == [writer._path]
+    assert flush(other) == []
+    writer._seal_active()
+    assert flush(other) == [[b"reading"]]
+
+
+def test_stale_opening_files_are_removed(tmp_path):
+    stale = tmp_path / "0000000001000-deadbeef0000-000001.opening"
+    stale.touch()
+    fresh = tmp_path / f"{int(time.time() * 1000):013d}-deadbeef0000-000001.opening"
+    fresh.touch()
+    SegmentLog(str(tmp_path), 1 << 20, 1 << 30, fsync=False)
+    assert not stale.exists()
+    assert fresh.exists()
@@ -0,0 +1,52 @@
+"""Reading batches are held to what the measurement columns store, whatever their encoding."""
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from backend.module.wearable.entity.wearable_dto import WearableMeasurementCreateDTO
+from backend.module.wearable.usecases.wearable_columnar import decode_batch
+from backend.pkg.core.exceptions import ValidationException
+
+OUT_OF_RANGE = (
+    ("heart_rate", 3_000_000_000),
+    ("steps", -3_000_000_000),
+    ("body_temperature", 1000),
+)
+
+
+@pytest.mark.parametrize("name, value", OUT_OF_RANGE)
+def test_json_batch_out_of_range(name, value):
+    body = json.dumps({"readings": [{"recorded_at": "2026-01-01T00:00:00Z", name: value}]}).encode()
+    with pytest.raises(ValidationException) as raised:
+        decode_batch("application/json", body)
+    assert raised.value.errors[0].field == f"readings.0.{name}"
+
+
+@pytest.mark.parametrize("name, value", OUT_OF_RANGE)
+def test_columnar_batch_out_of_range(name, value):
+    msgpack = pytest.importorskip("msgpack")  # The binary-ingest extra
+    body = msgpack.packb({"t0": 1767225600000, "dt": [0], name: [value]})
+    with pytest.raises(ValidationException) as raised:
+        decode_batch("application/msgpack", body)
+    assert raised.value.errors[0].field == name
+
+
+@pytest.mark.parametrize("name, value", OUT_OF_RANGE)
+def test_single_reading_out_of_range(name, value):
+    with pytest.raises(ValidationError):
+        WearableMeasurementCreateDTO(recorded_at="2026-01-01T00:00:00Z", **{name: value})
+
+
+def test_json_and_columnar_batches_decode_alike():
+    msgpack = pytest.importorskip("msgpack")
+    readings = [
+        {"recorded_at": "2026-01-01T00:00:00Z", "heart_rate": 2 ** 31 - 1, "body_temperature": -999.9},
+        {"recorded_at": "2026-01-01T00:00:01Z", "spo2": 97, "body_temperature": 36.6},
+    ]
+    from_json = decode_batch("application/json", json.dumps({"readings": readings}).encode())
+    from_msgpack = decode_batch("application/msgpack", msgpack.packb({
+        "t0": 1767225600000, "dt": [0, 1000], "heart_rate": [2 ** 31 - 1, None],
+        "body_temperature": [-999.9, 36.6], "spo2": [None, 97],
+    }))
+    assert from_json.records("device", [1, 2]) == from_msgpack.records("device", [1, 2])